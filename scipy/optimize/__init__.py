@@ -119,6 +119,7 @@ Nonlinear least-squares
    :toctree: generated/
 
    least_squares - Solve a nonlinear least-squares problem with bounds on the variables.
+   least_squares_batch - Solve a batch of small nonlinear least-squares problems.
 
 Linear least-squares
 --------------------
@@ -152,6 +153,7 @@ Scalar functions
    bisect - Bisection method.
    newton - Newton's method (also Secant and Halley's methods).
    toms748 - Alefeld, Potra & Shi Algorithm 748.
+   chandrupatla - Chandrupatla's method for arrays of brackets.
    RootResults - The root finding result returned by some root finders.
 
 The `root_scalar` function supports the following methods:
@@ -239,6 +241,7 @@ Linear programming
    :toctree: generated/
 
    linprog -- Unified interface for minimizers of linear programming problems.
+   HighsLP -- Linear program kept in HiGHS for fast re-solves after changes.
 
 The `linprog` function supports the following methods:
 
@@ -411,9 +414,10 @@ from .slsqp import fmin_slsqp
 from ._nnls import nnls
 from ._basinhopping import basinhopping
 from ._linprog import linprog, linprog_verbose_callback
+from ._linprog_highs import HighsLP
 from ._lsap import linear_sum_assignment
 from ._differentialevolution import differential_evolution
-from ._lsq import least_squares, lsq_linear
+from ._lsq import least_squares, least_squares_batch, lsq_linear
 from ._constraints import (NonlinearConstraint,
                            LinearConstraint,
                            Bounds)
@@ -5,7 +5,7 @@ import numpy as np
 import math
 from numpy import cos, sin
 import scipy.optimize
-from scipy._lib._util import check_random_state
+from scipy._lib._util import check_random_state, MapWrapper
 
 __all__ = ['basinhopping']
 
@@ -53,9 +53,12 @@ class BasinHoppingRunner:
         escape from a local minimum that ``basinhopping`` is trapped in.
     disp : bool, optional
         Display status messages.
+    minres : `optimize.OptimizeResult`, optional
+        The result of the initial minimization, if it was already done.
 
     """
-    def __init__(self, x0, minimizer, step_taking, accept_tests, disp=False):
+    def __init__(self, x0, minimizer, step_taking, accept_tests, disp=False,
+                 minres=None):
         self.x = np.copy(x0)
         self.minimizer = minimizer
         self.step_taking = step_taking
@@ -69,15 +72,16 @@ class BasinHoppingRunner:
         self.res.minimization_failures = 0
 
         # do initial minimization
-        minres = minimizer(self.x)
-        if not minres.success:
-            self.res.minimization_failures += 1
+        if minres is None:
+            minres = minimizer(self.x)
+            if not minres.success:
+                self.res.minimization_failures += 1
+                if self.disp:
+                    print("warning: basinhopping: local minimization failure")
             if self.disp:
-                print("warning: basinhopping: local minimization failure")
+                print("basinhopping step %d: f %g" % (self.nstep, minres.fun))
         self.x = np.copy(minres.x)
         self.energy = minres.fun
-        if self.disp:
-            print("basinhopping step %d: f %g" % (self.nstep, self.energy))
 
         # initialize storage class
         self.storage = Storage(minres)
@@ -89,19 +93,29 @@ class BasinHoppingRunner:
         if hasattr(minres, "nhev"):
             self.res.nhev = minres.nhev
 
+    def _take_step(self):
+        """Randomly displace a copy of the coordinates"""
+        # Make a copy of x because the step_taking algorithm might change x
+        # in place
+        x_after_step = np.copy(self.x)
+        return self.step_taking(x_after_step)
+
     def _monte_carlo_step(self):
         """Do one Monte Carlo iteration
 
         Randomly displace the coordinates, minimize, and decide whether
         or not to accept the new coordinates.
         """
-        # Take a random step.  Make a copy of x because the step_taking
-        # algorithm might change x in place
-        x_after_step = np.copy(self.x)
-        x_after_step = self.step_taking(x_after_step)
+        # Take a random step
+        x_after_step = self._take_step()
 
         # do a local minimization
         minres = self.minimizer(x_after_step)
+        return self._accept_step(minres), minres
+
+    def _accept_step(self, minres):
+        """Decide whether or not to accept the result of a local minimization
+        """
         x_after_quench = minres.x
         energy_after_quench = minres.fun
         if not minres.success:
@@ -141,16 +155,18 @@ class BasinHoppingRunner:
                                     x_new=x_after_quench, f_old=self.energy,
                                     x_old=self.x)
 
-        return accept, minres
+        return accept
 
     def one_cycle(self):
         """Do one cycle of the basinhopping algorithm
         """
         self.nstep += 1
-        new_global_min = False
-
         accept, minres = self._monte_carlo_step()
+        return self._update(accept, minres)
 
+    def _update(self, accept, minres):
+        """Move to the new coordinates if the step was accepted"""
+        new_global_min = False
         if accept:
             self.energy = minres.fun
             self.x = np.copy(minres.x)
@@ -178,6 +194,102 @@ class BasinHoppingRunner:
                                 accept, minres.fun))
 
 
+class ParallelTemperingRunner:
+    """This class implements the parallel tempering variant of basinhopping.
+
+    One replica of the basinhopping walk is run at each temperature. In each
+    cycle every replica takes a step, the local minimizations of all the
+    replicas are performed by `mapper`, and then replicas at neighbouring
+    temperatures exchange their coordinates with the replica exchange
+    probability ``min(1, exp((beta_i - beta_j) * (f_i - f_j)))``.
+
+    x0 : ndarray
+        The starting coordinates.
+    minimizer : callable
+        The local minimizer, with signature ``result = minimizer(x)``.
+        The return value is an `optimize.OptimizeResult` object.
+    step_taking : list of callables
+        The step taking routine of each replica.
+    accept_tests : list of lists of callables
+        The acceptance tests of each replica.
+    betas : ndarray
+        The inverse temperature of each replica.
+    mapper : map-like callable
+        Used to perform the local minimizations of the replicas as
+        ``mapper(minimizer, iterable)``.
+    random_gen : `numpy.random.Generator` or `numpy.random.RandomState`
+        Random number generator used for the replica exchanges.
+    disp : bool, optional
+        Display status messages.
+
+    """
+    def __init__(self, x0, minimizer, step_taking, accept_tests, betas,
+                 mapper, random_gen, disp=False):
+        self.minimizer = minimizer
+        self.betas = betas
+        self.mapper = mapper
+        self.random_gen = random_gen
+        self.nstep = 0
+        self.nexchange = 0
+
+        # All replicas start from the same local minimum, and share the
+        # return object and the storage of the lowest minimum
+        first = BasinHoppingRunner(x0, minimizer, step_taking[0],
+                                   accept_tests[0], disp=disp)
+        self.res = first.res
+        self.storage = first.storage
+        self.replicas = [first]
+        for take_step, tests in zip(step_taking[1:], accept_tests[1:]):
+            replica = BasinHoppingRunner(x0, minimizer, take_step, tests,
+                                         disp=disp,
+                                         minres=first.storage.minres)
+            replica.res = self.res
+            replica.storage = self.storage
+            self.replicas.append(replica)
+
+    def one_cycle(self):
+        """Do one cycle of the parallel tempering algorithm
+        """
+        self.nstep += 1
+        new_global_min = False
+
+        # The local minimizations of the replicas are independent
+        x_after_step = [replica._take_step() for replica in self.replicas]
+        minres_list = self.mapper(self.minimizer, x_after_step)
+
+        for replica, minres in zip(self.replicas, minres_list):
+            replica.nstep += 1
+            accept = replica._accept_step(minres)
+            new_global_min |= replica._update(accept, minres)
+
+        self._exchange()
+
+        # save the trial minima of all replicas
+        self.xtrial = [replica.xtrial for replica in self.replicas]
+        self.energy_trial = [replica.energy_trial
+                             for replica in self.replicas]
+        self.accept = [replica.accept for replica in self.replicas]
+
+        return new_global_min
+
+    def _exchange(self):
+        """Exchange the coordinates of replicas at neighbouring temperatures
+        """
+        for i in range(len(self.replicas) - 1):
+            r1, r2 = self.replicas[i], self.replicas[i + 1]
+            with np.errstate(invalid='ignore'):
+                # As in `Metropolis`, an exchange between replicas with
+                # equal energy is always accepted
+                prod = (self.betas[i] - self.betas[i + 1]) * (r1.energy
+                                                              - r2.energy)
+                w = math.exp(min(0, prod))
+
+            if w >= self.random_gen.uniform():
+                r1.x, r2.x = r2.x, r1.x
+                r1.energy, r2.energy = r2.energy, r1.energy
+                self.nexchange += 1
+
+
 class AdaptiveStepsize:
     """
     Class to implement adaptive stepsize.
@@ -351,7 +463,7 @@ class Metropolis:
 def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
                  minimizer_kwargs=None, take_step=None, accept_test=None,
                  callback=None, interval=50, disp=False, niter_success=None,
-                 seed=None):
+                 seed=None, *, workers=1):
     """Find the global minimum of a function using the basin-hopping algorithm.
 
     Basin-hopping is a two-phase method that combines a global stepping
@@ -373,12 +485,19 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
         Initial guess.
     niter : integer, optional
         The number of basin-hopping iterations. There will be a total of
-        ``niter + 1`` runs of the local minimizer.
-    T : float, optional
+        ``niter + 1`` runs of the local minimizer, or ``niter * len(T) + 1``
+        if `T` is a sequence.
+    T : float or sequence of floats, optional
         The "temperature" parameter for the accept or reject criterion. Higher
         "temperatures" mean that larger jumps in function value will be
         accepted.  For best results ``T`` should be comparable to the
         separation (in function value) between local minima.
+        If a sequence, a replica of the basin-hopping walk is run at each
+        temperature, and replicas at neighbouring temperatures exchange their
+        coordinates after every iteration (parallel tempering). See Notes.
+
+        .. versionchanged:: 1.8.0
+            Sequences of temperatures are accepted.
     stepsize : float, optional
         Maximum step size for use in the random displacement.
     minimizer_kwargs : dict, optional
@@ -437,6 +556,18 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
         `take_step` and `accept_test`, and these functions use random
         number generation, then those functions are responsible for the state
         of their random number generator.
+    workers : int or map-like callable, optional
+        If `T` is a sequence, the local minimizations of the replicas in each
+        iteration are carried out in parallel
+        (uses `multiprocessing.Pool <multiprocessing>`).
+        Supply -1 to use all available CPU cores.
+        Alternatively supply a map-like callable, such as
+        `multiprocessing.Pool.map` for evaluating the local minimizations in
+        parallel. This evaluation is carried out as ``workers(minimizer,
+        iterable)``, and requires that `func` and the contents of
+        `minimizer_kwargs` be pickleable. Ignored if `T` is a scalar.
+
+        .. versionadded:: 1.8.0
 
     Returns
     -------
@@ -520,6 +651,22 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
     If ``T`` is 0, the algorithm becomes Monotonic Basin-Hopping, in which all
     steps that increase energy are rejected.
 
+    Parallel tempering: If ``T`` is a sequence of temperatures, a replica of
+    the walk is run at each temperature [6]_. Each replica takes its own
+    steps, with its own adaptive ``stepsize`` if the default step-taking
+    routine is used, and accepts them with the Metropolis criterion at its
+    own temperature. After every iteration, the replicas at temperatures
+    ``T[i]`` and ``T[i + 1]`` exchange their coordinates with probability::
+
+        min(1, exp( (1/T[i] - 1/T[i + 1]) * (func(x[i]) - func(x[i + 1])) ))
+
+    so that low minima found by the replicas at high temperatures, which
+    cross barriers easily, migrate to the replicas at low temperatures,
+    which refine them. The local minimizations of the replicas are
+    independent, and are distributed among `workers`. ``callback`` is called
+    for the trial minimum of every replica, and the lowest minimum found by
+    any replica is returned.
+
     .. versionadded:: 0.12.0
 
     References
@@ -538,6 +685,9 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
         a General and Versatile Optimization Framework for the Characterization
         of Biological Macromolecules, Advances in Artificial Intelligence,
         Volume 2012 (2012), Article ID 674832, :doi:`10.1155/2012/674832`
+    .. [6] Earl, D. J. and Deem, M. W., Parallel tempering: Theory,
+        applications, and new perspectives, Physical Chemistry Chemical
+        Physics, 2005, 7, 3910, :doi:`10.1039/B509983H`
 
     Examples
     --------
@@ -659,6 +809,12 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
     # set up the np.random generator
     rng = check_random_state(seed)
 
+    # a sequence of temperatures runs one replica at each temperature
+    parallel_tempering = np.ndim(T) > 0
+    temperatures = np.atleast_1d(np.asarray(T, dtype=float))
+    if temperatures.ndim != 1 or temperatures.size == 0:
+        raise ValueError("T must be a scalar or a non-empty 1-D sequence")
+
     # set up minimizer
     if minimizer_kwargs is None:
         minimizer_kwargs = dict()
@@ -676,56 +832,75 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
                                                  verbose=disp)
         else:
             take_step_wrapped = take_step
+        # a user supplied routine is shared by all replicas
+        take_steps = [take_step_wrapped] * temperatures.size
     else:
-        # use default
-        displace = RandomDisplacement(stepsize=stepsize, random_gen=rng)
-        take_step_wrapped = AdaptiveStepsize(displace, interval=interval,
-                                             verbose=disp)
+        # use default, with an adaptive stepsize for each replica
+        take_steps = []
+        for _ in temperatures:
+            displace = RandomDisplacement(stepsize=stepsize, random_gen=rng)
+            take_steps.append(AdaptiveStepsize(displace, interval=interval,
+                                               verbose=disp))
 
     # set up accept tests
-    accept_tests = []
+    user_tests = []
     if accept_test is not None:
         if not callable(accept_test):
             raise TypeError("accept_test must be callable")
-        accept_tests = [accept_test]
+        user_tests = [accept_test]
 
     # use default
-    metropolis = Metropolis(T, random_gen=rng)
-    accept_tests.append(metropolis)
+    accept_tests = [user_tests + [Metropolis(temperature, random_gen=rng)]
+                    for temperature in temperatures]
 
     if niter_success is None:
         niter_success = niter + 2
 
-    bh = BasinHoppingRunner(x0, wrapped_minimizer, take_step_wrapped,
-                            accept_tests, disp=disp)
-
-    # The wrapped minimizer is called once during construction of
-    # BasinHoppingRunner, so run the callback
-    if callable(callback):
-        callback(bh.storage.minres.x, bh.storage.minres.fun, True)
-
-    # start main iteration loop
-    count, i = 0, 0
-    message = ["requested number of basinhopping iterations completed"
-               " successfully"]
-    for i in range(niter):
-        new_global_min = bh.one_cycle()
+    # `workers` is ignored for a single replica, so no pool is created
+    with MapWrapper(workers if parallel_tempering else 1) as mapper:
+        if parallel_tempering:
+            # Avoid ZeroDivisionError as in `Metropolis`
+            with np.errstate(divide='ignore'):
+                betas = 1.0 / temperatures
+            bh = ParallelTemperingRunner(x0, wrapped_minimizer, take_steps,
+                                         accept_tests, betas, mapper, rng,
+                                         disp=disp)
+        else:
+            bh = BasinHoppingRunner(x0, wrapped_minimizer, take_steps[0],
+                                    accept_tests[0], disp=disp)
 
+        # The wrapped minimizer is called once during construction of
+        # BasinHoppingRunner, so run the callback
         if callable(callback):
-            # should we pass a copy of x?
-            val = callback(bh.xtrial, bh.energy_trial, bh.accept)
-            if val is not None:
-                if val:
+            callback(bh.storage.minres.x, bh.storage.minres.fun, True)
+
+        # start main iteration loop
+        count, i = 0, 0
+        message = ["requested number of basinhopping iterations completed"
+                   " successfully"]
+        for i in range(niter):
+            new_global_min = bh.one_cycle()
+
+            if callable(callback):
+                # should we pass a copy of x?
+                if parallel_tempering:
+                    trials = zip(bh.xtrial, bh.energy_trial, bh.accept)
+                else:
+                    trials = [(bh.xtrial, bh.energy_trial, bh.accept)]
+                # every replica's callback is called, even if an earlier
+                # one requests a stop
+                stops = [callback(*trial) for trial in trials]
+                if any(stops):
                     message = ["callback function requested stop early by"
                                "returning True"]
                     break
 
-        count += 1
-        if new_global_min:
-            count = 0
-        elif count > niter_success:
-            message = ["success condition satisfied"]
-            break
+            count += 1
+            if new_global_min:
+                count = 0
+            elif count > niter_success:
+                message = ["success condition satisfied"]
+                break
 
     # prepare return object
     res = bh.res
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import numpy as np
 import scipy.sparse as sps
 from ._numdiff import approx_derivative, group_columns
@@ -8,6 +10,102 @@ from scipy.sparse.linalg import LinearOperator
 FD_METHODS = ('2-point', '3-point', 'cs')
 
 
+class _CountedMap:
+    """Map-like callable evaluating with the map-like callable `workers`,
+    which adds the number of evaluations to the ``nfev`` attribute of `owner`.
+    """
+    def __init__(self, workers, owner):
+        self.workers = workers
+        self.owner = owner
+
+    def __call__(self, func, iterable):
+        values = list(self.workers(func, iterable))
+        self.owner.nfev += len(values)
+        return values
+
+
+class _EvaluationCache:
+    """Least recently used cache of evaluations at up to `maxsize` points,
+    keyed on the exact bytes of ``x``.
+    """
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("`cache_size` must be a positive integer.")
+        self.maxsize = int(maxsize)
+        self._entries = OrderedDict()
+
+    def get(self, key, name):
+        entry = self._entries.get(key)
+        if entry is None or name not in entry:
+            return None
+        self._entries.move_to_end(key)
+        return _copy_value(entry[name])
+
+    def put(self, key, name, value):
+        self._entries.setdefault(key, {})[name] = _copy_value(value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _copy_value(value):
+    # Cached arrays are copied both ways, so that modifying a returned value
+    # in place doesn't alter the cache
+    if isinstance(value, np.ndarray) or sps.issparse(value):
+        return value.copy()
+    return value
+
+
+def _cached_update(owner, update, name):
+    """Wrap `update`, which sets the attribute `name` of `owner` at
+    ``owner.x``, to look the value up in the evaluation cache of `owner`
+    first. Cache hits are counted in ``owner.ncache_hits``.
+    """
+    cache = owner._cache
+    if cache is None:
+        return update
+
+    def cached_update():
+        key = owner.x.tobytes()
+        value = cache.get(key, name)
+        if value is None:
+            update()
+            cache.put(key, name, getattr(owner, name))
+        else:
+            owner.ncache_hits += 1
+            setattr(owner, name, value)
+
+    return cached_update
+
+
+def _prepare_finite_diff(owner, fun, args, fun_wrapped, finite_diff_options,
+                         workers, vectorized):
+    """Select the function evaluated at the points of a finite difference
+    scheme and set the corresponding options of `approx_derivative`.
+
+    `fun_wrapped` evaluates a single point and counts the evaluation in the
+    ``nfev`` attribute of `owner`; the evaluations of a vectorized `fun` or
+    by `workers` are counted in the same way.
+    """
+    if vectorized:
+        def fun_vectorized(x):
+            owner.nfev += x.shape[-1]
+            return fun(np.copy(x), *args)
+
+        finite_diff_options["vectorized"] = True
+        return fun_vectorized
+    elif workers != 1:
+        if not callable(workers):
+            raise ValueError("`workers` must be 1 or a map-like callable.")
+        # The points are evaluated by the workers, so `fun` itself, which
+        # must be pickleable, is passed on
+        finite_diff_options["args"] = args
+        finite_diff_options["workers"] = _CountedMap(workers, owner)
+        return fun
+    else:
+        return fun_wrapped
+
+
 class ScalarFunction:
     """Scalar function and its derivatives.
 
@@ -71,6 +169,21 @@ class ScalarFunction:
         For ``method='3-point'`` the sign of `epsilon` is ignored. By default
         relative steps are used, only if ``epsilon is not None`` are absolute
         steps used.
+    workers : 1 or map-like callable, optional
+        Used to evaluate the points of a finite difference gradient in
+        parallel, see `approx_derivative`. Requires that `fun` be pickleable
+        if ``workers != 1``. The minimizers accept an integer, for which
+        they create a pool used throughout the minimization.
+    vectorized : bool, optional
+        If True, the points of a finite difference gradient are sent to `fun`
+        in a single call, as an array of shape (n, S), and `fun` should return
+        an array of shape (S,). See `approx_derivative`.
+    cache_size : int, optional
+        If given, the function values and gradients at up to `cache_size`
+        points are kept in a least recently used cache, keyed on the exact
+        bytes of ``x``. Revisiting a cached point then doesn't evaluate `fun`
+        or `grad` again; such lookups are counted in the ``ncache_hits``
+        attribute. By default only the last point is memoized.
 
     Notes
     -----
@@ -84,7 +197,8 @@ class ScalarFunction:
            of *any* of the methods may overwrite the attribute.
     """
     def __init__(self, fun, x0, args, grad, hess, finite_diff_rel_step,
-                 finite_diff_bounds, epsilon=None):
+                 finite_diff_bounds, epsilon=None, *, workers=1,
+                 vectorized=False, cache_size=None):
         if not callable(grad) and grad not in FD_METHODS:
             raise ValueError(
                 f"`grad` must be either callable or one of {FD_METHODS}."
@@ -109,9 +223,12 @@ class ScalarFunction:
         self.nfev = 0
         self.ngev = 0
         self.nhev = 0
+        self.ncache_hits = 0
         self.f_updated = False
         self.g_updated = False
         self.H_updated = False
+        self._cache = (None if cache_size is None
+                       else _EvaluationCache(cache_size))
 
         finite_diff_options = {}
         if grad in FD_METHODS:
@@ -146,9 +263,15 @@ class ScalarFunction:
         def update_fun():
             self.f = fun_wrapped(self.x)
 
-        self._update_fun_impl = update_fun
+        self._update_fun_impl = _cached_update(self, update_fun, 'f')
         self._update_fun()
 
+        # Function evaluation at the points of a finite difference gradient
+        if grad in FD_METHODS:
+            fun_fd = _prepare_finite_diff(self, fun, args, fun_wrapped,
+                                          finite_diff_options, workers,
+                                          vectorized)
+
         # Gradient evaluation
         if callable(grad):
             def grad_wrapped(x):
@@ -162,10 +285,10 @@ class ScalarFunction:
             def update_grad():
                 self._update_fun()
                 self.ngev += 1
-                self.g = approx_derivative(fun_wrapped, self.x, f0=self.f,
+                self.g = approx_derivative(fun_fd, self.x, f0=self.f,
                                            **finite_diff_options)
 
-        self._update_grad_impl = update_grad
+        self._update_grad_impl = _cached_update(self, update_grad, 'g')
         self._update_grad()
 
         # Hessian Evaluation
@@ -285,6 +408,12 @@ class VectorFunction:
     This class defines a vector function F: R^n->R^m and methods for
     computing or approximating its first and second derivatives.
 
+    The `workers` and `vectorized` keywords are used for the finite
+    difference Jacobian as in `ScalarFunction`, with a vectorized `fun`
+    returning an array of shape (m, S). With `cache_size`, the function values
+    and Jacobians at up to `cache_size` points are kept in a least recently
+    used cache, with hits counted in the ``ncache_hits`` attribute.
+
     Notes
     -----
     This class implements a memoization logic. There are methods `fun`,
@@ -298,7 +427,8 @@ class VectorFunction:
     """
     def __init__(self, fun, x0, jac, hess,
                  finite_diff_rel_step, finite_diff_jac_sparsity,
-                 finite_diff_bounds, sparse_jacobian):
+                 finite_diff_bounds, sparse_jacobian, *, workers=1,
+                 vectorized=False, cache_size=None):
         if not callable(jac) and jac not in FD_METHODS:
             raise ValueError("`jac` must be either callable or one of {}."
                              .format(FD_METHODS))
@@ -320,9 +450,12 @@ class VectorFunction:
         self.nfev = 0
         self.njev = 0
         self.nhev = 0
+        self.ncache_hits = 0
         self.f_updated = False
         self.J_updated = False
         self.H_updated = False
+        self._cache = (None if cache_size is None
+                       else _EvaluationCache(cache_size))
 
         finite_diff_options = {}
         if jac in FD_METHODS:
@@ -353,12 +486,18 @@ class VectorFunction:
         def update_fun():
             self.f = fun_wrapped(self.x)
 
-        self._update_fun_impl = update_fun
-        update_fun()
+        self._update_fun_impl = _cached_update(self, update_fun, 'f')
+        self._update_fun_impl()
 
         self.v = np.zeros_like(self.f)
         self.m = self.v.size
 
+        # Function evaluation at the points of a finite difference Jacobian
+        if jac in FD_METHODS:
+            fun_fd = _prepare_finite_diff(self, fun, (), fun_wrapped,
+                                          finite_diff_options, workers,
+                                          vectorized)
+
         # Jacobian Evaluation
         if callable(jac):
             self.J = jac(self.x)
@@ -391,7 +530,7 @@ class VectorFunction:
                 self.J = jac_wrapped(self.x)
 
         elif jac in FD_METHODS:
-            self.J = approx_derivative(fun_wrapped, self.x, f0=self.f,
+            self.J = approx_derivative(fun_fd, self.x, f0=self.f,
                                        **finite_diff_options)
             self.J_updated = True
 
@@ -400,7 +539,7 @@ class VectorFunction:
                 def update_jac():
                     self._update_fun()
                     self.J = sps.csr_matrix(
-                        approx_derivative(fun_wrapped, self.x, f0=self.f,
+                        approx_derivative(fun_fd, self.x, f0=self.f,
                                           **finite_diff_options))
                 self.J = sps.csr_matrix(self.J)
                 self.sparse_jacobian = True
@@ -408,7 +547,7 @@ class VectorFunction:
             elif sps.issparse(self.J):
                 def update_jac():
                     self._update_fun()
-                    self.J = approx_derivative(fun_wrapped, self.x, f0=self.f,
+                    self.J = approx_derivative(fun_fd, self.x, f0=self.f,
                                                **finite_diff_options).toarray()
                 self.J = self.J.toarray()
                 self.sparse_jacobian = False
@@ -417,12 +556,14 @@ class VectorFunction:
                 def update_jac():
                     self._update_fun()
                     self.J = np.atleast_2d(
-                        approx_derivative(fun_wrapped, self.x, f0=self.f,
+                        approx_derivative(fun_fd, self.x, f0=self.f,
                                           **finite_diff_options))
                 self.J = np.atleast_2d(self.J)
                 self.sparse_jacobian = False
 
-        self._update_jac_impl = update_jac
+        self._update_jac_impl = _cached_update(self, update_jac, 'J')
+        if self._cache is not None:
+            self._cache.put(self.x.tobytes(), 'J', self.J)
 
         # Define Hessian
         if callable(hess):
@@ -3,6 +3,8 @@ differential_evolution: The differential evolution global optimization algorithm
 Added by Andrew Nelson 2014
 """
 import warnings
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 
 import numpy as np
 from scipy.optimize import OptimizeResult, minimize
@@ -24,7 +26,8 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
                            mutation=(0.5, 1), recombination=0.7, seed=None,
                            callback=None, disp=False, polish=True,
                            init='latinhypercube', atol=0, updating='immediate',
-                           workers=1, constraints=(), x0=None):
+                           workers=1, constraints=(), x0=None, *,
+                           vectorized=False):
     """Finds the global minimum of a multivariate function.
 
     Differential Evolution is stochastic in nature (does not use gradient
@@ -155,18 +158,29 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
         ``np.std(pop) <= atol + tol * np.abs(np.mean(population_energies))``,
         where and `atol` and `tol` are the absolute and relative tolerance
         respectively.
-    updating : {'immediate', 'deferred'}, optional
+    updating : {'immediate', 'deferred', 'async'}, optional
         If ``'immediate'``, the best solution vector is continuously updated
         within a single generation [4]_. This can lead to faster convergence as
         trial vectors can take advantage of continuous improvements in the best
         solution.
         With ``'deferred'``, the best solution vector is updated once per
-        generation. Only ``'deferred'`` is compatible with parallelization, and
-        the `workers` keyword can over-ride this option.
+        generation. ``'deferred'`` is compatible with parallelization, and
+        the `workers` keyword can over-ride ``'immediate'`` to this option.
+        With ``'async'``, trial vectors are evaluated by `workers`
+        concurrently, without synchronizing at the end of each generation: as
+        soon as the oldest pending trial has been evaluated it is merged into
+        the population, and a new trial is submitted. The trials are merged
+        in the order in which they were submitted, so that the solution is
+        reproducible for a given `seed` and number of workers; only the
+        count of evaluations still in progress when the solver stops, which
+        are included in ``nfev``, depends on timing. This keeps the workers
+        busy when the cost of `func` varies. See Notes.
 
         .. versionadded:: 1.2.0
+        .. versionchanged:: 1.8.0
+           Added ``'async'``.
 
-    workers : int or map-like callable, optional
+    workers : int, map-like callable or `concurrent.futures.Executor`, optional
         If `workers` is an int the population is subdivided into `workers`
         sections and evaluated in parallel
         (uses `multiprocessing.Pool <multiprocessing>`).
@@ -175,7 +189,12 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
         `multiprocessing.Pool.map` for evaluating the population in parallel.
         This evaluation is carried out as ``workers(func, iterable)``.
         This option will override the `updating` keyword to
-        ``updating='deferred'`` if ``workers != 1``.
+        ``updating='deferred'`` if ``workers != 1`` and
+        ``updating='immediate'``.
+        With ``updating='async'``, `workers` must be an int, in which case a
+        `concurrent.futures.ProcessPoolExecutor` is used, or an executor
+        such as `concurrent.futures.ThreadPoolExecutor`, to which the trials
+        are submitted as ``workers.submit(func, x)``.
         Requires that `func` be pickleable.
 
         .. versionadded:: 1.2.0
@@ -193,6 +212,25 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
 
         .. versionadded:: 1.7.0
 
+    vectorized : bool, optional
+        If ``vectorized is True``, `func` is sent an `x` array with
+        ``x.shape == (N, S)``, and is expected to return an array of shape
+        ``(S,)``, where `S` is the number of solution vectors to be
+        calculated. The whole trial population of a generation is then
+        evaluated in a single call, which removes the overhead of a Python
+        call per solution for cheap objectives. If constraints are applied,
+        each of the functions used to construct a `Constraint` object should
+        accept an `x` array with ``x.shape == (N, S)``, and return an array
+        of shape ``(M, S)``, where `M` is the number of constraint
+        components. During polishing and for the final check of the
+        constraints the functions are called with a single solution, as
+        ``x.shape == (N, 1)`` for `func` and ``x.shape == (N,)`` for the
+        constraint functions.
+        This option will override the `updating` keyword to
+        ``updating='deferred'`` and takes precedence over `workers`.
+
+        .. versionadded:: 1.8.0
+
     Returns
     -------
     res : OptimizeResult
@@ -244,6 +282,13 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
     solutions. To use the original Storn and Price behaviour, updating the best
     solution once per iteration, set ``updating='deferred'``.
 
+    With ``updating='async'``, a trial for each member of the population is
+    pending at any time; this is a steady-state variant of the algorithm, in
+    which the population is updated one trial at a time. A trial whose
+    evaluation is slow delays the merging, but not the evaluation, of the
+    trials submitted after it. A generation corresponds to as many merged
+    trials as there are members of the population.
+
     .. versionadded:: 0.15.0
 
     Examples
@@ -325,7 +370,8 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
                                      updating=updating,
                                      workers=workers,
                                      constraints=constraints,
-                                     x0=x0) as solver:
+                                     x0=x0,
+                                     vectorized=vectorized) as solver:
         ret = solver.solve()
 
     return ret
@@ -460,15 +506,17 @@ class DifferentialEvolutionSolver:
         ``np.std(pop) <= atol + tol * np.abs(np.mean(population_energies))``,
         where and `atol` and `tol` are the absolute and relative tolerance
         respectively.
-    updating : {'immediate', 'deferred'}, optional
+    updating : {'immediate', 'deferred', 'async'}, optional
         If `immediate` the best solution vector is continuously updated within
         a single generation. This can lead to faster convergence as trial
         vectors can take advantage of continuous improvements in the best
         solution.
         With `deferred` the best solution vector is updated once per
-        generation. Only `deferred` is compatible with parallelization, and the
-        `workers` keyword can over-ride this option.
-    workers : int or map-like callable, optional
+        generation. `deferred` is compatible with parallelization, and the
+        `workers` keyword can over-ride `immediate` to this option.
+        With `async` the trials are evaluated concurrently and merged one at
+        a time, in the order in which they were submitted.
+    workers : int, map-like callable or `concurrent.futures.Executor`, optional
         If `workers` is an int the population is subdivided into `workers`
         sections and evaluated in parallel
         (uses `multiprocessing.Pool <multiprocessing>`).
@@ -477,7 +525,9 @@ class DifferentialEvolutionSolver:
         `multiprocessing.Pool.map` for evaluating the population in parallel.
         This evaluation is carried out as ``workers(func, iterable)``.
         This option will override the `updating` keyword to
-        `updating='deferred'` if `workers != 1`.
+        `updating='deferred'` if `workers != 1` and `updating='immediate'`.
+        With `updating='async'` it must be an int or an executor, to which
+        the trials are submitted.
         Requires that `func` be pickleable.
     constraints : {NonLinearConstraint, LinearConstraint, Bounds}
         Constraints on the solver, over and above those applied by the `bounds`
@@ -486,6 +536,14 @@ class DifferentialEvolutionSolver:
         Provides an initial guess to the minimization. Once the population has
         been initialized this vector replaces the first (best) member. This
         replacement is done even if `init` is given an initial population.
+    vectorized : bool, optional
+        If ``vectorized is True``, `func` is sent an `x` array with
+        ``x.shape == (N, S)``, and is expected to return an array of shape
+        ``(S,)``, where `S` is the number of solution vectors to be
+        calculated. Constraint functions should then accept an `x` array with
+        ``x.shape == (N, S)`` and return an array of shape ``(M, S)``.
+        This option will override the `updating` keyword to
+        ``updating='deferred'`` and takes precedence over `workers`.
     """
 
     # Dispatch of mutation strategy method (binomial or exponential).
@@ -511,7 +569,7 @@ class DifferentialEvolutionSolver:
                  tol=0.01, mutation=(0.5, 1), recombination=0.7, seed=None,
                  maxfun=np.inf, callback=None, disp=False, polish=True,
                  init='latinhypercube', atol=0, updating='immediate',
-                 workers=1, constraints=(), x0=None):
+                 workers=1, constraints=(), x0=None, *, vectorized=False):
 
         if strategy in self._binomial:
             self.mutation_func = getattr(self, self._binomial[strategy])
@@ -525,9 +583,24 @@ class DifferentialEvolutionSolver:
         self.polish = polish
 
         # set the updating / parallelisation options
-        if updating in ['immediate', 'deferred']:
+        if updating in ['immediate', 'deferred', 'async']:
             self._updating = updating
 
+        # the population is sent to a vectorized function all at once
+        self.vectorized = vectorized
+        if vectorized:
+            if workers != 1:
+                warnings.warn("differential_evolution: the 'vectorized' "
+                              "keyword has overridden workers=%r" % workers,
+                              UserWarning)
+                workers = 1
+            if updating != 'deferred':
+                warnings.warn("differential_evolution: the 'vectorized' "
+                              "keyword has overridden updating=%r "
+                              "to updating='deferred'" % updating,
+                              UserWarning)
+                self._updating = 'deferred'
+
         # want to use parallelisation, but updating is immediate
         if workers != 1 and updating == 'immediate':
             warnings.warn("differential_evolution: the 'workers' keyword has"
@@ -535,6 +608,25 @@ class DifferentialEvolutionSolver:
                           " updating='deferred'", UserWarning)
             self._updating = 'deferred'
 
+        # the executor to which trials are submitted for 'async' updating;
+        # it also evaluates the initial population
+        self._executor = None
+        self._own_executor = False
+        if self._updating == 'async':
+            if hasattr(workers, 'submit'):
+                self._executor = workers
+            elif callable(workers):
+                raise ValueError("updating='async' requires `workers` to be "
+                                 "an int or a `concurrent.futures.Executor`")
+            elif int(workers) != 1:
+                self._executor = ProcessPoolExecutor(
+                    None if int(workers) == -1 else int(workers))
+                self._own_executor = True
+            self._pending = deque()
+            self._async_candidate = 0
+            if self._executor is not None:
+                workers = self._executor.map
+
         # an object with a map method.
         self._mapwrapper = MapWrapper(workers)
 
@@ -879,6 +971,9 @@ class DifferentialEvolutionSolver:
             status_message = _status_message['maxiter']
             warning_flag = True
 
+        if self._updating == 'async':
+            self._cancel_pending()
+
         DE_result = OptimizeResult(
             x=self.x,
             fun=self.population_energies[0],
@@ -900,7 +995,13 @@ class DifferentialEvolutionSolver:
                                   " attempting to polish from the least"
                                   " infeasible solution", UserWarning)
 
-            result = minimize(self.func,
+            if self.vectorized:
+                def polish_func(x):
+                    return np.atleast_1d(self.func(x[:, np.newaxis]))[0]
+            else:
+                polish_func = self.func
+
+            result = minimize(polish_func,
                               np.copy(DE_result.x),
                               method=polish_method,
                               bounds=self.limits.T,
@@ -962,6 +1063,18 @@ class DifferentialEvolutionSolver:
         energies = np.full(num_members, np.inf)
 
         parameters_pop = self._scale_parameters(population)
+        if self.vectorized:
+            if nfevs > 0:
+                calc_energies = np.atleast_1d(
+                    self.func(parameters_pop[0:nfevs].T))
+                if calc_energies.shape != (nfevs,):
+                    raise RuntimeError(
+                        "The vectorized function must return an array of "
+                        "shape (S,) when given an array of shape (N, S)")
+                energies[0:nfevs] = calc_energies
+            self._nfev += nfevs
+            return energies
+
         try:
             calc_energies = list(self._mapwrapper(self.func,
                                                   parameters_pop[0:nfevs]))
@@ -1042,8 +1155,13 @@ class DifferentialEvolutionSolver:
 
         parameters_pop = self._scale_parameters(population)
 
-        constraint_violation = np.array([self._constraint_violation_fn(x)
-                                         for x in parameters_pop])
+        if self.vectorized:
+            constraint_violation = np.concatenate(
+                [c.violation_vectorized(parameters_pop.T)
+                 for c in self._wrapped_constraints]).T
+        else:
+            constraint_violation = np.array(
+                [self._constraint_violation_fn(x) for x in parameters_pop])
         feasible = ~(np.sum(constraint_violation, axis=1) > 0)
 
         return feasible, constraint_violation
@@ -1055,8 +1173,59 @@ class DifferentialEvolutionSolver:
         return self
 
     def __exit__(self, *args):
+        if self._updating == 'async':
+            self._cancel_pending()
+            if self._own_executor:
+                self._executor.shutdown()
         return self._mapwrapper.__exit__(*args)
 
+    def _cancel_pending(self):
+        # trials that are still pending when the solver stops are discarded;
+        # those whose evaluation already started can't be cancelled and
+        # count as function evaluations
+        for *_, future in self._pending:
+            if future is not None and not future.cancel():
+                self._nfev += 1
+        self._pending.clear()
+
+    def _submit_trials(self):
+        """
+        Submit trials for 'async' updating until the window is full.
+
+        The candidates are targeted in turn, so that each of them has at
+        most one pending trial. A trial is created from the population as it
+        is when the trial is submitted; infeasible trials are not evaluated.
+        The number of pending evaluations is limited by `maxfun`.
+        """
+        # every member has a trial pending when there are workers, so that
+        # they stay busy while the oldest trial is waited for; without
+        # workers the trials are evaluated one at a time, only when they are
+        # about to be merged
+        window = self.num_population_members if self._executor else 1
+        n_evals = sum(future is not None for *_, future in self._pending)
+        while (len(self._pending) < window
+               and self._nfev + n_evals < self.maxfun):
+            candidate = self._async_candidate
+            self._async_candidate = ((candidate + 1)
+                                     % self.num_population_members)
+
+            trial = self._mutate(candidate)
+            self._ensure_constraint(trial)
+            feasible, cv = self._calculate_population_feasibilities(
+                trial[np.newaxis, :])
+
+            future = None
+            if feasible[0]:
+                parameters = self._scale_parameters(trial)
+                if self._executor is not None:
+                    future = self._executor.submit(self.func, parameters)
+                else:
+                    future = Future()
+                    future.set_result(self.func(parameters))
+                n_evals += 1
+            self._pending.append((candidate, trial, feasible[0], cv[0],
+                                  future))
+
     def _accept_trial(self, energy_trial, feasible_trial, cv_trial,
                       energy_orig, feasible_orig, cv_orig):
         """
@@ -1180,6 +1349,37 @@ class DifferentialEvolutionSolver:
                                           self.constraint_violation[0]):
                         self._promote_lowest_energy()
 
+        elif self._updating == 'async':
+            # steady-state updating: trials are evaluated concurrently and
+            # merged one at a time, in the order in which they were
+            # submitted, so that the result doesn't depend on timing
+            for _ in range(self.num_population_members):
+                self._submit_trials()
+                if not self._pending:
+                    raise StopIteration
+
+                candidate, trial, feasible, cv, future = (
+                    self._pending.popleft())
+                energy = np.inf
+                if future is not None:
+                    energy = future.result()
+                    self._nfev += 1
+
+                if self._accept_trial(energy, feasible, cv,
+                                      self.population_energies[candidate],
+                                      self.feasible[candidate],
+                                      self.constraint_violation[candidate]):
+                    self.population[candidate] = trial
+                    self.population_energies[candidate] = energy
+                    self.feasible[candidate] = feasible
+                    self.constraint_violation[candidate] = cv
+
+                    if self._accept_trial(energy, feasible, cv,
+                                          self.population_energies[0],
+                                          self.feasible[0],
+                                          self.constraint_violation[0]):
+                        self._promote_lowest_energy()
+
         elif self._updating == 'deferred':
             # update best solution once per generation
             if self._nfev >= self.maxfun:
@@ -1202,11 +1402,12 @@ class DifferentialEvolutionSolver:
             trial_energies[feasible] = self._calculate_population_energies(
                 trial_pop[feasible])
 
-            # which solutions are 'improved'?
-            loc = [self._accept_trial(*val) for val in
-                   zip(trial_energies, feasible, cv, self.population_energies,
-                       self.feasible, self.constraint_violation)]
-            loc = np.array(loc)
+            # which solutions are 'improved'? The criteria of
+            # `_accept_trial`, for the whole population at once
+            loc = np.where(
+                feasible,
+                ~self.feasible | (trial_energies <= self.population_energies),
+                np.all(cv <= self.constraint_violation, axis=1))
             self.population = np.where(loc[:, np.newaxis],
                                        trial_pop,
                                        self.population)
@@ -1397,6 +1598,7 @@ class _ConstraintWrapper:
 
         f0 = fun(x0)
         m = f0.size
+        self.num_constr = m
 
         if lb.ndim == 0:
             lb = np.resize(lb, m)
@@ -1428,3 +1630,31 @@ class _ConstraintWrapper:
         excess_ub = np.maximum(ev - self.bounds[1], 0)
 
         return excess_lb + excess_ub
+
+    def violation_vectorized(self, x):
+        """How much the constraint is exceeded by, for many solutions at once.
+
+        Parameters
+        ----------
+        x : ndarray
+            Solution vectors, of shape ``(N, S)``.
+
+        Returns
+        -------
+        excess : ndarray
+            How much the constraint is exceeded by, for each of the
+            constraints specified by `_ConstraintWrapper.fun` and each of the
+            `S` solutions. Has shape ``(M, S)``.
+        """
+        S = x.shape[1]
+        ev = np.asarray(self.fun(x))
+        if ev.size != self.num_constr * S:
+            raise RuntimeError("A vectorized constraint function must return "
+                               "an array of shape (M, S) when given an array "
+                               "of shape (N, S)")
+        ev = ev.reshape(self.num_constr, S)
+
+        excess_lb = np.maximum(self.bounds[0][:, np.newaxis] - ev, 0)
+        excess_ub = np.maximum(ev - self.bounds[1][:, np.newaxis], 0)
+
+        return excess_lb + excess_ub
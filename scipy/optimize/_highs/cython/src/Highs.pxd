@@ -41,10 +41,19 @@ cdef extern from "Highs.h":
         HighsStatus writeSolution(const string filename, const bool pretty) const
 
         HighsStatus setBasis()
+        HighsStatus setBasis(const HighsBasis& basis)
         const HighsSolution& getSolution() const
         const HighsBasis& getBasis() const
+        const HighsLp& getLp() const
 
         bool changeObjectiveSense(const ObjSense sense)
+        bool changeColsCost(const int num_set_entries, const int* set, const double* cost)
+        bool changeColsBounds(const int num_set_entries, const int* set, const double* lower, const double* upper)
+        bool changeRowsBounds(const int num_set_entries, const int* set, const double* lower, const double* upper)
+        bool changeCoeff(const int row, const int col, const double value)
+        bool addRows(const int num_new_row, const double* lower, const double* upper,
+                     const int num_new_nz, const int* starts, const int* indices, const double* values)
+        bool deleteRows(const int num_set_entries, const int* set)
 
         HighsStatus setHighsOptionValueBool "setHighsOptionValue" (const string & option, const bool value)
         HighsStatus setHighsOptionValueInt "setHighsOptionValue" (const string & option, const int value)
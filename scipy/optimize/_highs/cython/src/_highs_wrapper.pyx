@@ -11,6 +11,7 @@ from libc.stdio cimport stdout
 from libcpp.string cimport string
 from libcpp.memory cimport unique_ptr
 from libcpp.map cimport map as cppmap
+from libcpp.vector cimport vector
 
 from .HighsIO cimport (
     ML_NONE,
@@ -37,7 +38,9 @@ from .HConst cimport (
     HighsOptionTypeDOUBLE,
     HighsOptionTypeSTRING,
 
+    HighsBasisStatus,
     HighsBasisStatusLOWER,
+    HighsBasisStatusBASIC,
     HighsBasisStatusUPPER,
 )
 from .Highs cimport Highs
@@ -565,12 +568,45 @@ def _highs_wrapper(
     '''
 
 
+    # Fill up a HighsLp object
+    cdef HighsLp lp
+    _fill_lp(lp, c, astart, aindex, avalue, lhs, rhs, lb, ub)
+
+    # Create the options
+    cdef Highs highs
+    apply_options(options, highs)
+
+    # Make a Highs object and pass it everything
+    cdef HighsModelStatus err_model_status = HighsModelStatusNOTSET
+    cdef HighsStatus init_status = highs.passModel(lp)
+    if init_status != HighsStatusOK:
+        if init_status != HighsStatusWarning:
+            err_model_status = HighsModelStatusMODEL_ERROR
+            return {
+                'status': <int> err_model_status,
+                'message': highs.highsModelStatusToString(err_model_status).decode(),
+            }
+
+    # Solve the LP
+    highs.setBasis()
+    return _run(highs)
+
+
+cdef _fill_lp(
+        HighsLp & lp,
+        double[::1] c,
+        int[::1] astart,
+        int[::1] aindex,
+        double[::1] avalue,
+        double[::1] lhs,
+        double[::1] rhs,
+        double[::1] lb,
+        double[::1] ub):
+    '''Fill up a HighsLp object from the arrays of the problem.'''
     cdef int numcol = c.size
     cdef int numrow = rhs.size
     cdef int numnz = avalue.size
 
-    # Fill up a HighsLp object
-    cdef HighsLp lp
     lp.numCol_ = numcol
     lp.numRow_ = numrow
 
@@ -628,23 +664,11 @@ def _highs_wrapper(
         lp.Aindex_.empty()
         lp.Avalue_.empty()
 
-    # Create the options
-    cdef Highs highs
-    apply_options(options, highs)
-
-    # Make a Highs object and pass it everything
-    cdef HighsModelStatus err_model_status = HighsModelStatusNOTSET
-    cdef HighsStatus init_status = highs.passModel(lp)
-    if init_status != HighsStatusOK:
-        if init_status != HighsStatusWarning:
-            err_model_status = HighsModelStatusMODEL_ERROR
-            return {
-                'status': <int> err_model_status,
-                'message': highs.highsModelStatusToString(err_model_status).decode(),
-            }
 
-    # Solve the LP
-    highs.setBasis()
+cdef dict _run(Highs & highs):
+    '''Solve the LP passed to `highs` and extract the solution.'''
+    cdef int numcol = highs.getLp().numCol_
+    cdef int numrow = highs.getLp().numRow_
     cdef HighsStatus run_status = highs.run()
     if run_status == HighsStatusError:
         return {
@@ -704,7 +728,8 @@ def _highs_wrapper(
 
             # Ax + s = b => Ax = b - s
             # Note: this is for all constraints (A_ub and A_eq)
-            'slack': [rhs[ii] - solution.row_value[ii] for ii in range(numrow)],
+            'slack': [highs.getLp().rowUpper_[ii] - solution.row_value[ii]
+                      for ii in range(numrow)],
 
             # slacks in HiGHS appear as Ax - s, not Ax + s, so lambda is negated;
             # lambda are the lagrange multipliers associated with Ax=b
@@ -716,3 +741,139 @@ def _highs_wrapper(
             'ipm_nit': info.ipm_iteration_count,
             'crossover_nit': info.crossover_iteration_count,
         }
+
+
+cdef class _HighsModel:
+    '''Persistent HiGHS model for incremental changes and warm starts.
+
+    The problem is passed as for `_highs_wrapper`. The HiGHS instance is
+    kept alive between calls of `run`, so that after changing the costs,
+    bounds, coefficients or rows of the LP, the simplex solver restarts
+    from the basis of the previous solution instead of solving the new LP
+    from scratch. Presolve is only used by the first solve, or when no
+    valid basis is available.
+
+    Indices of columns and rows passed to the methods must be in
+    increasing order.
+    '''
+    cdef Highs * highs
+    cdef HighsStatus init_status
+
+    def __cinit__(
+            self,
+            double[::1] c,
+            int[::1] astart,
+            int[::1] aindex,
+            double[::1] avalue,
+            double[::1] lhs,
+            double[::1] rhs,
+            double[::1] lb,
+            double[::1] ub,
+            dict options):
+        cdef HighsLp lp
+        _fill_lp(lp, c, astart, aindex, avalue, lhs, rhs, lb, ub)
+
+        self.highs = new Highs()
+        apply_options(options, self.highs[0])
+        self.init_status = self.highs.passModel(lp)
+        self.highs.setBasis()
+
+    def __dealloc__(self):
+        del self.highs
+
+    def run(self):
+        '''Solve the LP, starting from the last basis if there is one.'''
+        cdef HighsModelStatus err_model_status = HighsModelStatusMODEL_ERROR
+        if (self.init_status != HighsStatusOK and
+                self.init_status != HighsStatusWarning):
+            return {
+                'status': <int> err_model_status,
+                'message': self.highs.highsModelStatusToString(err_model_status).decode(),
+            }
+        return _run(self.highs[0])
+
+    def set_options(self, dict options):
+        '''Apply options, as for `_highs_wrapper`, to the next solves.'''
+        apply_options(options, self.highs[0])
+
+    def clear_basis(self):
+        '''Forget the basis, so that the next `run` starts from scratch.'''
+        self.highs.setBasis()
+
+    def change_col_costs(self, int[::1] indices, double[::1] cost):
+        if indices.size and not self.highs.changeColsCost(
+                indices.size, &indices[0], &cost[0]):
+            raise ValueError("HiGHS could not change the column costs.")
+
+    def change_col_bounds(self, int[::1] indices, double[::1] lower,
+                          double[::1] upper):
+        if indices.size and not self.highs.changeColsBounds(
+                indices.size, &indices[0], &lower[0], &upper[0]):
+            raise ValueError("HiGHS could not change the column bounds.")
+
+    def change_row_bounds(self, int[::1] indices, double[::1] lower,
+                          double[::1] upper):
+        if indices.size and not self.highs.changeRowsBounds(
+                indices.size, &indices[0], &lower[0], &upper[0]):
+            raise ValueError("HiGHS could not change the row bounds.")
+
+    def change_coeffs(self, int[::1] rows, int[::1] cols,
+                      double[::1] values):
+        cdef Py_ssize_t ii
+        for ii in range(rows.size):
+            if not self.highs.changeCoeff(rows[ii], cols[ii], values[ii]):
+                raise ValueError("HiGHS could not change a coefficient.")
+
+    def add_rows(self, double[::1] lower, double[::1] upper,
+                 int[::1] starts, int[::1] indices, double[::1] values):
+        '''Append rows given in CSR format, with basic slack variables.'''
+        cdef int numrow = lower.size
+        cdef int numnz = values.size
+        cdef HighsBasis basis = self.highs.getBasis()
+        cdef int ii
+        cdef int * indices_ptr = NULL
+        cdef double * values_ptr = NULL
+        if numrow == 0:
+            return
+        if numnz > 0:
+            indices_ptr = &indices[0]
+            values_ptr = &values[0]
+        if not self.highs.addRows(numrow, &lower[0], &upper[0], numnz,
+                                  &starts[0], indices_ptr, values_ptr):
+            raise ValueError("HiGHS could not add the rows.")
+
+        # The basis of the new LP is the previous one with the slack
+        # variables of the new rows made basic
+        if basis.valid_:
+            for ii in range(numrow):
+                basis.row_status.push_back(HighsBasisStatusBASIC)
+            self.highs.setBasis(basis)
+
+    def delete_rows(self, int[::1] indices):
+        '''Delete rows, keeping the basis of the remaining rows if valid.'''
+        cdef HighsBasis basis = self.highs.getBasis()
+        cdef vector[HighsBasisStatus] row_status
+        cdef Py_ssize_t ii, jj = 0
+        cdef int numbasic = 0
+        if indices.size == 0:
+            return
+        if not self.highs.deleteRows(indices.size, &indices[0]):
+            raise ValueError("HiGHS could not delete the rows.")
+
+        if basis.valid_:
+            for ii in range(basis.row_status.size()):
+                if jj < indices.size and indices[jj] == ii:
+                    jj += 1
+                else:
+                    row_status.push_back(basis.row_status[ii])
+            basis.row_status = row_status
+            for ii in range(basis.col_status.size()):
+                numbasic += basis.col_status[ii] == HighsBasisStatusBASIC
+            for ii in range(basis.row_status.size()):
+                numbasic += basis.row_status[ii] == HighsBasisStatusBASIC
+            # The basis stays valid only if none of the deleted rows had
+            # a nonbasic slack variable; otherwise, start from scratch
+            if numbasic == basis.row_status.size():
+                self.highs.setBasis(basis)
+            else:
+                self.highs.setBasis()
@@ -28,7 +28,7 @@ from ._linprog_doc import (_linprog_highs_doc, _linprog_ip_doc,
                            _linprog_highs_ipm_doc, _linprog_highs_ds_doc)
 from ._linprog_util import (
     _parse_linprog, _presolve, _get_Abc, _LPProblem, _autoscale,
-    _postsolve, _check_result, _display_summary)
+    _postsolve, _check_result, _display_summary, _display_presolve)
 from copy import deepcopy
 
 __all__ = ['linprog', 'linprog_verbose_callback', 'linprog_terse_callback']
@@ -283,7 +283,10 @@ def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
             Set to ``True`` to print convergence messages.
             Default: ``False``.
         presolve : bool
-            Set to ``False`` to disable automatic presolve.
+            Set to ``False`` to disable automatic presolve. For all methods
+            except the HiGHS solvers, the reductions made by presolve and the
+            time spent in each of its passes are printed if ``disp`` is
+            ``True``.
             Default: ``True``.
 
         All methods except the HiGHS solvers also accept:
@@ -325,8 +328,12 @@ def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
                 prior notice.
 
             Default: None.
-            For problems with sparse input, this option is ignored, and the
-            pivot-based algorithm presented in [5]_ is used.
+            For problems with sparse input, this option is ignored. Rows
+            that are independent by virtue of a column singleton are set
+            aside, the rank of the remaining rows is checked with a sparse
+            LU factorization, and the pivot-based algorithm presented in
+            [5]_ is used only if they are not of full row rank; the
+            constraint matrices are never converted to dense arrays.
 
         For method-specific options, see
         :func:`show_options('linprog') <show_options>`.
@@ -621,9 +628,11 @@ def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
     rr = solver_options.pop('rr', True)  # they're not passed to methods
     c0 = 0  # we might get a constant term in the objective
     if solver_options.pop('presolve', True):
-        (lp, c0, x, undo, complete, status, message) = _presolve(lp, rr,
-                                                                 rr_method,
-                                                                 tol)
+        presolve_stats = {}
+        (lp, c0, x, undo, complete, status, message) = _presolve(
+            lp, rr, rr_method, tol, presolve_stats)
+        if solver_options.get('disp', False):
+            _display_presolve(lp_o, lp, presolve_stats)
 
     C, b_scale = 1, 1  # for trivial unscaling if autoscale is not used
     postsolve_args = (lp_o._replace(bounds=lp.bounds), undo, C, b_scale)
@@ -17,7 +17,7 @@ import inspect
 import numpy as np
 from .optimize import _check_unknown_options, OptimizeWarning, OptimizeResult
 from warnings import warn
-from ._highs._highs_wrapper import _highs_wrapper
+from ._highs._highs_wrapper import _highs_wrapper, _HighsModel
 from ._highs._highs_constants import (
     CONST_I_INF,
     CONST_INF,
@@ -50,7 +50,9 @@ from ._highs._highs_constants import (
     HIGHS_SIMPLEX_DUAL_EDGE_WEIGHT_STRATEGY_DEVEX,
     HIGHS_SIMPLEX_DUAL_EDGE_WEIGHT_STRATEGY_STEEPEST_EDGE,
 )
-from scipy.sparse import csc_matrix, vstack, issparse
+from ._linprog_util import (_LPProblem, _parse_linprog, _clean_inputs,
+                            _check_result)
+from scipy.sparse import csc_matrix, csr_matrix, vstack, issparse
 
 
 def _replace_inf(x):
@@ -254,6 +256,51 @@ def _linprog_highs(lp, solver, time_limit=None, presolve=True,
             simplex algorithm." Mathematical Programming 12.1 (1977): 361-371.
     """
 
+    options = _highs_options(solver, time_limit, presolve, disp, maxiter,
+                             dual_feasibility_tolerance,
+                             primal_feasibility_tolerance,
+                             ipm_optimality_tolerance,
+                             simplex_dual_edge_weight_strategy,
+                             **unknown_options)
+
+    c, A_ub, b_ub, A_eq, b_eq, bounds, x0 = lp
+
+    lb, ub = bounds.T.copy()  # separate bounds, copy->C-cntgs
+    # highs_wrapper solves LHS <= A*x <= RHS, not equality constraints
+    lhs_ub = -np.ones_like(b_ub)*np.inf  # LHS of UB constraints is -inf
+    rhs_ub = b_ub  # RHS of UB constraints is b_ub
+    lhs_eq = b_eq  # Equality constaint is inequality
+    rhs_eq = b_eq  # constraint with LHS=RHS
+    lhs = np.concatenate((lhs_ub, lhs_eq))
+    rhs = np.concatenate((rhs_ub, rhs_eq))
+
+    if issparse(A_ub) or issparse(A_eq):
+        A = vstack((A_ub, A_eq))
+    else:
+        A = np.vstack((A_ub, A_eq))
+    A = csc_matrix(A)
+
+    # np.inf doesn't work; use very large constant
+    rhs = _replace_inf(rhs)
+    lhs = _replace_inf(lhs)
+    lb = _replace_inf(lb)
+    ub = _replace_inf(ub)
+
+    res = _highs_wrapper(c, A.indptr, A.indices, A.data, lhs, rhs,
+                         lb, ub, options)
+
+    n_ub, n_eq = len(b_ub), len(b_eq)
+    return _highs_result(res, np.arange(n_ub), np.arange(n_ub, n_ub + n_eq),
+                         lb, ub)
+
+
+def _highs_options(solver, time_limit=None, presolve=True, disp=False,
+                   maxiter=None, dual_feasibility_tolerance=None,
+                   primal_feasibility_tolerance=None,
+                   ipm_optimality_tolerance=None,
+                   simplex_dual_edge_weight_strategy=None,
+                   **unknown_options):
+    # Options of `_linprog_highs` as expected by the HiGHS wrapper
     _check_unknown_options(unknown_options)
 
     # Map options to HiGHS enum values
@@ -267,6 +314,28 @@ def _linprog_highs(lp, solver, time_limit=None, presolve=True,
                  HIGHS_SIMPLEX_DUAL_EDGE_WEIGHT_STRATEGY_STEEPEST_EDGE,
                  None: None})
 
+    return {
+        'presolve': presolve,
+        'sense': 1,  # minimization
+        'solver': solver,
+        'time_limit': time_limit,
+        'message_level': MESSAGE_LEVEL_MINIMAL * disp,
+        'dual_feasibility_tolerance': dual_feasibility_tolerance,
+        'ipm_optimality_tolerance': ipm_optimality_tolerance,
+        'primal_feasibility_tolerance': primal_feasibility_tolerance,
+        'simplex_dual_edge_weight_strategy':
+            simplex_dual_edge_weight_strategy_enum,
+        'simplex_strategy': HIGHS_SIMPLEX_STRATEGY_DUAL,
+        'simplex_crash_strategy': HIGHS_SIMPLEX_CRASH_STRATEGY_OFF,
+        'ipm_iteration_limit': maxiter,
+        'simplex_iteration_limit': maxiter,
+    }
+
+
+def _highs_result(res, ub_rows, eq_rows, lb, ub):
+    # Solution of `_linprog_highs` from the output of the HiGHS wrapper;
+    # `ub_rows` and `eq_rows` are the HiGHS rows of the inequality and
+    # equality constraints
     statuses = {
         MODEL_STATUS_NOTSET: (
             4,
@@ -331,64 +400,21 @@ def _linprog_highs(lp, solver, time_limit=None, presolve=True,
         ),
     }
 
-    c, A_ub, b_ub, A_eq, b_eq, bounds, x0 = lp
-
-    lb, ub = bounds.T.copy()  # separate bounds, copy->C-cntgs
-    # highs_wrapper solves LHS <= A*x <= RHS, not equality constraints
-    lhs_ub = -np.ones_like(b_ub)*np.inf  # LHS of UB constraints is -inf
-    rhs_ub = b_ub  # RHS of UB constraints is b_ub
-    lhs_eq = b_eq  # Equality constaint is inequality
-    rhs_eq = b_eq  # constraint with LHS=RHS
-    lhs = np.concatenate((lhs_ub, lhs_eq))
-    rhs = np.concatenate((rhs_ub, rhs_eq))
-
-    if issparse(A_ub) or issparse(A_eq):
-        A = vstack((A_ub, A_eq))
-    else:
-        A = np.vstack((A_ub, A_eq))
-    A = csc_matrix(A)
-
-    options = {
-        'presolve': presolve,
-        'sense': 1,  # minimization
-        'solver': solver,
-        'time_limit': time_limit,
-        'message_level': MESSAGE_LEVEL_MINIMAL * disp,
-        'dual_feasibility_tolerance': dual_feasibility_tolerance,
-        'ipm_optimality_tolerance': ipm_optimality_tolerance,
-        'primal_feasibility_tolerance': primal_feasibility_tolerance,
-        'simplex_dual_edge_weight_strategy':
-            simplex_dual_edge_weight_strategy_enum,
-        'simplex_strategy': HIGHS_SIMPLEX_STRATEGY_DUAL,
-        'simplex_crash_strategy': HIGHS_SIMPLEX_CRASH_STRATEGY_OFF,
-        'ipm_iteration_limit': maxiter,
-        'simplex_iteration_limit': maxiter,
-    }
-
-    # np.inf doesn't work; use very large constant
-    rhs = _replace_inf(rhs)
-    lhs = _replace_inf(lhs)
-    lb = _replace_inf(lb)
-    ub = _replace_inf(ub)
-
-    res = _highs_wrapper(c, A.indptr, A.indices, A.data, lhs, rhs,
-                         lb, ub, options)
-
     # HiGHS represents constraints as lhs/rhs, so
     # Ax + s = b => Ax = b - s
     # and we need to split up s by A_ub and A_eq
     if 'slack' in res:
-        slack = res['slack']
-        con = np.array(slack[len(b_ub):])
-        slack = np.array(slack[:len(b_ub)])
+        slack = np.array(res['slack'])
+        con = slack[eq_rows]
+        slack = slack[ub_rows]
     else:
         slack, con = None, None
 
     # lagrange multipliers for equalities/inequalities and upper/lower bounds
     if 'lambda' in res:
-        lamda = res['lambda']
-        marg_ineqlin = np.array(lamda[:len(b_ub)])
-        marg_eqlin = np.array(lamda[len(b_ub):])
+        lamda = np.array(res['lambda'])
+        marg_ineqlin = lamda[ub_rows]
+        marg_eqlin = lamda[eq_rows]
         marg_upper = res['marg_bnds'][1, :]
         marg_lower = res['marg_bnds'][0, :]
     else:
@@ -440,3 +466,293 @@ def _linprog_highs(lp, solver, time_limit=None, presolve=True,
            }
 
     return sol
+
+
+class HighsLP:
+    r"""
+    Linear program kept in HiGHS for fast re-solves after changes.
+
+    Holds the linear programming problem::
+
+        min_x c @ x
+        such that
+        A_ub @ x <= b_ub
+        A_eq @ x == b_eq
+        lb <= x <= ub
+
+    in a persistent instance of the HiGHS solver, as used by `linprog` with
+    the HiGHS methods. The costs, constraint coefficients, right-hand sides
+    and bounds can then be changed in place with `update`, and constraints
+    can be added or removed, without building a new model. `solve` then
+    restarts the dual simplex solver from the optimal basis of the previous
+    solve, which typically needs only a few iterations when the problem has
+    changed little, whereas `linprog` solves each problem from scratch.
+
+    .. versionadded:: 1.8.0
+
+    Parameters
+    ----------
+    c, A_ub, b_ub, A_eq, b_eq, bounds
+        The linear programming problem, as for `linprog`.
+    method : {'highs', 'highs-ds', 'highs-ipm'}, optional
+        The HiGHS method used for the first solve, as for `linprog`.
+        Later solves always use the dual simplex solver, starting from the
+        basis of the previous solution.
+    options : dict, optional
+        The options of the chosen `method`, as for `linprog`. The
+        ``presolve`` option only applies to the first solve, and to the
+        solves without a warm start.
+
+    See Also
+    --------
+    linprog
+
+    Notes
+    -----
+    The constraints are stored in HiGHS in the order of their addition,
+    but the constraint-related fields of the results, such as ``slack``,
+    ``con``, ``ineqlin`` and ``eqlin``, are always given in the order of the
+    current rows of `A_ub` and `A_eq`, that is in their original order, with
+    added constraints last and removed constraints left out.
+
+    A warm start needs a basis. Without one, for instance after
+    ``solve(warm_start=False)`` or after removing constraints whose slack
+    variables were nonbasic, the problem is solved from scratch.
+
+    Examples
+    --------
+    >>> from scipy.optimize import HighsLP
+    >>> c = [-1, 4]
+    >>> A_ub = [[-3, 1], [1, 2]]
+    >>> lp = HighsLP(c, A_ub=A_ub, b_ub=[6, 4],
+    ...              bounds=[(None, None), (-3, None)])
+    >>> res = lp.solve()
+    >>> res.fun, res.x
+    (-22.0, array([10., -3.]))
+
+    Change the right-hand side of the inequality constraints and solve again,
+    from the previous basis:
+
+    >>> lp.update(b_ub=[6, 5])
+    >>> res = lp.solve()
+    >>> res.fun, res.x
+    (-23.0, array([11., -3.]))
+
+    Add the constraint ``x[0] <= 8`` and solve again:
+
+    >>> lp.add_constraints(A_ub=[[1, 0]], b_ub=[8])
+    >>> res = lp.solve()
+    >>> res.fun, res.x
+    (-20.0, array([ 8., -3.]))
+    >>> res.slack
+    array([33.,  3.,  0.])
+
+    """
+
+    def __init__(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
+                 bounds=None, method='highs', options=None):
+        meth = method.lower()
+        highs_solvers = {'highs-ipm': 'ipm', 'highs-ds': 'simplex',
+                         'highs': None}
+        if meth not in highs_solvers:
+            raise ValueError(f"Unknown solver '{method}'")
+
+        lp = _LPProblem(c, A_ub, b_ub, A_eq, b_eq, bounds)
+        lp, solver_options = _parse_linprog(lp, options, meth)
+        self._tol = solver_options.pop('tol', 1e-9)
+        self._options = _highs_options(highs_solvers[meth],
+                                       **solver_options)
+
+        self._c = lp.c
+        self._A_ub, self._b_ub = csr_matrix(lp.A_ub), lp.b_ub
+        self._A_eq, self._b_eq = csr_matrix(lp.A_eq), lp.b_eq
+        self._bounds = lp.bounds
+        n_ub, n_eq = len(self._b_ub), len(self._b_eq)
+        self._ub_rows = np.arange(n_ub, dtype=np.intc)
+        self._eq_rows = np.arange(n_ub, n_ub + n_eq, dtype=np.intc)
+
+        A = csc_matrix(vstack((self._A_ub, self._A_eq)))
+        lhs, rhs = self._row_bounds(self._b_ub, self._b_eq)
+        lb, ub = _replace_inf(self._bounds.T.copy())
+        self._model = _HighsModel(self._c, A.indptr.astype(np.intc),
+                                  A.indices.astype(np.intc), A.data,
+                                  lhs, rhs, lb, ub, self._options)
+        self._solved = False
+
+    @staticmethod
+    def _row_bounds(b_ub, b_eq):
+        # HiGHS solves lhs <= A @ x <= rhs
+        lhs = np.concatenate((np.full(len(b_ub), -np.inf), b_eq))
+        rhs = np.concatenate((b_ub, b_eq))
+        return _replace_inf(lhs), _replace_inf(rhs)
+
+    def _clean(self, c=None, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
+               bounds=None):
+        # Complete the given arrays with the current ones and check them
+        if A_ub is None and b_ub is None and len(self._b_ub):
+            A_ub, b_ub = self._A_ub, self._b_ub
+        elif A_ub is None and b_ub is not None:
+            A_ub = self._A_ub
+        elif b_ub is None and A_ub is not None:
+            b_ub = self._b_ub
+        if A_eq is None and b_eq is None and len(self._b_eq):
+            A_eq, b_eq = self._A_eq, self._b_eq
+        elif A_eq is None and b_eq is not None:
+            A_eq = self._A_eq
+        elif b_eq is None and A_eq is not None:
+            b_eq = self._b_eq
+        return _clean_inputs(_LPProblem(
+            self._c if c is None else c, A_ub, b_ub, A_eq, b_eq,
+            self._bounds if bounds is None else bounds))
+
+    def update(self, c=None, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
+               bounds=None):
+        """
+        Change the problem in place.
+
+        Parameters
+        ----------
+        c, A_ub, b_ub, A_eq, b_eq, bounds : optional
+            The new values of the given parts of the problem, as for
+            `linprog`. Their shapes must match the current problem; use
+            `add_constraints` and `remove_constraints` to change the number
+            of constraints. Only the entries which differ from the current
+            problem are sent to HiGHS.
+
+        """
+        lp = self._clean(c, A_ub, b_ub, A_eq, b_eq, bounds)
+        if (lp.c.shape != self._c.shape or
+                lp.b_ub.shape != self._b_ub.shape or
+                lp.b_eq.shape != self._b_eq.shape):
+            raise ValueError("The shapes of the arrays of the problem cannot "
+                             "be changed by `update`; use `add_constraints` "
+                             "and `remove_constraints` to change the number "
+                             "of constraints.")
+
+        cols = np.flatnonzero(lp.c != self._c)
+        self._model.change_col_costs(cols.astype(np.intc), lp.c[cols])
+
+        cols = np.flatnonzero((lp.bounds != self._bounds).any(axis=1))
+        lb, ub = _replace_inf(lp.bounds[cols].T.copy())
+        self._model.change_col_bounds(cols.astype(np.intc), lb, ub)
+
+        rows = np.flatnonzero(lp.b_ub != self._b_ub)
+        lhs, rhs = self._row_bounds(lp.b_ub[rows], [])
+        self._model.change_row_bounds(self._ub_rows[rows], lhs, rhs)
+
+        rows = np.flatnonzero(lp.b_eq != self._b_eq)
+        lhs, rhs = self._row_bounds([], lp.b_eq[rows])
+        self._model.change_row_bounds(self._eq_rows[rows], lhs, rhs)
+
+        A_ub, A_eq = csr_matrix(lp.A_ub), csr_matrix(lp.A_eq)
+        for A, A_old, highs_rows in ((A_ub, self._A_ub, self._ub_rows),
+                                     (A_eq, self._A_eq, self._eq_rows)):
+            changed = (A != A_old).tocoo()
+            rows, cols = changed.row, changed.col
+            if len(rows):
+                values = np.asarray(A[rows, cols], dtype=float).ravel()
+                self._model.change_coeffs(highs_rows[rows],
+                                          cols.astype(np.intc), values)
+
+        self._c, self._bounds = lp.c, lp.bounds
+        self._A_ub, self._b_ub = A_ub, lp.b_ub
+        self._A_eq, self._b_eq = A_eq, lp.b_eq
+
+    def add_constraints(self, A_ub=None, b_ub=None, A_eq=None, b_eq=None):
+        """
+        Add constraints to the problem.
+
+        Parameters
+        ----------
+        A_ub, b_ub, A_eq, b_eq : optional
+            The new inequality and equality constraints, as for `linprog`.
+            They are appended to the current ones.
+
+        """
+        lp = _clean_inputs(_LPProblem(self._c, A_ub, b_ub, A_eq, b_eq,
+                                      self._bounds))
+        A_ub, A_eq = csr_matrix(lp.A_ub), csr_matrix(lp.A_eq)
+        A = csr_matrix(vstack((A_ub, A_eq)))
+        lhs, rhs = self._row_bounds(lp.b_ub, lp.b_eq)
+        self._model.add_rows(lhs, rhs, A.indptr.astype(np.intc),
+                             A.indices.astype(np.intc), A.data)
+
+        n_rows = len(self._ub_rows) + len(self._eq_rows)
+        n_ub, n_eq = len(lp.b_ub), len(lp.b_eq)
+        self._ub_rows = np.concatenate(
+            (self._ub_rows, np.arange(n_rows, n_rows + n_ub, dtype=np.intc)))
+        self._eq_rows = np.concatenate(
+            (self._eq_rows, np.arange(n_rows + n_ub, n_rows + n_ub + n_eq,
+                                      dtype=np.intc)))
+        self._A_ub = csr_matrix(vstack((self._A_ub, A_ub)))
+        self._A_eq = csr_matrix(vstack((self._A_eq, A_eq)))
+        self._b_ub = np.concatenate((self._b_ub, lp.b_ub))
+        self._b_eq = np.concatenate((self._b_eq, lp.b_eq))
+
+    def remove_constraints(self, ub=None, eq=None):
+        """
+        Remove constraints from the problem.
+
+        Parameters
+        ----------
+        ub, eq : array_like of int, slice or boolean mask, optional
+            The indices of the rows of `A_ub` and `A_eq` to remove.
+
+        """
+        remove_ub = np.zeros(len(self._ub_rows), dtype=bool)
+        remove_eq = np.zeros(len(self._eq_rows), dtype=bool)
+        if ub is not None:
+            remove_ub[np.arange(len(self._ub_rows))[ub]] = True
+        if eq is not None:
+            remove_eq[np.arange(len(self._eq_rows))[eq]] = True
+
+        rows = np.sort(np.concatenate((self._ub_rows[remove_ub],
+                                       self._eq_rows[remove_eq])))
+        self._model.delete_rows(rows)
+
+        # the remaining rows are renumbered in HiGHS
+        kept = np.ones(len(self._ub_rows) + len(self._eq_rows), dtype=bool)
+        kept[rows] = False
+        new_rows = (np.cumsum(kept) - 1).astype(np.intc)
+        self._ub_rows = new_rows[self._ub_rows[~remove_ub]]
+        self._eq_rows = new_rows[self._eq_rows[~remove_eq]]
+        self._A_ub = self._A_ub[np.flatnonzero(~remove_ub)]
+        self._A_eq = self._A_eq[np.flatnonzero(~remove_eq)]
+        self._b_ub = self._b_ub[~remove_ub]
+        self._b_eq = self._b_eq[~remove_eq]
+
+    def solve(self, warm_start=True):
+        """
+        Solve the current problem.
+
+        Parameters
+        ----------
+        warm_start : bool, optional
+            If True (default), start from the basis of the previous
+            solution, if there is one. Otherwise, solve the problem from
+            scratch.
+
+        Returns
+        -------
+        res : OptimizeResult
+            The solution, with the same fields as the result of `linprog`
+            with the HiGHS methods.
+
+        """
+        if not warm_start:
+            self._model.clear_basis()
+        res = self._model.run()
+        if not self._solved and self._options['solver'] == 'ipm':
+            # restarts from a basis need the simplex solver
+            self._model.set_options(dict(self._options, solver='simplex'))
+        self._solved = True
+
+        lb, ub = _replace_inf(self._bounds.T.copy())
+        sol = _highs_result(res, self._ub_rows, self._eq_rows, lb, ub)
+        sol['status'], sol['message'] = (
+            _check_result(sol['x'], sol['fun'], sol['status'], sol['slack'],
+                          sol['con'], self._bounds, self._tol,
+                          sol['message']))
+        sol['success'] = sol['status'] == 0
+        return OptimizeResult(sol)
+
@@ -4,10 +4,11 @@ Method agnostic utility functions for linear progamming
 
 import numpy as np
 import scipy.sparse as sps
+from time import perf_counter
 from warnings import warn
 from .optimize import OptimizeWarning
 from scipy.optimize._remove_redundancy import (
-    _remove_redundancy_svd, _remove_redundancy_pivot_sparse,
+    _remove_redundancy_svd, _remove_redundancy_sparse,
     _remove_redundancy_pivot_dense, _remove_redundancy_id
     )
 from collections import namedtuple
@@ -451,7 +452,68 @@ def _clean_inputs(lp):
     return _LPProblem(c, A_ub, b_ub, A_eq, b_eq, bounds_clean, x0)
 
 
-def _presolve(lp, rr, rr_method, tol=1e-9):
+def _parallel_rows(A, signed, tol):
+    """
+    Identify rows of a constraint matrix that are positive (or, if `signed`
+    is ``True``, arbitrary nonzero) multiples of an earlier row.
+
+    Parameters
+    ----------
+    A : 2-D array or sparse matrix
+        Constraint matrix without zero rows.
+    signed : bool
+        Whether rows that are negative multiples of one another are
+        considered parallel.
+    tol : float
+        Absolute tolerance for comparing the normalized rows.
+
+    Returns
+    -------
+    leader : 1-D array of int
+        For each row, the index of the first row it is a multiple of (its
+        own index if there is none).
+    scale : 1-D array
+        For each row, the factor by which the row was normalized;
+        ``A[i] / scale[i]`` equals ``A[leader[i]] / scale[leader[i]]``.
+
+    """
+    A = sps.csr_matrix(A, copy=True)
+    A.eliminate_zeros()
+    A.sort_indices()
+    m, n = A.shape
+    leader = np.arange(m)
+    counts = np.diff(A.indptr)
+    scale = A.data[A.indptr[:-1]] if A.nnz else np.ones(m)
+    if not signed:
+        scale = np.abs(scale)
+    if m < 2:
+        return leader, scale
+    A = sps.diags(1 / scale) @ A
+
+    # rows with equal patterns and values have equal random projections;
+    # sort on them and only compare neighbors
+    r = np.random.RandomState(0).uniform(1, 2, size=n)
+    key = A @ r
+    order = np.lexsort((key, counts))
+    close = ((np.diff(counts[order]) == 0)
+             & (np.abs(np.diff(key[order])) <= 2 * tol * counts[order[1:]]))
+    for k in np.flatnonzero(close):
+        i, j = order[k], order[k + 1]
+        i = leader[i]
+        a_i = A.indices[A.indptr[i]:A.indptr[i + 1]]
+        a_j = A.indices[A.indptr[j]:A.indptr[j + 1]]
+        if (np.array_equal(a_i, a_j)
+                and np.allclose(A.data[A.indptr[i]:A.indptr[i + 1]],
+                                A.data[A.indptr[j]:A.indptr[j + 1]],
+                                rtol=0, atol=tol)):
+            leader[j] = i
+    # make the leader of each group the row that comes first
+    first = np.full(m, m)
+    np.minimum.at(first, leader, np.arange(m))
+    return first[leader], scale
+
+
+def _presolve(lp, rr, rr_method, tol=1e-9, stats=None):
     """
     Given inputs for a linear programming problem in preferred format,
     presolve the problem: identify trivial infeasibilities, redundancies,
@@ -498,6 +560,9 @@ def _presolve(lp, rr, rr_method, tol=1e-9):
         The tolerance which determines when a solution is "close enough" to
         zero in Phase 1 to be considered a basic feasible solution or close
         enough to positive to serve as an optimal solution.
+    stats : dict, optional
+        If provided, the time in seconds spent in each presolve pass is
+        stored here, keyed by the name of the pass.
 
     Returns
     -------
@@ -535,7 +600,6 @@ def _presolve(lp, rr, rr_method, tol=1e-9):
         the functions in the list reverse the operations of _presolve()
         the function signature is x_org = f(x_mod), where x_mod is the result
         of a presolve step and x_org the value at the start of the step
-        (currently, the revstack contains only one function)
     complete: bool
         Whether the solution is complete (solved or determined to be infeasible
         or unbounded in presolve)
@@ -574,6 +638,16 @@ def _presolve(lp, rr, rr_method, tol=1e-9):
 
     c, A_ub, b_ub, A_eq, b_eq, bounds, x0 = lp
 
+    if stats is None:
+        stats = {}
+    t_last = [perf_counter()]
+
+    def _record_time(name):
+        # time spent since the previous pass ended
+        t = perf_counter()
+        stats[name] = stats.get(name, 0) + t - t_last[0]
+        t_last[0] = t
+
     revstack = []               # record of variables eliminated from problem
     # constant term in cost function may be added if variables are eliminated
     c0 = 0
@@ -657,6 +731,8 @@ def _presolve(lp, rr, rr_method, tol=1e-9):
             A_ub = A_ub[np.logical_not(zero_row), :]
             b_ub = b_ub[np.logical_not(zero_row)]
 
+    _record_time("zero rows")
+
     # zero column in (both) constraints
     # this indicates that a variable isn't constrained and can be removed
     A = vstack((A_eq, A_ub))
@@ -682,28 +758,36 @@ def _presolve(lp, rr, rr_method, tol=1e-9):
         ub[np.logical_and(zero_col, c > 0)] = lb[
             np.logical_and(zero_col, c > 0)]
 
+    _record_time("zero columns")
+
     # row singleton in equality constraints
     # this fixes a variable and removes the constraint
     singleton_row = np.array(np.sum(A_eq != 0, axis=1) == 1).flatten()
     rows = where(singleton_row)[0]
-    cols = where(A_eq[rows, :])[1]
     if len(rows) > 0:
-        for row, col in zip(rows, cols):
-            val = b_eq[row] / A_eq[row, col]
-            if not lb[col] - tol <= val <= ub[col] + tol:
-                # infeasible if fixed value is not within bounds
-                status = 2
-                message = ("The problem is (trivially) infeasible because a "
-                           "singleton row in the equality constraints is "
-                           "inconsistent with the bounds.")
-                complete = True
-                return (_LPProblem(c, A_ub, b_ub, A_eq, b_eq, bounds, x0),
-                        c0, x, revstack, complete, status, message)
-            else:
-                # sets upper and lower bounds at that fixed value - variable
-                # will be removed later
-                lb[col] = val
-                ub[col] = val
+        A_s = A_eq[rows, :]
+        i, cols = where(A_s)
+        vals = b_eq[rows[i]] / np.asarray(A_s[i, cols]).flatten()
+        # several rows may fix the same variable; they must agree
+        val_min = np.full(n, np.inf)
+        val_max = np.full(n, -np.inf)
+        np.minimum.at(val_min, cols, vals)
+        np.maximum.at(val_max, cols, vals)
+        if (np.any(val_min[cols] < lb[cols] - tol)
+                or np.any(val_max[cols] > ub[cols] + tol)
+                or np.any(val_max[cols] - val_min[cols] > tol)):
+            # infeasible if fixed value is not within bounds
+            status = 2
+            message = ("The problem is (trivially) infeasible because a "
+                       "singleton row in the equality constraints is "
+                       "inconsistent with the bounds.")
+            complete = True
+            return (_LPProblem(c, A_ub, b_ub, A_eq, b_eq, bounds, x0),
+                    c0, x, revstack, complete, status, message)
+        # sets upper and lower bounds at that fixed value - variable
+        # will be removed later
+        lb[cols] = vals
+        ub[cols] = vals
         A_eq = A_eq[np.logical_not(singleton_row), :]
         b_eq = b_eq[np.logical_not(singleton_row)]
 
@@ -713,30 +797,64 @@ def _presolve(lp, rr, rr_method, tol=1e-9):
     # After all of the simple bound information is combined here, get_Abc will
     # turn the simple bounds into constraints
     singleton_row = np.array(np.sum(A_ub != 0, axis=1) == 1).flatten()
-    cols = where(A_ub[singleton_row, :])[1]
     rows = where(singleton_row)[0]
     if len(rows) > 0:
-        for row, col in zip(rows, cols):
-            val = b_ub[row] / A_ub[row, col]
-            if A_ub[row, col] > 0:  # upper bound
-                if val < lb[col] - tol:  # infeasible
-                    complete = True
-                elif val < ub[col]:  # new upper bound
-                    ub[col] = val
-            else:  # lower bound
-                if val > ub[col] + tol:  # infeasible
-                    complete = True
-                elif val > lb[col]:  # new lower bound
-                    lb[col] = val
-            if complete:
+        A_s = A_ub[rows, :]
+        i, cols = where(A_s)
+        coef = np.asarray(A_s[i, cols]).flatten()
+        vals = b_ub[rows[i]] / coef
+        upper = coef > 0
+        new_ub = ub.copy()
+        new_lb = lb.copy()
+        np.minimum.at(new_ub, cols[upper], vals[upper])  # new upper bounds
+        np.maximum.at(new_lb, cols[~upper], vals[~upper])  # new lower bounds
+        if (np.any(new_ub < lb - tol) or np.any(new_lb > ub + tol)
+                or np.any(new_lb > new_ub + tol)):
+            status = 2
+            message = ("The problem is (trivially) infeasible because a "
+                       "singleton row in the upper bound constraints is "
+                       "inconsistent with the bounds.")
+            complete = True
+            return (_LPProblem(c, A_ub, b_ub, A_eq, b_eq, bounds, x0),
+                    c0, x, revstack, complete, status, message)
+        lb, ub = new_lb, new_ub
+        A_ub = A_ub[np.logical_not(singleton_row), :]
+        b_ub = b_ub[np.logical_not(singleton_row)]
+
+    _record_time("singleton rows")
+
+    # parallel rows in equality constraints
+    # these are either redundant or inconsistent
+    if A_eq.shape[0] > 1:
+        leader, scale = _parallel_rows(A_eq, True, tol)
+        duplicate = leader != np.arange(len(leader))
+        if np.any(duplicate):
+            beta = b_eq / scale
+            if np.any(np.abs(beta[duplicate] - beta[leader[duplicate]])
+                      > tol * (1 + np.abs(beta[duplicate]))):
                 status = 2
-                message = ("The problem is (trivially) infeasible because a "
-                           "singleton row in the upper bound constraints is "
-                           "inconsistent with the bounds.")
+                message = ("The problem is (trivially) infeasible because "
+                           "two equality constraints are multiples of one "
+                           "another but their constraint values are not.")
+                complete = True
                 return (_LPProblem(c, A_ub, b_ub, A_eq, b_eq, bounds, x0),
                         c0, x, revstack, complete, status, message)
-        A_ub = A_ub[np.logical_not(singleton_row), :]
-        b_ub = b_ub[np.logical_not(singleton_row)]
+            A_eq = A_eq[np.logical_not(duplicate), :]
+            b_eq = b_eq[np.logical_not(duplicate)]
+
+    # parallel rows in inequality constraints
+    # only the tightest of the constraints needs to be kept
+    if A_ub.shape[0] > 1:
+        leader, scale = _parallel_rows(A_ub, False, tol)
+        duplicate = leader != np.arange(len(leader))
+        if np.any(duplicate):
+            beta = b_ub / scale
+            np.minimum.at(beta, leader, beta.copy())
+            b_ub = beta * scale
+            A_ub = A_ub[np.logical_not(duplicate), :]
+            b_ub = b_ub[np.logical_not(duplicate)]
+
+    _record_time("parallel rows")
 
     # identical bounds indicate that variable can be removed
     i_f = np.abs(lb - ub) < tol   # indices of "fixed" variables
@@ -788,9 +906,64 @@ def _presolve(lp, rr, rr_method, tol=1e-9):
             x_rev = np.insert(x_mod.astype(float), insert_indices, x_undo)
             return x_rev
 
-        # Use revstack as a list of functions, currently just this one.
+        # Use revstack as a list of functions
+        revstack.append(rev)
+
+    _record_time("fixed variables")
+
+    # free column singleton in equality constraints
+    # the variable can be expressed in terms of the others using its row, so
+    # the row and the variable are substituted out of the problem
+    free = np.logical_and(lb_mod == -np.inf, ub_mod == np.inf)
+    if np.any(free) and A_eq.shape[0] > 0:
+        eq_count = np.array(np.sum(A_eq != 0, axis=0)).flatten()
+        ub_count = np.array(np.sum(A_ub != 0, axis=0)).flatten()
+        candidates = np.flatnonzero(free & (eq_count == 1) & (ub_count == 0))
+        rows, i = where(A_eq[:, candidates])
+        # use only one variable per row
+        rows, first = np.unique(rows, return_index=True)
+        cols = candidates[i[first]]
+    else:
+        rows = np.array([], dtype=int)
+    if len(rows) > 0:
+        pivot = np.asarray(A_eq[rows, cols]).flatten()
+        large = np.abs(pivot) > tol
+        rows, cols, pivot = rows[large], cols[large], pivot[large]
+    if len(rows) > 0:
+        keep_row = np.ones(A_eq.shape[0], dtype=bool)
+        keep_row[rows] = False
+        keep_col = np.ones(len(c), dtype=bool)
+        keep_col[cols] = False
+
+        A_s = A_eq[rows, :]
+        b_s = b_eq[rows]
+        ratio = c[cols] / pivot
+        c0 += ratio.dot(b_s)
+        c = c - A_s.T.dot(ratio)
+        A_s = A_s[:, keep_col]
+
+        c = c[keep_col]
+        x = x[keep_col]
+        if x0 is not None:
+            x0 = x0[keep_col]
+        A_eq = A_eq[keep_row, :][:, keep_col]
+        b_eq = b_eq[keep_row]
+        A_ub = A_ub[:, keep_col]
+        lb_mod = lb_mod[keep_col]
+        ub_mod = ub_mod[keep_col]
+
+        def rev(x_mod):
+            # Function to restore x: solve each substituted row for its
+            # column singleton.
+            x_rev = np.zeros(len(keep_col))
+            x_rev[keep_col] = x_mod
+            x_rev[cols] = (b_s - A_s.dot(x_mod)) / pivot
+            return x_rev
+
         revstack.append(rev)
 
+    _record_time("singleton columns")
+
     # no constraints indicates that problem is trivial
     if A_eq.size == 0 and A_ub.size == 0:
         b_eq = np.array([])
@@ -836,13 +1009,14 @@ def _presolve(lp, rr, rr_method, tol=1e-9):
                           "improve performance, check the problem formulation "
                           "for redundant equality constraints.")
     if (sps.issparse(A_eq)):
-        if rr and A_eq.size > 0:  # TODO: Fast sparse rank check?
-            rr_res = _remove_redundancy_pivot_sparse(A_eq, b_eq)
+        if rr and A_eq.size > 0:
+            rr_res = _remove_redundancy_sparse(A_eq, b_eq)
             A_eq, b_eq, status, message = rr_res
             if A_eq.shape[0] < n_rows_A:
                 warn(redundancy_warning, OptimizeWarning, stacklevel=1)
             if status != 0:
                 complete = True
+        _record_time("redundancy removal")
         return (_LPProblem(c, A_ub, b_ub, A_eq, b_eq, bounds, x0),
                 c0, x, revstack, complete, status, message)
 
@@ -889,6 +1063,7 @@ def _presolve(lp, rr, rr_method, tol=1e-9):
             status = 4
         if status != 0:
             complete = True
+    _record_time("redundancy removal")
     return (_LPProblem(c, A_ub, b_ub, A_eq, b_eq, bounds, x0),
             c0, x, revstack, complete, status, message)
 
@@ -1290,6 +1465,31 @@ def _display_summary(message, status, fun, iteration):
     print("         Iterations: {0:d}".format(iteration))
 
 
+def _display_presolve(lp_o, lp, stats):
+    """
+    Print a summary of the reductions made by presolve and the time spent
+    in each of its passes.
+
+    Parameters
+    ----------
+    lp_o : A `scipy.optimize._linprog_util._LPProblem`
+        The problem before presolve.
+    lp : A `scipy.optimize._linprog_util._LPProblem`
+        The problem after presolve.
+    stats : dict
+        The time in seconds spent in each presolve pass, keyed by the name
+        of the pass.
+    """
+    rows_o = lp_o.A_ub.shape[0] + lp_o.A_eq.shape[0]
+    rows = lp.A_ub.shape[0] + lp.A_eq.shape[0]
+    print("Presolve removed {0:d} of {1:d} rows and {2:d} of {3:d} columns "
+          "in {4:.3g} s".format(rows_o - rows, rows_o,
+                                len(lp_o.c) - len(lp.c), len(lp_o.c),
+                                sum(stats.values())))
+    for name, t in stats.items():
+        print("         {0: <20}{1:.3g} s".format(name + ":", t))
+
+
 def _postsolve(x, postsolve_args, complete=False):
     """
     Given solution x to presolved, standard form linear program x, add
@@ -1,5 +1,6 @@
 """This module contains least-squares algorithms."""
 from .least_squares import least_squares
+from .least_squares_batch import least_squares_batch
 from .lsq_linear import lsq_linear
 
-__all__ = ['least_squares', 'lsq_linear']
+__all__ = ['least_squares', 'least_squares_batch', 'lsq_linear']
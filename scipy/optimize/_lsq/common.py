@@ -6,7 +6,7 @@ from numpy.linalg import norm
 
 from scipy.linalg import cho_factor, cho_solve, LinAlgError
 from scipy.sparse import issparse
-from scipy.sparse.linalg import LinearOperator, aslinearoperator
+from scipy.sparse.linalg import LinearOperator, aslinearoperator, lsmr
 
 
 EPS = np.finfo(float).eps
@@ -669,6 +669,73 @@ def regularized_lsq_operator(J, diag):
     return LinearOperator((m + n, n), matvec=matvec, rmatvec=rmatvec)
 
 
+def build_lsmr_preconditioner(preconditioner, J, d, diag):
+    """Build a right preconditioner for the regularized least-squares
+    operator returned by ``regularized_lsq_operator(J diag(d), diag)``.
+
+    Returns
+    -------
+    P : ndarray, shape (n,) or LinearOperator
+        The preconditioner, a 1-D array standing for a diagonal matrix.
+    """
+    if preconditioner == 'jacobi':
+        if issparse(J):
+            col_sq = np.asarray(J.power(2).sum(axis=0)).ravel()
+        else:
+            col_sq = np.sum(J**2, axis=0)
+        col_norms = (col_sq * d**2 + diag**2)**0.5
+        col_norms[col_norms == 0] = 1
+        return 1 / col_norms
+
+    P = preconditioner(right_multiply(J, d), diag)
+    if isinstance(P, np.ndarray) and P.ndim == 1:
+        return P
+    return aslinearoperator(P)
+
+
+def preconditioned_lsmr(A, b, P, **lsmr_options):
+    """Solve ``A x = b`` in the least-squares sense with lsmr, right
+    preconditioned by `P`: ``x = P y`` where ``y`` is the solution for
+    the operator ``A P``.
+    """
+    if isinstance(P, np.ndarray):
+        y = lsmr(right_multiplied_operator(A, P), b, **lsmr_options)[0]
+        return P * y
+
+    y = lsmr(aslinearoperator(A).dot(P), b, **lsmr_options)[0]
+    return P.matvec(y)
+
+
+def broyden_update(J, s, y):
+    """Rank-1 Broyden update of the Jacobian `J` after a step `s` which
+    changed the residuals by `y`.
+
+    A sparse `J` is updated following [Schubert]_, which keeps its sparsity
+    structure. `J` is not modified in place.
+
+    References
+    ----------
+    .. [Schubert] L. K. Schubert, "Modification of a quasi-Newton method for
+        nonlinear equations with a sparse Jacobian," Mathematics of
+        Computation, Vol. 24, pp. 27-30, 1970.
+    """
+    r = y - J.dot(s)
+    if issparse(J):
+        J = J.tocsr(copy=True)
+        rows = np.repeat(np.arange(J.shape[0]), np.diff(J.indptr))
+        s_nz = s[J.indices]
+        s_sq = np.bincount(rows, s_nz**2, minlength=J.shape[0])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coef = np.where(s_sq > 0, r / s_sq, 0)
+        J.data += coef[rows] * s_nz
+        return J
+
+    s_sq = np.dot(s, s)
+    if s_sq == 0:
+        return J.copy()
+    return J + np.outer(r / s_sq, s)
+
+
 def right_multiply(J, d, copy=True):
     """Compute J diag(d).
 
@@ -7,11 +7,12 @@ from numpy.linalg import norm
 from scipy.sparse import issparse, csr_matrix
 from scipy.sparse.linalg import LinearOperator
 from scipy.optimize import _minpack, OptimizeResult
-from scipy.optimize._numdiff import approx_derivative, group_columns
+from scipy.optimize._numdiff import (approx_derivative, group_columns,
+                                     _with_workers_pool)
 
 from .trf import trf
 from .dogbox import dogbox
-from .common import EPS, in_bounds, make_strictly_feasible
+from .common import EPS, in_bounds, make_strictly_feasible, broyden_update
 
 
 TERMINATION_MESSAGES = {
@@ -237,11 +238,44 @@ def construct_loss_function(m, loss, f_scale):
     return loss_function
 
 
+class BroydenJacobian:
+    """Jacobian evaluation replaced by rank-1 Broyden updates for up to
+    `max_updates` consecutive calls, see `broyden_update`.
+
+    Copies are returned, as the algorithms may modify the Jacobian in place.
+    The number of actual evaluations of `jac` is counted in ``njev``.
+    """
+    def __init__(self, jac, x0, f0, J0, max_updates):
+        self.jac = jac
+        self.max_updates = max_updates
+        self.x = x0.copy()
+        self.f = f0.copy()
+        self.J = J0.copy()
+        self.n_updates = 0
+        self.njev = 1
+
+    def __call__(self, x, f):
+        if self.n_updates < self.max_updates:
+            J = broyden_update(self.J, x - self.x, f - self.f)
+            self.n_updates += 1
+        else:
+            J = self.jac(x, f)
+            self.njev += 1
+            self.n_updates = 0
+
+        self.x = x.copy()
+        self.f = f.copy()
+        self.J = J
+        return J.copy()
+
+
+@_with_workers_pool
 def least_squares(
         fun, x0, jac='2-point', bounds=(-np.inf, np.inf), method='trf',
         ftol=1e-8, xtol=1e-8, gtol=1e-8, x_scale=1.0, loss='linear',
         f_scale=1.0, diff_step=None, tr_solver=None, tr_options={},
-        jac_sparsity=None, max_nfev=None, verbose=0, args=(), kwargs={}):
+        jac_sparsity=None, max_nfev=None, verbose=0, args=(), kwargs={},
+        *, workers=1, vectorized=False, broyden_updates=0):
     """Solve a nonlinear least-squares problem with bounds on the variables.
 
     Given the residuals f(x) (an m-D real function of n real
@@ -413,7 +447,19 @@ def least_squares(
               Additionally,  ``method='trf'`` supports  'regularize' option
               (bool, default is True), which adds a regularization term to the
               normal equation, which improves convergence if the Jacobian is
-              rank-deficient [Byrd]_ (eq. 3.4).
+              rank-deficient [Byrd]_ (eq. 3.4). ``method='trf'`` also supports
+              a 'preconditioner' option (default is None), a right
+              preconditioner for lsmr, which can greatly reduce the number of
+              lsmr iterations for badly scaled Jacobians. It is either
+              'jacobi', the inverse of the norms of the columns of the
+              (regularized and scaled) Jacobian, or a callable
+              ``preconditioner(J, diag)``, where ``J`` is the scaled Jacobian,
+              of the same type as the one returned by `jac`, and ``diag`` a
+              1-D array of regularization terms. It must return a
+              LinearOperator or a 1-D array (a diagonal matrix) ``P`` such
+              that the operator ``[J; diag(diag)] @ P`` is well conditioned.
+              For example ``P = inv(R)`` with ``R`` an incomplete Cholesky
+              factor of ``J.T @ J + diag(diag**2)``.
 
     jac_sparsity : {None, array_like, sparse matrix}, optional
         Defines the sparsity structure of the Jacobian matrix for finite
@@ -436,6 +482,31 @@ def least_squares(
         Additional arguments passed to `fun` and `jac`. Both empty by default.
         The calling signature is ``fun(x, *args, **kwargs)`` and the same for
         `jac`.
+    workers : int or map-like callable, optional
+        Evaluates the points of a finite difference Jacobian in parallel, see
+        `approx_derivative`. Requires that `fun` be pickleable if
+        ``workers != 1``. Has no effect for 'lm' method.
+
+        .. versionadded:: 1.8.0
+
+    vectorized : bool, optional
+        If True, the points of a finite difference Jacobian are sent to `fun`
+        in a single call, as an array of shape ``(n, S)``, and `fun` should
+        return an array of shape ``(m, S)``. Has no effect for 'lm' method.
+
+        .. versionadded:: 1.8.0
+
+    broyden_updates : int, optional
+        Number of consecutive iterations in which the Jacobian is updated with
+        the rank-1 Broyden formula, instead of being evaluated, before it is
+        evaluated again. Sparse Jacobians are updated keeping their sparsity
+        structure [Schubert]_. This saves Jacobian evaluations, which dominate
+        the run time when they are expensive (or estimated by finite
+        differences), at the price of possibly more iterations. Default is 0,
+        evaluating the Jacobian at every iteration. Not supported by the 'lm'
+        method and when `jac` returns LinearOperator.
+
+        .. versionadded:: 1.8.0
 
     Returns
     -------
@@ -474,8 +545,9 @@ def least_squares(
                 not count function calls for numerical Jacobian approximation, as
                 opposed to 'lm' method.
             njev : int or None
-                Number of Jacobian evaluations done. If numerical Jacobian
-                approximation is used in 'lm' method, it is set to None.
+                Number of Jacobian evaluations done, not counting Broyden
+                updates. If numerical Jacobian approximation is used in 'lm'
+                method, it is set to None.
             status : int
                 The reason for algorithm termination:
 
@@ -578,6 +650,9 @@ def least_squares(
     .. [BA] B. Triggs et. al., "Bundle Adjustment - A Modern Synthesis",
             Proceedings of the International Workshop on Vision Algorithms:
             Theory and Practice, pp. 298-372, 1999.
+    .. [Schubert] L. K. Schubert, "Modification of a quasi-Newton method for
+                  nonlinear equations with a sparse Jacobian", Mathematics of
+                  Computation, Vol. 24, pp. 27-30, 1970.
 
     Examples
     --------
@@ -885,7 +960,8 @@ def least_squares(
             def jac_wrapped(x, f):
                 J = approx_derivative(fun, x, rel_step=diff_step, method=jac,
                                       f0=f, bounds=bounds, args=args,
-                                      kwargs=kwargs, sparsity=jac_sparsity)
+                                      kwargs=kwargs, sparsity=jac_sparsity,
+                                      workers=workers, vectorized=vectorized)
                 if J.ndim != 2:  # J is guaranteed not sparse.
                     J = np.atleast_2d(J)
 
@@ -914,12 +990,28 @@ def least_squares(
             raise ValueError("x_scale='jac' can't be used when `jac` "
                              "returns LinearOperator.")
 
+        if (isinstance(J0, LinearOperator) and
+                tr_options.get('preconditioner') == 'jacobi'):
+            raise ValueError("The 'jacobi' preconditioner can't be used when "
+                             "`jac` returns LinearOperator.")
+
         if tr_solver is None:
             if isinstance(J0, np.ndarray):
                 tr_solver = 'exact'
             else:
                 tr_solver = 'lsmr'
 
+    if broyden_updates < 0:
+        raise ValueError("`broyden_updates` must be non-negative.")
+    elif broyden_updates > 0:
+        if method == 'lm':
+            raise ValueError("method='lm' doesn't support `broyden_updates`.")
+        if isinstance(J0, LinearOperator):
+            raise ValueError("`broyden_updates` can't be used when `jac` "
+                             "returns LinearOperator.")
+        jac_wrapped = BroydenJacobian(jac_wrapped, x0, f0, J0,
+                                      broyden_updates)
+
     if method == 'lm':
         result = call_minpack(fun_wrapped, x0, jac_wrapped, ftol, xtol, gtol,
                               max_nfev, x_scale, diff_step)
@@ -930,16 +1022,20 @@ def least_squares(
                      tr_options.copy(), verbose)
 
     elif method == 'dogbox':
-        if tr_solver == 'lsmr' and 'regularize' in tr_options:
-            warn("The keyword 'regularize' in `tr_options` is not relevant "
-                 "for 'dogbox' method.")
-            tr_options = tr_options.copy()
-            del tr_options['regularize']
+        for key in ['regularize', 'preconditioner']:
+            if tr_solver == 'lsmr' and key in tr_options:
+                warn("The keyword '{}' in `tr_options` is not relevant "
+                     "for 'dogbox' method.".format(key))
+                tr_options = tr_options.copy()
+                del tr_options[key]
 
         result = dogbox(fun_wrapped, jac_wrapped, x0, f0, J0, lb, ub, ftol,
                         xtol, gtol, max_nfev, x_scale, loss_function,
                         tr_solver, tr_options, verbose)
 
+    if broyden_updates > 0:
+        result.njev = jac_wrapped.njev
+
     result.message = TERMINATION_MESSAGES[result.status]
     result.success = result.status > 0
 
@@ -0,0 +1,301 @@
+"""Levenberg-Marquardt algorithm for a batch of independent small
+least-squares problems.
+
+All the problems of the batch are advanced together, so that the residuals
+and Jacobians are evaluated with one vectorized call per iteration and the
+linear algebra is done with stacked arrays. Each problem follows its own
+Levenberg-Marquardt iteration: the step solves
+
+    (J^T J + alpha * D^2) p = -J^T f,
+
+with D^2 the diagonal of J^T J (kept at its running maximum, as in MINPACK),
+and the damping parameter alpha is updated from the ratio of the actual and
+predicted reductions of the cost following [Nielsen]_. The termination
+conditions are the ones of `least_squares`, and a problem is removed from
+the active set, and not evaluated anymore, as soon as one of them is
+satisfied.
+
+References
+----------
+.. [Nielsen] H. B. Nielsen, "Damping Parameter in Marquardt's Method",
+    Technical Report IMM-REP-1999-05, Technical University of Denmark,
+    1999.
+"""
+import numpy as np
+from numpy.linalg import norm
+
+from scipy.optimize import OptimizeResult
+
+
+def least_squares_batch(fun, x0, jac='2-point', *, ftol=1e-8, xtol=1e-8,
+                        gtol=1e-8, max_nfev=None, diff_step=None, args=(),
+                        kwargs={}):
+    """Solve a batch of independent nonlinear least-squares problems.
+
+    Given a stack of `B` problems with `n` variables and `m` residuals each,
+    find for every problem ``b`` a local minimum of the cost function::
+
+        F(x[b]) = 0.5 * sum(fun(x[b])**2)
+
+    with the Levenberg-Marquardt algorithm. This is intended for a large
+    number of small, unbounded problems (e.g. a curve fit per pixel of an
+    image), for which calling `least_squares` in a loop is dominated by the
+    Python overhead of each call. The residuals and Jacobians of all the
+    problems still being optimized are evaluated with a single vectorized
+    call per iteration, and problems that have converged are removed from the
+    batch.
+
+    Parameters
+    ----------
+    fun : callable
+        Vectorized function which computes the vectors of residuals, with the
+        signature ``fun(x, batch, *args, **kwargs)``. ``x`` is an array of
+        shape (k, n) holding the variables of ``k`` problems of the batch and
+        ``batch`` is an integer array of shape (k,) with their indices in the
+        batch, which can be used to select the data of each problem.
+        Indices may be repeated in ``batch`` (when the Jacobian is estimated
+        by finite differences). `fun` must return an array of shape (k, m).
+    x0 : array_like, shape (B, n)
+        Initial guess of each problem of the batch.
+    jac : {'2-point', '3-point', callable}, optional
+        Method of computing the Jacobian matrices of the residuals. The
+        keywords select a finite difference scheme for numerical estimation
+        evaluating all the problems and perturbed points with one call of
+        `fun`. If callable, it is used as ``jac(x, batch, *args, **kwargs)``
+        and should return an array of shape (k, m, n). Default is '2-point'.
+    ftol : float, optional
+        Tolerance for termination by the change of the cost function, see
+        `least_squares`. Default is 1e-8.
+    xtol : float, optional
+        Tolerance for termination by the change of the independent
+        variables, see `least_squares`. Default is 1e-8.
+    gtol : float, optional
+        Tolerance for termination by the norm of the gradient. The condition
+        is ``norm(g, ord=np.inf) < gtol``. Default is 1e-8.
+    max_nfev : None or int, optional
+        Maximum number of evaluations of the residuals of each problem,
+        excluding the evaluations used for the finite difference Jacobian.
+        If None (default), ``100 * n`` is used.
+    diff_step : None or array_like, optional
+        Relative step size for the finite difference approximation of the
+        Jacobian, as in `least_squares`. If None (default), it is selected
+        automatically.
+    args, kwargs : tuple and dict, optional
+        Additional arguments passed to `fun` and `jac`. Both empty by default.
+
+    Returns
+    -------
+    result : OptimizeResult
+        The fields have the meaning of the ones returned by `least_squares`,
+        with an additional leading dimension of size `B`:
+
+            * x : ndarray, shape (B, n)
+            * cost : ndarray, shape (B,)
+            * fun : ndarray, shape (B, m)
+            * jac : ndarray, shape (B, m, n)
+            * grad : ndarray, shape (B, n)
+            * optimality : ndarray, shape (B,)
+            * nfev, njev : ndarray of int, shape (B,)
+            * status : ndarray of int, shape (B,)
+            * success : ndarray of bool, shape (B,)
+
+        The values of ``status`` are the ones of `least_squares`.
+
+    See Also
+    --------
+    least_squares : Solve a single nonlinear least-squares problem, with
+                    bounds and robust loss functions.
+
+    Notes
+    -----
+    The iteration of each problem is independent of the rest of the batch,
+    so that the solution found for a problem is the one found when it is
+    solved alone, which is equivalent to the solution of `least_squares`
+    with ``method='lm'`` (up to the tolerances, as MINPACK solves the
+    trust-region subproblem differently). Like ``method='lm'``, neither
+    bounds nor robust loss functions are supported, and ``m >= n`` is
+    required.
+
+    .. versionadded:: 1.8.0
+
+    Examples
+    --------
+    Fit an exponential decay to each of 1000 noisy signals:
+
+    >>> from scipy.optimize import least_squares_batch
+    >>> rng = np.random.default_rng()
+    >>> t = np.linspace(0, 3, 20)
+    >>> p_true = rng.uniform([1, 0.5], [2, 1.5], size=(1000, 2))
+    >>> y = p_true[:, :1] * np.exp(-p_true[:, 1:] * t)
+    >>> y += 0.01 * rng.standard_normal(y.shape)
+
+    >>> def residuals(p, batch):
+    ...     return p[:, :1] * np.exp(-p[:, 1:] * t) - y[batch]
+
+    >>> res = least_squares_batch(residuals, np.ones((1000, 2)))
+    >>> res.success.all()
+    True
+    >>> np.abs(res.x - p_true).max() < 0.1
+    True
+    """
+    if jac not in ['2-point', '3-point'] and not callable(jac):
+        raise ValueError("`jac` must be '2-point', '3-point' or callable.")
+
+    x0 = np.atleast_2d(x0).astype(float)
+    if x0.ndim != 2:
+        raise ValueError("`x0` must have shape (B, n).")
+    B, n = x0.shape
+
+    if max_nfev is None:
+        max_nfev = 100 * n
+    elif max_nfev <= 0:
+        raise ValueError("`max_nfev` must be None or positive integer.")
+
+    if diff_step is None:
+        # the same default relative steps as in `approx_derivative`
+        diff_step = np.finfo(float).eps ** (0.5 if jac == '2-point' else 1/3)
+    diff_step = np.broadcast_to(diff_step, (n,))
+
+    def fun_wrapped(x, batch):
+        f = np.asarray(fun(x, batch, *args, **kwargs), dtype=float)
+        if f.ndim != 2 or f.shape[0] != x.shape[0]:
+            raise ValueError("`fun` must return an array of shape (k, m) "
+                             "when given an array of shape (k, n).")
+        return f
+
+    if callable(jac):
+        def jac_wrapped(x, batch, f):
+            J = np.asarray(jac(x, batch, *args, **kwargs), dtype=float)
+            if J.shape != f.shape + (n,):
+                raise ValueError("`jac` must return an array of shape "
+                                 "(k, m, n).")
+            return J
+    else:
+        def jac_wrapped(x, batch, f):
+            return _approx_jacobian(fun_wrapped, x, batch, f, jac, diff_step)
+
+    batch = np.arange(B)
+    x = x0.copy()
+    f = fun_wrapped(x, batch)
+    m = f.shape[1]
+    if m < n:
+        raise ValueError("Levenberg-Marquardt requires that the number of "
+                         "residuals `m` is not less than the number of "
+                         "variables `n`.")
+    if not np.all(np.isfinite(f)):
+        raise ValueError("Residuals are not finite in the initial point.")
+
+    J = jac_wrapped(x, batch, f)
+    cost = 0.5 * np.sum(f**2, axis=1)
+    g = np.einsum('bmn,bm->bn', J, f)
+    nfev = np.ones(B, dtype=int)
+    njev = np.ones(B, dtype=int)
+
+    # diag(J^T J) is used to scale the damping term, kept at its running
+    # maximum (`scale_inv` in `compute_jac_scale`)
+    scale2 = np.sum(J**2, axis=1)
+    scale2[scale2 == 0] = 1
+    alpha = np.full(B, 1e-3)
+    nu = np.full(B, 2.0)
+
+    status = np.full(B, -2, dtype=int)
+    status[norm(g, ord=np.inf, axis=1) < gtol] = 1
+
+    active = np.flatnonzero(status == -2)
+    while active.size:
+        Ja, ga = J[active], g[active]
+        A = np.einsum('kmi,kmj->kij', Ja, Ja)
+        damp = alpha[active, None] * scale2[active]
+        A[:, np.arange(n), np.arange(n)] += damp
+        try:
+            step = -np.linalg.solve(A, ga[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            # solve problems one by one, using a least-squares solution for
+            # the (numerically) singular ones
+            step = np.array([-np.linalg.lstsq(Ak, gk, rcond=None)[0]
+                             for Ak, gk in zip(A, ga)])
+        predicted_reduction = 0.5 * np.sum(step * (damp * step - ga), axis=1)
+
+        x_new = x[active] + step
+        f_new = fun_wrapped(x_new, active)
+        nfev[active] += 1
+        finite = np.all(np.isfinite(f_new), axis=1)
+        cost_new = np.where(finite, 0.5 * np.sum(f_new**2, axis=1), np.inf)
+        actual_reduction = cost[active] - cost_new
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(predicted_reduction > 0,
+                             actual_reduction / predicted_reduction, 0)
+        ratio[(predicted_reduction == 0) & (actual_reduction == 0)] = 1
+
+        # termination conditions of `check_termination`
+        step_norm = norm(step, axis=1)
+        ftol_satisfied = ((actual_reduction < ftol * cost[active]) &
+                          (ratio > 0.25))
+        xtol_satisfied = step_norm < xtol * (xtol + norm(x[active], axis=1))
+        new_status = np.select(
+            [ftol_satisfied & xtol_satisfied, ftol_satisfied, xtol_satisfied],
+            [4, 2, 3], default=-2)
+
+        # damping update of [Nielsen]
+        accept = actual_reduction > 0
+        alpha[active] = np.where(
+            accept,
+            alpha[active] * np.maximum(1/3, 1 - (2*ratio - 1)**3),
+            alpha[active] * nu[active])
+        nu[active] = np.where(accept, 2, 2 * nu[active])
+
+        accepted = active[accept]
+        if accepted.size:
+            x[accepted] = x_new[accept]
+            f[accepted] = f_new[accept]
+            cost[accepted] = cost_new[accept]
+            J[accepted] = jac_wrapped(x[accepted], accepted, f[accepted])
+            njev[accepted] += 1
+            g[accepted] = np.einsum('kmn,km->kn', J[accepted], f[accepted])
+            scale2[accepted] = np.maximum(scale2[accepted],
+                                          np.sum(J[accepted]**2, axis=1))
+            gtol_satisfied = norm(g[accepted], ord=np.inf, axis=1) < gtol
+            new_status[accept] = np.where(gtol_satisfied, 1,
+                                          new_status[accept])
+
+        new_status[(new_status == -2) & (nfev[active] >= max_nfev)] = 0
+        status[active] = new_status
+        active = active[new_status == -2]
+
+    return OptimizeResult(
+        x=x, cost=cost, fun=f, jac=J, grad=g,
+        optimality=norm(g, ord=np.inf, axis=1), nfev=nfev, njev=njev,
+        status=status, success=status > 0)
+
+
+def _approx_jacobian(fun, x, batch, f0, method, rel_step):
+    """Finite difference Jacobians of a batch of problems, evaluating all
+    the perturbed points with one call of `fun`.
+    """
+    k, n = x.shape
+    sign_x = np.where(x >= 0, 1.0, -1.0)
+    h = rel_step * sign_x * np.maximum(1.0, np.abs(x))
+    # Round the steps so that they are exactly representable
+    h = (x + h) - x
+
+    # perturbed points, of shape (k, n, n) for the n variables of each
+    # problem, flattened to (k * n, n) for the call of `fun`
+    dx = h[:, :, None] * np.eye(n)[None, :, :]
+    batch_rep = np.repeat(batch, n)
+    if method == '2-point':
+        x1 = (x[:, None, :] + dx).reshape(k * n, n)
+        f1 = fun(x1, batch_rep).reshape(k, n, -1)
+        df = f1 - f0[:, None, :]
+        dh = h
+    else:
+        x1 = (x[:, None, :] - dx).reshape(k * n, n)
+        x2 = (x[:, None, :] + dx).reshape(k * n, n)
+        f12 = fun(np.concatenate((x1, x2)), np.concatenate((batch_rep,
+                                                            batch_rep)))
+        f1, f2 = f12.reshape(2, k, n, -1)
+        df = f2 - f1
+        dh = 2 * h
+
+    # df[b, j, :] is the change of the residuals with the variable j
+    return np.transpose(df / dh[:, :, None], (0, 2, 1))
@@ -106,7 +106,7 @@ from .common import (
     evaluate_quadratic, right_multiplied_operator, regularized_lsq_operator,
     CL_scaling_vector, compute_grad, compute_jac_scale, check_termination,
     update_tr_radius, scale_for_robust_loss_function, print_header_nonlinear,
-    print_iteration_nonlinear)
+    print_iteration_nonlinear, build_lsmr_preconditioner, preconditioned_lsmr)
 
 
 def trf(fun, jac, x0, f0, J0, lb, ub, ftol, xtol, gtol, max_nfev, x_scale,
@@ -243,6 +243,7 @@ def trf_bounds(fun, jac, x0, f0, J0, lb, ub, ftol, xtol, gtol, max_nfev,
     elif tr_solver == 'lsmr':
         reg_term = 0.0
         regularize = tr_options.pop('regularize', True)
+        preconditioner = tr_options.pop('preconditioner', None)
 
     if max_nfev is None:
         max_nfev = x0.size * 100
@@ -310,8 +311,14 @@ def trf_bounds(fun, jac, x0, f0, J0, lb, ub, ftol, xtol, gtol, max_nfev,
                 ag_value = minimize_quadratic_1d(a, b, 0, to_tr)[1]
                 reg_term = -ag_value / Delta**2
 
-            lsmr_op = regularized_lsq_operator(J_h, (diag_h + reg_term)**0.5)
-            gn_h = lsmr(lsmr_op, f_augmented, **tr_options)[0]
+            diag_reg = (diag_h + reg_term)**0.5
+            lsmr_op = regularized_lsq_operator(J_h, diag_reg)
+            if preconditioner is None:
+                gn_h = lsmr(lsmr_op, f_augmented, **tr_options)[0]
+            else:
+                P = build_lsmr_preconditioner(preconditioner, J, d, diag_reg)
+                gn_h = preconditioned_lsmr(lsmr_op, f_augmented, P,
+                                           **tr_options)
             S = np.vstack((g_h, gn_h)).T
             S, _ = qr(S, mode='economic')
             JS = J_h.dot(S)  # LinearOperator does dot too.
@@ -433,6 +440,9 @@ def trf_no_bounds(fun, jac, x0, f0, J0, ftol, xtol, gtol, max_nfev,
         reg_term = 0
         damp = tr_options.pop('damp', 0.0)
         regularize = tr_options.pop('regularize', True)
+        preconditioner = tr_options.pop('preconditioner', None)
+        if preconditioner is not None:
+            f_augmented = np.zeros(m + n)
 
     if max_nfev is None:
         max_nfev = x0.size * 100
@@ -477,7 +487,17 @@ def trf_no_bounds(fun, jac, x0, f0, J0, ftol, xtol, gtol, max_nfev,
                 reg_term = -ag_value / Delta**2
 
             damp_full = (damp**2 + reg_term)**0.5
-            gn_h = lsmr(J_h, f, damp=damp_full, **tr_options)[0]
+            if preconditioner is None:
+                gn_h = lsmr(J_h, f, damp=damp_full, **tr_options)[0]
+            else:
+                # The damping is applied to the unpreconditioned variables
+                # by an explicitly regularized operator.
+                diag_reg = np.full(n, damp_full)
+                f_augmented[:m] = f
+                P = build_lsmr_preconditioner(preconditioner, J, d, diag_reg)
+                gn_h = preconditioned_lsmr(
+                    regularized_lsq_operator(J_h, diag_reg), f_augmented, P,
+                    **tr_options)
             S = np.vstack((g_h, gn_h)).T
             S, _ = qr(S, mode='economic')
             JS = J_h.dot(S)
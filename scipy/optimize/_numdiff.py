@@ -5,6 +5,7 @@ from numpy.linalg import norm
 
 from scipy.sparse.linalg import LinearOperator
 from ..sparse import issparse, csc_matrix, csr_matrix, coo_matrix, find
+from .._lib._util import MapWrapper
 from ._group_columns import group_dense, group_sparse
 
 
@@ -256,7 +257,8 @@ def group_columns(A, order=0):
 
 def approx_derivative(fun, x0, method='3-point', rel_step=None, abs_step=None,
                       f0=None, bounds=(-np.inf, np.inf), sparsity=None,
-                      as_linear_operator=False, args=(), kwargs={}):
+                      as_linear_operator=False, args=(), kwargs={}, *,
+                      workers=1, vectorized=False):
     """Compute finite difference approximation of the derivatives of a
     vector-valued function.
 
@@ -334,6 +336,32 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, abs_step=None,
     args, kwargs : tuple and dict, optional
         Additional arguments passed to `fun`. Both empty by default.
         The calling signature is ``fun(x, *args, **kwargs)``.
+    workers : int or map-like callable, optional
+        If `workers` is an int the perturbed points are subdivided into
+        `workers` sections and `fun` is evaluated at them in parallel
+        (uses `multiprocessing.Pool <multiprocessing>`).
+        Supply -1 to use all available CPU cores.
+        Alternatively supply a map-like callable, such as
+        `multiprocessing.Pool.map` for evaluating the points in parallel.
+        This evaluation is carried out as ``workers(fun, iterable)``, and
+        requires that `fun` be pickleable. A new pool of processes is created
+        for each call when `workers` is an int, so for repeated calls a
+        map-like callable of a pool that is kept alive is more efficient.
+        Not used when `as_linear_operator` is True.
+
+        .. versionadded:: 1.8.0
+
+    vectorized : bool, optional
+        If ``vectorized is True``, `fun` is sent an `x` array with
+        ``x.shape == (n, S)``, and is expected to return an array of shape
+        ``(m, S)``, or ``(S,)`` if ``m == 1``, where `S` is the number of
+        points to be evaluated. All the perturbed points are then evaluated
+        in a single call, which takes precedence over `workers`. `fun` is
+        also called with ``x.shape == (n, 1)`` to compute ``fun(x0)``, and
+        for each product of the `LinearOperator` if `as_linear_operator` is
+        True.
+
+        .. versionadded:: 1.8.0
 
     Returns
     -------
@@ -378,6 +406,13 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, abs_step=None,
     different cases. b) In all cases np.atleast_2d can be called to get 2-D
     Jacobian with correct dimensions.
 
+    With `workers` or `vectorized`, all the perturbed points are formed
+    before `fun` is evaluated at any of them, so that they can be evaluated
+    concurrently or in a single call. This is worthwhile when `fun` is
+    expensive, as the points of the finite difference scheme are
+    independent. Otherwise each point is formed only when `fun` is
+    evaluated at it.
+
     References
     ----------
     .. [1] W. H. Press et. al. "Numerical Recipes. The Art of Scientific
@@ -433,12 +468,13 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, abs_step=None,
         raise ValueError("Bounds not supported when "
                          "`as_linear_operator` is True.")
 
-    def fun_wrapped(x):
-        f = np.atleast_1d(fun(x, *args, **kwargs))
-        if f.ndim > 1:
-            raise RuntimeError("`fun` return value has "
-                               "more than 1 dimension.")
-        return f
+    if vectorized:
+        fun_vectorized = _VectorizedFunctionWrapper(fun, args, kwargs)
+
+        def fun_wrapped(x):
+            return fun_vectorized([x])[0]
+    else:
+        fun_wrapped = _FunctionWrapper(fun, args, kwargs)
 
     if f0 is None:
         f0 = fun_wrapped(x0)
@@ -482,10 +518,7 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, abs_step=None,
         elif method == 'cs':
             use_one_sided = False
 
-        if sparsity is None:
-            return _dense_difference(fun_wrapped, x0, f0, h,
-                                     use_one_sided, method)
-        else:
+        if sparsity is not None:
             if not issparse(sparsity) and len(sparsity) == 2:
                 structure, groups = sparsity
             else:
@@ -498,9 +531,78 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, abs_step=None,
                 structure = np.atleast_2d(structure)
 
             groups = np.atleast_1d(groups)
-            return _sparse_difference(fun_wrapped, x0, f0, h,
-                                      use_one_sided, structure,
-                                      groups, method)
+
+        # The perturbed points are evaluated all at once, either in a single
+        # call of a vectorized `fun` or distributed among the workers
+        with MapWrapper(1 if vectorized else workers) as mapper:
+            if vectorized:
+                fun_points = fun_vectorized
+            else:
+                def fun_points(points):
+                    return mapper(fun_wrapped, points)
+
+            if sparsity is None:
+                return _dense_difference(fun_points, x0, f0, h,
+                                         use_one_sided, method)
+            else:
+                return _sparse_difference(fun_points, x0, f0, h,
+                                          use_one_sided, structure,
+                                          groups, method)
+
+
+class _FunctionWrapper:
+    """
+    Object to wrap user function and check its return value, allowing
+    picklability
+    """
+    def __init__(self, fun, args, kwargs):
+        self.fun = fun
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self, x):
+        f = np.atleast_1d(self.fun(x, *self.args, **self.kwargs))
+        if f.ndim > 1:
+            raise RuntimeError("`fun` return value has "
+                               "more than 1 dimension.")
+        return f
+
+
+def _with_workers_pool(solver):
+    """Decorate `solver` so that an integer `workers` creates a single pool,
+    which evaluates all of its finite difference derivatives and is closed
+    when `solver` returns.
+    """
+    @functools.wraps(solver)
+    def wrapper(*args, workers=1, **kwargs):
+        if callable(workers) or int(workers) == 1:
+            return solver(*args, workers=workers, **kwargs)
+        with MapWrapper(workers) as mapper:
+            return solver(*args, workers=mapper, **kwargs)
+    return wrapper
+
+
+class _VectorizedFunctionWrapper:
+    """
+    Object to evaluate a vectorized user function at a sequence of points,
+    returning the sequence of function values
+    """
+    def __init__(self, fun, args, kwargs):
+        self.fun = fun
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self, points):
+        points = list(points)
+        x = np.stack(points, axis=-1)
+        f = np.asarray(self.fun(x, *self.args, **self.kwargs))
+        if f.ndim == 1:
+            f = f[np.newaxis]
+        if f.ndim != 2 or f.shape[1] != len(points):
+            raise RuntimeError("The vectorized function must return an "
+                               "array of shape (m, S) when given an array "
+                               "of shape (n, S)")
+        return f.T
 
 
 def _linear_operator_difference(fun, x0, f0, h, method):
@@ -545,36 +647,50 @@ def _linear_operator_difference(fun, x0, f0, h, method):
 
 
 def _dense_difference(fun, x0, f0, h, use_one_sided, method):
+    # `fun` evaluates an iterable of points and returns an iterable of the
+    # function values at them
     m = f0.size
     n = x0.size
     J_transposed = np.empty((n, m))
     h_vecs = np.diag(h)
 
+    def perturbed_points():
+        # The points are generated as they are evaluated, so that they are
+        # only all held in memory if `fun` needs them at once
+        for i in range(h.size):
+            if method == '2-point':
+                yield x0 + h_vecs[i]
+            elif method == '3-point' and use_one_sided[i]:
+                yield x0 + h_vecs[i]
+                yield x0 + 2 * h_vecs[i]
+            elif method == '3-point' and not use_one_sided[i]:
+                yield x0 - h_vecs[i]
+                yield x0 + h_vecs[i]
+            elif method == 'cs':
+                yield x0 + h_vecs[i]*1.j
+            else:
+                raise RuntimeError("Never be here.")
+
+    f_values = iter(fun(perturbed_points()))
     for i in range(h.size):
         if method == '2-point':
-            x = x0 + h_vecs[i]
-            dx = x[i] - x0[i]  # Recompute dx as exactly representable number.
-            df = fun(x) - f0
+            # Recompute dx as exactly representable number.
+            dx = (x0[i] + h[i]) - x0[i]
+            df = next(f_values) - f0
         elif method == '3-point' and use_one_sided[i]:
-            x1 = x0 + h_vecs[i]
-            x2 = x0 + 2 * h_vecs[i]
-            dx = x2[i] - x0[i]
-            f1 = fun(x1)
-            f2 = fun(x2)
+            dx = (x0[i] + 2 * h[i]) - x0[i]
+            f1 = next(f_values)
+            f2 = next(f_values)
             df = -3.0 * f0 + 4 * f1 - f2
         elif method == '3-point' and not use_one_sided[i]:
-            x1 = x0 - h_vecs[i]
-            x2 = x0 + h_vecs[i]
-            dx = x2[i] - x1[i]
-            f1 = fun(x1)
-            f2 = fun(x2)
+            dx = (x0[i] + h[i]) - (x0[i] - h[i])
+            f1 = next(f_values)
+            f2 = next(f_values)
             df = f2 - f1
         elif method == 'cs':
-            f1 = fun(x0 + h_vecs[i]*1.j)
+            f1 = next(f_values)
             df = f1.imag
             dx = h_vecs[i, i]
-        else:
-            raise RuntimeError("Never be here.")
 
         J_transposed[i] = df / dx
 
@@ -593,14 +709,45 @@ def _sparse_difference(fun, x0, f0, h, use_one_sided,
     fractions = []
 
     n_groups = np.max(groups) + 1
+
+    def three_point(e, h_vec):
+        # Here we do conceptually the same but separate one-sided
+        # and two-sided schemes.
+        x1 = x0.copy()
+        x2 = x0.copy()
+
+        mask_1 = use_one_sided & e
+        x1[mask_1] += h_vec[mask_1]
+        x2[mask_1] += 2 * h_vec[mask_1]
+
+        mask_2 = ~use_one_sided & e
+        x1[mask_2] -= h_vec[mask_2]
+        x2[mask_2] += h_vec[mask_2]
+        return x1, x2
+
+    def perturbed_points():
+        # The points are generated as they are evaluated, so that they are
+        # only all held in memory if `fun` needs them at once
+        for group in range(n_groups):
+            # Perturb variables which are in the same group simultaneously.
+            e = np.equal(group, groups)
+            h_vec = h * e
+            if method == '2-point':
+                yield x0 + h_vec
+            elif method == '3-point':
+                yield from three_point(e, h_vec)
+            elif method == 'cs':
+                yield x0 + h_vec*1.j
+            else:
+                raise ValueError("Never be here.")
+
+    f_values = iter(fun(perturbed_points()))
     for group in range(n_groups):
-        # Perturb variables which are in the same group simultaneously.
         e = np.equal(group, groups)
         h_vec = h * e
         if method == '2-point':
-            x = x0 + h_vec
-            dx = x - x0
-            df = fun(x) - f0
+            dx = (x0 + h_vec) - x0
+            df = next(f_values) - f0
             # The result is  written to columns which correspond to perturbed
             # variables.
             cols, = np.nonzero(e)
@@ -609,25 +756,17 @@ def _sparse_difference(fun, x0, f0, h, use_one_sided,
             # Restore column indices in the full array.
             j = cols[j]
         elif method == '3-point':
-            # Here we do conceptually the same but separate one-sided
-            # and two-sided schemes.
-            x1 = x0.copy()
-            x2 = x0.copy()
+            x1, x2 = three_point(e, h_vec)
 
             mask_1 = use_one_sided & e
-            x1[mask_1] += h_vec[mask_1]
-            x2[mask_1] += 2 * h_vec[mask_1]
-
             mask_2 = ~use_one_sided & e
-            x1[mask_2] -= h_vec[mask_2]
-            x2[mask_2] += h_vec[mask_2]
 
             dx = np.zeros(n)
             dx[mask_1] = x2[mask_1] - x0[mask_1]
             dx[mask_2] = x2[mask_2] - x1[mask_2]
 
-            f1 = fun(x1)
-            f2 = fun(x2)
+            f1 = next(f_values)
+            f2 = next(f_values)
 
             cols, = np.nonzero(e)
             i, j, _ = find(structure[:, cols])
@@ -642,14 +781,12 @@ def _sparse_difference(fun, x0, f0, h, use_one_sided,
             rows = i[~mask]
             df[rows] = f2[rows] - f1[rows]
         elif method == 'cs':
-            f1 = fun(x0 + h_vec*1.j)
+            f1 = next(f_values)
             df = f1.imag
             dx = h_vec
             cols, = np.nonzero(e)
             i, j, _ = find(structure[:, cols])
             j = cols[j]
-        else:
-            raise ValueError("Never be here.")
 
         # All that's left is to compute the fraction. We store i, j and
         # fractions as separate arrays and later construct coo_matrix.
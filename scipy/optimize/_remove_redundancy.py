@@ -264,7 +264,45 @@ def _remove_redundancy_pivot_sparse(A, rhs):
            6.3 (1995): 219-227.
 
     """
+    A, rhs, status, message = _remove_zero_rows(A, rhs)
+
+    if status != 0:
+        return A, rhs, status, message
+
+    d, status, message = _dependent_rows_pivot_sparse(A, rhs)
+    if status != 0:
+        return A, rhs, status, message
+
+    keep = set(range(A.shape[0]))
+    keep = list(keep - set(d))
+    return A[keep, :], rhs[keep], status, message
+
+
+def _dependent_rows_pivot_sparse(A, rhs):
+    """
+    Identifies redundant equations of the system of equations defined by
+    Ax = b, which must not contain zero rows, and identifies infeasibilities.
+    This is the procedure behind `_remove_redundancy_pivot_sparse`.
+
+    Parameters
+    ----------
+    A : 2-D sparse matrix
+        An matrix representing the left-hand side of a system of equations
+    rhs : 1-D array
+        An array representing the right-hand side of a system of equations
+
+    Returns
+    -------
+    d : list of int
+        Indices of the rows of A found to be linearly dependent on the others
+    status: int
+        An integer indicating the status of the system
+        0: No infeasibility identified
+        2: Trivially infeasible
+    message : str
+        A string descriptor of the exit status of the optimization.
 
+    """
     tolapiv = 1e-8
     tolprimal = 1e-8
     status = 0
@@ -274,10 +312,6 @@ def _remove_redundancy_pivot_sparse(A, rhs):
                     "However the same linear combination of b_eq is "
                     "nonzero, suggesting that the constraints conflict "
                     "and the problem is infeasible.")
-    A, rhs, status, message = _remove_zero_rows(A, rhs)
-
-    if status != 0:
-        return A, rhs, status, message
 
     m, n = A.shape
 
@@ -288,7 +322,6 @@ def _remove_redundancy_pivot_sparse(A, rhs):
     k = set(range(m, m+n))  # Structural column indices.
     d = []                  # Indices of dependent rows
 
-    A_orig = A
     A = scipy.sparse.hstack((scipy.sparse.eye(m), A)).tocsc()
     e = np.zeros(m)
 
@@ -350,13 +383,163 @@ def _remove_redundancy_pivot_sparse(A, rhs):
             if abs(bibar)/(1 + bnorm) > tolprimal:
                 status = 2
                 message = inconsistent
-                return A_orig, rhs, status, message
+                return d, status, message
             else:  # dependent
                 d.append(i)
 
-    keep = set(range(m))
-    keep = list(keep - set(d))
-    return A_orig[keep, :], rhs[keep], status, message
+    return d, status, message
+
+
+def _independent_rows_sparse(A):
+    """
+    Identifies rows of a sparse matrix that cannot take part in any linear
+    dependency because they contain the only nonzero of some column.
+
+    Rows owning a column singleton are removed and the column counts of the
+    remaining rows are updated; this is repeated until no new column
+    singletons appear (the "crash" procedure of [2]).
+
+    Parameters
+    ----------
+    A : 2-D sparse matrix
+        A matrix representing the left-hand side of a system of equations
+
+    Returns
+    -------
+    independent : 1-D logical array
+        Values indicate whether the corresponding row of A is known to be
+        linearly independent of all other rows.
+
+    References
+    ----------
+    .. [2] Andersen, Erling D. "Finding all linearly dependent rows in
+           large-scale linear programming." Optimization Methods and Software
+           6.3 (1995): 219-227.
+
+    """
+    tol = 1e-13
+    m, n = A.shape
+    A = scipy.sparse.csc_matrix(A)
+    A.data[np.abs(A.data) <= tol] = 0
+    A.eliminate_zeros()
+    rows, indptr = A.indices, A.indptr
+    A_csr = A.tocsr()
+
+    independent = np.zeros(m, dtype=bool)
+    counts = np.diff(indptr)
+    frontier = np.flatnonzero(counts == 1)
+    while len(frontier) > 0:
+        # entries of the columns that have (just) become singletons
+        lengths = indptr[frontier + 1] - indptr[frontier]
+        starts = np.repeat(indptr[frontier] - np.cumsum(lengths) + lengths,
+                           lengths)
+        entries = starts + np.arange(lengths.sum())
+        candidates = rows[entries]
+        new = np.unique(candidates[~independent[candidates]])
+        if len(new) == 0:
+            break
+        independent[new] = True
+
+        # columns touched by the peeled rows lose one nonzero each
+        cols = A_csr[new].indices
+        counts = counts - np.bincount(cols, minlength=n)
+        touched = np.unique(cols)
+        frontier = touched[counts[touched] == 1]
+    return independent
+
+
+def _full_row_rank_sparse(A):
+    """
+    Checks whether a sparse matrix has full row rank using a sparse LU
+    factorization of ``A @ A.T``.
+
+    Parameters
+    ----------
+    A : 2-D sparse matrix
+        A matrix representing the left-hand side of a system of equations
+
+    Returns
+    -------
+    full_rank : bool
+        ``True`` if ``A`` was found to have full row rank. ``False`` means
+        only that full row rank could not be confirmed; it is also returned
+        without factorizing if ``A @ A.T`` would be much denser than ``A``.
+
+    """
+    m, n = A.shape
+    if m > n:
+        return False
+    # A column with k nonzeros contributes up to k**2 nonzeros to A @ A.T,
+    # so a few dense columns make it dense. Rather than forming it, such
+    # matrices are left to the pivoting routine.
+    counts = np.diff(scipy.sparse.csc_matrix(A).indptr).astype(np.int64)
+    if np.sum(counts**2) > max(10 * A.nnz, 10**6):
+        return False
+    A = scipy.sparse.csr_matrix(A)
+    M = (A @ A.T).tocsc()
+    try:
+        # A @ A.T is symmetric positive (semi)definite; a symmetric ordering
+        # without numerical pivoting preserves that structure
+        lu = scipy.sparse.linalg.splu(M, permc_spec="MMD_AT_PLUS_A",
+                                      diag_pivot_thresh=0,
+                                      options=dict(SymmetricMode=True))
+    except RuntimeError:  # exactly singular
+        return False
+    d = np.abs(lu.U.diagonal())
+    # the pivots scale with the square of the singular values of A, so this
+    # accepts condition numbers of A up to about 1e5 and hands anything
+    # worse to the pivoting routine
+    return d.min() > 1e-10 * d.max()
+
+
+def _remove_redundancy_sparse(A, rhs):
+    """
+    Eliminates redundant equations from system of equations defined by Ax = b
+    and identifies infeasibilities, without converting ``A`` to a dense
+    array.
+
+    Rows owning a column singleton (directly or after other such rows are
+    removed) are set aside, as they cannot be linearly dependent. The rank of
+    the remaining rows is checked with a sparse LU factorization, and only if
+    they are not found to have full row rank is the pivoting procedure of
+    `_remove_redundancy_pivot_sparse` applied to them, which solves a sparse
+    system for each of them.
+
+    Parameters
+    ----------
+    A : 2-D sparse matrix
+        A matrix representing the left-hand side of a system of equations
+    rhs : 1-D array
+        An array representing the right-hand side of a system of equations
+
+    Returns
+    -------
+    A : 2-D sparse matrix
+        A matrix representing the left-hand side of a system of equations
+    rhs : 1-D array
+        An array representing the right-hand side of a system of equations
+    status: int
+        An integer indicating the status of the system
+        0: No infeasibility identified
+        2: Trivially infeasible
+    message : str
+        A string descriptor of the exit status of the optimization.
+
+    """
+    A, rhs, status, message = _remove_zero_rows(A, rhs)
+
+    if status != 0:
+        return A, rhs, status, message
+
+    A = scipy.sparse.csr_matrix(A)
+    core = np.flatnonzero(~_independent_rows_sparse(A))
+    if len(core) == 0 or _full_row_rank_sparse(A[core]):
+        return A, rhs, status, message
+
+    d, status, message = _dependent_rows_pivot_sparse(A[core], rhs[core])
+    keep = np.ones(A.shape[0], dtype=bool)
+    keep[core[d]] = False
+    return A[keep], rhs[keep], status, message
 
 
 def _remove_redundancy_svd(A, b):
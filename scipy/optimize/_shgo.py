@@ -8,6 +8,8 @@ import logging
 import warnings
 from scipy import spatial
 from scipy.optimize import OptimizeResult, minimize
+from scipy.optimize._differentialevolution import _FunctionWrapper
+from scipy._lib._util import MapWrapper
 from scipy.optimize._shgo_lib.triangulation import Complex
 
 
@@ -16,7 +18,8 @@ __all__ = ['shgo']
 
 def shgo(func, bounds, args=(), constraints=None, n=None, iters=1,
          callback=None,
-         minimizer_kwargs=None, options=None, sampling_method='simplicial'):
+         minimizer_kwargs=None, options=None, sampling_method='simplicial',
+         *, workers=1, vectorized=False):
     """
     Finds the global minimum of a function using SHG optimization.
 
@@ -201,6 +204,33 @@ def shgo(func, bounds, args=(), constraints=None, n=None, iters=1,
         User defined sampling functions must accept two arguments of ``n``
         sampling points of dimension ``dim`` per call and output an array of
         sampling points with shape `n x dim`.
+    workers : int or map-like callable, optional
+        Sampling points and local minimizations are evaluated in parallel
+        using `multiprocessing.Pool <multiprocessing>`.
+        Supply -1 to use all available CPU cores.
+        Alternatively supply a map-like callable, such as
+        `multiprocessing.Pool.map` for parallel evaluation.
+        This evaluation is carried out as ``workers(func, iterable)``.
+        `func`, `constraints` and the contents of `minimizer_kwargs` must be
+        pickleable if `workers` is an int other than 1. See Notes.
+
+        .. versionadded:: 1.8.0
+
+    vectorized : bool, optional
+        If ``vectorized is True``, `func` is sent an `x` array with
+        ``x.shape == (N, S)``, and is expected to return an array of shape
+        ``(S,)``, where `S` is the number of sampling points to be
+        evaluated. All new ``halton``, ``sobol`` or custom sampling points
+        of an iteration are then evaluated in a single call, and the
+        inequality constraints should likewise accept an `x` array with
+        ``x.shape == (N, S)`` and return an array of shape ``(S,)``.
+        The ``simplicial`` sampling method and the local minimizations
+        evaluate a single point at a time, as ``x.shape == (N, 1)`` for
+        `func` and ``x.shape == (N,)`` for the constraint functions.
+        With `vectorized`, `workers` is only used for the local
+        minimizations.
+
+        .. versionadded:: 1.8.0
 
     Returns
     -------
@@ -253,7 +283,18 @@ def shgo(func, bounds, args=(), constraints=None, n=None, iters=1,
     are defined for the problem since the other methods do not use constraints.
 
     The ``halton`` and ``sobol`` method points are generated using
-    `scipy.stats.qmc`. Any other QMC method could be used.
+    `scipy.stats.qmc`. Any other QMC method could be used. With these methods,
+    each iteration draws further points of the same sequence and evaluates
+    only the new points.
+
+    With ``workers != 1`` the objective function is evaluated at each new
+    batch of ``halton``, ``sobol`` or custom sampling points in parallel; the
+    ``simplicial`` method evaluates its vertices as the complex is refined,
+    so its sampling stage remains serial. The local minimizations started
+    from the minimizer pool are also run concurrently, unless ``local_iter``
+    or ``f_min`` is specified in `options`: these select the next starting
+    point from the results of the previous local minimizations, so that the
+    local searches must then be performed sequentially.
 
     References
     ----------
@@ -413,10 +454,12 @@ def shgo(func, bounds, args=(), constraints=None, n=None, iters=1,
     shc = SHGO(func, bounds, args=args, constraints=constraints, n=n,
                iters=iters, callback=callback,
                minimizer_kwargs=minimizer_kwargs,
-               options=options, sampling_method=sampling_method)
+               options=options, sampling_method=sampling_method,
+               workers=workers, vectorized=vectorized)
 
     # Run the algorithm, process results and test success
-    shc.construct_complex()
+    with shc:
+        shc.construct_complex()
 
     if not shc.break_routine:
         if shc.disp:
@@ -446,7 +489,8 @@ def shgo(func, bounds, args=(), constraints=None, n=None, iters=1,
 class SHGO:
     def __init__(self, func, bounds, args=(), constraints=None, n=None,
                  iters=None, callback=None, minimizer_kwargs=None,
-                 options=None, sampling_method='sobol'):
+                 options=None, sampling_method='sobol', workers=1,
+                 vectorized=False):
 
         from scipy.stats import qmc
 
@@ -457,11 +501,24 @@ class SHGO:
                               " Valid methods: {}").format(', '.join(methods)))
 
         # Initiate class
+        # A vectorized objective evaluates all new sampling points at once,
+        # while the simplicial complex and the local minimizations evaluate
+        # one point at a time
+        self.vectorized = vectorized
+        if vectorized:
+            self.vfunc = func
+            func = _PointwiseWrapper(func)
         self.func = func
         self.bounds = bounds
         self.args = args
         self.callback = callback
 
+        # Objective function and local minimizations may be evaluated in
+        # parallel
+        self.workers = workers
+        self._mapwrapper = MapWrapper(workers)
+        self._wrapped_func = _FunctionWrapper(func, args)
+
         # Bounds
         abound = np.array(bounds, float)
         self.dim = np.shape(abound)[0]  # Dimensionality of problem
@@ -634,13 +691,13 @@ class SHGO:
                     self.sampling_method = 'halton'
                     self.qmc_engine = qmc.Halton(d=self.dim, scramble=True,
                                                  seed=np.random.RandomState())
-                sampling_method = lambda n, d: self.qmc_engine.random(n)
+                # Stream further points of the sequence every iteration
+                self.sampling = self.sampling_qmc
             else:
                 # A user defined sampling method:
                 self.sampling_method = 'custom'
-
-            self.sampling = self.sampling_custom
-            self.sampling_function = sampling_method  # F(n, d)
+                self.sampling = self.sampling_custom
+                self.sampling_function = sampling_method  # F(n, d)
 
         # Local controls
         self.stop_l_iter = False  # Local minimisation iterations
@@ -659,6 +716,12 @@ class SHGO:
         self.res.nljev = 0  # Local Jacobian evals for all minimisers
         self.res.nlhev = 0  # Local Hessian evals for all minimisers
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return self._mapwrapper.__exit__(*args)
+
     # Initiation aids
     def init_options(self, options):
         """
@@ -972,6 +1035,14 @@ class SHGO:
                      globally or locally)
 
         """
+        # Without a rule that depends on the results of the previous local
+        # minimizations, every point in the pool is minimized and the local
+        # searches can run concurrently
+        if (self.workers != 1 and not force_iter
+                and self.f_min_true is None):
+            self.minimise_pool_parallel()
+            return
+
         # Find first local minimum
         # NOTE: Since we always minimize this value regardless it is a waste to
         # build the topograph first before minimizing
@@ -1023,6 +1094,28 @@ class SHGO:
         self.stop_l_iter = False
         return
 
+    def minimise_pool_parallel(self):
+        """
+        Minimise every candidate in the minimizer pool, distributing the local
+        minimizations among the workers
+        """
+        starts = []
+        for x_min, ind in zip(self.X_min, self.minimizer_pool):
+            # Skip vertices that were already run or appear twice in the pool
+            if self.LMC[x_min].lres is not None or any(
+                    np.array_equal(x_min, x) for x, _ in starts):
+                continue
+            starts.append((x_min, self.local_bounds(x_min, ind=ind)))
+
+        minimizer = _LocalMinimizer(self.func, self.minimizer_kwargs)
+        lres_list = self._mapwrapper(minimizer, starts)
+        for (x_min, g_bounds), lres in zip(starts, lres_list):
+            self.add_local_result(x_min, lres, g_bounds)
+
+        # Every candidate has been minimised
+        self.trim_min_pool(np.arange(np.shape(self.X_min)[0]))
+        return
+
     def sort_min_pool(self):
         # Sort to find minimum func value in min_pool
         self.ind_f_min = np.argsort(self.minimizer_pool_F)
@@ -1141,6 +1234,26 @@ class SHGO:
             print('Starting '
                   'minimization at {}...'.format(x_min))
 
+        g_bounds = self.local_bounds(x_min, ind=ind)
+
+        if self.disp and 'bounds' in self.minimizer_kwargs:
+            print('bounds in kwarg:')
+            print(self.minimizer_kwargs['bounds'])
+
+        # Local minimization using scipy.optimize.minimize:
+        lres = minimize(self.func, x_min, **self.minimizer_kwargs)
+
+        if self.disp:
+            print('lres = {}'.format(lres))
+
+        return self.add_local_result(x_min, lres, g_bounds)
+
+    def local_bounds(self, x_min, ind=None):
+        """
+        Construct the bounds of the local minimization started at ``x_min``
+        and set them in the local minimizer keyword arguments if it supports
+        them.
+        """
         if self.sampling_method == 'simplicial':
             x_min_t = tuple(x_min)
             # Find the normalized tuple in the Vertex cache:
@@ -1149,24 +1262,19 @@ class SHGO:
             x_min_t_norm = tuple(x_min_t_norm)
 
             g_bounds = self.construct_lcb_simplicial(self.HC.V[x_min_t_norm])
-            if 'bounds' in self.min_solver_args:
-                self.minimizer_kwargs['bounds'] = g_bounds
-
         else:
             g_bounds = self.construct_lcb_delaunay(x_min, ind=ind)
-            if 'bounds' in self.min_solver_args:
-                self.minimizer_kwargs['bounds'] = g_bounds
 
-        if self.disp and 'bounds' in self.minimizer_kwargs:
-            print('bounds in kwarg:')
-            print(self.minimizer_kwargs['bounds'])
-
-        # Local minimization using scipy.optimize.minimize:
-        lres = minimize(self.func, x_min, **self.minimizer_kwargs)
+        if 'bounds' in self.min_solver_args:
+            self.minimizer_kwargs['bounds'] = g_bounds
 
-        if self.disp:
-            print('lres = {}'.format(lres))
+        return g_bounds
 
+    def add_local_result(self, x_min, lres, g_bounds):
+        """
+        Count the evaluations of a local minimization and add its result to
+        the local minima cache.
+        """
         # Local function evals for all minimizers
         self.res.nlfev += lres.nfev
         if 'njev' in lres:
@@ -1301,6 +1409,24 @@ class SHGO:
                             + self.bounds[i][0])
         return self.C
 
+    def sampling_qmc(self, n, dim):
+        """
+        Draws the next points of the QMC sequence so that ``n`` points have
+        been generated in total, scales them to the bound limits and appends
+        them to the sampling points of the previous iterations.
+        """
+        # Generate uniform sample points in [0, 1]^m \subset R^m
+        n_new = n - self.qmc_engine.num_generated
+        C_new = self.qmc_engine.random(n_new)
+        # Distribute over bounds
+        C_new = (C_new * (self.bounds[:, 1] - self.bounds[:, 0])
+                 + self.bounds[:, 0])
+        if self.qmc_engine.num_generated == n_new:
+            self.C = C_new
+        else:
+            self.C = np.concatenate([self.C, C_new])
+        return self.C
+
     def sampling_subspace(self):
         """Find subspace of feasible points from g_func definition"""
         # Subspace of feasible points.
@@ -1347,8 +1473,25 @@ class SHGO:
             f_cache_bool = True
 
         self.F = np.zeros(np.shape(self.C)[0])
+        if self.vectorized:
+            self.fun_ref_vectorized()
+        else:
+            self.fun_ref_pointwise()
+
+        if f_cache_bool:
+            if fn_old > 0:  # Restore saved function evaluations
+                self.F[0:fn_old] = Ftemp
+
+        return self.F
+
+    def fun_ref_pointwise(self):
+        """
+        Evaluate the objective function at the new feasible sampling points,
+        distributed among the workers
+        """
         # NOTE: It might be easier to replace this with a cached
         #      objective function
+        eval_ind = []
         for i in range(self.fn, np.shape(self.C)[0]):
             eval_f = True
             if self.g_cons is not None:
@@ -1358,16 +1501,41 @@ class SHGO:
                         break  # Breaks the g loop
 
             if eval_f:
-                self.F[i] = self.func(self.C[i, :], *self.args)
+                eval_ind.append(i)
                 self.fn += 1
             elif self.infty_cons_sampl:
                 self.F[i] = np.inf
                 self.fn += 1
-        if f_cache_bool:
-            if fn_old > 0:  # Restore saved function evaluations
-                self.F[0:fn_old] = Ftemp
 
-        return self.F
+        # Evaluate the feasible points, distributed among the workers
+        f_new = self._mapwrapper(self._wrapped_func, self.C[eval_ind])
+        for i, f in zip(eval_ind, f_new):
+            self.F[i] = f
+
+    def fun_ref_vectorized(self):
+        """
+        Evaluate the constraints and the vectorized objective function at all
+        new sampling points at once
+        """
+        new_ind = np.arange(self.fn, np.shape(self.C)[0])
+        feasible = np.ones(new_ind.size, dtype=bool)
+        if self.g_cons is not None:
+            for g, g_args in zip(self.g_cons, self.g_args):
+                feasible &= np.asarray(g(self.C[new_ind].T, *g_args)) >= 0.0
+
+        eval_ind = new_ind[feasible]
+        if eval_ind.size:
+            F_new = np.atleast_1d(self.vfunc(self.C[eval_ind].T, *self.args))
+            if F_new.shape != (eval_ind.size,):
+                raise RuntimeError(
+                    "The vectorized function must return an array of "
+                    "shape (S,) when given an array of shape (N, S)")
+            self.F[eval_ind] = F_new
+        self.fn += eval_ind.size
+
+        if self.infty_cons_sampl:
+            self.F[new_ind[~feasible]] = np.inf
+            self.fn += np.count_nonzero(~feasible)
 
     def surface_topo_ref(self):  # Validated
         """
@@ -1508,6 +1676,35 @@ class SHGO:
         return self.X_min
 
 
+class _PointwiseWrapper:
+    """
+    Object to evaluate a vectorized function at a single point, allowing
+    picklability
+    """
+    def __init__(self, f):
+        self.f = f
+
+    def __call__(self, x, *args):
+        return np.atleast_1d(self.f(np.asarray(x)[:, np.newaxis], *args))[0]
+
+
+class _LocalMinimizer:
+    """
+    Object to run a local minimization from a ``(x0, bounds)`` starting
+    point of the minimizer pool, allowing picklability
+    """
+    def __init__(self, func, minimizer_kwargs):
+        self.func = func
+        self.minimizer_kwargs = minimizer_kwargs
+
+    def __call__(self, start):
+        x0, bounds = start
+        minimizer_kwargs = dict(self.minimizer_kwargs)
+        if 'bounds' in minimizer_kwargs:
+            minimizer_kwargs['bounds'] = bounds
+        return minimize(self.func, x0, **minimizer_kwargs)
+
+
 class LMap:
     def __init__(self, v):
         self.v = v
@@ -117,7 +117,8 @@ def _minimize_trust_region(fun, x0, args=(), jac=None, hess=None, hessp=None,
                            subproblem=None, initial_trust_radius=1.0,
                            max_trust_radius=1000.0, eta=0.15, gtol=1e-4,
                            maxiter=None, disp=False, return_all=False,
-                           callback=None, inexact=True, **unknown_options):
+                           callback=None, inexact=True, cache_size=None,
+                           **unknown_options):
     """
     Minimization of scalar function of one or more variables using a
     trust-region algorithm.
@@ -140,6 +141,10 @@ def _minimize_trust_region(fun, x0, args=(), jac=None, hess=None, hessp=None,
             Accuracy to solve subproblems. If True requires less nonlinear
             iterations, but more vector products. Only effective for method
             trust-krylov.
+        cache_size : int
+            If given, the values and gradients of `fun` at up to `cache_size`
+            points are kept in a least recently used cache. The number of
+            cache hits is returned as ``ncache_hits`` in the result.
 
     This function is called by the `minimize` function.
     It is not supposed to be called directly.
@@ -170,7 +175,8 @@ def _minimize_trust_region(fun, x0, args=(), jac=None, hess=None, hessp=None,
 
     # A ScalarFunction representing the problem. This caches calls to fun, jac,
     # hess.
-    sf = _prepare_scalar_function(fun, x0, jac=jac, hess=hess, args=args)
+    sf = _prepare_scalar_function(fun, x0, jac=jac, hess=hess, args=args,
+                                  cache_size=cache_size)
     fun = sf.fun
     jac = sf.grad
     if callable(hess):
@@ -294,6 +300,9 @@ def _minimize_trust_region(fun, x0, args=(), jac=None, hess=None, hessp=None,
     if hess is not None:
         result['hess'] = m.hess
 
+    if cache_size is not None:
+        result['ncache_hits'] = sf.ncache_hits
+
     if return_all:
         result['allvecs'] = allvecs
 
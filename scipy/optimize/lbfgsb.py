@@ -39,6 +39,7 @@ from . import _lbfgsb
 from .optimize import (MemoizeJac, OptimizeResult,
                        _check_unknown_options, _prepare_scalar_function)
 from ._constraints import old_bound_to_new
+from ._numdiff import _with_workers_pool
 
 from scipy.sparse.linalg import LinearOperator
 
@@ -207,11 +208,13 @@ def fmin_l_bfgs_b(func, x0, fprime=None, args=(),
     return x, f, d
 
 
+@_with_workers_pool
 def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
                      disp=None, maxcor=10, ftol=2.2204460492503131e-09,
                      gtol=1e-5, eps=1e-8, maxfun=15000, maxiter=15000,
                      iprint=-1, callback=None, maxls=20,
-                     finite_diff_rel_step=None, **unknown_options):
+                     finite_diff_rel_step=None, workers=1, vectorized=False,
+                     cache_size=None, **unknown_options):
     """
     Minimize a scalar function of one or more variables using the L-BFGS-B
     algorithm.
@@ -260,6 +263,27 @@ def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
         possibly adjusted to fit into the bounds. For ``method='3-point'``
         the sign of `h` is ignored. If None (default) then step is selected
         automatically.
+    workers : int or map-like callable, optional
+        Evaluates the points of a finite difference gradient in parallel,
+        see `approx_derivative`. Requires that `fun` be pickleable if
+        ``workers != 1``.
+
+        .. versionadded:: 1.8.0
+
+    vectorized : bool, optional
+        If True, the points of a finite difference gradient are sent to
+        `fun` in a single call, as an array of shape ``(n, S)``, and
+        `fun` should return an array of shape ``(S,)``. Otherwise `fun`
+        is called with 1-D arrays. See `approx_derivative`.
+
+        .. versionadded:: 1.8.0
+    cache_size : int, optional
+        If given, the values and gradients of `fun` at up to `cache_size`
+        points are kept in a least recently used cache, so that revisiting a
+        point doesn't evaluate `fun` or `jac` again. The number of cache hits
+        is returned as ``ncache_hits`` in the result.
+
+        .. versionadded:: 1.8.0
 
     Notes
     -----
@@ -305,7 +329,9 @@ def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
 
     sf = _prepare_scalar_function(fun, x0, jac=jac, args=args, epsilon=eps,
                                   bounds=new_bounds,
-                                  finite_diff_rel_step=finite_diff_rel_step)
+                                  finite_diff_rel_step=finite_diff_rel_step,
+                                  workers=workers, vectorized=vectorized,
+                                  cache_size=cache_size)
 
     func_and_grad = sf.fun_and_grad
 
@@ -393,10 +419,14 @@ def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
     hess_inv = LbfgsInvHessProduct(s[:n_corrs], y[:n_corrs])
 
     task_str = task_str.decode()
-    return OptimizeResult(fun=f, jac=g, nfev=sf.nfev,
-                          njev=sf.ngev,
-                          nit=n_iterations, status=warnflag, message=task_str,
-                          x=x, success=(warnflag == 0), hess_inv=hess_inv)
+    result = OptimizeResult(fun=f, jac=g, nfev=sf.nfev,
+                            njev=sf.ngev,
+                            nit=n_iterations, status=warnflag,
+                            message=task_str, x=x, success=(warnflag == 0),
+                            hess_inv=hess_inv)
+    if cache_size is not None:
+        result['ncache_hits'] = sf.ncache_hits
+    return result
 
 
 class LbfgsInvHessProduct(LinearOperator):
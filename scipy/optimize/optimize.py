@@ -27,13 +27,14 @@ __docformat__ = "restructuredtext en"
 
 import warnings
 import sys
+import operator
 from numpy import (atleast_1d, eye, argmin, zeros, shape, squeeze,
                    asarray, sqrt, Inf, asfarray, isinf)
 import numpy as np
 from .linesearch import (line_search_wolfe1, line_search_wolfe2,
                          line_search_wolfe2 as line_search,
                          LineSearchWarning)
-from ._numdiff import approx_derivative
+from ._numdiff import approx_derivative, _with_workers_pool
 from scipy._lib._util import getfullargspec_no_self as _getfullargspec
 from scipy._lib._util import MapWrapper, check_random_state, rng_integers
 from scipy.optimize._differentiable_functions import ScalarFunction, FD_METHODS
@@ -172,7 +173,8 @@ def vecnorm(x, ord=2):
 
 def _prepare_scalar_function(fun, x0, jac=None, args=(), bounds=None,
                              epsilon=None, finite_diff_rel_step=None,
-                             hess=None):
+                             hess=None, workers=1, vectorized=False,
+                             cache_size=None):
     """
     Creates a ScalarFunction object for use with scalar minimizers
     (BFGS/LBFGSB/SLSQP/TNC/CG/etc).
@@ -225,6 +227,16 @@ def _prepare_scalar_function(fun, x0, jac=None, args=(), bounds=None,
         Whenever the gradient is estimated via finite-differences, the Hessian
         cannot be estimated with options {'2-point', '3-point', 'cs'} and needs
         to be estimated using one of the quasi-Newton strategies.
+    workers : int or map-like callable, optional
+        Used to evaluate the points of a finite difference gradient in
+        parallel, see `approx_derivative`.
+    vectorized : bool, optional
+        If True, the points of a finite difference gradient are evaluated in
+        a single call of `fun`, see `approx_derivative`.
+    cache_size : int, optional
+        Size of the least recently used cache of function values and
+        gradients, see `ScalarFunction`. By default only the last point is
+        memoized.
 
     Returns
     -------
@@ -259,7 +271,9 @@ def _prepare_scalar_function(fun, x0, jac=None, args=(), bounds=None,
     # ScalarFunction caches. Reuse of fun(x) during grad
     # calculation reduces overall function evaluations.
     sf = ScalarFunction(fun, x0, args, grad, hess,
-                        finite_diff_rel_step, bounds, epsilon=epsilon)
+                        finite_diff_rel_step, bounds, epsilon=epsilon,
+                        workers=workers, vectorized=vectorized,
+                        cache_size=cache_size)
 
     return sf
 
@@ -1205,9 +1219,11 @@ def fmin_bfgs(f, x0, fprime=None, args=(), gtol=1e-5, norm=Inf,
             return res['x']
 
 
+@_with_workers_pool
 def _minimize_bfgs(fun, x0, args=(), jac=None, callback=None,
                    gtol=1e-5, norm=Inf, eps=_epsilon, maxiter=None,
                    disp=False, return_all=False, finite_diff_rel_step=None,
+                   workers=1, vectorized=False, cache_size=None,
                    **unknown_options):
     """
     Minimization of scalar function of one or more variables using the
@@ -1237,6 +1253,27 @@ def _minimize_bfgs(fun, x0, args=(), jac=None, callback=None,
         possibly adjusted to fit into the bounds. For ``method='3-point'``
         the sign of `h` is ignored. If None (default) then step is selected
         automatically.
+    workers : int or map-like callable, optional
+        Evaluates the points of a finite difference gradient in parallel,
+        see `approx_derivative`. Requires that `fun` be pickleable if
+        ``workers != 1``.
+
+        .. versionadded:: 1.8.0
+
+    vectorized : bool, optional
+        If True, the points of a finite difference gradient are sent to
+        `fun` in a single call, as an array of shape ``(n, S)``, and
+        `fun` should return an array of shape ``(S,)``. Otherwise `fun`
+        is called with 1-D arrays. See `approx_derivative`.
+
+        .. versionadded:: 1.8.0
+    cache_size : int, optional
+        If given, the values and gradients of `fun` at up to `cache_size`
+        points are kept in a least recently used cache, so that revisiting a
+        point doesn't evaluate `fun` or `jac` again. The number of cache hits
+        is returned as ``ncache_hits`` in the result.
+
+        .. versionadded:: 1.8.0
 
     """
     _check_unknown_options(unknown_options)
@@ -1249,7 +1286,9 @@ def _minimize_bfgs(fun, x0, args=(), jac=None, callback=None,
         maxiter = len(x0) * 200
 
     sf = _prepare_scalar_function(fun, x0, jac, args=args, epsilon=eps,
-                                  finite_diff_rel_step=finite_diff_rel_step)
+                                  finite_diff_rel_step=finite_diff_rel_step,
+                                  workers=workers, vectorized=vectorized,
+                                  cache_size=cache_size)
 
     f = sf.fun
     myfprime = sf.grad
@@ -1342,6 +1381,8 @@ def _minimize_bfgs(fun, x0, args=(), jac=None, callback=None,
                             njev=sf.ngev, status=warnflag,
                             success=(warnflag == 0), message=msg, x=xk,
                             nit=k)
+    if cache_size is not None:
+        result['ncache_hits'] = sf.ncache_hits
     if retall:
         result['allvecs'] = allvecs
     return result
@@ -1520,9 +1561,11 @@ def fmin_cg(f, x0, fprime=None, args=(), gtol=1e-5, norm=Inf, epsilon=_epsilon,
             return res['x']
 
 
+@_with_workers_pool
 def _minimize_cg(fun, x0, args=(), jac=None, callback=None,
                  gtol=1e-5, norm=Inf, eps=_epsilon, maxiter=None,
                  disp=False, return_all=False, finite_diff_rel_step=None,
+                 workers=1, vectorized=False, cache_size=None,
                  **unknown_options):
     """
     Minimization of scalar function of one or more variables using the
@@ -1552,6 +1595,27 @@ def _minimize_cg(fun, x0, args=(), jac=None, callback=None,
         possibly adjusted to fit into the bounds. For ``method='3-point'``
         the sign of `h` is ignored. If None (default) then step is selected
         automatically.
+    workers : int or map-like callable, optional
+        Evaluates the points of a finite difference gradient in parallel,
+        see `approx_derivative`. Requires that `fun` be pickleable if
+        ``workers != 1``.
+
+        .. versionadded:: 1.8.0
+
+    vectorized : bool, optional
+        If True, the points of a finite difference gradient are sent to
+        `fun` in a single call, as an array of shape ``(n, S)``, and
+        `fun` should return an array of shape ``(S,)``. Otherwise `fun`
+        is called with 1-D arrays. See `approx_derivative`.
+
+        .. versionadded:: 1.8.0
+    cache_size : int, optional
+        If given, the values and gradients of `fun` at up to `cache_size`
+        points are kept in a least recently used cache, so that revisiting a
+        point doesn't evaluate `fun` or `jac` again. The number of cache hits
+        is returned as ``ncache_hits`` in the result.
+
+        .. versionadded:: 1.8.0
     """
     _check_unknown_options(unknown_options)
 
@@ -1562,7 +1626,9 @@ def _minimize_cg(fun, x0, args=(), jac=None, callback=None,
         maxiter = len(x0) * 200
 
     sf = _prepare_scalar_function(fun, x0, jac=jac, args=args, epsilon=eps,
-                                  finite_diff_rel_step=finite_diff_rel_step)
+                                  finite_diff_rel_step=finite_diff_rel_step,
+                                  workers=workers, vectorized=vectorized,
+                                  cache_size=cache_size)
 
     f = sf.fun
     myfprime = sf.grad
@@ -1660,6 +1726,8 @@ def _minimize_cg(fun, x0, args=(), jac=None, callback=None,
                             njev=sf.ngev, status=warnflag,
                             success=(warnflag == 0), message=msg, x=xk,
                             nit=k)
+    if cache_size is not None:
+        result['ncache_hits'] = sf.ncache_hits
     if retall:
         result['allvecs'] = allvecs
     return result
@@ -1780,7 +1848,7 @@ def fmin_ncg(f, x0, fprime, fhess_p=None, fhess=None, args=(), avextol=1e-5,
 
 def _minimize_newtoncg(fun, x0, args=(), jac=None, hess=None, hessp=None,
                        callback=None, xtol=1e-5, eps=_epsilon, maxiter=None,
-                       disp=False, return_all=False,
+                       disp=False, return_all=False, cache_size=None,
                        **unknown_options):
     """
     Minimization of scalar function of one or more variables using the
@@ -1802,6 +1870,13 @@ def _minimize_newtoncg(fun, x0, args=(), jac=None, hess=None, hessp=None,
     return_all : bool, optional
         Set to True to return a list of the best solution at each of the
         iterations.
+    cache_size : int, optional
+        If given, the values and gradients of `fun` at up to `cache_size`
+        points are kept in a least recently used cache, so that revisiting a
+        point doesn't evaluate `fun` or `jac` again. The number of cache hits
+        is returned as ``ncache_hits`` in the result.
+
+        .. versionadded:: 1.8.0
     """
     _check_unknown_options(unknown_options)
     if jac is None:
@@ -1815,7 +1890,8 @@ def _minimize_newtoncg(fun, x0, args=(), jac=None, hess=None, hessp=None,
     x0 = asarray(x0).flatten()
     # TODO: allow hess to be approximated by FD?
     # TODO: add hessp (callable or FD) to ScalarFunction?
-    sf = _prepare_scalar_function(fun, x0, jac, args=args, epsilon=eps, hess=fhess)
+    sf = _prepare_scalar_function(fun, x0, jac, args=args, epsilon=eps,
+                                  hess=fhess, cache_size=cache_size)
     f = sf.fun
     fprime = sf.grad
 
@@ -1832,6 +1908,8 @@ def _minimize_newtoncg(fun, x0, args=(), jac=None, hess=None, hessp=None,
                                 njev=sf.ngev, nhev=hcalls, status=warnflag,
                                 success=(warnflag == 0), message=msg, x=xk,
                                 nit=k)
+        if cache_size is not None:
+            result['ncache_hits'] = sf.ncache_hits
         if retall:
             result['allvecs'] = allvecs
         return result
@@ -3164,7 +3242,8 @@ def _endprint(x, flag, fval, maxfun, xtol, disp):
 
 
 def brute(func, ranges, args=(), Ns=20, full_output=0, finish=fmin,
-          disp=False, workers=1):
+          disp=False, workers=1, *, vectorized=False, chunksize=None,
+          nbest=1):
     """Minimize a function over a given range by brute force.
 
     Uses the "brute force" method, i.e., computes the function's value
@@ -3227,6 +3306,35 @@ def brute(func, ranges, args=(), Ns=20, full_output=0, finish=fmin,
 
         .. versionadded:: 1.3.0
 
+    vectorized : bool, optional
+        If ``vectorized is True``, `func` is sent an `x` array with
+        ``x.shape == (N, S)``, and is expected to return an array of shape
+        ``(S,)``, where `N` is the number of variables and `S` the number of
+        grid points to be evaluated. Without `chunksize`, the whole grid is
+        evaluated in a single call and `workers` is not used; with
+        `chunksize`, each chunk is evaluated in a single call. `finish` is
+        given a function of a single point, which calls `func` with an `x`
+        of shape ``(N, 1)``.
+
+        .. versionadded:: 1.8.0
+
+    chunksize : int, optional
+        If given, the grid is generated and evaluated in chunks of at most
+        `chunksize` points, which are distributed among the `workers`, and
+        only the `nbest` lowest function values of each chunk are kept.
+        Neither the grid nor the function values on it are stored, so that
+        the memory needed no longer grows with the number of grid points.
+        With `full_output`, `grid` and `Jout` are then replaced by the
+        `nbest` best grid points and their function values.
+
+        .. versionadded:: 1.8.0
+
+    nbest : int, optional
+        The number of best grid points returned with `chunksize` and
+        `full_output`. Default is 1.
+
+        .. versionadded:: 1.8.0
+
     Returns
     -------
     x0 : ndarray
@@ -3238,11 +3346,15 @@ def brute(func, ranges, args=(), Ns=20, full_output=0, finish=fmin,
         True.)
     grid : tuple
         Representation of the evaluation grid. It has the same
-        length as `x0`. (Returned when `full_output` is True.)
+        length as `x0`. (Returned when `full_output` is True.) If
+        `chunksize` is given, an array of shape ``(nbest, N)`` (or
+        ``(nbest,)`` if ``N == 1``) holding the `nbest` grid points with the
+        lowest function values, in increasing order of function value.
     Jout : ndarray
         Function values at each point of the evaluation
         grid, i.e., ``Jout = func(*grid)``. (Returned
-        when `full_output` is True.)
+        when `full_output` is True.) If `chunksize` is given, the function
+        values at the `nbest` grid points of `grid`.
 
     See Also
     --------
@@ -3334,6 +3446,20 @@ def brute(func, ranges, args=(), Ns=20, full_output=0, finish=fmin,
     Note that if `finish` had been set to None, we would have gotten the
     gridpoint [-1.0 1.75] where the rounded function value is -2.892.
 
+    On finer grids, or with more variables, the grid and the function values
+    on it may not fit in memory. With `chunksize`, the grid is evaluated in
+    chunks, here with a vectorized objective function, and only the best
+    grid points are kept:
+
+    >>> rranges = (slice(-4, 4, 0.01), slice(-4, 4, 0.01))
+    >>> resbrute = optimize.brute(f, rranges, args=params, full_output=True,
+    ...                           finish=None, vectorized=True,
+    ...                           chunksize=10**5, nbest=3)
+    >>> resbrute[2]  # the three best gridpoints
+    array([[-1.06,  1.81],
+           [-1.05,  1.81],
+           [-1.06,  1.8 ]])
+
     """
     N = len(ranges)
     if N > 40:
@@ -3345,44 +3471,13 @@ def brute(func, ranges, args=(), Ns=20, full_output=0, finish=fmin,
             if len(lrange[k]) < 3:
                 lrange[k] = tuple(lrange[k]) + (complex(Ns),)
             lrange[k] = slice(*lrange[k])
-    if (N == 1):
-        lrange = lrange[0]
-
-    grid = np.mgrid[lrange]
-
-    # obtain an array of parameters that is iterable by a map-like callable
-    inpt_shape = grid.shape
-    if (N > 1):
-        grid = np.reshape(grid, (inpt_shape[0], np.prod(inpt_shape[1:]))).T
-
-    wrapped_func = _Brute_Wrapper(func, args)
-
-    # iterate over input arrays, possibly in parallel
-    with MapWrapper(pool=workers) as mapper:
-        Jout = np.array(list(mapper(wrapped_func, grid)))
-        if (N == 1):
-            grid = (grid,)
-            Jout = np.squeeze(Jout)
-        elif (N > 1):
-            Jout = np.reshape(Jout, inpt_shape[1:])
-            grid = np.reshape(grid.T, inpt_shape)
-
-    Nshape = shape(Jout)
-
-    indx = argmin(Jout.ravel(), axis=-1)
-    Nindx = np.empty(N, int)
-    xmin = np.empty(N, float)
-    for k in range(N - 1, -1, -1):
-        thisN = Nshape[k]
-        Nindx[k] = indx % Nshape[k]
-        indx = indx // thisN
-    for k in range(N):
-        xmin[k] = grid[k][tuple(Nindx)]
 
-    Jmin = Jout[tuple(Nindx)]
-    if (N == 1):
-        grid = grid[0]
-        xmin = xmin[0]
+    if chunksize is not None:
+        xmin, Jmin, grid, Jout = _brute_chunked(func, lrange, args, workers,
+                                                vectorized, chunksize, nbest)
+    else:
+        xmin, Jmin, grid, Jout = _brute_grid(func, lrange, args, workers,
+                                             vectorized)
 
     if callable(finish):
         # set up kwargs for `finish` function
@@ -3397,8 +3492,16 @@ def brute(func, ranges, args=(), Ns=20, full_output=0, finish=fmin,
             # (e.g., if `finish` is `minimize`)
             finish_kwargs['options'] = {'disp': disp}
 
+        if vectorized:
+            # `finish` evaluates one point at a time
+            def finish_func(x, *args):
+                x = np.reshape(x, (-1, 1))
+                return np.atleast_1d(func(x, *args))[0]
+        else:
+            finish_func = func
+
         # run minimizer
-        res = finish(func, xmin, args=args, **finish_kwargs)
+        res = finish(finish_func, xmin, args=args, **finish_kwargs)
 
         if isinstance(res, OptimizeResult):
             xmin = res.x
@@ -3420,6 +3523,137 @@ def brute(func, ranges, args=(), Ns=20, full_output=0, finish=fmin,
         return xmin
 
 
+def _brute_grid(func, lrange, args, workers, vectorized):
+    """
+    Evaluate `func` on the whole grid for `brute` and find its minimum.
+    """
+    N = len(lrange)
+    if (N == 1):
+        lrange = lrange[0]
+
+    grid = np.mgrid[lrange]
+
+    # obtain an array of parameters that is iterable by a map-like callable
+    inpt_shape = grid.shape
+    if (N > 1):
+        grid = np.reshape(grid, (inpt_shape[0], np.prod(inpt_shape[1:]))).T
+
+    if vectorized:
+        Jout = _Brute_Chunk(func, args, None, True, None).evaluate(
+            np.reshape(grid, (-1, N)).T)
+        if (N == 1):
+            grid = (grid,)
+        else:
+            Jout = np.reshape(Jout, inpt_shape[1:])
+            grid = np.reshape(grid.T, inpt_shape)
+    else:
+        wrapped_func = _Brute_Wrapper(func, args)
+
+        # iterate over input arrays, possibly in parallel
+        with MapWrapper(pool=workers) as mapper:
+            Jout = np.array(list(mapper(wrapped_func, grid)))
+            if (N == 1):
+                grid = (grid,)
+                Jout = np.squeeze(Jout)
+            elif (N > 1):
+                Jout = np.reshape(Jout, inpt_shape[1:])
+                grid = np.reshape(grid.T, inpt_shape)
+
+    Nshape = shape(Jout)
+
+    indx = argmin(Jout.ravel(), axis=-1)
+    Nindx = np.empty(N, int)
+    xmin = np.empty(N, float)
+    for k in range(N - 1, -1, -1):
+        thisN = Nshape[k]
+        Nindx[k] = indx % Nshape[k]
+        indx = indx // thisN
+    for k in range(N):
+        xmin[k] = grid[k][tuple(Nindx)]
+
+    Jmin = Jout[tuple(Nindx)]
+    if (N == 1):
+        grid = grid[0]
+        xmin = xmin[0]
+    return xmin, Jmin, grid, Jout
+
+
+def _brute_chunked(func, lrange, args, workers, vectorized, chunksize, nbest):
+    """
+    Evaluate `func` on the grid for `brute` in chunks, keeping only the
+    `nbest` best grid points.
+    """
+    chunksize = operator.index(chunksize)
+    nbest = operator.index(nbest)
+    if chunksize < 1:
+        raise ValueError("`chunksize` must be a positive integer.")
+    if nbest < 1:
+        raise ValueError("`nbest` must be a positive integer.")
+
+    # the points of the grid along each axis, as `np.mgrid` would give them
+    N = len(lrange)
+    axes = [np.mgrid[r] for r in lrange]
+    npoints = int(np.prod([axis.size for axis in axes]))
+    bounds = [(start, min(start + chunksize, npoints))
+              for start in range(0, npoints, chunksize)]
+
+    # each chunk is reduced to its best points where it is evaluated, so
+    # that only those are sent back by the workers
+    chunk_func = _Brute_Chunk(func, args, axes, vectorized, nbest)
+    with MapWrapper(pool=workers) as mapper:
+        results = list(mapper(chunk_func, bounds))
+
+    Jbest = np.concatenate([J for J, indx in results])
+    indx = np.concatenate([indx for J, indx in results])
+    # a stable sort keeps the first grid point among equal values, as
+    # `argmin` does on the whole grid
+    order = np.argsort(Jbest, kind='stable')[:nbest]
+    Jbest, indx = Jbest[order], indx[order]
+    xbest = chunk_func.points(indx).T
+    if (N == 1):
+        # scalars and 1-D arrays, as for the whole grid
+        xbest = xbest[:, 0]
+    return xbest[0], Jbest[0], xbest, Jbest
+
+
+class _Brute_Chunk:
+    """
+    Object to evaluate a chunk of the grid of optimize.brute and keep its
+    best points, allowing picklability
+    """
+
+    def __init__(self, f, args, axes, vectorized, nbest):
+        self.f = f
+        self.args = [] if args is None else args
+        self.axes = axes
+        self.vectorized = vectorized
+        self.nbest = nbest
+
+    def points(self, indx):
+        # the grid points with flat indices `indx`, with shape (N, S)
+        shape = tuple(axis.size for axis in self.axes)
+        return np.array([axis[i] for axis, i in
+                         zip(self.axes, np.unravel_index(indx, shape))],
+                        dtype=float)
+
+    def evaluate(self, x):
+        if self.vectorized:
+            J = np.atleast_1d(self.f(x, *self.args))
+            if J.shape != x.shape[1:]:
+                raise RuntimeError(
+                    "The vectorized function must return an array of "
+                    "shape (S,) when given an array of shape (N, S)")
+            return J
+        return np.reshape([self.f(xi, *self.args) for xi in x.T],
+                          x.shape[1:])
+
+    def __call__(self, bounds):
+        indx = np.arange(*bounds)
+        J = self.evaluate(self.points(indx))
+        best = np.argsort(J, kind='stable')[:self.nbest]
+        return J[best], indx[best]
+
+
 class _Brute_Wrapper:
     """
     Object to wrap user cost function for optimize.brute, allowing picklability
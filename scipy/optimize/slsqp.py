@@ -23,7 +23,7 @@ from numpy import (zeros, array, linalg, append, asfarray, concatenate, finfo,
 from .optimize import (OptimizeResult, _check_unknown_options,
                        _prepare_scalar_function, _clip_x_for_func,
                        _check_clip_x)
-from ._numdiff import approx_derivative
+from ._numdiff import approx_derivative, _with_workers_pool
 from ._constraints import old_bound_to_new, _arr_to_scalar
 
 
@@ -212,10 +212,12 @@ def fmin_slsqp(func, x0, eqcons=(), f_eqcons=None, ieqcons=(), f_ieqcons=None,
         return res['x']
 
 
+@_with_workers_pool
 def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
                     constraints=(),
                     maxiter=100, ftol=1.0E-6, iprint=1, disp=False,
                     eps=_epsilon, callback=None, finite_diff_rel_step=None,
+                    workers=1, vectorized=False, cache_size=None,
                     **unknown_options):
     """
     Minimize a scalar function of one or more variables using Sequential
@@ -239,6 +241,27 @@ def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
         possibly adjusted to fit into the bounds. For ``method='3-point'``
         the sign of `h` is ignored. If None (default) then step is selected
         automatically.
+    workers : int or map-like callable, optional
+        Evaluates the points of a finite difference gradient in parallel,
+        see `approx_derivative`. Requires that `func` be pickleable if
+        ``workers != 1``.
+
+        .. versionadded:: 1.8.0
+
+    vectorized : bool, optional
+        If True, the points of a finite difference gradient are sent to
+        `func` in a single call, as an array of shape ``(n, S)``, and
+        `func` should return an array of shape ``(S,)``. Otherwise `func`
+        is called with 1-D arrays. See `approx_derivative`.
+
+        .. versionadded:: 1.8.0
+    cache_size : int, optional
+        If given, the values and gradients of `func` at up to `cache_size`
+        points are kept in a least recently used cache, so that revisiting a
+        point doesn't evaluate `func` or `jac` again. The number of cache hits
+        is returned as ``ncache_hits`` in the result.
+
+        .. versionadded:: 1.8.0
     """
     _check_unknown_options(unknown_options)
     iter = maxiter - 1
@@ -374,7 +397,8 @@ def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
     # ScalarFunction provides function and gradient evaluation
     sf = _prepare_scalar_function(func, x, jac=jac, args=args, epsilon=eps,
                                   finite_diff_rel_step=finite_diff_rel_step,
-                                  bounds=new_bounds)
+                                  bounds=new_bounds, workers=workers,
+                                  vectorized=vectorized, cache_size=cache_size)
     # gh11403 SLSQP sometimes exceeds bounds by 1 or 2 ULP, make sure this
     # doesn't get sent to the func/grad evaluator.
     wrapped_fun = _clip_x_for_func(sf.fun, new_bounds)
@@ -457,9 +481,13 @@ def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
         print("            Function evaluations:", sf.nfev)
         print("            Gradient evaluations:", sf.ngev)
 
-    return OptimizeResult(x=x, fun=fx, jac=g[:-1], nit=int(majiter),
-                          nfev=sf.nfev, njev=sf.ngev, status=int(mode),
-                          message=exit_modes[int(mode)], success=(mode == 0))
+    result = OptimizeResult(x=x, fun=fx, jac=g[:-1], nit=int(majiter),
+                            nfev=sf.nfev, njev=sf.ngev, status=int(mode),
+                            message=exit_modes[int(mode)],
+                            success=(mode == 0))
+    if cache_size is not None:
+        result['ncache_hits'] = sf.ncache_hits
+    return result
 
 
 def _eval_constraint(x, cons):
@@ -2,6 +2,8 @@
 Unit tests for the basin hopping global minimization algorithm.
 """
 import copy
+import multiprocessing
+from unittest.mock import patch
 
 from numpy.testing import assert_almost_equal, assert_equal, assert_
 import pytest
@@ -330,6 +332,74 @@ class TestBasinHopping:
                            niter=self.niter, disp=self.disp, T=0)
         assert_almost_equal(res.x, self.sol[i], self.tol)
 
+    def test_parallel_tempering(self):
+        # test 2-D minimizations with a replica at each temperature
+        i = 1
+        T = [0.5, 1.0, 2.0, 0.0]
+        ncalls = []
+
+        def callback(x, f, accept):
+            ncalls.append(f)
+
+        res = basinhopping(func2d, self.x0[i], minimizer_kwargs=self.kwargs,
+                           niter=self.niter, disp=self.disp, T=T,
+                           callback=callback, seed=1234)
+        assert_almost_equal(res.x, self.sol[i], self.tol)
+        assert_equal(len(ncalls), self.niter * len(T) + 1)
+        assert_equal(res.fun, min(ncalls))
+
+        # the result does not depend on the workers
+        res2 = basinhopping(func2d, self.x0[i], minimizer_kwargs=self.kwargs,
+                            niter=self.niter, disp=self.disp, T=T,
+                            seed=1234, workers=map)
+        assert_equal(res2.x, res.x)
+        assert_equal(res2.nfev, res.nfev)
+
+        res3 = basinhopping(func2d, self.x0[i], minimizer_kwargs=self.kwargs,
+                            niter=10, T=T, seed=1234, workers=2)
+        assert_equal(res3.x.shape, res.x.shape)
+
+    def test_parallel_tempering_T(self):
+        # a single temperature in a sequence is plain basin-hopping
+        i = 1
+        res1 = basinhopping(func2d, self.x0[i], minimizer_kwargs=self.kwargs,
+                            niter=10, T=[1.0], seed=1234)
+        res2 = basinhopping(func2d, self.x0[i], minimizer_kwargs=self.kwargs,
+                            niter=10, T=1.0, seed=1234)
+        assert_equal(res1.x, res2.x)
+        assert_equal(res1.nfev, res2.nfev)
+
+        assert_raises(ValueError, basinhopping, func2d, self.x0[i], T=[])
+        assert_raises(ValueError, basinhopping, func2d, self.x0[i],
+                      T=[[1.0]])
+
+        # `workers` is ignored for a scalar T, without creating a pool
+        with patch('multiprocessing.Pool',
+                   wraps=multiprocessing.Pool) as pool:
+            res3 = basinhopping(func2d, self.x0[i],
+                                minimizer_kwargs=self.kwargs, niter=10,
+                                T=1.0, seed=1234, workers=2)
+        assert_equal(pool.call_count, 0)
+        assert_equal(res3.x, res2.x)
+
+    def test_parallel_tempering_callback(self):
+        # the callback is called for every replica, even after one of them
+        # requests a stop
+        i = 1
+        T = [0.5, 1.0, 2.0]
+        ncalls = []
+
+        def callback(x, f, accept):
+            ncalls.append(f)
+            return True
+
+        res = basinhopping(func2d, self.x0[i], minimizer_kwargs=self.kwargs,
+                           niter=10, T=T, callback=callback, seed=1234)
+        assert_("callback" in res.message[0])
+        assert_equal(res.nit, 1)
+        # one call during construction, then one for each replica
+        assert_equal(len(ncalls), 1 + len(T))
+
 
 class Test_Storage:
     def setup_method(self):
@@ -3,6 +3,8 @@ Unit tests for the differential global minimization algorithm.
 """
 import multiprocessing
 import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from scipy.optimize._differentialevolution import (DifferentialEvolutionSolver,
                                                    _ConstraintWrapper)
@@ -609,6 +611,152 @@ class TestDifferentialEvolutionSolver:
             assert_(solver._updating == 'deferred')
             solver.solve()
 
+    def test_vectorized(self):
+        # the population is sent to the function in one call, and the
+        # result is the same as that of the non-vectorized function
+        calls = []
+
+        def func(x):
+            calls.append(x.shape)
+            return rosen(x)
+
+        bounds = [(0., 2.), (0., 2.)]
+        with warns(UserWarning, match="overridden updating='immediate'"):
+            res = differential_evolution(func, bounds, seed=1,
+                                         vectorized=True)
+        res2 = differential_evolution(rosen, bounds, seed=1,
+                                      updating='deferred')
+        assert_allclose(res.x, res2.x)
+        assert_equal(res.nfev, res2.nfev)
+        # the polishing evaluations are sent with S == 1
+        assert_equal(calls[0], (2, 30))
+        assert_equal(calls[-1], (2, 1))
+        # one call per generation, plus the initial population
+        n_polish = res.nfev - 30 * (res.nit + 1)
+        assert_equal(len(calls), res.nit + 1 + n_polish)
+
+        with warns(UserWarning, match="overridden workers=2"):
+            with DifferentialEvolutionSolver(rosen, bounds, workers=2,
+                                             updating='deferred',
+                                             vectorized=True) as solver:
+                assert solver._mapwrapper.pool is None
+
+        with assert_raises(RuntimeError, match='shape'):
+            differential_evolution(lambda x: 1., bounds, vectorized=True,
+                                   updating='deferred')
+
+    def test_vectorized_constraints(self):
+        def constr_f(x):
+            return np.array([x[0] + x[1]])
+
+        def constr_f2(x):
+            return np.array([x[0]**2 + x[1], x[0] - x[1]])
+
+        nlc1 = NonlinearConstraint(constr_f, -np.inf, 1.9)
+        nlc2 = NonlinearConstraint(constr_f2, (0.9, 0.5), (2.0, 2.0))
+        lc = LinearConstraint([[1., 1.]], -np.inf, 1.9)
+        bounds = [(0., 2.), (0., 2.)]
+
+        def func(x):
+            return rosen(x)
+
+        for constraints in [(nlc1, nlc2), lc]:
+            solver = DifferentialEvolutionSolver(
+                func, bounds, constraints=constraints, updating='deferred')
+            vsolver = DifferentialEvolutionSolver(
+                func, bounds, constraints=constraints, updating='deferred',
+                vectorized=True)
+            feasible, cv = solver._calculate_population_feasibilities(
+                solver.population)
+            vfeasible, vcv = vsolver._calculate_population_feasibilities(
+                solver.population)
+            assert_equal(vfeasible, feasible)
+            assert_allclose(vcv, cv)
+
+        res = differential_evolution(func, bounds, constraints=(nlc1, nlc2),
+                                     seed=1, updating='deferred',
+                                     vectorized=True)
+        res2 = differential_evolution(func, bounds, constraints=(nlc1, nlc2),
+                                      seed=1, updating='deferred')
+        assert_allclose(res.x, res2.x)
+        assert res.success
+
+    def test_async(self):
+        # asynchronous updating converges, and is reproducible for a given
+        # seed and number of workers whatever the order of completion
+        bounds = [(0., 2.), (0., 2.)]
+
+        def func(x):
+            # evaluations that take very different times
+            time.sleep(0.0002 * (x[0] > 1))
+            return rosen(x)
+
+        results = []
+        for _ in range(2):
+            with ThreadPoolExecutor(3) as executor:
+                res = differential_evolution(func, bounds, seed=1,
+                                             updating='async',
+                                             workers=executor)
+            results.append(res)
+        assert res.success
+        assert_allclose(res.x, [1., 1.], atol=1e-4)
+        assert_equal(results[0].x, results[1].x)
+        # trials still being evaluated when the solver stops are counted,
+        # so `nfev` can differ by up to one trial per population member
+        assert abs(results[0].nfev - results[1].nfev) <= 2 * 15
+
+        with DifferentialEvolutionSolver(rosen, bounds, seed=1,
+                                         updating='async',
+                                         workers=2) as solver:
+            res = solver.solve()
+            assert not solver._pending
+        assert_allclose(res.x, [1., 1.], atol=1e-4)
+
+        # without workers the trials are evaluated one at a time
+        res = differential_evolution(rosen, bounds, seed=1, updating='async',
+                                     maxiter=10, polish=False)
+        assert_equal(res.nfev, 30 * 11)
+
+        solver = DifferentialEvolutionSolver(rosen, bounds, seed=1,
+                                             updating='async', maxfun=200,
+                                             polish=False)
+        assert_equal(solver.solve().nfev, 200)
+
+        # every evaluation that ran is counted, including those of trials
+        # that are discarded when the solver stops
+        calls = []
+
+        def counted(x):
+            calls.append(x)
+            return rosen(x)
+
+        res = differential_evolution(counted, bounds, seed=1,
+                                     updating='async', polish=False)
+        assert_equal(res.nfev, len(calls))
+        calls.clear()
+        with ThreadPoolExecutor(3) as executor:
+            res = differential_evolution(counted, bounds, seed=1,
+                                         updating='async', workers=executor,
+                                         polish=False)
+        assert_equal(res.nfev, len(calls))
+
+        with assert_raises(ValueError, match="requires `workers`"):
+            differential_evolution(rosen, bounds, updating='async',
+                                   workers=map)
+
+    def test_async_constraints(self):
+        def constr_f(x):
+            return [x[0] + x[1]]
+
+        nlc = NonlinearConstraint(constr_f, -np.inf, 1.9)
+        bounds = [(0., 2.), (0., 2.)]
+        with ThreadPoolExecutor(2) as executor:
+            res = differential_evolution(rosen, bounds, constraints=nlc,
+                                         seed=1, updating='async',
+                                         workers=executor)
+        assert res.success
+        assert constr_f(res.x)[0] <= 1.9 + 1e-8
+
     def test_converged(self):
         solver = DifferentialEvolutionSolver(rosen, [(0, 2), (0, 2)])
         solver.solve()
@@ -305,6 +305,55 @@ class TestApproxDerivativesDense:
         assert_raises(ValueError, approx_derivative,
                       self.wrong_dimensions_fun, x0, f0=f0)
 
+    def test_workers(self):
+        x0 = np.array([-0.1, 0.1])
+        for method in ['2-point', '3-point', 'cs']:
+            jac_serial = approx_derivative(self.fun_vector_vector, x0,
+                                           method=method)
+            jac_map = approx_derivative(self.fun_vector_vector, x0,
+                                        method=method, workers=map)
+            assert_equal(jac_map, jac_serial)
+
+        jac_serial = approx_derivative(self.fun_parametrized, x0,
+                                       args=(-1.0,), kwargs=dict(c1=1.0))
+        jac_pool = approx_derivative(self.fun_parametrized, x0,
+                                     args=(-1.0,), kwargs=dict(c1=1.0),
+                                     workers=2)
+        assert_equal(jac_pool, jac_serial)
+
+    def test_vectorized(self):
+        calls = []
+
+        def fun(x):
+            calls.append(x.shape)
+            return self.fun_vector_vector(x)
+
+        x0 = np.array([-0.1, 0.1])
+        for method, nsteps in [('2-point', 2), ('3-point', 4), ('cs', 2)]:
+            calls.clear()
+            jac_serial = approx_derivative(self.fun_vector_vector, x0,
+                                           method=method)
+            jac_vec = approx_derivative(fun, x0, method=method,
+                                        vectorized=True)
+            # f0 and then all the perturbed points in a single call
+            assert_equal(calls, [(2, 1), (2, nsteps)])
+            assert_allclose(jac_vec, jac_serial, rtol=1e-15)
+
+        # scalar output may be returned with shape (S,)
+        def fun_vector_scalar(x):
+            return np.sin(x[0] * x[1]) * np.log(x[0])
+
+        x0 = np.array([100.0, -0.5])
+        jac_vec = approx_derivative(fun_vector_scalar, x0, vectorized=True)
+        assert_allclose(jac_vec, self.jac_vector_scalar(x0), rtol=1e-7)
+
+    def test_vectorized_wrong_shape(self):
+        def fun(x):
+            return np.zeros(3)
+
+        assert_raises(RuntimeError, approx_derivative, fun, [1.0, 2.0],
+                      vectorized=True)
+
     def test_custom_rel_step(self):
         x0 = np.array([-0.1, 0.1])
         jac_diff_2 = approx_derivative(self.fun_vector_vector, x0,
@@ -574,6 +623,26 @@ class TestApproxDerivativeSparse:
             assert_allclose(J_dense, J_sparse.toarray(),
                             rtol=5e-16, atol=7e-15)
 
+    def test_workers_vectorized(self):
+        def fun_vectorized(x):
+            e = x[1:]**3 - x[:-1]**2
+            zero = np.zeros((1,) + x.shape[1:])
+            return (np.concatenate((zero, 3 * e)) +
+                    np.concatenate((2 * e, zero)))
+
+        A = self.structure(self.n)
+        for method in ['2-point', '3-point', 'cs']:
+            J = approx_derivative(self.fun, self.x0, method=method,
+                                  bounds=(self.lb, self.ub), sparsity=A)
+            J_map = approx_derivative(self.fun, self.x0, method=method,
+                                      bounds=(self.lb, self.ub), sparsity=A,
+                                      workers=map)
+            J_vec = approx_derivative(fun_vectorized, self.x0, method=method,
+                                      bounds=(self.lb, self.ub), sparsity=A,
+                                      vectorized=True)
+            assert_equal(J_map.toarray(), J.toarray())
+            assert_allclose(J_vec.toarray(), J.toarray(), rtol=1e-15)
+
     def test_check_derivative(self):
         def jac(x):
             return csr_matrix(self.jac(x))
@@ -17,8 +17,11 @@ from scipy.optimize._remove_redundancy import _remove_redundancy_svd
 from scipy.optimize._remove_redundancy import _remove_redundancy_pivot_dense
 from scipy.optimize._remove_redundancy import _remove_redundancy_pivot_sparse
 from scipy.optimize._remove_redundancy import _remove_redundancy_id
+from scipy.optimize._remove_redundancy import _remove_redundancy_sparse
+from scipy.optimize._remove_redundancy import _independent_rows_sparse
+from scipy.optimize._remove_redundancy import _full_row_rank_sparse
 
-from scipy.sparse import csc_matrix
+from scipy.sparse import csc_matrix, csr_matrix, hstack
 
 
 def setup_module():
@@ -253,3 +256,45 @@ class TestRRPivotSparse(RRCommonTests):
         rr_res = _remove_redundancy_pivot_sparse(csc_matrix(A), b)
         A1, b1, status, message = rr_res
         return A1.toarray(), b1, status, message
+
+
+class TestRRSparse(RRCommonTests):
+    def rr(self, A, b):
+        rr_res = _remove_redundancy_sparse(csc_matrix(A), b)
+        A1, b1, status, message = rr_res
+        return A1.toarray(), b1, status, message
+
+    def test_independent_rows(self):
+        # the first two rows own columns 0 and 1; once they are set aside,
+        # the third row owns column 2. The last two rows are parallel.
+        A = np.array([[1, 0, 1, 1, 0],
+                      [0, 1, 1, 0, 1],
+                      [0, 0, 1, 1, 1],
+                      [0, 0, 0, 1, 1],
+                      [0, 0, 0, 2, 2]])
+        independent = _independent_rows_sparse(csr_matrix(A))
+        assert_equal(independent, [True, True, True, False, False])
+
+        A1, b1, status, message = self.rr(A, np.array([1, 2, 3, 4, 8]))
+        assert_equal(status, 0)
+        assert_equal(A1, A[:4])
+        assert_equal(b1, [1, 2, 3, 4])
+
+    def test_staircase(self):
+        # a block staircase has no dependencies and should be handled by
+        # the column singleton procedure without any pivoting
+        m = 1000
+        A = csr_matrix(np.eye(m) + np.eye(m, k=1))
+        assert_(np.all(_independent_rows_sparse(A)))
+        A1, b1, status, message = _remove_redundancy_sparse(A, np.ones(m))
+        assert_equal(status, 0)
+        assert_equal(A1.shape[0], m)
+
+    def test_dense_column(self):
+        # a dense column would make A @ A.T dense, so the rank check is
+        # skipped rather than forming it
+        m = 2000
+        A = csr_matrix(np.eye(m) + np.eye(m, k=1))
+        assert_(_full_row_rank_sparse(A))
+        A = hstack([A, np.ones((m, 1))])
+        assert_(not _full_row_rank_sparse(A))
@@ -278,11 +278,12 @@ test_infeasible = StructTestInfeasible(bounds=[(2, 50), (-1, 1)],
 
 def run_test(test, args=(), test_atol=1e-5, n=128, iters=None,
              callback=None, minimizer_kwargs=None, options=None,
-             sampling_method='sobol'):
+             sampling_method='sobol', workers=1, vectorized=False):
     res = shgo(test.f, test.bounds, args=args, constraints=test.cons,
                n=n, iters=iters, callback=callback,
                minimizer_kwargs=minimizer_kwargs, options=options,
-               sampling_method=sampling_method)
+               sampling_method=sampling_method, workers=workers,
+               vectorized=vectorized)
 
     logging.info(res)
 
@@ -649,6 +650,64 @@ class TestShgoArguments:
 
         run_test(test1_1, n=30, sampling_method=sample)
 
+    @pytest.mark.parametrize('sampling_method, n, iters',
+                             [('sobol', 64, 1), ('simplicial', None, 7)])
+    def test_18_workers(self, sampling_method, n, iters):
+        """Test parallel sampling and local minimizations"""
+        kwargs = dict(constraints=test2_1.cons, n=n, iters=iters,
+                      sampling_method=sampling_method)
+        res = shgo(test2_1.f, test2_1.bounds, **kwargs)
+        res_map = shgo(test2_1.f, test2_1.bounds, workers=map, **kwargs)
+        numpy.testing.assert_allclose(res_map.x, res.x)
+        numpy.testing.assert_allclose(res_map.fun, res.fun)
+        numpy.testing.assert_allclose(res_map.funl, res.funl)
+        numpy.testing.assert_allclose(res_map.funl, test2_1.expected_funl,
+                                      atol=1e-5)
+        assert res_map.nfev == res.nfev
+        assert res_map.nlfev == res.nlfev
+
+        run_test(test1_1, workers=2, sampling_method=sampling_method)
+
+    def test_19_vectorized(self):
+        """Test evaluation of all sampling points in a single call"""
+        ncalls = []
+
+        def f(x):
+            ncalls.append(x.shape)
+            return test1_1.f(x)
+
+        kwargs = dict(n=64, iters=3, sampling_method='sobol')
+        res = shgo(test1_1.f, test1_1.bounds, **kwargs)
+        res_vec = shgo(f, test1_1.bounds, vectorized=True, **kwargs)
+        numpy.testing.assert_allclose(res_vec.x, res.x)
+        numpy.testing.assert_allclose(res_vec.fun, res.fun)
+        assert res_vec.nfev == res.nfev
+        # the sampling points are evaluated in batches, the local
+        # minimizations evaluate single points
+        n_sampled = sum(s[1] for s in ncalls if s[1] > 1)
+        assert n_sampled == res_vec.nfev - res_vec.nlfev
+        assert all(s == (2, 1) for s in ncalls if s[1] == 1)
+
+        run_test(test1_1, iters=3, vectorized=True)
+        run_test(test1_1, n=1, sampling_method='simplicial',
+                 vectorized=True)
+
+        def f_bad(x):
+            return numpy.ones(3)
+
+        assert_raises(RuntimeError, shgo, f_bad, test1_1.bounds,
+                      sampling_method='sobol', vectorized=True)
+
+    def test_20_sobol_streaming(self):
+        """Test that the sampling points of previous iterations are kept"""
+        shc = SHGO(test1_1.f, test1_1.bounds, n=64, iters=3,
+                   sampling_method='sobol')
+        with shc:
+            shc.construct_complex()
+        assert shc.C.shape[0] == shc.qmc_engine.num_generated
+        assert numpy.unique(shc.C, axis=0).shape[0] == shc.C.shape[0]
+        numpy.testing.assert_allclose(shc.F, [test1_1.f(x) for x in shc.C])
+
 # Failure test functions
 class TestShgoFailures:
     def test_1_maxiter(self):
@@ -127,6 +127,81 @@ class TestScalarFunction(TestCase):
         assert_array_almost_equal(f_analit, f_approx)
         assert_array_almost_equal(g_analit, g_approx)
 
+    def test_finite_difference_grad_workers_vectorized(self):
+        x0 = [1.0, 0.0]
+        ex = ExScalarFunction()
+        serial = ScalarFunction(ex.fun, x0, (), '2-point',
+                                ex.hess, None, (-np.inf, np.inf))
+        ex = ExScalarFunction()
+        mapped = ScalarFunction(ex.fun, x0, (), '2-point',
+                                ex.hess, None, (-np.inf, np.inf), workers=map)
+        assert_equal(ex.nfev, 3)
+        assert_equal(mapped.nfev, 3)
+        assert_array_equal(mapped.g, serial.g)
+
+        ex = ExScalarFunction()
+        vect = ScalarFunction(ex.fun, x0, (), '2-point',
+                              ex.hess, None, (-np.inf, np.inf),
+                              vectorized=True)
+        # one call for f(x0) and one for both perturbed points
+        assert_equal(ex.nfev, 2)
+        assert_equal(vect.nfev, 3)
+        assert_array_almost_equal(vect.g, serial.g)
+
+        x = [10, 0.3]
+        assert_array_almost_equal(mapped.grad(x), serial.grad(x))
+        assert_array_almost_equal(vect.grad(x), serial.grad(x))
+        assert_equal(mapped.nfev, serial.nfev)
+        assert_equal(vect.nfev, serial.nfev)
+
+    def test_cache(self):
+        x0 = np.array([1.0, 0.0])
+        x1 = np.array([10, 0.3])
+        x2 = np.array([2.0, -1.0])
+        for grad in ['2-point', 'callable']:
+            ex = ExScalarFunction()
+            sf = ScalarFunction(ex.fun, x0, (),
+                                ex.grad if grad == 'callable' else grad,
+                                ex.hess, None, (-np.inf, np.inf),
+                                cache_size=2)
+            f0, g0 = sf.f, sf.g.copy()
+            nfev, ngev = sf.nfev, sf.ngev
+            f1 = sf.fun(x1)
+            nfev += 1
+            assert_equal(sf.nfev, nfev)
+
+            # x0 is still in the cache
+            assert_equal(sf.fun(x0), f0)
+            assert_array_equal(sf.grad(x0), g0)
+            assert_equal(sf.ncache_hits, 2)
+            assert_equal(sf.nfev, nfev)
+            assert_equal(sf.ngev, ngev)
+
+            # modifying a returned array in place doesn't alter the cache
+            g = sf.grad(x0)
+            g[:] = 0
+            sf.fun(x1)
+            assert_array_equal(sf.grad(x0), g0)
+            assert_equal(sf.ncache_hits, 4)
+
+            # x1 is evicted, as the least recently used point
+            sf.fun(x2)
+            assert_equal(sf.fun(x1), f1)
+            assert_equal(sf.nfev, nfev + 2)
+            assert_equal(sf.ncache_hits, 4)
+
+        ex = ExScalarFunction()
+        sf = ScalarFunction(ex.fun, x0, (), ex.grad, ex.hess, None,
+                            (-np.inf, np.inf))
+        sf.fun(x1)
+        sf.fun(x0)
+        assert_equal(sf.nfev, 3)
+        assert_equal(sf.ncache_hits, 0)
+
+        with pytest.raises(ValueError, match="cache_size"):
+            ScalarFunction(ex.fun, x0, (), ex.grad, ex.hess, None,
+                           (-np.inf, np.inf), cache_size=0)
+
     def test_fun_and_grad(self):
         ex = ExScalarFunction()
 
@@ -462,6 +537,48 @@ class TestVectorialFunction(TestCase):
         assert_array_almost_equal(f_analit, f_approx)
         assert_array_almost_equal(J_analit, J_approx)
 
+    def test_finite_difference_jac_workers_vectorized(self):
+        x0 = [1.0, 0.0]
+        ex = ExVectorialFunction()
+        serial = VectorFunction(ex.fun, x0, '3-point', ex.hess, None, None,
+                                (-np.inf, np.inf), None)
+        ex = ExVectorialFunction()
+        mapped = VectorFunction(ex.fun, x0, '3-point', ex.hess, None, None,
+                                (-np.inf, np.inf), None, workers=map)
+        assert_equal(ex.nfev, 5)
+        assert_equal(mapped.nfev, 5)
+        assert_array_equal(mapped.J, serial.J)
+
+        ex = ExVectorialFunction()
+        vect = VectorFunction(ex.fun, x0, '3-point', ex.hess, None, None,
+                              (-np.inf, np.inf), None, vectorized=True)
+        assert_equal(ex.nfev, 2)
+        assert_equal(vect.nfev, 5)
+        assert_array_almost_equal(vect.J, serial.J)
+
+        x = [10, 0.3]
+        assert_array_almost_equal(mapped.jac(x), serial.jac(x))
+        assert_array_almost_equal(vect.jac(x), serial.jac(x))
+        assert_equal(mapped.nfev, serial.nfev)
+        assert_equal(vect.nfev, serial.nfev)
+
+    def test_cache(self):
+        x0 = np.array([1.0, 0.0])
+        x1 = np.array([10, 0.3])
+        ex = ExVectorialFunction()
+        vf = VectorFunction(ex.fun, x0, '2-point', ex.hess, None, None,
+                            (-np.inf, np.inf), None, cache_size=4)
+        f0, J0 = vf.f.copy(), vf.J.copy()
+        nfev = vf.nfev
+        vf.jac(x1)
+        assert_equal(vf.nfev, nfev + 3)
+        assert_array_equal(vf.fun(x0), f0)
+        assert_array_equal(vf.jac(x0), J0)
+        vf.fun(x1)
+        vf.jac(x1)
+        assert_equal(vf.nfev, nfev + 3)
+        assert_equal(vf.ncache_hits, 4)
+
     def test_finite_difference_hess_linear_operator(self):
         ex = ExVectorialFunction()
         nfev = 0
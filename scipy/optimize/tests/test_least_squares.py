@@ -4,11 +4,12 @@ import numpy as np
 from numpy.linalg import norm
 from numpy.testing import (assert_, assert_allclose,
                            assert_equal, suppress_warnings)
+import pytest
 from pytest import raises as assert_raises
-from scipy.sparse import issparse, lil_matrix
+from scipy.sparse import diags, issparse, lil_matrix
 from scipy.sparse.linalg import aslinearoperator
 
-from scipy.optimize import least_squares
+from scipy.optimize import least_squares, least_squares_batch
 from scipy.optimize._lsq.least_squares import IMPLEMENTED_LOSSES
 from scipy.optimize._lsq.common import EPS, make_strictly_feasible
 
@@ -533,6 +534,49 @@ class SparseMixin:
             assert_allclose(res_2.optimality, 0, atol=1e-10)
             assert_allclose(res_3.optimality, 0, atol=1e-10)
 
+    def test_numerical_jac_workers_vectorized(self):
+        x0 = [-2, 1]
+        for jac in ['2-point', '3-point', 'cs']:
+            res = least_squares(fun_rosenbrock, x0, jac, method=self.method)
+            res_map = least_squares(fun_rosenbrock, x0, jac,
+                                    method=self.method, workers=map)
+            res_vec = least_squares(fun_rosenbrock, x0, jac,
+                                    method=self.method, vectorized=True)
+            assert_equal(res_map.x, res.x)
+            assert_equal(res_map.nfev, res.nfev)
+            assert_allclose(res_vec.x, res.x, atol=1e-10)
+
+        p = BroydenTridiagonal()
+        res = least_squares(p.fun, p.x0, method=self.method,
+                            jac_sparsity=p.sparsity)
+        res_map = least_squares(p.fun, p.x0, method=self.method,
+                                jac_sparsity=p.sparsity, workers=map)
+        assert_equal(res_map.x, res.x)
+
+    def test_broyden_updates(self):
+        p = BroydenTridiagonal()
+        res = least_squares(p.fun, p.x0, p.jac, method=self.method)
+        res_1 = least_squares(p.fun, p.x0, p.jac, method=self.method,
+                              broyden_updates=3)
+        assert_allclose(res_1.cost, 0, atol=1e-15)
+        assert_(res_1.njev < res.njev)
+
+        res = least_squares(p.fun, p.x0, bounds=(p.lb, p.ub),
+                            jac_sparsity=p.sparsity, method=self.method,
+                            broyden_updates=2)
+        assert_(res.success)
+        assert_allclose(res.optimality, 0, atol=1e-8)
+
+        res = least_squares(fun_rosenbrock, [2, 2], jac_rosenbrock,
+                            method=self.method, broyden_updates=2)
+        assert_allclose(res.x, [1, 1])
+
+        p = BroydenTridiagonal(mode='operator')
+        assert_raises(ValueError, least_squares, p.fun, p.x0, p.jac,
+                      method=self.method, broyden_updates=1)
+        assert_raises(ValueError, least_squares, fun_trivial, 2.0,
+                      method=self.method, broyden_updates=-1)
+
     def test_wrong_jac_sparsity(self):
         p = BroydenTridiagonal()
         sparsity = p.sparsity[:-1]
@@ -707,6 +751,33 @@ class TestTRF(BaseMixin, BoundsMixin, SparseMixin, LossFunctionMixin):
                                 tr_options={'regularize': regularize})
             assert_allclose(res.cost, 0, atol=1e-20)
 
+    def test_lsmr_preconditioner(self):
+        # a badly scaled problem, solved by variables of the scale of x_true
+        p = BroydenTridiagonal()
+        scale = np.logspace(0, 3, p.n)
+
+        def fun(x):
+            return p.fun(x / scale)
+
+        def jac(x):
+            return p.jac(x / scale).tocsr().multiply(1 / scale).tocsr()
+
+        def diag_preconditioner(J, diag):
+            col_sq = np.asarray(J.power(2).sum(axis=0)).ravel()
+            return aslinearoperator(diags((col_sq + diag**2)**-0.5))
+
+        x0 = p.x0 * scale
+        bounds = [(-np.inf, np.inf), (p.lb * scale, p.ub * scale)]
+        for preconditioner, bounds in product(
+                ['jacobi', diag_preconditioner], bounds):
+            res = least_squares(fun, x0, jac, bounds=bounds, method='trf',
+                                tr_options={'preconditioner': preconditioner})
+            assert_allclose(res.cost, 0, atol=1e-20)
+
+        p = BroydenTridiagonal(mode='operator')
+        assert_raises(ValueError, least_squares, p.fun, p.x0, p.jac,
+                      method='trf', tr_options={'preconditioner': 'jacobi'})
+
 
 class TestLM(BaseMixin):
     method = 'lm'
@@ -729,6 +800,10 @@ class TestLM(BaseMixin):
         assert_raises(ValueError, least_squares, fun_trivial, 2.0,
                       jac_sparsity=[1], method='lm')
 
+    def test_broyden_updates_not_supported(self):
+        assert_raises(ValueError, least_squares, fun_trivial, 2.0,
+                      jac_trivial, method='lm', broyden_updates=3)
+
     def test_LinearOperator_not_supported(self):
         p = BroydenTridiagonal(mode="operator")
         assert_raises(ValueError, least_squares, p.fun, p.x0, p.jac,
@@ -779,3 +854,82 @@ def test_fp32_gh12991():
     # used a step size for FP64 when the working space was FP32.
     assert res.nfev > 3
     assert_allclose(res.x, np.array([0.4082241, 0.15530563]), atol=5e-5)
+
+
+class TestLeastSquaresBatch:
+    def setup_method(self):
+        rng = np.random.default_rng(1234)
+        self.t = np.linspace(0, 3, 20)
+        self.p_true = rng.uniform([1, 0.5, -0.2], [2, 1.5, 0.2],
+                                  size=(50, 3))
+        self.y = self.model(self.p_true)
+        self.y += 0.01 * rng.standard_normal(self.y.shape)
+
+    def model(self, p):
+        return p[:, :1] * np.exp(-p[:, 1:2] * self.t) + p[:, 2:]
+
+    def residuals(self, p, batch):
+        return self.model(p) - self.y[batch]
+
+    def jac(self, p, batch):
+        e = np.exp(-p[:, 1:2] * self.t)
+        return np.stack([e, -p[:, :1] * self.t * e, np.ones_like(e)],
+                        axis=-1)
+
+    @pytest.mark.parametrize('jac', ['2-point', '3-point', 'callable'])
+    def test_equivalent_to_least_squares(self, jac):
+        if jac == 'callable':
+            jac = self.jac
+        x0 = np.ones((50, 3))
+        res = least_squares_batch(self.residuals, x0, jac=jac)
+        assert_(res.success.all())
+        assert_equal(res.x.shape, (50, 3))
+        assert_equal(res.jac.shape, (50, 20, 3))
+
+        for b in range(50):
+            ref = least_squares(lambda p: self.residuals(p[None], [b])[0],
+                                x0[b], method='lm')
+            assert_allclose(res.x[b], ref.x, rtol=1e-5, atol=1e-6)
+            assert_allclose(res.cost[b], ref.cost, rtol=1e-7)
+            assert_allclose(res.fun[b], ref.fun, atol=1e-6)
+        assert_allclose(res.grad, np.einsum('bmn,bm->bn', res.jac, res.fun))
+        assert_allclose(res.optimality, np.abs(res.grad).max(axis=1))
+
+    def test_independent_problems(self):
+        # the result of a problem doesn't depend on the rest of the batch,
+        # and converged problems are no longer evaluated
+        sizes = []
+
+        def fun(p, batch, scale=1.0):
+            sizes.append(len(batch))
+            return scale * self.residuals(p, batch)
+
+        def jac(p, batch, scale=1.0):
+            return scale * self.jac(p, batch)
+
+        x0 = np.ones((50, 3))
+        res = least_squares_batch(fun, x0, jac=jac, kwargs={'scale': 2.0})
+        x0[10:] = self.p_true[10:]
+        res_1 = least_squares_batch(fun, x0, jac=jac, kwargs={'scale': 2.0})
+        assert_equal(res_1.x[:10], res.x[:10])
+        assert_equal(res_1.nfev[:10], res.nfev[:10])
+        assert_(sizes[-1] < 50)
+        assert_equal(sum(sizes), res.nfev.sum() + res_1.nfev.sum())
+
+    def test_max_nfev(self):
+        res = least_squares_batch(self.residuals, np.ones((50, 3)),
+                                  max_nfev=2)
+        assert_(np.all(res.nfev <= 2))
+        assert_equal(res.status, 0)
+        assert_(not res.success.any())
+
+    def test_errors(self):
+        x0 = np.ones((50, 3))
+        assert_raises(ValueError, least_squares_batch, self.residuals, x0,
+                      jac='cs')
+        assert_raises(ValueError, least_squares_batch, self.residuals, x0,
+                      max_nfev=0)
+        assert_raises(ValueError, least_squares_batch,
+                      lambda p, batch: self.residuals(p, batch)[:, :2], x0)
+        assert_raises(ValueError, least_squares_batch,
+                      lambda p, batch: self.residuals(p, batch)[0], x0)
@@ -7,7 +7,7 @@ import numpy as np
 from numpy.testing import (assert_, assert_allclose, assert_equal,
                            assert_array_less, assert_warns, suppress_warnings)
 from pytest import raises as assert_raises
-from scipy.optimize import linprog, OptimizeWarning
+from scipy.optimize import linprog, HighsLP, OptimizeWarning
 from scipy.optimize._numdiff import approx_derivative
 from scipy.sparse.linalg import MatrixRankWarning
 from scipy.linalg import LinAlgWarning
@@ -839,6 +839,47 @@ class LinprogCommonTests:
                       method=self.method, options=self.options)
         _assert_success(res, desired_fun=0.5)
 
+    def test_parallel_rows_eq_1(self):
+        c = [1, 1, 1]
+        A_eq = [[1, 2, 0], [0, 1, 1], [-2, -4, 0]]
+        b_eq = [2, 1, -3]
+        res = linprog(c, A_ub, b_ub, A_eq, b_eq, bounds,
+                      method=self.method, options=self.options)
+        _assert_infeasible(res)
+
+        # Infeasibility detected in presolve
+        if self.options.get('presolve', True):
+            assert_equal(res.nit, 0)
+
+    def test_parallel_rows_eq_2(self):
+        c = [1, 1, 1]
+        A_eq = [[1, 2, 0], [0, 1, 1], [-2, -4, 0]]
+        b_eq = [2, 1, -4]
+        res = linprog(c, A_ub, b_ub, A_eq, b_eq, bounds,
+                      method=self.method, options=self.options)
+        _assert_success(res, desired_fun=1, desired_x=[0, 1, 0])
+
+    def test_parallel_rows_ub(self):
+        # only the tightest of the parallel constraints is active
+        c = [-1, -2]
+        A_ub = [[1, 1], [2, 2], [0.5, 0.5], [1, 3]]
+        b_ub = [4, 6, 2.5, 12]
+        res = linprog(c, A_ub, b_ub, A_eq, b_eq, bounds,
+                      method=self.method, options=self.options)
+        _assert_success(res, desired_fun=-6, desired_x=[0, 3])
+
+    def test_free_column_singleton(self):
+        # x[2] is free and appears only in the first equality constraint
+        c = [1, 2, -1]
+        A_eq = [[1, 1, 1], [1, -1, 0]]
+        b_eq = [4, 0]
+        A_ub = [[1, 1, 0]]
+        b_ub = [2]
+        bounds = [(0, None), (0, None), (None, None)]
+        res = linprog(c, A_ub, b_ub, A_eq, b_eq, bounds,
+                      method=self.method, options=self.options)
+        _assert_success(res, desired_fun=-4, desired_x=[0, 0, 4])
+
     def test_infeasible(self):
         # Test linprog response to an infeasible problem
         c = [-1, -1]
@@ -2095,6 +2136,124 @@ class TestLinprogHiGHSIPM(LinprogHiGHSTests):
     options = {}
 
 
+#################################
+# HiGHS Persistent Model Tests  #
+#################################
+
+
+class TestHighsLP:
+
+    def assert_same_solution(self, res, c, A_ub, b_ub, A_eq, b_eq, bounds):
+        ref = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
+                      bounds=bounds, method='highs')
+        assert_equal(res.status, ref.status)
+        assert_allclose(res.fun, ref.fun, rtol=1e-9, atol=1e-12)
+        assert_allclose(res.x, ref.x, atol=1e-8)
+        assert_allclose(res.slack, ref.slack, atol=1e-8)
+        assert_allclose(res.con, ref.con, atol=1e-8)
+        assert_allclose(res.ineqlin.marginals, ref.ineqlin.marginals,
+                        atol=1e-8)
+        assert_allclose(res.eqlin.marginals, ref.eqlin.marginals, atol=1e-8)
+
+    @pytest.mark.parametrize('method', ['highs', 'highs-ds', 'highs-ipm'])
+    def test_solve(self, method):
+        c, A_ub, b_ub, A_eq, b_eq, bounds = very_random_gen(0)
+        lp = HighsLP(c, A_ub, b_ub, A_eq, b_eq, bounds, method=method)
+        res = lp.solve()
+        _assert_success(res)
+        self.assert_same_solution(res, c, A_ub, b_ub, A_eq, b_eq, bounds)
+
+        # a second solve starts from the optimal basis
+        res = lp.solve()
+        _assert_success(res)
+        assert_equal(res.nit, 0)
+
+    @pytest.mark.parametrize('sparse', [False, True])
+    def test_update(self, sparse):
+        c, A_ub, b_ub, A_eq, b_eq, bounds = very_random_gen(3)
+        if sparse:
+            A_ub = scipy.sparse.csr_matrix(A_ub)
+        lp = HighsLP(c, A_ub, b_ub, A_eq, b_eq, bounds)
+        lp.solve()
+
+        rng = np.random.RandomState(0)
+        for _ in range(5):
+            b_ub = b_ub + 0.05 * rng.rand(len(b_ub))
+            c = c + 0.05 * (rng.rand(len(c)) - 0.5)
+            lp.update(c=c, b_ub=b_ub)
+            res = lp.solve()
+            self.assert_same_solution(res, c, A_ub, b_ub, A_eq, b_eq, bounds)
+
+            cold = lp.solve(warm_start=False)
+            assert_allclose(cold.fun, res.fun, rtol=1e-9, atol=1e-12)
+            lp.solve()
+
+        b_eq = b_eq + 0.01
+        bounds = bounds.copy()
+        bounds[:5, 0] = -0.5
+        lp.update(b_eq=b_eq, bounds=bounds)
+        res = lp.solve()
+        self.assert_same_solution(res, c, A_ub, b_ub, A_eq, b_eq, bounds)
+
+        A_ub = A_ub.copy()
+        A_ub[0, 0] = 1
+        A_ub[3, :] = 0
+        A_eq = A_eq.copy()
+        A_eq[1, 2] = -2
+        lp.update(A_ub=A_ub, A_eq=A_eq)
+        res = lp.solve()
+        self.assert_same_solution(res, c, A_ub, b_ub, A_eq, b_eq, bounds)
+
+    def test_add_remove_constraints(self):
+        c, A_ub, b_ub, A_eq, b_eq, bounds = very_random_gen(4)
+        lp = HighsLP(c, A_ub[:15], b_ub[:15], A_eq[:8], b_eq[:8], bounds)
+        lp.solve()
+
+        lp.add_constraints(A_ub=A_ub[15:], b_ub=b_ub[15:])
+        lp.add_constraints(A_eq=A_eq[8:], b_eq=b_eq[8:])
+        res = lp.solve()
+        self.assert_same_solution(res, c, A_ub, b_ub, A_eq, b_eq, bounds)
+
+        # removed rows are left out of the results, and the remaining rows
+        # keep their order
+        lp.remove_constraints(ub=[0, 16], eq=slice(0, 2))
+        keep_ub = np.setdiff1d(np.arange(len(b_ub)), [0, 16])
+        A_ub, b_ub = A_ub[keep_ub], b_ub[keep_ub]
+        A_eq, b_eq = A_eq[2:], b_eq[2:]
+        res = lp.solve()
+        self.assert_same_solution(res, c, A_ub, b_ub, A_eq, b_eq, bounds)
+
+        # the problem can still be changed afterwards
+        b_ub = b_ub + 0.1
+        lp.update(b_ub=b_ub)
+        lp.add_constraints(A_ub=A_ub[:1], b_ub=b_ub[:1] - 0.2)
+        res = lp.solve()
+        self.assert_same_solution(res, c, np.vstack((A_ub, A_ub[:1])),
+                                  np.concatenate((b_ub, b_ub[:1] - 0.2)),
+                                  A_eq, b_eq, bounds)
+
+    def test_infeasible_then_feasible(self):
+        c = [-1, -1]
+        lp = HighsLP(c, A_ub=[[1, 1]], b_ub=[1], A_eq=[[1, -1]], b_eq=[0])
+        _assert_success(lp.solve(), desired_fun=-1)
+        lp.update(b_ub=[-1])
+        _assert_infeasible(lp.solve())
+        lp.update(b_ub=[2])
+        _assert_success(lp.solve(), desired_fun=-2, desired_x=[1, 1])
+
+    def test_input_validation(self):
+        c, A_ub, b_ub, A_eq, b_eq, bounds = very_random_gen(0)
+        with pytest.raises(ValueError, match='Unknown solver'):
+            HighsLP(c, A_ub, b_ub, method='simplex')
+        lp = HighsLP(c, A_ub, b_ub, A_eq, b_eq, bounds)
+        with pytest.raises(ValueError, match='add_constraints'):
+            lp.update(A_ub=A_ub[:-1], b_ub=b_ub[:-1])
+        with pytest.raises(ValueError):
+            lp.update(c=c[:-1])
+        with pytest.raises(IndexError):
+            lp.remove_constraints(ub=[len(b_ub)])
+
+
 ###########################
 # Autoscale-Specific Tests#
 ###########################
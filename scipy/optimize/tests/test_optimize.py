@@ -10,6 +10,8 @@ To run it in its simplest form::
 
 """
 import itertools
+import multiprocessing
+from unittest.mock import patch
 import numpy as np
 from numpy.testing import (assert_allclose, assert_equal,
                            assert_, assert_almost_equal,
@@ -2032,6 +2034,93 @@ class TestBrute:
         assert_allclose(resbrute1[-1], resbrute[-1])
         assert_allclose(resbrute1[0], resbrute[0])
 
+    @pytest.mark.parametrize('workers', [1, 2])
+    @pytest.mark.parametrize('vectorized', [False, True])
+    @pytest.mark.parametrize('chunksize', [37, 2000])
+    def test_chunksize(self, workers, vectorized, chunksize):
+        # the chunked evaluation finds the same minimum as the whole grid and
+        # returns the best grid points instead of the grid
+        xmin, Jmin, grid, Jout = optimize.brute(
+            brute_func, self.rranges, args=self.params, full_output=True,
+            finish=None)
+        res = optimize.brute(brute_func, self.rranges, args=self.params,
+                             full_output=True, finish=None, workers=workers,
+                             vectorized=vectorized, chunksize=chunksize,
+                             nbest=5)
+        assert_allclose(res[0], xmin)
+        assert_allclose(res[1], Jmin)
+
+        order = np.argsort(Jout.ravel(), kind='stable')[:5]
+        assert_allclose(res[3], Jout.ravel()[order])
+        assert_allclose(res[2], grid.reshape(2, -1)[:, order].T)
+
+        # with polishing, and without the best grid points
+        res = optimize.brute(brute_func, self.rranges, args=self.params,
+                             chunksize=chunksize)
+        assert_allclose(res, self.solution, atol=1e-3)
+
+    def test_chunksize_1D(self):
+        def f(x):
+            assert_(x.shape == (1,))
+            return (x[0] - 0.3)**2
+
+        xmin, Jmin, grid, Jout = optimize.brute(f, [(-1, 1)], Ns=11,
+                                                full_output=True, finish=None,
+                                                chunksize=3, nbest=2)
+        assert_allclose(xmin, 0.2)
+        assert_allclose(Jmin, 0.01)
+        assert_allclose(grid, [0.2, 0.4])
+        assert_allclose(Jout, [0.01, 0.01])
+
+    def test_vectorized(self):
+        def f(x, *params):
+            assert_(x.shape == (2, 32 * 32))
+            return brute_func(x, *params)
+
+        resbrute = optimize.brute(brute_func, self.rranges, args=self.params,
+                                  full_output=True, finish=None)
+        resbrute1 = optimize.brute(f, self.rranges, args=self.params,
+                                   full_output=True, finish=None,
+                                   vectorized=True)
+        for res, res1 in zip(resbrute, resbrute1):
+            assert_allclose(res1, res)
+
+        with pytest.raises(RuntimeError, match='vectorized function'):
+            optimize.brute(lambda x: 1.0, self.rranges, vectorized=True,
+                           chunksize=10)
+
+    @pytest.mark.parametrize('chunksize', [None, 100])
+    def test_vectorized_finish(self, chunksize):
+        # the polishing step also sends `func` arrays of shape (N, S)
+        def f(x, *params):
+            assert_(x.ndim == 2)
+            return brute_func(x, *params)
+
+        res = optimize.brute(f, self.rranges, args=self.params,
+                             vectorized=True, chunksize=chunksize)
+        assert_allclose(res, self.solution, atol=1e-3)
+
+    def test_chunksize_1D_shapes(self):
+        # for a 1-D problem the chunked evaluation returns scalars and 1-D
+        # arrays, as the evaluation of the whole grid does
+        def f(x):
+            return (x[0] - 0.3)**2
+
+        res = optimize.brute(f, [(-1, 1)], Ns=11, full_output=True,
+                             finish=None)
+        res_chunked = optimize.brute(f, [(-1, 1)], Ns=11, full_output=True,
+                                     finish=None, chunksize=3, nbest=11)
+        for r, r_chunked in zip(res, res_chunked):
+            assert_equal(np.shape(r_chunked), np.shape(r))
+
+    def test_chunksize_input_validation(self):
+        with pytest.raises(ValueError, match='chunksize'):
+            optimize.brute(brute_func, self.rranges, args=self.params,
+                           chunksize=0)
+        with pytest.raises(ValueError, match='nbest'):
+            optimize.brute(brute_func, self.rranges, args=self.params,
+                           chunksize=10, nbest=0)
+
 
 def test_cobyla_threadsafe():
 
@@ -2271,6 +2360,59 @@ def test_bounds_with_list():
     )
 
 
+@pytest.mark.parametrize('method', ['BFGS', 'CG', 'L-BFGS-B', 'TNC',
+                                    'SLSQP'])
+def test_finite_difference_workers_vectorized(method):
+    # the finite difference gradient may be evaluated in parallel or with a
+    # single vectorized call without changing the result.
+    x0 = np.array([1.3, 0.7, 0.8, 1.9, 1.2])
+    res = optimize.minimize(optimize.rosen, x0, method=method)
+
+    res_map = optimize.minimize(optimize.rosen, x0, method=method,
+                                options={'workers': map})
+    assert_equal(res_map.x, res.x)
+    assert_equal(res_map.nfev, res.nfev)
+
+    # an integer creates a single pool for the whole minimization
+    with patch('multiprocessing.Pool', wraps=multiprocessing.Pool) as pool:
+        res_pool = optimize.minimize(optimize.rosen, x0, method=method,
+                                     options={'workers': 2})
+    assert_equal(pool.call_count, 1)
+    assert_equal(res_pool.x, res.x)
+    assert_equal(res_pool.nfev, res.nfev)
+
+    shapes = []
+
+    def rosen_vectorized(x):
+        shapes.append(np.shape(x))
+        return optimize.rosen(x)
+
+    res_vec = optimize.minimize(rosen_vectorized, x0, method=method,
+                                options={'vectorized': True})
+    assert_allclose(res_vec.x, res.x, atol=1e-6)
+    assert_equal(res_vec.nfev, res.nfev)
+    assert_((5, 5) in shapes)
+
+
+@pytest.mark.parametrize('method', ['BFGS', 'CG', 'Newton-CG', 'L-BFGS-B',
+                                    'TNC', 'SLSQP', 'trust-ncg'])
+def test_cache_size(method):
+    # a bounded evaluation cache doesn't change the result and the cache hits
+    # are reported in the result
+    x0 = np.array([1.3, 0.7, 0.8, 1.9, 1.2])
+    kwds = dict(method=method, jac=optimize.rosen_der)
+    if method == 'trust-ncg':
+        kwds['hess'] = optimize.rosen_hess
+    res = optimize.minimize(optimize.rosen, x0, **kwds)
+    assert_('ncache_hits' not in res)
+
+    res_cached = optimize.minimize(optimize.rosen, x0,
+                                   options={'cache_size': 10}, **kwds)
+    assert_allclose(res_cached.x, res.x)
+    assert_(res_cached.ncache_hits >= 0)
+    assert_(res_cached.nfev <= res.nfev)
+
+
 def test_x_overwritten_user_function():
     # if the user overwrites the x-array in the user function it's likely
     # that the minimizer stops working properly.
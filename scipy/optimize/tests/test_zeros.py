@@ -13,6 +13,7 @@ from numpy import finfo, power, nan, isclose
 
 
 from scipy.optimize import zeros, newton, root_scalar
+from scipy.special import ndtr
 
 from scipy._lib._util import getfullargspec_no_self as _getfullargspec
 
@@ -753,3 +754,116 @@ def test_gh9551_raise_error_if_disp_true():
         zeros.newton(f, 1.0, f_p)
     root = zeros.newton(f, complex(10.0, 10.0), f_p)
     assert_allclose(root, complex(0.0, 1.0))
+
+
+class TestChandrupatla:
+
+    @staticmethod
+    def call_price(sigma, S, K, T, r):
+        # Black-Scholes price of a European call option
+        d1 = (np.log(S / K) + (r + sigma**2 / 2) * T) / (sigma * np.sqrt(T))
+        d2 = d1 - sigma * np.sqrt(T)
+        return S * ndtr(d1) - K * np.exp(-r * T) * ndtr(d2)
+
+    def test_implied_volatility(self):
+        K = np.linspace(60, 140, 1001)
+        sigma = 0.2 + 0.005 * (K - 100)**2 / 100
+        price = self.call_price(sigma, 100, K, 0.5, 0.01)
+
+        def f(s, K, price):
+            assert_equal(s.shape, K.shape)
+            return self.call_price(s, 100, K, 0.5, 0.01) - price
+
+        root, r = zeros.chandrupatla(f, 1e-3, 3, args=(K, price),
+                                     full_output=True)
+        assert_allclose(root, sigma, rtol=1e-10)
+        assert_(r.converged.all())
+        assert_equal(r.flag, zeros._ECONVERGED)
+        assert_equal(r.function_calls, r.iterations + 2)
+
+        # same roots as the scalar solver
+        for i in range(0, K.size, 100):
+            expected = zeros.brentq(
+                lambda s: self.call_price(s, 100, K[i], 0.5, 0.01) - price[i],
+                1e-3, 3)
+            assert_allclose(root[i], expected, rtol=1e-10)
+
+    @pytest.mark.parametrize('xtol, rtol', [(2e-12, 4*_FLOAT_EPS),
+                                            (1e-6, 1e-6)])
+    def test_tolerances(self, xtol, rtol):
+        c = np.linspace(-5, 5, 21)
+        root = zeros.chandrupatla(lambda x, c: x**3 - c, -2, 2, args=(c,),
+                                  xtol=xtol, rtol=rtol)
+        assert_allclose(root, np.cbrt(c), atol=xtol, rtol=rtol)
+
+    def test_broadcasting(self):
+        c = np.arange(1, 6)
+
+        def f(x, c, p):
+            return x**p - c
+
+        root = zeros.chandrupatla(f, 0, np.array([[10], [20]]), args=(c, 2))
+        assert_equal(root.shape, (2, 5))
+        assert_allclose(root, np.broadcast_to(np.sqrt(c), (2, 5)))
+
+        root = zeros.chandrupatla(f, 0, 10, args=(2, 2))
+        assert_equal(np.shape(root), ())
+        assert_allclose(root, np.sqrt(2))
+
+    def test_masks(self):
+        # the root at an end of the bracket, a sign error, and a regular root
+        root, r = zeros.chandrupatla(lambda x: x - 1, [1, 2, 0], [5, 3, 3],
+                                     full_output=True, disp=False)
+        assert_allclose(root, [1, nan, 1])
+        assert_equal(r.converged, [True, False, True])
+        assert_equal(r.flag, [zeros._ECONVERGED, zeros._ESIGNERR,
+                              zeros._ECONVERGED])
+        assert_equal(r.iterations[:2], [0, 0])
+
+        with pytest.raises(ValueError, match='different signs'):
+            zeros.chandrupatla(lambda x: x - 1, [1, 2, 0], [5, 3, 3])
+
+    def test_converged_elements_not_evaluated(self):
+        sizes = []
+
+        def f(x, c):
+            sizes.append(x.size)
+            return x - c
+
+        c = np.array([0.5, 1/3])
+        root, r = zeros.chandrupatla(f, 0, 1, args=(c,), full_output=True)
+        assert_allclose(root, c)
+        assert_equal(r.iterations, [1, np.max(r.iterations)])
+        assert_(r.iterations[1] > 1)
+        assert_equal(sizes[:3], [2, 2, 2])
+        assert_equal(sizes[3:], [1] * (len(sizes) - 3))
+
+    def test_maxiter(self):
+        def f(x):
+            return np.exp(x) - 5
+
+        root, r = zeros.chandrupatla(f, 0, 10, maxiter=3,
+                                     full_output=True, disp=False)
+        assert_equal(r.flag, zeros._ECONVERR)
+        assert_equal(r.iterations, 3)
+        assert_(0 < root < 10)
+
+        with pytest.raises(RuntimeError, match='failed to converge'):
+            zeros.chandrupatla(f, 0, 10, maxiter=3)
+
+        root = zeros.chandrupatla(f, [0, np.log(5)], 10, maxiter=0,
+                                  full_output=True, disp=False)[0]
+        assert_allclose(root[1], np.log(5))
+
+    def test_input_validation(self):
+        def f(x):
+            return x
+
+        with pytest.raises(ValueError, match='xtol too small'):
+            zeros.chandrupatla(f, -1, 1, xtol=-1)
+        with pytest.raises(ValueError, match='rtol too small'):
+            zeros.chandrupatla(f, -1, 1, rtol=0)
+        with pytest.raises(ValueError, match='maxiter'):
+            zeros.chandrupatla(f, -1, 1, maxiter=-1)
+        with pytest.raises(ValueError, match='shape'):
+            zeros.chandrupatla(lambda x: 1.0, [-1, -2], 1)
@@ -36,6 +36,7 @@ from scipy.optimize import moduleTNC
 from .optimize import (MemoizeJac, OptimizeResult, _check_unknown_options,
                        _prepare_scalar_function)
 from ._constraints import old_bound_to_new
+from ._numdiff import _with_workers_pool
 
 from numpy import inf, array, zeros, asfarray
 
@@ -278,11 +279,13 @@ def fmin_tnc(func, x0, fprime=None, args=(), approx_grad=0,
     return res['x'], res['nfev'], res['status']
 
 
+@_with_workers_pool
 def _minimize_tnc(fun, x0, args=(), jac=None, bounds=None,
                   eps=1e-8, scale=None, offset=None, mesg_num=None,
                   maxCGit=-1, maxiter=None, eta=-1, stepmx=0, accuracy=0,
                   minfev=0, ftol=-1, xtol=-1, gtol=-1, rescale=-1, disp=False,
                   callback=None, finite_diff_rel_step=None, maxfun=None,
+                  workers=1, vectorized=False, cache_size=None,
                   **unknown_options):
     """
     Minimize a scalar function of one or more variables using a truncated
@@ -350,6 +353,27 @@ def _minimize_tnc(fun, x0, args=(), jac=None, bounds=None,
     maxfun : int
         Maximum number of function evaluations. If None, `maxfun` is
         set to max(100, 10*len(x0)). Defaults to None.
+    workers : int or map-like callable, optional
+        Evaluates the points of a finite difference gradient in parallel,
+        see `approx_derivative`. Requires that `fun` be pickleable if
+        ``workers != 1``.
+
+        .. versionadded:: 1.8.0
+
+    vectorized : bool, optional
+        If True, the points of a finite difference gradient are sent to
+        `fun` in a single call, as an array of shape ``(n, S)``, and
+        `fun` should return an array of shape ``(S,)``. Otherwise `fun`
+        is called with 1-D arrays. See `approx_derivative`.
+
+        .. versionadded:: 1.8.0
+    cache_size : int, optional
+        If given, the values and gradients of `fun` at up to `cache_size`
+        points are kept in a least recently used cache, so that revisiting a
+        point doesn't evaluate `fun` or `jac` again. The number of cache hits
+        is returned as ``ncache_hits`` in the result.
+
+        .. versionadded:: 1.8.0
     """
     _check_unknown_options(unknown_options)
     fmin = minfev
@@ -374,7 +398,8 @@ def _minimize_tnc(fun, x0, args=(), jac=None, bounds=None,
 
     sf = _prepare_scalar_function(fun, x0, jac=jac, args=args, epsilon=eps,
                                   finite_diff_rel_step=finite_diff_rel_step,
-                                  bounds=new_bounds)
+                                  bounds=new_bounds, workers=workers,
+                                  vectorized=vectorized, cache_size=cache_size)
     func_and_grad = sf.fun_and_grad
 
     """
@@ -418,9 +443,12 @@ def _minimize_tnc(fun, x0, args=(), jac=None, bounds=None,
 
     funv, jacv = func_and_grad(x)
 
-    return OptimizeResult(x=x, fun=funv, jac=jacv, nfev=sf.nfev,
-                          nit=nit, status=rc, message=RCSTRINGS[rc],
-                          success=(-1 < rc < 3))
+    result = OptimizeResult(x=x, fun=funv, jac=jacv, nfev=sf.nfev,
+                            nit=nit, status=rc, message=RCSTRINGS[rc],
+                            success=(-1 < rc < 3))
+    if cache_size is not None:
+        result['ncache_hits'] = sf.ncache_hits
+    return result
 
 
 if __name__ == '__main__':
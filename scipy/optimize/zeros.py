@@ -10,7 +10,7 @@ _xtol = 2e-12
 _rtol = 4 * np.finfo(float).eps
 
 __all__ = ['newton', 'bisect', 'ridder', 'brentq', 'brenth', 'toms748',
-           'RootResults']
+           'chandrupatla', 'RootResults']
 
 # Must agree with CONVERGED, SIGNERR, CONVERR, ...  in zeros.h
 _ECONVERGED = 0
@@ -1362,3 +1362,227 @@ def toms748(f, a, b, args=(), k=1,
                           maxiter=maxiter, disp=disp)
     x, function_calls, iterations, flag = result
     return _results_select(full_output, (x, function_calls, iterations, flag))
+
+
+def chandrupatla(f, a, b, args=(), xtol=_xtol, rtol=_rtol, maxiter=_iter,
+                 full_output=False, disp=True):
+    """
+    Find the roots of many scalar functions in brackets with Chandrupatla's
+    method.
+
+    Solves the independent equations ``f(x[i], *args[i]) = 0`` for all the
+    elements ``i`` of the arrays of brackets `a` and `b` simultaneously, with
+    one vectorized call of `f` per iteration. Each element follows its own
+    iteration of Chandrupatla's algorithm [Chandrupatla1997]_, which combines
+    bisection and inverse quadratic interpolation like Brent's method (see
+    `brentq`) but with a simpler criterion for accepting the interpolation
+    [Scherer2010]_. Elements are removed from the arrays passed to `f` as
+    soon as they have converged.
+
+    Parameters
+    ----------
+    f : function
+        Vectorized function, called as ``f(x, *args)``, where ``x`` is a 1-D
+        array holding the current abscissae of the elements which have not
+        converged yet, and the arrays in `args` are restricted to the same
+        elements. It must return an array of the shape of ``x``. For each
+        element, :math:`f` must be continuous, and :math:`f(a)` and
+        :math:`f(b)` must have opposite signs.
+    a, b : array_like
+        The ends of the bracketing intervals.
+    args : tuple, optional
+        Extra arguments for `f`. Arrays are broadcast together with `a` and
+        `b`, other arguments are passed unchanged.
+    xtol, rtol : number, optional
+        The computed root ``x0`` will satisfy ``np.allclose(x, x0,
+        atol=xtol, rtol=rtol)``, where ``x`` is the exact root. `xtol` must
+        be nonnegative and `rtol` cannot be smaller than its default value
+        of ``4*np.finfo(float).eps``.
+    maxiter : int, optional
+        The maximum number of iterations of each element. Must be >= 0.
+    full_output : bool, optional
+        If `full_output` is False (default), the roots are returned. If True,
+        the return value is ``(x, r)``, where `x` holds the roots and `r` is
+        a named tuple with the arrays ``converged``, ``flag``, ``iterations``
+        and ``function_calls`` of the shape of `x`. The values of
+        ``flag`` are 0 (converged), -1 (sign error: `f` has the same sign at
+        both ends of the bracket) and -2 (convergence error).
+    disp : bool, optional
+        If True (default), raise ValueError if there are elements with a sign
+        error and RuntimeError if some elements didn't converge. Otherwise,
+        the roots of the elements with a sign error are NaN, and the ones of
+        the elements which didn't converge are the best approximations found.
+
+    Returns
+    -------
+    x0 : ndarray
+        Approximate zeros of `f`, with the broadcast shape of `a`, `b` and
+        the arrays in `args`.
+    r : namedtuple (present if ``full_output = True``)
+        The convergence information of each element.
+
+    See Also
+    --------
+    brentq, toms748 : scalar bracketing root finders.
+    newton : also supports arrays, without bracketing.
+
+    Notes
+    -----
+    As with `brentq`, each element needs about as many function evaluations
+    as Brent's method, but the whole array is solved with one call of `f`
+    per iteration, so that the Python overhead of the loop is shared between
+    the elements.
+
+    .. versionadded:: 1.8.0
+
+    References
+    ----------
+    .. [Chandrupatla1997]
+       Chandrupatla, T. R.,
+       "A new hybrid quadratic/bisection algorithm for finding the zero of a
+       nonlinear function without using derivatives",
+       *Advances in Engineering Software*, 28(3), pp. 145-149, 1997.
+
+    .. [Scherer2010]
+       Scherer, P. O. J., *Computational Physics: Simulation of Classical
+       and Quantum Systems*, Section 6.1.7.3. Berlin: Springer, 2010.
+
+    Examples
+    --------
+    Invert the Black-Scholes formula to find the implied volatilities of
+    call options with a range of strikes:
+
+    >>> from scipy import optimize
+    >>> from scipy.special import ndtr
+
+    >>> def call_price(sigma, S, K, T, r):
+    ...     d1 = ((np.log(S / K) + (r + sigma**2 / 2) * T)
+    ...           / (sigma * np.sqrt(T)))
+    ...     d2 = d1 - sigma * np.sqrt(T)
+    ...     return S * ndtr(d1) - K * np.exp(-r * T) * ndtr(d2)
+
+    >>> K = np.linspace(80, 120, 1000)
+    >>> sigma = 0.2 + 0.001 * (K - 100)**2 / 10
+    >>> price = call_price(sigma, 100, K, 1, 0.01)
+
+    >>> def f(s, K, price):
+    ...     return call_price(s, 100, K, 1, 0.01) - price
+
+    >>> root = optimize.chandrupatla(f, 0.01, 2, args=(K, price))
+    >>> np.allclose(root, sigma)
+    True
+    """
+    maxiter = operator.index(maxiter)
+    if xtol < 0:
+        raise ValueError("xtol too small (%g < 0)" % xtol)
+    if rtol < _rtol:
+        raise ValueError("rtol too small (%g < %g)" % (rtol, _rtol))
+    if maxiter < 0:
+        raise ValueError("maxiter must be greater than or equal to 0")
+    if not isinstance(args, tuple):
+        args = (args,)
+
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    shape = np.broadcast(a, b, *[arg for arg in args
+                                 if isinstance(arg, np.ndarray)]).shape
+    a = np.broadcast_to(a, shape)
+    b = np.broadcast_to(b, shape)
+    args = [np.broadcast_to(arg, shape).ravel()
+            if isinstance(arg, np.ndarray) else arg for arg in args]
+
+    def f_active(x, active):
+        fx = f(x, *[arg[active] if isinstance(arg, np.ndarray) else arg
+                    for arg in args])
+        fx = np.asarray(fx, dtype=float)
+        if fx.shape != x.shape:
+            raise ValueError("`f` must return an array of the shape of `x`.")
+        return fx
+
+    x1 = a.ravel().copy()
+    x2 = b.ravel().copy()
+    size = x1.size
+    active = np.arange(size)
+    f1 = f_active(x1, active)
+    f2 = f_active(x2, active)
+
+    root = np.where(np.abs(f1) < np.abs(f2), x1, x2)
+    flag = np.full(size, _ECONVERR, dtype=int)
+    iterations = np.zeros(size, dtype=int)
+    function_calls = np.full(size, 2, dtype=int)
+
+    # elements with a root at one end of the bracket, or a sign error
+    zero = (f1 == 0) | (f2 == 0)
+    sign_error = ~zero & (np.sign(f1) == np.sign(f2))
+    flag[zero] = _ECONVERGED
+    flag[sign_error] = _ESIGNERR
+    root[sign_error] = np.nan
+
+    # x1 and x2 bracket the root, x3 is the previous value of x1 (or x2)
+    x3, f3 = x1.copy(), f1.copy()
+
+    active = np.flatnonzero(flag == _ECONVERR)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for iteration in range(maxiter + 1):
+            # the best approximation and the convergence check
+            x1a, x2a, x3a = x1[active], x2[active], x3[active]
+            f1a, f2a, f3a = f1[active], f2[active], f3[active]
+            best_1 = np.abs(f1a) < np.abs(f2a)
+            xm = np.where(best_1, x1a, x2a)
+            fm = np.where(best_1, f1a, f2a)
+            root[active] = xm
+            tol = 0.5 * (xtol + rtol * np.abs(xm))
+            tlim = tol / np.abs(x2a - x3a)
+            converged = (fm == 0) | (tlim > 0.5) | (x1a == x2a)
+            flag[active[converged]] = _ECONVERGED
+            keep = ~converged
+            active = active[keep]
+            if iteration == maxiter or not active.size:
+                break
+
+            x1a, x2a, x3a = x1a[keep], x2a[keep], x3a[keep]
+            f1a, f2a, f3a = f1a[keep], f2a[keep], f3a[keep]
+            tlim = tlim[keep]
+
+            # inverse quadratic interpolation if the three points allow it,
+            # and bisection otherwise
+            xi = (x1a - x2a) / (x3a - x2a)
+            phi = (f1a - f2a) / (f3a - f2a)
+            iqi = (phi**2 < xi) & ((1 - phi)**2 < 1 - xi)
+            t_iqi = (f1a / (f2a - f1a) * f3a / (f2a - f3a) +
+                     (x3a - x1a) / (x2a - x1a) * f1a / (f3a - f1a) *
+                     f2a / (f3a - f2a))
+            ta = np.where(iqi, t_iqi, 0.5)
+            ta = np.clip(ta, tlim, 1 - tlim)
+
+            xt = x1a + ta * (x2a - x1a)
+            ft = f_active(xt, active)
+            iterations[active] += 1
+            function_calls[active] += 1
+
+            # update the bracket
+            same_sign = np.sign(ft) == np.sign(f1a)
+            x3[active] = np.where(same_sign, x1a, x2a)
+            f3[active] = np.where(same_sign, f1a, f2a)
+            x2[active] = np.where(same_sign, x2a, x1a)
+            f2[active] = np.where(same_sign, f2a, f1a)
+            x1[active] = xt
+            f1[active] = ft
+
+    root = root.reshape(shape)
+    flag = flag.reshape(shape)
+    if disp:
+        if (flag == _ESIGNERR).any():
+            raise ValueError("f(a) and f(b) must have different signs")
+        if (flag == _ECONVERR).any():
+            all_or_some = 'all' if (flag == _ECONVERR).all() else 'some'
+            raise RuntimeError("{0:s} failed to converge after {1:d} "
+                               "iterations".format(all_or_some, maxiter))
+
+    if full_output:
+        result = namedtuple('result', ('converged', 'flag', 'iterations',
+                                       'function_calls'))
+        return root, result(flag == _ECONVERGED, flag,
+                            iterations.reshape(shape),
+                            function_calls.reshape(shape))
+    return root
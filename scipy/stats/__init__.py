@@ -252,6 +252,7 @@ Frequency statistics
    binned_statistic     -- Compute a binned statistic for a set of data.
    binned_statistic_2d  -- Compute a 2-D binned statistic for a set of data.
    binned_statistic_dd  -- Compute a d-D binned statistic for a set of data.
+   BinnedStatisticAccumulator -- Accumulate a d-D binned statistic over chunks.
 
 Correlation functions
 =====================
@@ -293,6 +294,7 @@ Statistical tests
    mannwhitneyu
    tiecorrect
    rankdata
+   RankedData
    ranksums
    wilcoxon
    kruskal
@@ -301,6 +303,7 @@ Statistical tests
    combine_pvalues
    jarque_bera
    page_trend_test
+   permutation_test
 
 .. autosummary::
    :toctree: generated/
@@ -449,12 +452,13 @@ from . import qmc
 from ._multivariate import *
 from . import contingency
 from .contingency import chi2_contingency
-from ._bootstrap import bootstrap
+from ._bootstrap import bootstrap, permutation_test
 from ._entropy import *
 from ._hypotests import *
 from ._rvs_sampling import rvs_ratio_uniforms, NumericalInverseHermite
 from ._page_trend_test import page_trend_test
 from ._mannwhitneyu import mannwhitneyu
+from ._ranked import RankedData
 
 __all__ = [s for s in dir() if not s.startswith("_")]  # Remove dunders.
 
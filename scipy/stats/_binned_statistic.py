@@ -6,7 +6,7 @@ from collections import namedtuple
 
 __all__ = ['binned_statistic',
            'binned_statistic_2d',
-           'binned_statistic_dd']
+           'binned_statistic_dd', 'BinnedStatisticAccumulator']
 
 
 BinnedStatisticResult = namedtuple('BinnedStatisticResult',
@@ -446,7 +446,8 @@ def binned_statistic_dd(sample, values, statistic='mean',
 
     See Also
     --------
-    numpy.digitize, numpy.histogramdd, binned_statistic, binned_statistic_2d
+    numpy.digitize, numpy.histogramdd, binned_statistic, binned_statistic_2d,
+    BinnedStatisticAccumulator
 
     Notes
     -----
@@ -583,8 +584,9 @@ def binned_statistic_dd(sample, values, statistic='mean',
             flatsum = np.bincount(binnumbers, values[vv])
             result[vv, a] = flatsum[a] / flatcount[a]
     elif statistic == 'std':
-        result.fill(0)
-        _calc_binned_statistic(Vdim, binnumbers, result, values, np.std)
+        result[:] = _statistic_from_moments(
+            _binned_moments(binnumbers, values, 'std', result.shape[1]),
+            'std', Vdim)
     elif statistic == 'count':
         result.fill(0)
         flatcount = np.bincount(binnumbers, None)
@@ -598,13 +600,11 @@ def binned_statistic_dd(sample, values, statistic='mean',
             result[vv, a] = flatsum
     elif statistic == 'median':
         result.fill(np.nan)
-        _calc_binned_statistic(Vdim, binnumbers, result, values, np.median)
-    elif statistic == 'min':
-        result.fill(np.nan)
-        _calc_binned_statistic(Vdim, binnumbers, result, values, np.min)
-    elif statistic == 'max':
-        result.fill(np.nan)
-        _calc_binned_statistic(Vdim, binnumbers, result, values, np.max)
+        _calc_binned_median(Vdim, binnumbers, result, values)
+    elif statistic in ('min', 'max'):
+        result[:] = _statistic_from_moments(
+            _binned_moments(binnumbers, values, statistic, result.shape[1]),
+            statistic, Vdim)
     elif callable(statistic):
         with np.errstate(invalid='ignore'), suppress_warnings() as sup:
             sup.filter(RuntimeWarning)
@@ -636,6 +636,235 @@ def binned_statistic_dd(sample, values, statistic='mean',
     return BinnedStatisticddResult(result, edges, binnumbers)
 
 
+class BinnedStatisticAccumulator:
+    """
+    Accumulate a multidimensional binned statistic over chunks of data.
+
+    The statistic of a data set too large to hold in memory is computed by
+    passing it chunk by chunk to `update`. Only a fixed number of
+    statistics per bin is kept between chunks, so the memory used does not
+    depend on the number of points. The result is the same as that of
+    `binned_statistic_dd` applied to all of the points at once, up to
+    rounding.
+
+    Parameters
+    ----------
+    bins : sequence or positive int
+        The bin specification, as for `binned_statistic_dd`. The bins must
+        be fixed before the data is seen, so `range` is required unless the
+        edges are given explicitly for all dimensions.
+    range : sequence, optional
+        A sequence of lower and upper bin edges to be used if the edges are
+        not given explicitly in `bins`.
+    statistic : {'mean', 'count', 'sum', 'std', 'min', 'max'}, optional
+        The statistic to compute (default is 'mean'); see
+        `binned_statistic_dd`. The median and user-defined functions cannot
+        be computed chunk by chunk.
+
+    Attributes
+    ----------
+    bin_edges : list of ndarrays
+        A list of D arrays describing the (nxi + 1) bin edges for each
+        dimension.
+    n : int
+        The number of points accumulated so far, including those outside
+        of the bins.
+
+    See Also
+    --------
+    binned_statistic_dd
+
+    Notes
+    -----
+    The standard deviations are computed from the means and the sums of
+    squared deviations of each bin, which are updated with every chunk as in
+    [1]_.
+
+    .. versionadded:: 1.8.0
+
+    References
+    ----------
+    .. [1] T. F. Chan, G. H. Golub and R. J. LeVeque, "Updating Formulae and
+           a Pairwise Algorithm for Computing Sample Variances", Technical
+           Report STAN-CS-79-773, Stanford University, 1979.
+
+    Examples
+    --------
+    >>> from scipy import stats
+    >>> rng = np.random.default_rng(3875214)
+
+    Accumulate the mean of ``x + y`` over 10 chunks of points:
+
+    >>> acc = stats.BinnedStatisticAccumulator(bins=[4, 3],
+    ...                                        range=[(0, 1), (0, 1)])
+    >>> samples = []
+    >>> for _ in range(10):
+    ...     sample = rng.random((1000, 2))
+    ...     acc = acc.update(sample, sample.sum(axis=1))
+    ...     samples.append(sample)
+    >>> acc.n
+    10000
+
+    The result is the same as that for all of the points at once:
+
+    >>> sample = np.concatenate(samples)
+    >>> res = stats.binned_statistic_dd(sample, sample.sum(axis=1),
+    ...                                 bins=[4, 3], range=[(0, 1), (0, 1)])
+    >>> np.allclose(acc.statistic, res.statistic)
+    True
+
+    """
+
+    _statistics = ('mean', 'count', 'sum', 'std', 'min', 'max')
+
+    def __init__(self, bins, range=None, statistic='mean'):
+        if statistic not in self._statistics:
+            raise ValueError(f'invalid statistic {statistic!r}; the '
+                             f'statistic must be one of {self._statistics}')
+        try:
+            bins = index(bins)
+        except TypeError:
+            # bins is not an integer
+            pass
+
+        if isinstance(bins, int):
+            if range is None:
+                raise ValueError('`range` must be given unless the bin edges '
+                                 'are given for all dimensions.')
+            bins = len(range) * [bins]
+        elif range is None:
+            if any(np.isscalar(b) for b in bins):
+                raise ValueError('`range` must be given unless the bin edges '
+                                 'are given for all dimensions.')
+            # the range is not used when all of the edges are given
+            range = len(bins) * [(0, 1)]
+
+        Ndim = len(bins)
+        self._nbin, self.bin_edges, self._dedges = _bin_edges(
+            np.empty((0, Ndim)), bins, range)
+        self._statistic = statistic
+        self.n = 0
+        self._shape = None
+        self._moments = None
+
+    def update(self, sample, values=None):
+        """
+        Add a chunk of points to the statistic.
+
+        Parameters
+        ----------
+        sample : array_like
+            Chunk of the data to histogram passed as a sequence of N arrays
+            of length D, or as an (N,D) array.
+        values : (N,) array_like or list of (N,) array_like, optional
+            The data on which the statistic will be computed, as for
+            `binned_statistic_dd`. The shape of `values`, other than the
+            number of points, must be the same for all chunks. Only
+            optional for the 'count' statistic.
+
+        Returns
+        -------
+        self : BinnedStatisticAccumulator
+            The accumulator, updated in place.
+
+        """
+        try:
+            Dlen, Ndim = sample.shape
+        except (AttributeError, ValueError):
+            sample = np.atleast_2d(sample).T
+            Dlen, Ndim = sample.shape
+        if Ndim != len(self.bin_edges):
+            raise ValueError('The dimension of bins must be equal '
+                             'to the dimension of the sample x.')
+
+        if values is None:
+            if self._statistic != 'count':
+                raise ValueError('`values` are required unless the '
+                                 'statistic is \'count\'.')
+            values = np.zeros(Dlen)
+        values = np.asarray(values)
+        shape = values.shape[:-1]
+        values = np.atleast_2d(values)
+        if values.shape[1] != Dlen:
+            raise ValueError('The number of `values` elements must match the '
+                             'length of each `sample` dimension.')
+        if self._shape is None:
+            self._shape = shape
+        elif shape != self._shape:
+            raise ValueError('The shape of `values` must be the same for all '
+                             'chunks.')
+
+        binnumbers = _bin_numbers(sample, self._nbin, self.bin_edges,
+                                  self._dedges)
+        moments = _binned_moments(binnumbers, values, self._statistic,
+                                  self._nbin.prod())
+        if self._moments is None:
+            self._moments = moments
+        else:
+            self._moments = _merge_binned_moments(self._moments, moments)
+        self.n += Dlen
+        return self
+
+    def merge(self, other):
+        """
+        Add the points accumulated by another accumulator.
+
+        This allows chunks of the data to be accumulated independently, e.g.
+        in different processes, and combined afterwards.
+
+        Parameters
+        ----------
+        other : BinnedStatisticAccumulator
+            An accumulator with the same bins and statistic.
+
+        Returns
+        -------
+        self : BinnedStatisticAccumulator
+            The accumulator, updated in place.
+
+        """
+        if (other._statistic != self._statistic
+                or len(other.bin_edges) != len(self.bin_edges)
+                or not all(np.array_equal(a, b) for a, b
+                           in zip(self.bin_edges, other.bin_edges))):
+            raise ValueError('Only accumulators with the same bins and '
+                             'statistic can be merged.')
+        if other._moments is None:
+            return self
+        if self._moments is None:
+            self._shape = other._shape
+            self._moments = dict(other._moments)
+        elif other._shape != self._shape:
+            raise ValueError('The shape of `values` must be the same for all '
+                             'chunks.')
+        else:
+            self._moments = _merge_binned_moments(self._moments,
+                                                  other._moments)
+        self.n += other.n
+        return self
+
+    @property
+    def statistic(self):
+        """The statistic of the points accumulated so far in each bin.
+
+        The shape is that of the result of `binned_statistic_dd`. Before any
+        point has been added, all bins are empty.
+        """
+        nbin = self._nbin
+        shape = () if self._shape is None else self._shape
+        Vdim = int(np.prod(shape))
+        moments = self._moments
+        if moments is None:
+            moments = _binned_moments(np.empty(0, np.intp),
+                                      np.empty((Vdim, 0)),
+                                      self._statistic, nbin.prod())
+        result = _statistic_from_moments(moments, self._statistic, Vdim)
+        # Remove outliers (indices 0 and -1 for each bin-dimension).
+        result = result.reshape(np.append(Vdim, nbin))
+        core = tuple([slice(None)] + len(nbin) * [slice(1, -1)])
+        return result[core].reshape(list(shape) + list(nbin - 2))
+
+
 def _calc_binned_statistic(Vdim, bin_numbers, result, values, stat_func,
                            is_callable=False):
     unique_bin_numbers = np.unique(bin_numbers)
@@ -664,6 +893,120 @@ def _create_binned_data(bin_numbers, unique_bin_numbers, values, vv):
     return bin_map
 
 
+def _calc_binned_median(Vdim, bin_numbers, result, values):
+    """Median of the values in every bin at once.
+
+    The values are sorted by bin and then by value, so that the median of
+    each bin is found from the positions of its middle elements.
+    """
+    if len(bin_numbers) == 0:
+        return
+    for vv in builtins.range(Vdim):
+        v = values[vv]
+        order = np.lexsort((v, bin_numbers))
+        sorted_bins = bin_numbers[order]
+        v = v[order]
+        starts = np.flatnonzero(np.concatenate(
+            ([True], sorted_bins[1:] != sorted_bins[:-1])))
+        counts = np.diff(np.append(starts, len(v)))
+        median = (v[starts + (counts - 1) // 2] + v[starts + counts // 2]) / 2
+        # NaNs are sorted last; like `np.median`, they propagate
+        has_nan = np.bincount(sorted_bins, np.isnan(v))[sorted_bins[starts]]
+        median[has_nan > 0] = np.nan
+        result[vv, sorted_bins[starts]] = median
+
+
+def _binned_moments(bin_numbers, values, statistic, size):
+    """Sufficient statistics of `values` in each of `size` bins.
+
+    The moments of disjoint sets of points are combined with
+    `_merge_binned_moments`, and the statistic is obtained from them with
+    `_statistic_from_moments`. Only the mergeable statistics 'count',
+    'sum', 'mean', 'std', 'min' and 'max' are supported.
+    """
+    moments = {'count': np.bincount(bin_numbers, minlength=size)}
+    if statistic in ('sum', 'mean', 'std'):
+        flatsum = np.array([np.bincount(bin_numbers, v, minlength=size)
+                            for v in values])
+        if statistic != 'std':
+            moments['sum'] = flatsum
+        else:
+            # sum of squared deviations from the mean of each bin, with the
+            # deviations computed in a second pass for accuracy
+            count = moments['count']
+            mean = flatsum / np.maximum(count, 1)
+            dev = values - mean[:, bin_numbers]
+            moments['mean'] = mean
+            moments['m2'] = np.array([
+                np.bincount(bin_numbers, d**2, minlength=size) for d in dev])
+    elif statistic in ('min', 'max'):
+        ufunc, fill = ((np.minimum, np.inf) if statistic == 'min'
+                       else (np.maximum, -np.inf))
+        extreme = np.full((len(values), size), fill)
+        if len(bin_numbers):
+            order = np.argsort(bin_numbers, kind='stable')
+            sorted_bins = bin_numbers[order]
+            starts = np.flatnonzero(np.concatenate(
+                ([True], sorted_bins[1:] != sorted_bins[:-1])))
+            extreme[:, sorted_bins[starts]] = ufunc.reduceat(
+                values[:, order], starts, axis=1)
+        moments[statistic] = extreme
+    return moments
+
+
+def _merge_binned_moments(a, b):
+    """Moments of the union of the points of two sets of moments.
+
+    The means and sums of squared deviations are combined as in [1]_.
+
+    References
+    ----------
+    .. [1] T. F. Chan, G. H. Golub and R. J. LeVeque, "Updating Formulae and
+           a Pairwise Algorithm for Computing Sample Variances", Technical
+           Report STAN-CS-79-773, Stanford University, 1979.
+
+    """
+    count = a['count'] + b['count']
+    merged = {'count': count}
+    if 'sum' in a:
+        merged['sum'] = a['sum'] + b['sum']
+    if 'm2' in a:
+        frac = b['count'] / np.maximum(count, 1)
+        delta = b['mean'] - a['mean']
+        merged['mean'] = a['mean'] + delta * frac
+        merged['m2'] = a['m2'] + b['m2'] + delta**2 * a['count'] * frac
+    if 'min' in a:
+        merged['min'] = np.minimum(a['min'], b['min'])
+    if 'max' in a:
+        merged['max'] = np.maximum(a['max'], b['max'])
+    return merged
+
+
+def _statistic_from_moments(moments, statistic, Vdim):
+    """The statistic in each bin, shape (Vdim, size), from its moments."""
+    count = moments['count']
+    if statistic == 'count':
+        return np.repeat(count[np.newaxis, :].astype(float), Vdim, axis=0)
+    elif statistic == 'sum':
+        return moments['sum'].astype(float)
+    elif statistic == 'mean':
+        result = np.full(moments['sum'].shape, np.nan)
+        a = count.nonzero()[0]
+        result[:, a] = moments['sum'][:, a] / count[a]
+        return result
+    elif statistic == 'std':
+        # as before, the standard deviation of bins with fewer than two
+        # points is zero
+        result = np.zeros(moments['m2'].shape)
+        a = (count > 1).nonzero()[0]
+        result[:, a] = np.sqrt(moments['m2'][:, a] / count[a])
+        return result
+    else:
+        result = np.array(moments[statistic], float)
+        result[:, count == 0] = np.nan
+        return result
+
+
 def _bin_edges(sample, bins=None, range=None):
     """ Create edge arrays
     """
@@ -1,27 +1,53 @@
+import os
+from itertools import combinations, permutations, product, islice
 import numpy as np
-from scipy._lib._util import check_random_state
-from scipy.special import ndtr, ndtri
+from scipy._lib._util import check_random_state, MapWrapper
+from scipy.special import ndtr, ndtri, comb, factorial
 from scipy._lib._util import rng_integers
 from dataclasses import make_dataclass
 from ._common import ConfidenceInterval
 from scipy.stats.stats import _broadcast_concatenate
 
 
-def _vectorize_statistic(statistic):
-    """Vectorize an n-sample statistic"""
-    # This is a little cleaner than np.nditer at the expense of some data
-    # copying: concatenate samples together, then use np.apply_along_axis
-    def stat_nd(*data, axis=0):
+class _VectorizedStatistic:
+    """An n-sample statistic vectorized with `np.apply_along_axis`.
+
+    This is a class rather than a closure so that it can be pickled.
+    """
+    def __init__(self, statistic):
+        self.statistic = statistic
+
+    def __call__(self, *data, axis=0):
+        # This is a little cleaner than np.nditer at the expense of some data
+        # copying: concatenate samples together, then use np.apply_along_axis
         lengths = [sample.shape[axis] for sample in data]
         split_indices = np.cumsum(lengths)[:-1]
         z = _broadcast_concatenate(data, axis)
 
         def stat_1d(z):
             data = np.split(z, split_indices)
-            return statistic(*data)
+            return self.statistic(*data)
 
         return np.apply_along_axis(stat_1d, axis, z)[()]
-    return stat_nd
+
+
+def _vectorize_statistic(statistic):
+    """Vectorize an n-sample statistic"""
+    return _VectorizedStatistic(statistic)
+
+
+def _jackknife_batch(sample, k, batch):
+    """Jackknife resamples leaving out observations ``k:k+batch``."""
+    n = sample.shape[-1]
+
+    # jackknife - each row leaves out one observation
+    j = np.ones((batch, n), dtype=bool)
+    np.fill_diagonal(j[:, k:k+batch], False)
+    i = np.arange(n)
+    i = np.broadcast_to(i, (batch, n))
+    i = i[j].reshape((batch, n-1))
+
+    return sample[..., i]
 
 
 def _jackknife_resample(sample, batch=None):
@@ -32,16 +58,7 @@ def _jackknife_resample(sample, batch=None):
     for k in range(0, n, batch_nominal):
         # col_start:col_end are the observations to remove
         batch_actual = min(batch_nominal, n-k)
-
-        # jackknife - each row leaves out one observation
-        j = np.ones((batch_actual, n), dtype=bool)
-        np.fill_diagonal(j[:, k:k+batch_actual], False)
-        i = np.arange(n)
-        i = np.broadcast_to(i, (batch_actual, n))
-        i = i[j].reshape((batch_actual, n-1))
-
-        resamples = sample[..., i]
-        yield resamples
+        yield _jackknife_batch(sample, k, batch_actual)
 
 
 def _bootstrap_resample(sample, n_resamples=None, random_state=None):
@@ -55,6 +72,91 @@ def _bootstrap_resample(sample, n_resamples=None, random_state=None):
     return resamples
 
 
+def _spawn_random_states(random_state, n):
+    """`n` independent random number generators seeded by `random_state`."""
+    entropy = rng_integers(random_state, 1 << 32, size=4, dtype=np.uint32)
+    try:
+        # SeedSequence is only available in numpy >= 1.17
+        seeds = np.random.SeedSequence(entropy).spawn(n)
+        return [np.random.default_rng(seed) for seed in seeds]
+    except AttributeError:
+        return [np.random.RandomState(rng_integers(random_state, 1 << 32,
+                                                   size=4, dtype=np.uint32))
+                for _ in range(n)]
+
+
+class _BootstrapStatistic:
+    """Evaluate the statistic for a batch of bootstrap resamples.
+
+    This is a class rather than a closure so that it can be pickled and
+    evaluated by `MapWrapper` in other processes.
+    """
+    def __init__(self, data, statistic):
+        self.data = data
+        self.statistic = statistic
+
+    def __call__(self, task):
+        batch, random_state = task
+        resampled_data = [_bootstrap_resample(sample, n_resamples=batch,
+                                              random_state=random_state)
+                          for sample in self.data]
+        return self.statistic(*resampled_data, axis=-1)
+
+
+class _JackknifeStatistic:
+    """Evaluate the statistic for a batch of jackknife resamples."""
+    def __init__(self, sample, statistic):
+        self.sample = sample
+        self.statistic = statistic
+
+    def __call__(self, task):
+        k, batch = task
+        return self.statistic(_jackknife_batch(self.sample, k, batch),
+                              axis=-1)
+
+
+def _n_workers(workers):
+    """Number of processes that `MapWrapper(workers)` evaluates tasks on."""
+    if callable(workers):
+        return os.cpu_count() or 1
+    n = int(workers)
+    return (os.cpu_count() or 1) if n == -1 else max(n, 1)
+
+
+# Default maximum number of elements in a batch of resamples
+_BATCH_ELEMENTS = 2**24
+
+
+def _default_batch(n_resamples, n_elements, workers):
+    """Default batch size of resamples of data with `n_elements` elements."""
+    batch = max(1, _BATCH_ELEMENTS // n_elements)
+    if workers != 1:
+        batch = min(batch, -(-n_resamples // _n_workers(workers)))
+    return min(batch, n_resamples)
+
+
+def _batches(n, batch):
+    """Start and size of the batches that divide ``range(n)``."""
+    return [(k, min(batch, n - k)) for k in range(0, n, batch)]
+
+
+def _map_batches(func, tasks, starts, workers):
+    """Evaluate `func` on `tasks` and place the results along the last axis.
+
+    The batch statistics are written into a preallocated array as they are
+    received, so only the statistics (not the resamples) are accumulated.
+    """
+    res = None
+    with MapWrapper(workers) as mapwrapper:
+        for (k, batch), theta in zip(starts, mapwrapper(func, tasks)):
+            theta = np.asarray(theta)
+            if res is None:
+                n = starts[-1][0] + starts[-1][1]
+                res = np.empty(theta.shape[:-1] + (n,), dtype=theta.dtype)
+            res[..., k:k+batch] = theta
+    return res
+
+
 def _percentile_of_score(a, score, axis):
     """Vectorized, simplified `scipy.stats.percentileofscore`.
 
@@ -79,7 +181,8 @@ def _percentile_along_axis(theta_hat_b, alpha):
     return percentiles[()]  # return scalar instead of 0d array
 
 
-def _bca_interval(data, statistic, axis, alpha, theta_hat_b, batch):
+def _bca_interval(data, statistic, axis, alpha, theta_hat_b, batch,
+                  workers=1):
     """Bias-corrected and accelerated interval."""
     # closely follows [2] "BCa Bootstrap CIs"
     sample = data[0]  # only works with 1 sample statistics right now
@@ -90,10 +193,12 @@ def _bca_interval(data, statistic, axis, alpha, theta_hat_b, batch):
     z0_hat = ndtri(percentile)
 
     # calculate a_hat
-    theta_hat_i = []  # would be better to fill pre-allocated array
-    for jackknife_sample in _jackknife_resample(sample, batch):
-        theta_hat_i.append(statistic(jackknife_sample, axis=-1))
-    theta_hat_i = np.concatenate(theta_hat_i, axis=-1)
+    n = sample.shape[-1]
+    if batch is None:
+        batch = _default_batch(n, sample.size, workers)
+    tasks = _batches(n, batch)
+    theta_hat_i = _map_batches(_JackknifeStatistic(sample, statistic), tasks,
+                               tasks, workers)
     theta_hat_dot = theta_hat_i.mean(axis=-1, keepdims=True)
     num = ((theta_hat_dot - theta_hat_i)**3).sum(axis=-1)
     den = 6*((theta_hat_dot - theta_hat_i)**2).sum(axis=-1)**(3/2)
@@ -110,7 +215,7 @@ def _bca_interval(data, statistic, axis, alpha, theta_hat_b, batch):
 
 
 def _bootstrap_iv(data, statistic, vectorized, paired, axis, confidence_level,
-                  n_resamples, batch, method, random_state):
+                  n_resamples, batch, method, workers, random_state):
     """Input validation and standardization for `bootstrap`."""
 
     if vectorized not in {True, False}:
@@ -182,11 +287,18 @@ def _bootstrap_iv(data, statistic, vectorized, paired, axis, confidence_level,
     if not paired and n_samples > 1 and method == 'bca':
         raise ValueError(message)
 
+    if not callable(workers):
+        workers_int = int(workers)
+        if workers != workers_int or not (workers_int == -1
+                                          or workers_int >= 1):
+            raise ValueError("`workers` must be -1, a positive integer, or "
+                             "a map-like callable.")
+
     random_state = check_random_state(random_state)
 
     return (data_iv, statistic, vectorized, paired, axis_int,
             confidence_level_float, n_resamples_int, batch_iv,
-            method, random_state)
+            method, workers, random_state)
 
 
 fields = ['confidence_interval', 'standard_error']
@@ -195,7 +307,7 @@ BootstrapResult = make_dataclass("BootstrapResult", fields)
 
 def bootstrap(data, statistic, *, vectorized=True, paired=False, axis=0,
               confidence_level=0.95, n_resamples=9999, batch=None,
-              method='BCa', random_state=None):
+              method='BCa', workers=1, random_state=None):
     r"""
     Compute a two-sided bootstrap confidence interval of a statistic.
 
@@ -253,15 +365,28 @@ def bootstrap(data, statistic, *, vectorized=True, paired=False, axis=0,
         of the statistic.
     batch : int, optional
         The number of resamples to process in each vectorized call to
-        `statistic`. Memory usage is O(`batch`*``n``), where ``n`` is the
-        sample size. Default is ``None``, in which case ``batch = n_resamples``
-        (or ``batch = max(n_resamples, n)`` for ``method='BCa'``).
+        `statistic`. Memory usage is O(`batch`*``n``) per worker, where ``n``
+        is the sample size. Default is ``None``, in which case `batch` is
+        chosen such that each batch of resamples has at most about ``2**24``
+        elements and, if `workers` is not ``1``, such that there is at least
+        one batch per worker. The same `batch` is used for the jackknife
+        resamples of ``method='BCa'``.
     method : {'percentile', 'basic', 'bca'}, default: ``'BCa'``
         Whether to return the 'percentile' bootstrap confidence interval
         (``'percentile'``), the 'reverse' or the bias-corrected and accelerated
         bootstrap confidence interval (``'BCa'``).
         Note that only ``'percentile'`` and ``'basic'`` support multi-sample
         statistics at this time.
+    workers : int or map-like callable, optional
+        If `workers` is an int the batches of resamples are subdivided into
+        `workers` sections and evaluated in parallel (uses
+        `multiprocessing.Pool <multiprocessing>`). Supply `-1` to use all cores
+        available to the Process. Alternatively supply a map-like callable,
+        such as `multiprocessing.Pool.map` for evaluating the batches in
+        parallel. This evaluation is carried out as ``workers(func,
+        iterable)``. Requires that `statistic` be pickleable. Default is 1.
+
+        .. versionadded:: 1.8.0
     random_state : {None, int, `numpy.random.Generator`,
                     `numpy.random.RandomState`}, optional
 
@@ -273,6 +398,10 @@ def bootstrap(data, statistic, *, vectorized=True, paired=False, axis=0,
         that instance is used.
 
         Pseudorandom number generator state used to generate resamples.
+        If `workers` is not ``1``, `random_state` is used to seed an
+        independent stream of random numbers for each batch (using
+        `numpy.random.SeedSequence` when available), so the result is
+        reproducible for a given `random_state` and `batch`.
 
     Returns
     -------
@@ -416,33 +545,36 @@ def bootstrap(data, statistic, *, vectorized=True, paired=False, axis=0,
     """
     # Input validation
     args = _bootstrap_iv(data, statistic, vectorized, paired, axis,
-                         confidence_level, n_resamples, batch, method,
+                         confidence_level, n_resamples, batch, method, workers,
                          random_state)
     data, statistic, vectorized, paired, axis = args[:5]
-    confidence_level, n_resamples, batch, method, random_state = args[5:]
-
-    theta_hat_b = []
-
-    batch_nominal = batch or n_resamples
-
-    for k in range(0, n_resamples, batch_nominal):
-        batch_actual = min(batch_nominal, n_resamples-k)
-        # Generate resamples
-        resampled_data = []
-        for sample in data:
-            resample = _bootstrap_resample(sample, n_resamples=batch_actual,
-                                           random_state=random_state)
-            resampled_data.append(resample)
+    confidence_level, n_resamples, batch, method, workers = args[5:10]
+    random_state = args[10]
+
+    n_elements = sum(sample.size for sample in data)
+    batch_nominal = batch or _default_batch(n_resamples, n_elements, workers)
+    tasks = _batches(n_resamples, batch_nominal)
+
+    # With a single worker, the batches draw from `random_state` in turn, so
+    # the resamples do not depend on `batch`. Otherwise, each batch gets an
+    # independent stream so that the batches can be generated anywhere.
+    if workers == 1:
+        random_states = [random_state] * len(tasks)
+    else:
+        random_states = _spawn_random_states(random_state, len(tasks))
 
-        # Compute bootstrap distribution of statistic
-        theta_hat_b.append(statistic(*resampled_data, axis=-1))
-    theta_hat_b = np.concatenate(theta_hat_b, axis=-1)
+    # Generate resamples and compute bootstrap distribution of statistic
+    theta_hat_b = _map_batches(
+        _BootstrapStatistic(data, statistic),
+        [(batch, rs) for (_, batch), rs in zip(tasks, random_states)],
+        tasks, workers)
 
     # Calculate percentile interval
     alpha = (1 - confidence_level)/2
     if method == 'bca':
         interval = _bca_interval(data, statistic, axis=-1, alpha=alpha,
-                                 theta_hat_b=theta_hat_b, batch=batch)
+                                 theta_hat_b=theta_hat_b, batch=batch,
+                                 workers=workers)
         percentile_fun = _percentile_along_axis
     else:
         interval = alpha, 1-alpha
@@ -459,3 +591,453 @@ def bootstrap(data, statistic, *, vectorized=True, paired=False, axis=0,
 
     return BootstrapResult(confidence_interval=ConfidenceInterval(ci_l, ci_u),
                            standard_error=np.std(theta_hat_b, ddof=1, axis=-1))
+
+
+def _batched(iterable, batch):
+    """Group the elements of `iterable` into arrays of up to `batch` rows."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, batch))
+        if not chunk:
+            return
+        yield np.array(chunk)
+
+
+def _all_partitions_concatenated(ns):
+    """All partitions of ``range(sum(ns))`` into groups of sizes `ns`.
+
+    Each partition is yielded as the concatenation of its (sorted) groups;
+    the order of the groups matters but the order within a group does not.
+    """
+    def partitions(z, ns):
+        if len(ns) == 1:
+            yield [z]
+            return
+        for c in combinations(z, ns[0]):
+            rest = [i for i in z if i not in set(c)]
+            for p in partitions(rest, ns[1:]):
+                yield [list(c)] + p
+
+    for partition in partitions(list(range(sum(ns))), list(ns)):
+        yield np.concatenate(partition).astype(np.intp)
+
+
+class _PermutationStatistic:
+    """Evaluate the statistic for a batch of permutation indices.
+
+    This is a class rather than a closure so that it can be pickled and
+    evaluated by `MapWrapper` in other processes.
+    """
+    def __init__(self, data, statistic, permutation_type):
+        self.statistic = statistic
+        self.permutation_type = permutation_type
+        if permutation_type == 'independent':
+            self.split_indices = np.cumsum([x.shape[-1] for x in data])[:-1]
+            self.data = _broadcast_concatenate(data, axis=-1)
+        elif permutation_type == 'samples':
+            self.data = np.stack(np.broadcast_arrays(*data), axis=-2)
+        else:
+            self.data = data
+
+    def __call__(self, indices):
+        if self.permutation_type == 'independent':
+            # `indices` has shape (batch, n): permutations of pooled data
+            pooled = self.data[..., indices]
+            resamples = np.split(pooled, self.split_indices, axis=-1)
+        elif self.permutation_type == 'pairings':
+            # `indices` has shape (batch, n_permuted, n): the order of the
+            # observations in each of the last `n_permuted` samples
+            n_fixed = len(self.data) - indices.shape[1]
+            resamples = [sample[..., None, :] for sample in
+                         self.data[:n_fixed]]
+            resamples += [sample[..., indices[:, i, :]] for i, sample
+                          in enumerate(self.data[n_fixed:])]
+        else:
+            # `indices` has shape (batch, n, k): the sample that each of the
+            # `k` observations of each of the `n` tuples is assigned to
+            n = indices.shape[1]
+            j = np.arange(n)
+            resamples = [self.data[..., indices[..., i], j]
+                         for i in range(indices.shape[-1])]
+        return self.statistic(*resamples, axis=-1)
+
+
+def _permutation_indices(data, permutation_type, n_resamples, random_state):
+    """Number of distinct permutations and a generator of permutations.
+
+    If `n_resamples` is at least the number of distinct permutations of
+    `data`, all of them are generated exactly once; otherwise, `n_resamples`
+    random permutations are drawn. Returns ``(n_resamples, exact, indices)``.
+    """
+    ns = [sample.shape[-1] for sample in data]
+    n = ns[0]
+    k = len(data)
+
+    if permutation_type == 'independent':
+        n_obs = sum(ns)
+        n_max = np.prod([comb(n_obs - sum(ns[:i]), ns[i])
+                         for i in range(k)])
+
+        def exact_indices():
+            return _all_partitions_concatenated(ns)
+
+        def random_indices():
+            for _ in range(n_resamples):
+                yield random_state.permutation(n_obs)
+
+    elif permutation_type == 'pairings':
+        n_permuted = max(k - 1, 1)
+        n_max = factorial(n)**n_permuted
+
+        def exact_indices():
+            return product(permutations(range(n)), repeat=n_permuted)
+
+        def random_indices():
+            for _ in range(n_resamples):
+                yield [random_state.permutation(n)
+                       for _ in range(n_permuted)]
+
+    else:
+        n_max = factorial(k)**n
+
+        def exact_indices():
+            return product(permutations(range(k)), repeat=n)
+
+        def random_indices():
+            for _ in range(n_resamples):
+                yield np.argsort(random_state.random((n, k)), axis=-1)
+
+    if n_resamples >= n_max:
+        return int(n_max), True, exact_indices()
+    return n_resamples, False, random_indices()
+
+
+def _calculate_null(data, statistic, permutation_type, n_resamples, batch,
+                    workers, random_state):
+    """Null distribution of `statistic` under permutations of `data`.
+
+    Samples in `data` are arrays with observations along the last axis, and
+    `statistic` must be vectorized along ``axis=-1``. The resamples are formed
+    and reduced `batch` at a time, and the batches are distributed over
+    `workers`. The random permutations are always drawn in the calling
+    process, so the null distribution does not depend on `workers`.
+
+    Returns the null distribution, with permutations along the last axis, the
+    number of permutations used, and whether the null distribution is exact.
+    """
+    n_resamples, exact, indices = _permutation_indices(
+        data, permutation_type, n_resamples, random_state)
+
+    n_elements = sum(sample.size for sample in data)
+    batch_nominal = batch or _default_batch(n_resamples, n_elements, workers)
+
+    func = _PermutationStatistic(data, statistic, permutation_type)
+    with MapWrapper(workers) as mapwrapper:
+        null_distribution = list(mapwrapper(func, _batched(indices,
+                                                           batch_nominal)))
+    null_distribution = np.concatenate(null_distribution, axis=-1)
+    return null_distribution, n_resamples, exact
+
+
+def _permutation_test_iv(data, statistic, permutation_type, vectorized,
+                         n_resamples, batch, alternative, axis, workers,
+                         random_state):
+    """Input validation and standardization for `permutation_test`."""
+
+    axis_int = int(axis)
+    if axis != axis_int:
+        raise ValueError("`axis` must be an integer.")
+
+    permutation_types = {'samples', 'pairings', 'independent'}
+    permutation_type = permutation_type.lower()
+    if permutation_type not in permutation_types:
+        raise ValueError(f"`permutation_type` must be in {permutation_types}.")
+
+    if vectorized not in {True, False}:
+        raise ValueError("`vectorized` must be `True` or `False`.")
+
+    if not vectorized:
+        statistic = _vectorize_statistic(statistic)
+
+    message = "`data` must be a tuple containing at least two samples"
+    try:
+        if len(data) < 2 and permutation_type == 'independent':
+            raise ValueError(message)
+    except TypeError:
+        raise TypeError(message)
+
+    data_iv = []
+    for sample in data:
+        sample = np.atleast_1d(sample)
+        if sample.shape[axis_int] <= 1:
+            raise ValueError("each sample in `data` must contain two or more "
+                             "observations along `axis`.")
+        sample = np.moveaxis(sample, axis_int, -1)
+        data_iv.append(sample)
+
+    if permutation_type in {'samples', 'pairings'}:
+        n = data_iv[0].shape[-1]
+        for sample in data_iv[1:]:
+            if sample.shape[-1] != n:
+                message = ("When `permutation_type` is 'samples' or "
+                           "'pairings', all samples must have the same "
+                           "length along `axis`.")
+                raise ValueError(message)
+
+    n_resamples_int = (int(n_resamples) if not np.isinf(n_resamples)
+                       else np.inf)
+    if n_resamples != n_resamples_int or n_resamples_int <= 0:
+        raise ValueError("`n_resamples` must be a positive integer.")
+
+    if batch is None:
+        batch_iv = batch
+    else:
+        batch_iv = int(batch)
+        if batch != batch_iv or batch_iv <= 0:
+            raise ValueError("`batch` must be a positive integer or None.")
+
+    alternatives = {'two-sided', 'greater', 'less'}
+    alternative = alternative.lower()
+    if alternative not in alternatives:
+        raise ValueError(f"`alternative` must be in {alternatives}")
+
+    if not callable(workers):
+        workers_int = int(workers)
+        if workers != workers_int or not (workers_int == -1
+                                          or workers_int >= 1):
+            raise ValueError("`workers` must be -1, a positive integer, or "
+                             "a map-like callable.")
+
+    random_state = check_random_state(random_state)
+
+    return (data_iv, statistic, permutation_type, vectorized, n_resamples_int,
+            batch_iv, alternative, axis_int, workers, random_state)
+
+
+fields = ['statistic', 'pvalue', 'null_distribution']
+PermutationTestResult = make_dataclass("PermutationTestResult", fields)
+
+
+def permutation_test(data, statistic, *, permutation_type='independent',
+                     vectorized=True, n_resamples=9999, batch=None,
+                     alternative="two-sided", axis=0, workers=1,
+                     random_state=None):
+    r"""
+    Performs a permutation test of a given statistic on provided data.
+
+    For independent sample statistics, the null hypothesis is that the data
+    are randomly sampled from the same distribution.
+    For paired sample statistics, two null hypothesis can be tested:
+    that the data are paired at random or that the data are assigned to
+    samples at random.
+
+    Parameters
+    ----------
+    data : iterable of array-like
+        Contains the samples, each of which is an array of observations.
+        Dimensions of sample arrays must be compatible for broadcasting except
+        along `axis`.
+    statistic : callable
+        Statistic for which the p-value of the hypothesis test is to be
+        calculated. `statistic` must be a callable that accepts samples
+        as separate arguments (e.g. ``statistic(*data)``) and returns the
+        resulting statistic.
+        If `vectorized` is set ``True``, `statistic` must also accept a keyword
+        argument `axis` and be vectorized to compute the statistic along the
+        provided `axis` of the sample arrays.
+    permutation_type : {'independent', 'samples', 'pairings'}, optional
+        The type of permutations to be performed, in accordance with the
+        null hypothesis. See Notes.
+    vectorized : bool, default: ``True``
+        If `vectorized` is set ``False``, `statistic` will not be passed
+        keyword argument `axis`, and is assumed to calculate the statistic
+        only for 1D samples.
+    n_resamples : int or np.inf, default: 9999
+        Number of random permutations (resamples) used to approximate the null
+        distribution. If greater than or equal to the number of distinct
+        permutations, the exact null distribution will be computed.
+        Note that the number of distinct permutations grows very rapidly with
+        the sizes of samples, so exact tests are feasible only for very small
+        data sets.
+    batch : int, optional
+        The number of permutations to process in each call to `statistic`.
+        Memory usage is O(`batch`*``n``) per worker, where ``n`` is the total
+        size of all samples, regardless of the value of `vectorized`. Default
+        is ``None``, in which case `batch` is chosen such that each batch of
+        resamples has at most about ``2**24`` elements and, if `workers` is not
+        ``1``, such that there is at least one batch per worker.
+    alternative : {'two-sided', 'less', 'greater'}, optional
+        The alternative hypothesis for which the p-value is calculated.
+        For each alternative, the p-value is defined as follows.
+
+        - ``'greater'`` : the percentage of the null distribution that is
+          greater than or equal to the observed value of the test statistic.
+        - ``'less'`` : the percentage of the null distribution that is
+          less than or equal to the observed value of the test statistic.
+        - ``'two-sided'`` : twice the smaller of the p-values above.
+
+    axis : int, default: 0
+        The axis of the (broadcasted) samples over which to calculate the
+        statistic. If samples have a different number of dimensions,
+        singleton dimensions are prepended to samples with fewer dimensions
+        before `axis` is considered.
+    workers : int or map-like callable, optional
+        If `workers` is an int the permutations are subdivided into `workers`
+        sections and evaluated in parallel (uses
+        `multiprocessing.Pool <multiprocessing>`). Supply `-1` to use all cores
+        available to the Process. Alternatively supply a map-like callable,
+        such as `multiprocessing.Pool.map` for evaluating the statistic in
+        parallel. This evaluation is carried out as ``workers(func,
+        iterable)``. Requires that `statistic` be pickleable. The result does
+        not depend on `workers`. Default is 1.
+    random_state : {None, int, `numpy.random.Generator`,
+                    `numpy.random.RandomState`}, optional
+
+        Pseudorandom number generator state used to generate permutations.
+
+        If `random_state` is ``None`` (default), the
+        `numpy.random.RandomState` singleton is used.
+        If `random_state` is an int, a new ``RandomState`` instance is used,
+        seeded with `random_state`.
+        If `random_state` is already a ``Generator`` or ``RandomState``
+        instance then that instance is used.
+
+    Returns
+    -------
+    res : PermutationTestResult
+        An object with attributes:
+
+        statistic : float or ndarray
+            The observed test statistic of the data.
+        pvalue : float or ndarray
+            The p-value for the given alternative.
+        null_distribution : ndarray
+            The values of the test statistic generated under the null
+            hypothesis, along the last axis.
+
+    Notes
+    -----
+
+    The three types of permutation tests supported by this function are
+    described below.
+
+    **Unpaired statistics** (``permutation_type='independent'``):
+
+    The null hypothesis associated with this permutation type is that all
+    observations are sampled from the same underlying distribution and that
+    they have been assigned to one of the samples at random. Under the null
+    hypothesis, each distinct partition of the pooled observations into
+    samples of the original sizes is equally likely. If `n_resamples` is at
+    least the number of distinct partitions, each of them is used exactly
+    once.
+
+    **Paired statistics, permute pairings** (``permutation_type='pairings'``):
+
+    The null hypothesis associated with this permutation type is that
+    observations within each sample are drawn from the same underlying
+    distribution and that pairings with elements of other samples are
+    assigned at random. The order of the observations of all samples but the
+    first is permuted independently; if `data` contains a single sample, the
+    order of its observations is permuted. This is appropriate for
+    correlation statistics.
+
+    **Paired statistics, permute samples** (``permutation_type='samples'``):
+
+    The null hypothesis associated with this permutation type is that
+    observations within each tuple (the observations at the same index in
+    all samples) are drawn from the same underlying distribution and that
+    the sample to which they are assigned is random. Each tuple is permuted
+    among the samples independently.
+
+    The p-value of a test based on random permutations is computed as
+    ``(k + 1) / (n_resamples + 1)``, where ``k`` is the number of permutations
+    whose statistic is at least as extreme as the observed one, so that the
+    p-value is never zero [1]_. For exact tests, the p-value is
+    ``k / n_resamples``. Values of the statistic within a relative tolerance
+    of ``1e-14`` of the observed value are considered equal to it, so that
+    round-off error does not affect the p-value of exact tests.
+
+    The observed statistic and the permutations are evaluated in batches of
+    `batch` permutations, each of which is processed with a single vectorized
+    call to `statistic`. The permutations themselves are generated in the
+    calling process, so the result of a test with a given `random_state` is
+    identical regardless of `batch` and `workers`.
+
+    .. versionadded:: 1.8.0
+
+    References
+    ----------
+    .. [1] B. Phipson and G. K. Smyth. "Permutation P-values Should Never Be
+       Zero: Calculating Exact P-values When Permutations Are Randomly
+       Drawn." Statistical Applications in Genetics and Molecular Biology
+       9.1 (2010).
+
+    Examples
+    --------
+    Suppose we wish to test whether two samples are drawn from the same
+    distribution, using the difference between the sample means as the
+    statistic.
+
+    >>> import numpy as np
+    >>> from scipy.stats import permutation_test
+    >>> def statistic(x, y, axis):
+    ...     return np.mean(x, axis=axis) - np.mean(y, axis=axis)
+
+    >>> rng = np.random.default_rng()
+    >>> x = rng.normal(size=20)
+    >>> y = rng.normal(loc=1, size=30)
+    >>> res = permutation_test((x, y), statistic, random_state=rng)
+    >>> res.pvalue < 0.05
+    True
+
+    With small samples, the exact null distribution is used: there are only
+    ``binom(7, 3) = 35`` ways of partitioning seven observations into samples
+    of sizes three and four.
+
+    >>> res = permutation_test(([1, 2, 3], [4, 5, 6, 7]), statistic,
+    ...                        alternative='less')
+    >>> res.null_distribution.size, res.pvalue
+    (35, 0.02857142857142857)
+
+    """
+    args = _permutation_test_iv(data, statistic, permutation_type, vectorized,
+                                n_resamples, batch, alternative, axis,
+                                workers, random_state)
+    (data, statistic, permutation_type, vectorized, n_resamples, batch,
+     alternative, axis, workers, random_state) = args
+
+    observed = statistic(*data, axis=-1)
+
+    null_distribution, n_resamples, exact = _calculate_null(
+        data, statistic, permutation_type, n_resamples, batch, workers,
+        random_state)
+
+    # relative tolerance for detecting numerically distinct but
+    # theoretically equal values in the null distribution
+    eps = 1e-14
+    gamma = np.abs(eps * observed)
+    adjustment = 0 if exact else 1
+
+    def less(null_distribution, observed):
+        cmps = null_distribution <= observed[..., None] + gamma[..., None]
+        return (cmps.sum(axis=-1) + adjustment) / (n_resamples + adjustment)
+
+    def greater(null_distribution, observed):
+        cmps = null_distribution >= observed[..., None] - gamma[..., None]
+        return (cmps.sum(axis=-1) + adjustment) / (n_resamples + adjustment)
+
+    def two_sided(null_distribution, observed):
+        pvalues_less = less(null_distribution, observed)
+        pvalues_greater = greater(null_distribution, observed)
+        pvalues = np.minimum(pvalues_less, pvalues_greater) * 2
+        return np.clip(pvalues, 0, 1)
+
+    compare = {"less": less,
+               "greater": greater,
+               "two-sided": two_sided}
+
+    observed = np.asarray(observed)
+    gamma = np.asarray(gamma)
+    pvalues = compare[alternative](null_distribution, observed)
+
+    return PermutationTestResult(observed[()], pvalues[()], null_distribution)
@@ -34,7 +34,7 @@ from scipy.misc import derivative
 from scipy import stats
 
 from numpy import (arange, putmask, ravel, ones, shape, ndarray, zeros, floor,
-                   logical_and, log, sqrt, place, argmax, vectorize, asarray,
+                   logical_and, log, sqrt, place, vectorize, asarray,
                    nan, inf, isinf, NINF, empty)
 
 import numpy as np
@@ -2808,6 +2808,45 @@ def _drv2_ppfsingle(self, q, *args):  # Use basic bisection algorithm
             return c
 
 
+# Maximum number of elements of the tables of the CDF that the generic
+# `rv_discrete._cdf` and `rv_discrete._ppf` build for bounded supports
+_CDF_TABLE_MAX_SIZE = 2**20
+# Modules whose discrete distributions evaluate their methods on arrays
+_VECTORIZED_MODULES = ('scipy.stats._distn_infrastructure',
+                       'scipy.stats._discrete_distns')
+
+
+def _alias_table(p):
+    """Probability and alias tables of Walker's alias method.
+
+    Vose's algorithm [1]_ is used to build the tables in O(n) operations.
+    An index ``j`` drawn uniformly from ``range(n)`` is kept with
+    probability ``prob[j]`` and replaced by ``alias[j]`` otherwise.
+
+    References
+    ----------
+    .. [1] M. D. Vose, "A Linear Algorithm for Generating Random Numbers
+           with a Given Distribution", IEEE Transactions on Software
+           Engineering, Vol. 17, pp. 972-975, 1991.
+
+    """
+    n = len(p)
+    scaled = np.asarray(p, dtype=float) * (n / np.sum(p))
+    prob = np.ones(n)
+    alias = np.arange(n)
+    small = list(np.flatnonzero(scaled < 1))
+    large = list(np.flatnonzero(scaled >= 1))
+    while small and large:
+        j, k = small.pop(), large[-1]
+        prob[j] = scaled[j]
+        alias[j] = k
+        scaled[k] -= 1 - scaled[j]
+        if scaled[k] < 1:
+            small.append(large.pop())
+    # the remaining entries are 1 up to rounding
+    return prob, alias
+
+
 # Must over-ride one of _pmf or _cdf or pass in
 #  x_k, p(x_k) lists in initialization
 
@@ -2925,6 +2964,11 @@ class rv_discrete(rv_generic):
     on a finite set of values ``xk`` with ``Prob{X=xk} = pk`` by using the
     ``values`` keyword argument to the `rv_discrete` constructor.
 
+    .. versionchanged:: 1.8.0
+        The random variates of a distribution defined by ``values`` are
+        drawn with Walker's alias method, so the variates generated for a
+        given `random_state` differ from those of earlier versions.
+
     Examples
     --------
     Custom made discrete distribution:
@@ -2991,7 +3035,7 @@ class rv_discrete(rv_generic):
         dct = self.__dict__.copy()
         # these methods will be remade in __setstate__
         attrs = ["_parse_args", "_parse_args_stats", "_parse_args_rvs",
-                 "_cdfvec", "_ppfvec", "generic_moment"]
+                 "_cdfvec", "_ppfvec", "generic_moment", "_cdf_table_cache"]
         [dct.pop(attr, None) for attr in attrs]
         return dct
 
@@ -3078,11 +3122,95 @@ class rv_discrete(rv_generic):
         m = arange(int(_a), k+1)
         return np.sum(self._pmf(m, *args), axis=0)
 
+    def _cdf_table(self, x, *args):
+        """Table of the CDF over the support of each distinct set of shapes.
+
+        The distinct sets of shape parameters among `args`, broadcast with
+        the points `x`, are found, and the CDF of each of them is evaluated
+        at all points of its support at once. The table of the last call is
+        cached, so that repeated evaluations with the same parameters, as in
+        simulations, only look up the table.
+
+        Returns
+        -------
+        table : tuple or None
+            ``(inv, a, b, cdf)``, where ``inv`` maps each element of the
+            broadcast `x` to a row of ``cdf``, and the row ``i`` holds
+            the CDF at ``a[i], a[i] + 1, ...``, constant after ``b[i]``.
+            None if the support is unbounded, the table would be larger
+            than `_CDF_TABLE_MAX_SIZE`, or the methods of the distribution
+            are not known to accept arrays.
+
+        """
+        # The table evaluates `_pmf`, `_cdf` and `_get_support` at arrays of
+        # shape parameters, which only the methods defined by SciPy are known
+        # to support; those of a subclass may only handle scalars.
+        cls = type(self)
+        if not all(getattr(meth, '__module__', None) in _VECTORIZED_MODULES
+                   for meth in (cls._pmf, cls._cdf, cls._get_support)):
+            return None
+
+        args = np.broadcast_arrays(x, *args)[1:]
+        # check the support before searching for the distinct parameters
+        a, b = self._get_support(*args)
+        if not (np.isfinite(a).all() and np.isfinite(b).all()):
+            return None
+
+        params = np.stack([np.ravel(arg) for arg in args], axis=-1)
+        uniq, inv = np.unique(params, axis=0, return_inverse=True)
+        inv = inv.reshape(args[0].shape)
+
+        cache = getattr(self, '_cdf_table_cache', None)
+        if cache is not None and np.array_equal(cache[0], uniq):
+            return (inv,) + cache[1:]
+
+        shapes = [col[:, np.newaxis] for col in uniq.T]
+        a, b = self._get_support(*shapes)
+        a, b = np.broadcast_arrays(a, b, shapes[0])[:2]
+        width = int(np.max(b - a)) + 1
+        if width * len(uniq) > _CDF_TABLE_MAX_SIZE:
+            return None
+
+        k = np.minimum(a + np.arange(width), b)
+        if type(self)._cdf is rv_discrete._cdf:
+            pmf = self._pmf(k, *shapes)
+            cdf = np.cumsum(np.where(a + np.arange(width) <= b, pmf, 0),
+                            axis=-1)
+        else:
+            cdf = self._cdf(k, *shapes)
+        # rounding must not make the table decrease, for the search in _ppf
+        cdf = np.maximum.accumulate(cdf, axis=-1)
+
+        a, b = a[:, 0], b[:, 0]
+        self._cdf_table_cache = (uniq, a, b, cdf)
+        return inv, a, b, cdf
+
     def _cdf(self, x, *args):
         k = floor(x)
-        return self._cdfvec(k, *args)
+        table = self._cdf_table(k, *args) if args else None
+        if table is None:
+            return self._cdfvec(k, *args)
+        inv, a, b, cdf = table
+        j = np.clip(k - a[inv], 0, cdf.shape[1] - 1).astype(np.intp)
+        return cdf[inv, j]
 
-    # generic _logcdf, _sf, _logsf, _ppf, _isf, _rvs defined in rv_generic
+    def _ppf(self, q, *args):
+        table = self._cdf_table(q, *args) if args else None
+        if table is None:
+            return self._ppfvec(q, *args)
+        inv, a, b, cdf = table
+        q = np.broadcast_to(q, inv.shape)
+        # vectorized bisection for the first point with CDF not below `q`
+        lo = np.zeros(inv.shape, np.intp)
+        hi = (b - a)[inv].astype(np.intp)
+        for _ in range(int(cdf.shape[1]).bit_length()):
+            mid = (lo + hi) // 2
+            below = cdf[inv, mid] < q
+            lo = np.where(below, mid + 1, lo)
+            hi = np.where(below, hi, mid)
+        return (a[inv] + np.minimum(lo, hi)).astype(float)
+
+    # generic _logcdf, _sf, _logsf, _isf, _rvs defined in rv_generic
 
     def rvs(self, *args, **kwargs):
         """Random variates of given type.
@@ -3697,28 +3825,31 @@ class rv_sample(rv_discrete):
         return self.a, self.b
 
     def _pmf(self, x):
-        return np.select([x == k for k in self.xk],
-                         [np.broadcast_arrays(p, x)[0] for p in self.pk], 0)
+        indx = np.minimum(np.searchsorted(self.xk, x), len(self.xk) - 1)
+        return np.where(self.xk[indx] == x, self.pk[indx], 0.)
 
     def _cdf(self, x):
-        xx, xxk = np.broadcast_arrays(x[:, None], self.xk)
-        indx = np.argmax(xxk > xx, axis=-1) - 1
+        indx = np.searchsorted(self.xk, x, side='right') - 1
         return self.qvals[indx]
 
     def _ppf(self, q):
-        qq, sqq = np.broadcast_arrays(q[..., None], self.qvals)
-        indx = argmax(sqq >= qq, axis=-1)
-        return self.xk[indx]
+        indx = np.searchsorted(self.qvals, q)
+        return self.xk[np.minimum(indx, len(self.xk) - 1)]
 
     def _rvs(self, size=None, random_state=None):
-        # Need to define it explicitly, otherwise .rvs() with size=None
-        # fails due to explicit broadcasting in _ppf
-        U = random_state.uniform(size=size)
+        # Walker's alias method draws each variate in constant time; the
+        # integer and fractional parts of a single uniform variate select
+        # the entry of the table and decide between it and its alias
+        if getattr(self, '_alias', None) is None:
+            self._alias = _alias_table(self.pk)
+        prob, alias = self._alias
+        n = len(prob)
+        U = n * np.asarray(random_state.uniform(size=size))
+        indx = np.minimum(U.astype(np.intp), n - 1)
+        indx = np.where(U - indx < prob[indx], indx, alias[indx])
+        Y = self.xk[indx]
         if size is None:
-            U = np.array(U, ndmin=1)
-            Y = self._ppf(U)[0]
-        else:
-            Y = self._ppf(U)
+            Y = Y[()]
         return Y
 
     def _entropy(self):
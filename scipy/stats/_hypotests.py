@@ -1,4 +1,5 @@
 from collections import namedtuple
+import functools
 from dataclasses import make_dataclass
 import numpy as np
 import warnings
@@ -8,7 +9,6 @@ from scipy.optimize import shgo
 from . import distributions
 from ._continuous_distns import chi2, norm
 from scipy.special import gamma, kv, gammaln
-from . import _wilcoxon_data
 from ._hypotests_pythran import _Q, _P, _a_ij_Aij_Dij2
 
 __all__ = ['epps_singleton_2samp', 'cramervonmises', 'somersd',
@@ -380,20 +380,28 @@ def cramervonmises(rvs, cdf, args=()):
     return CramerVonMisesResult(statistic=w, pvalue=p)
 
 
-def _get_wilcoxon_distr(n):
+@functools.lru_cache(maxsize=64)
+def _get_wilcoxon_cdf(n):
     """
-    Distribution of counts of the Wilcoxon ranksum statistic r_plus (sum of
-    ranks of positive differences).
-    Returns an array with the counts/frequencies of all the possible ranks
-    r = 0, ..., n*(n+1)/2
+    Cumulative distribution function of the Wilcoxon ranksum statistic
+    r_plus under the null hypothesis, evaluated at r = 0, ..., n*(n+1)/2.
+
+    The probabilities are the coefficients of the generating function
+    prod_{i=1}^{n} (1 + q**i)/2, expanded one factor at a time in floating
+    point so that any `n` can be used. Every operation adds nonnegative
+    terms, so the small probabilities in the tails keep full relative
+    precision; use the symmetry
+    ``P(r_plus >= r) = cdf[n*(n+1)/2 - r]`` for the upper tail.
     """
-    cnt = _wilcoxon_data.COUNTS.get(n)
-
-    if cnt is None:
-        raise ValueError("The exact distribution of the Wilcoxon test "
-                         "statistic is not implemented for n={}".format(n))
-
-    return np.array(cnt, dtype=int)
+    pmf = np.zeros(n*(n+1)//2 + 1)
+    pmf[0] = 1
+    for i in range(1, n + 1):
+        r_max = i*(i+1)//2
+        pmf[i:r_max + 1] += pmf[:r_max + 1 - i].copy()
+        pmf[:r_max + 1] *= 0.5
+    cdf = np.cumsum(pmf)
+    cdf.setflags(write=False)
+    return cdf
 
 
 def _tau_b(A):
@@ -1,109 +1,118 @@
+import functools
+import warnings
 import numpy as np
 from dataclasses import make_dataclass
 from collections import namedtuple
 from scipy import special
 from scipy import stats
-
-
-def _broadcast_concatenate(x, y, axis):
-    '''Broadcast then concatenate arrays, leaving concatenation axis last'''
-    x = np.moveaxis(x, axis, -1)
-    y = np.moveaxis(y, axis, -1)
-    z = np.broadcast(x[..., 0], y[..., 0])
-    x = np.broadcast_to(x, z.shape + (x.shape[-1],))
-    y = np.broadcast_to(y, z.shape + (y.shape[-1],))
-    z = np.concatenate((x, y), axis=-1)
-    return x, y, z
+from ._ranked import RankedData
 
 
 class _MWU:
     '''Distribution of MWU statistic under the null hypothesis'''
-    # Possible improvement: if m and n are small enough, use integer arithmetic
 
-    def __init__(self):
-        '''Minimal initializer'''
-        self._fmnks = -np.ones((1, 1, 1))
+    def _distribution(self, m, n):
+        '''Lower halves of the PMF and CDF, computed once per pair of sizes'''
+        pmf, cdf, accurate = _mwu_distribution(min(m, n), max(m, n))
+        if not accurate:
+            warnings.warn("The exact distribution of the Mann-Whitney U "
+                          "statistic could not be computed accurately for "
+                          "samples of sizes {} and {}; consider "
+                          "`method='asymptotic'`.".format(m, n),
+                          RuntimeWarning, stacklevel=5)
+        return pmf, cdf
 
     def pmf(self, k, m, n):
         '''Probability mass function'''
-        self._resize_fmnks(m, n, np.max(k))
-        # could loop over just the unique elements, but probably not worth
-        # the time to find them
-        for i in np.ravel(k):
-            self._f(m, n, i)
-        return self._fmnks[m, n, k] / special.binom(m + n, m)
+        pmf, _ = self._distribution(m, n)
+        k = np.asarray(k)
+        # the distribution is symmetric about m*n/2
+        return pmf[np.minimum(k, m*n - k)]
 
     def cdf(self, k, m, n):
         '''Cumulative distribution function'''
-        # We could use the fact that the distribution is symmetric to avoid
-        # summing more than m*n/2 terms, but it might not be worth the
-        # overhead. Let's leave that to an improvement.
-        pmfs = self.pmf(np.arange(0, np.max(k) + 1), m, n)
-        cdfs = np.cumsum(pmfs)
-        return cdfs[k]
+        _, cdf = self._distribution(m, n)
+        k = np.asarray(k)
+        # by symmetry, CDF(k) = 1 - CDF(m*n - k - 1) in the upper half
+        upper = k >= len(cdf)
+        j = np.where(upper, m*n - k - 1, k)
+        res = np.where(j >= 0, cdf[np.maximum(j, 0)], 0)
+        return np.where(upper, 1 - res, res)[()]
 
     def sf(self, k, m, n):
         '''Survival function'''
         # Use the fact that the distribution is symmetric; i.e.
-        # _f(m, n, m*n-k) = _f(m, n, k), and sum from the left
-        k = m*n - k
+        # pmf(m*n-k) = pmf(k), and sum from the left
+        k = m*n - np.asarray(k)
         # Note that both CDF and SF include the PMF at k. The p-value is
         # calculated from the SF and should include the mass at k, so this
         # is desirable
         return self.cdf(k, m, n)
 
-    def _resize_fmnks(self, m, n, k):
-        '''If necessary, expand the array that remembers PMF values'''
-        # could probably use `np.pad` but I'm not sure it would save code
-        shape_old = np.array(self._fmnks.shape)
-        shape_new = np.array((m+1, n+1, k+1))
-        if np.any(shape_new > shape_old):
-            shape = np.maximum(shape_old, shape_new)
-            fmnks = -np.ones(shape)             # create the new array
-            m0, n0, k0 = shape_old
-            fmnks[:m0, :n0, :k0] = self._fmnks  # copy remembered values
-            self._fmnks = fmnks
-
-    def _f(self, m, n, k):
-        '''Recursive implementation of function of [3] Theorem 2.5'''
 
-        # [3] Theorem 2.5 Line 1
-        if k < 0 or m < 0 or n < 0 or k > m*n:
-            return 0
+@functools.lru_cache(maxsize=32)
+def _mwu_distribution(m, n):
+    '''Lower halves of the PMF and CDF of the MWU statistic for ``m <= n``
 
-        # if already calculated, return the value
-        if self._fmnks[m, n, k] >= 0:
-            return self._fmnks[m, n, k]
+    The number of arrangements with statistic ``k`` is the coefficient of
+    ``q**k`` in the Gaussian binomial coefficient (reference [3] of
+    `mannwhitneyu`)
 
-        if k == 0 and m >= 0 and n >= 0:  # [3] Theorem 2.5 Line 2
-            fmnk = 1
-        else:   # [3] Theorem 2.5 Line 3 / Equation 3
-            fmnk = self._f(m-1, n, k-n) + self._f(m, n-1, k)
+        prod_{i=1}^{m} (1 - q**(n+i)) / (1 - q**i),
 
-        self._fmnks[m, n, k] = fmnk  # remember result
+    which is expanded one factor at a time: multiplying by ``1 - q**(n+i)``
+    is a shifted subtraction and dividing by ``1 - q**i`` is a cumulative
+    sum with stride ``i``. This takes O(m**2 n) operations and O(m n) memory.
+    Only the coefficients up to ``m*n // 2`` are needed by symmetry.
 
-        return fmnk
-
-
-# Maintain state for faster repeat calls to mannwhitneyu w/ method='exact'
+    The subtractions cancel near the center of the distribution when both
+    samples are large; the returned flag is False if the probabilities fail
+    to sum to one as a result.
+    '''
+    h = m*n // 2
+    c = np.zeros(h + 1)
+    c[0] = 1
+    log_scale = 0
+    for i in range(1, m + 1):
+        a = n + i
+        if a <= h:
+            c[a:] -= c[:h + 1 - a].copy()
+        # cumulative sum with stride i along the columns of a padded reshape
+        size = -(-(h + 1) // i) * i
+        c = np.concatenate((c, np.zeros(size - h - 1)))
+        c = np.cumsum(c.reshape(-1, i), axis=0).ravel()[:h + 1]
+        # rescale to avoid overflow
+        scale = c.max()
+        c /= scale
+        log_scale += np.log(scale)
+
+    # normalize by the exact total, binom(m + n, m), so that the tails keep
+    # full relative precision
+    log_total = special.gammaln(m + n + 1) - special.gammaln(m + 1)
+    log_total -= special.gammaln(n + 1)
+    pmf = c * np.exp(log_scale - log_total)
+    cdf = np.cumsum(pmf)
+
+    total = 2*cdf[-1] - (pmf[-1] if (m*n) % 2 == 0 else 0)
+    accurate = abs(total - 1) < 1e-8 and pmf.min() >= 0
+
+    pmf.setflags(write=False)
+    cdf.setflags(write=False)
+    return pmf, cdf, accurate
+
+
+# Cache the distribution for faster repeat calls to mannwhitneyu w/ 'exact'
 _mwu_state = _MWU()
 
 
-def _tie_term(ranks):
-    """Tie correction term"""
-    # element i of t is the number of elements sharing rank i
-    _, t = np.unique(ranks, return_counts=True, axis=-1)
-    return (t**3 - t).sum(axis=-1)
-
-
-def _get_mwu_z(U, n1, n2, ranks, axis=0, continuity=True):
+def _get_mwu_z(U, n1, n2, ranked, continuity=True):
     '''Standardized MWU statistic'''
     # Follows mannwhitneyu [2]
     mu = n1 * n2 / 2
     n = n1 + n2
 
     # Tie correction according to [2]
-    tie_term = np.apply_along_axis(_tie_term, -1, ranks)
+    tie_term = ranked._tie_term()
     s = np.sqrt(n1*n2/12 * ((n + 1) - tie_term/(n*(n-1))))
 
     # equivalent to using scipy.stats.tiecorrect
@@ -127,12 +136,24 @@ def _get_mwu_z(U, n1, n2, ranks, axis=0, continuity=True):
 
 def _mwu_input_validation(x, y, use_continuity, alternative, axis, method):
     ''' Input validation and standardization for mannwhitneyu '''
-    # Would use np.asarray_chkfinite, but infs are OK
-    x, y = np.atleast_1d(x), np.atleast_1d(y)
-    if np.isnan(x).any() or np.isnan(y).any():
-        raise ValueError('`x` and `y` must not contain NaNs.')
-    if np.size(x) == 0 or np.size(y) == 0:
-        raise ValueError('`x` and `y` must be of nonzero size.')
+    if isinstance(x, RankedData):
+        if y is not None or len(x.sizes) != 2:
+            raise ValueError('If `x` is a `RankedData` instance, it must '
+                             'hold both samples and `y` must be None.')
+        if np.isnan(x._x).any():
+            raise ValueError('`x` and `y` must not contain NaNs.')
+        if min(x.sizes) == 0 or x._x.size == 0:
+            raise ValueError('`x` and `y` must be of nonzero size.')
+    else:
+        if y is None:
+            raise ValueError('`y` is required unless `x` is a `RankedData` '
+                             'instance.')
+        # Would use np.asarray_chkfinite, but infs are OK
+        x, y = np.atleast_1d(x), np.atleast_1d(y)
+        if np.isnan(x).any() or np.isnan(y).any():
+            raise ValueError('`x` and `y` must not contain NaNs.')
+        if np.size(x) == 0 or np.size(y) == 0:
+            raise ValueError('`x` and `y` must be of nonzero size.')
 
     bools = {True, False}
     if use_continuity not in bools:
@@ -155,13 +176,7 @@ def _mwu_input_validation(x, y, use_continuity, alternative, axis, method):
     return x, y, use_continuity, alternative, axis_int, method
 
 
-def _tie_check(xy):
-    """Find any ties in data"""
-    _, t = np.unique(xy, return_counts=True, axis=-1)
-    return np.any(t != 1)
-
-
-def _mwu_choose_method(n1, n2, xy, method):
+def _mwu_choose_method(n1, n2, ranked, method):
     """Choose method 'asymptotic' or 'exact' depending on input size, ties"""
 
     # if both inputs are large, asymptotic is OK
@@ -169,7 +184,7 @@ def _mwu_choose_method(n1, n2, xy, method):
         return "asymptotic"
 
     # if there are any ties, asymptotic is preferred
-    if np.apply_along_axis(_tie_check, -1, xy).any():
+    if np.any(ranked.has_ties):
         return "asymptotic"
 
     return "exact"
@@ -178,7 +193,7 @@ def _mwu_choose_method(n1, n2, xy, method):
 MannwhitneyuResult = namedtuple('MannwhitneyuResult', ('statistic', 'pvalue'))
 
 
-def mannwhitneyu(x, y, use_continuity=True, alternative="two-sided",
+def mannwhitneyu(x, y=None, use_continuity=True, alternative="two-sided",
                  axis=0, method="auto"):
     r'''Perform the Mann-Whitney U rank test on two independent samples.
 
@@ -191,7 +206,10 @@ def mannwhitneyu(x, y, use_continuity=True, alternative="two-sided",
     ----------
     x, y : array-like
         N-d arrays of samples. The arrays must be broadcastable except along
-        the dimension given by `axis`.
+        the dimension given by `axis`. Alternatively, `x` may be a
+        `RankedData` instance holding both samples (in the order `x`, `y`),
+        in which case `y` must be omitted and `axis` is taken from the
+        instance; the pooled data are then not sorted again.
     use_continuity : bool, optional
             Whether a continuity correction (1/2) should be applied.
             Default is True when `method` is ``'asymptotic'``; has no effect
@@ -248,8 +266,10 @@ def mannwhitneyu(x, y, use_continuity=True, alternative="two-sided",
     consider `scipy.stats.wilcoxon`.
 
     `method` ``'exact'`` is recommended when there are no ties and when either
-    sample size is less than 8 [1]_. The implementation follows the recurrence
-    relation originally proposed in [1]_ as it is described in [3]_.
+    sample size is less than 8 [1]_. The exact distribution is expanded from
+    its generating function [3]_ in O(m**2 n) operations, where ``m <= n``
+    are the sample sizes, and is cached for each pair of sizes so that
+    repeated tests with the same sizes are fast.
     Note that the exact method is *not* corrected for ties, but
     `mannwhitneyu` will not raise errors or warnings if there are ties in the
     data.
@@ -390,15 +410,17 @@ def mannwhitneyu(x, y, use_continuity=True, alternative="two-sided",
     x, y, use_continuity, alternative, axis_int, method = (
         _mwu_input_validation(x, y, use_continuity, alternative, axis, method))
 
-    x, y, xy = _broadcast_concatenate(x, y, axis)
+    # sort the pooled data once; ranks, ties and the tie correction all
+    # follow from the same ordering
+    ranked = x if isinstance(x, RankedData) else RankedData(x, y, axis=axis)
 
-    n1, n2 = x.shape[-1], y.shape[-1]
+    n1, n2 = ranked.sizes
 
     if method == "auto":
-        method = _mwu_choose_method(n1, n2, xy, method)
+        method = _mwu_choose_method(n1, n2, ranked, method)
 
     # Follows [2]
-    ranks = stats.rankdata(xy, axis=-1)  # method 2, step 1
+    ranks = ranked._rank()               # method 2, step 1
     R1 = ranks[..., :n1].sum(axis=-1)    # method 2, step 2
     U1 = R1 - n1*(n1+1)/2                # method 2, step 3
     U2 = n1 * n2 - U1                    # as U1 + U2 = n1 * n2
@@ -413,7 +435,7 @@ def mannwhitneyu(x, y, use_continuity=True, alternative="two-sided",
     if method == "exact":
         p = _mwu_state.sf(U.astype(int), n1, n2)
     elif method == "asymptotic":
-        z = _get_mwu_z(U, n1, n2, ranks, continuity=use_continuity)
+        z = _get_mwu_z(U, n1, n2, ranked, continuity=use_continuity)
         p = stats.norm.sf(z)
     p *= f
 
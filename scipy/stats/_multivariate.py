@@ -3,7 +3,6 @@
 #
 import math
 import numpy as np
-from numpy import asarray_chkfinite, asarray
 import scipy.linalg
 from scipy._lib import doccer
 from scipy.special import gammaln, psi, multigammaln, xlogy, entr, betaln
@@ -14,6 +13,7 @@ from scipy.linalg.lapack import get_lapack_funcs
 
 from ._discrete_distns import binom
 from . import mvn
+from ._qmvn import _qmvn
 
 __all__ = ['multivariate_normal',
            'matrix_normal',
@@ -67,8 +67,9 @@ def _eigvalsh_to_eps(spectrum, cond=None, rcond=None):
 
     Parameters
     ----------
-    spectrum : 1d ndarray
-        Array of eigenvalues of a Hermitian matrix.
+    spectrum : ndarray
+        Array of eigenvalues of a Hermitian matrix, or of a stack of
+        Hermitian matrices along the last axis.
     cond, rcond : float, optional
         Cutoff for small eigenvalues.
         Singular values smaller than rcond * largest_eigenvalue are
@@ -77,8 +78,8 @@ def _eigvalsh_to_eps(spectrum, cond=None, rcond=None):
 
     Returns
     -------
-    eps : float
-        Magnitude cutoff for numerical negligibility.
+    eps : float or ndarray
+        Magnitude cutoff for numerical negligibility of each matrix.
 
     """
     if rcond is not None:
@@ -87,7 +88,7 @@ def _eigvalsh_to_eps(spectrum, cond=None, rcond=None):
         t = spectrum.dtype.char.lower()
         factor = {'f': 1E3, 'd': 1E6}
         cond = factor[t] * np.finfo(t).eps
-    eps = cond * np.max(abs(spectrum))
+    eps = cond * np.max(abs(spectrum), axis=-1)
     return eps
 
 
@@ -110,6 +111,14 @@ def _pinv_1d(v, eps=1e-5):
     return np.array([0 if abs(x) <= eps else 1/x for x in v], dtype=float)
 
 
+def _dot_batch(x, U):
+    """Product of the vectors `x` with the matrix, or stack of matrices, `U`.
+    """
+    if U.ndim > 2:
+        return np.einsum('...j,...jk->...k', x, U)
+    return np.dot(x, U)
+
+
 class _PSD:
     """
     Compute coordinated functions of a symmetric positive semidefinite matrix.
@@ -127,7 +136,9 @@ class _PSD:
     Parameters
     ----------
     M : array_like
-        Symmetric positive semidefinite matrix (2-D).
+        Symmetric positive semidefinite matrix (2-D), or a stack of such
+        matrices in the last two dimensions. For a stack, the attributes
+        are arrays with one entry (or matrix) per matrix of the stack.
     cond, rcond : float, optional
         Cutoff for small eigenvalues.
         Singular values smaller than rcond * largest_eigenvalue are
@@ -152,6 +163,11 @@ class _PSD:
 
     def __init__(self, M, cond=None, rcond=None, lower=True,
                  check_finite=True, allow_singular=True):
+        if np.ndim(M) > 2:
+            self._init_batch(M, cond, rcond, lower, check_finite,
+                             allow_singular)
+            return
+
         # Compute the symmetric eigendecomposition.
         # Note that eigh takes care of array conversion, chkfinite,
         # and assertion that the matrix is square.
@@ -174,10 +190,33 @@ class _PSD:
         # Initialize an attribute to be lazily computed.
         self._pinv = None
 
+    def _init_batch(self, M, cond, rcond, lower, check_finite,
+                    allow_singular):
+        """Factor a stack of matrices with one vectorized call to eigh."""
+        M = np.asarray_chkfinite(M) if check_finite else np.asarray(M)
+        if M.shape[-1] != M.shape[-2]:
+            raise ValueError('expected square matrix in last two dimensions')
+        s, u = np.linalg.eigh(M, UPLO='L' if lower else 'U')
+
+        eps = _eigvalsh_to_eps(s, cond, rcond)[..., np.newaxis]
+        if np.any(s < -eps):
+            raise ValueError('the input matrix must be positive semidefinite')
+        positive = s > eps
+        rank = np.sum(positive, axis=-1)
+        if not allow_singular and np.any(rank < s.shape[-1]):
+            raise np.linalg.LinAlgError('singular matrix')
+        s_pinv = np.divide(1, s, out=np.zeros_like(s), where=positive)
+
+        self.rank = rank
+        self.U = u * np.sqrt(s_pinv)[..., np.newaxis, :]
+        self.log_pdet = np.sum(np.log(s, out=np.zeros_like(s), where=positive),
+                               axis=-1)
+        self._pinv = None
+
     @property
     def pinv(self):
         if self._pinv is None:
-            self._pinv = np.dot(self.U, self.U.T)
+            self._pinv = np.matmul(self.U, np.swapaxes(self.U, -1, -2))
         return self._pinv
 
 
@@ -276,9 +315,9 @@ class multivariate_normal_gen(multi_rv_generic):
         Probability density function.
     ``logpdf(x, mean=None, cov=1, allow_singular=False)``
         Log of the probability density function.
-    ``cdf(x, mean=None, cov=1, allow_singular=False, maxpts=1000000*dim, abseps=1e-5, releps=1e-5)``
+    ``cdf(x, mean=None, cov=1, allow_singular=False, maxpts=1000000*dim, abseps=1e-5, releps=1e-5, *, method='mvndst', workers=1, random_state=None)``
         Cumulative distribution function.
-    ``logcdf(x, mean=None, cov=1, allow_singular=False, maxpts=1000000*dim, abseps=1e-5, releps=1e-5)``
+    ``logcdf(x, mean=None, cov=1, allow_singular=False, maxpts=1000000*dim, abseps=1e-5, releps=1e-5, *, method='mvndst', workers=1, random_state=None)``
         Log of the cumulative distribution function.
     ``rvs(mean=None, cov=1, size=1, random_state=None)``
         Draw random samples from a multivariate normal distribution.
@@ -451,10 +490,11 @@ class multivariate_normal_gen(multi_rv_generic):
             Mean of the distribution
         prec_U : ndarray
             A decomposition such that np.dot(prec_U, prec_U.T)
-            is the precision matrix, i.e. inverse of the covariance matrix.
-        log_det_cov : float
+            is the precision matrix, i.e. inverse of the covariance matrix,
+            or a stack of such decompositions.
+        log_det_cov : float or ndarray
             Logarithm of the determinant of the covariance matrix
-        rank : int
+        rank : int or ndarray
             Rank of the covariance matrix.
 
         Notes
@@ -464,9 +504,27 @@ class multivariate_normal_gen(multi_rv_generic):
 
         """
         dev = x - mean
-        maha = np.sum(np.square(np.dot(dev, prec_U)), axis=-1)
+        maha = np.sum(np.square(_dot_batch(dev, prec_U)), axis=-1)
         return -0.5 * (rank * _LOG_2PI + log_det_cov + maha)
 
+    def _process_logpdf_parameters(self, x, mean, cov, allow_singular):
+        """Process the arguments of `logpdf` and `pdf` and decompose `cov`.
+
+        `mean` and `cov` may be stacks of vectors resp. matrices, in which
+        case all matrices are decomposed at once.
+        """
+        if np.ndim(cov) > 2 or np.ndim(mean) > 1:
+            dim, mean, cov = self._process_batch_parameters(mean, cov)
+            x = self._process_quantiles(x, dim)
+            if x.shape[-1] != dim:
+                raise ValueError("The last axis of `x` must have length %d, "
+                                 "the dimension of the distribution." % dim)
+        else:
+            dim, mean, cov = self._process_parameters(None, mean, cov)
+            x = self._process_quantiles(x, dim)
+        psd = _PSD(cov, allow_singular=allow_singular)
+        return x, mean, psd
+
     def logpdf(self, x, mean=None, cov=1, allow_singular=False):
         """Log of the multivariate normal probability density function.
 
@@ -485,10 +543,18 @@ class multivariate_normal_gen(multi_rv_generic):
         -----
         %(_mvn_doc_callparams_note)s
 
+        `mean` and `cov` may also be stacks of vectors and of matrices, with
+        shapes ``(..., dim)`` and ``(..., dim, dim)``, that are broadcast
+        against `x`. All covariance matrices are then decomposed in a single
+        vectorized call, which is much faster than a loop over frozen
+        distributions when each matrix is used only a few times.
+
+        .. versionadded:: 1.8.0
+            Stacks of parameters.
+
         """
-        dim, mean, cov = self._process_parameters(None, mean, cov)
-        x = self._process_quantiles(x, dim)
-        psd = _PSD(cov, allow_singular=allow_singular)
+        x, mean, psd = self._process_logpdf_parameters(x, mean, cov,
+                                                       allow_singular)
         out = self._logpdf(x, mean, psd.U, psd.log_pdet, psd.rank)
         return _squeeze_output(out)
 
@@ -510,10 +576,18 @@ class multivariate_normal_gen(multi_rv_generic):
         -----
         %(_mvn_doc_callparams_note)s
 
+        `mean` and `cov` may also be stacks of vectors and of matrices, with
+        shapes ``(..., dim)`` and ``(..., dim, dim)``, that are broadcast
+        against `x`. All covariance matrices are then decomposed in a single
+        vectorized call, which is much faster than a loop over frozen
+        distributions when each matrix is used only a few times.
+
+        .. versionadded:: 1.8.0
+            Stacks of parameters.
+
         """
-        dim, mean, cov = self._process_parameters(None, mean, cov)
-        x = self._process_quantiles(x, dim)
-        psd = _PSD(cov, allow_singular=allow_singular)
+        x, mean, psd = self._process_logpdf_parameters(x, mean, cov,
+                                                       allow_singular)
         out = np.exp(self._logpdf(x, mean, psd.U, psd.log_pdet, psd.rank))
         return _squeeze_output(out)
 
@@ -550,8 +624,74 @@ class multivariate_normal_gen(multi_rv_generic):
         out = np.apply_along_axis(func1d, -1, x)
         return _squeeze_output(out)
 
+    def _process_batch_parameters(self, mean, cov):
+        """
+        Like `_process_parameters`, but `mean` and `cov` may be stacks of
+        vectors resp. matrices along leading axes.
+        """
+        cov = np.asarray(1.0 if cov is None else cov, dtype=float)
+        if cov.ndim >= 2:
+            dim = cov.shape[-1]
+            if cov.shape[-2] != dim:
+                raise ValueError("Array 'cov' must be square in its last two "
+                                 "dimensions, but cov.shape = %s."
+                                 % str(cov.shape))
+        elif mean is not None and np.ndim(mean) > 0:
+            dim = np.shape(mean)[-1]
+        else:
+            dim = cov.size if cov.ndim == 1 else 1
+
+        mean = np.zeros(dim) if mean is None else np.asarray(mean, dtype=float)
+        mean = np.atleast_1d(mean)
+        if mean.shape[-1] != dim:
+            raise ValueError("Array 'mean' must be a vector of length %d." %
+                             dim)
+        if cov.ndim == 0:
+            cov = cov * np.eye(dim)
+        elif cov.ndim == 1:
+            if cov.size != dim:
+                raise ValueError("Dimension mismatch: array 'cov' is of "
+                                 "shape %s, but 'mean' is a vector of "
+                                 "length %d." % (str(cov.shape), dim))
+            cov = np.diag(cov)
+
+        return dim, mean, cov
+
+    def _cdf_qmc(self, x, mean, cov, maxpts, abseps, releps, workers,
+                 random_state):
+        """Multivariate normal CDF of a batch of distributions by QMC.
+
+        `x`, `mean` and `cov` are broadcast against each other, with `cov`
+        contributing all but its last two axes.
+
+        Notes
+        -----
+        As this function does no argument checking, it should not be
+        called directly; use 'cdf' instead.
+
+        """
+        dim = x.shape[-1]
+        batch = np.broadcast(x[..., 0], mean[..., 0], cov[..., 0, 0]).shape
+        n = int(np.prod(batch))
+        try:
+            np.linalg.cholesky(cov)
+        except np.linalg.LinAlgError as e:
+            raise np.linalg.LinAlgError(
+                "Method 'qmc' requires positive definite covariance "
+                "matrices; `allow_singular` is not supported.") from e
+        if cov.ndim == 2:
+            # avoid copying a single matrix for every point
+            cov = np.broadcast_to(cov, (n, dim, dim))
+        else:
+            cov = np.broadcast_to(cov, batch + (dim, dim)).reshape(n, dim, dim)
+        b = np.broadcast_to(x - mean, batch + (dim,)).reshape(n, dim)
+        out, _ = _qmvn(b, cov, maxpts, abseps, releps, workers=workers,
+                       random_state=random_state)
+        return _squeeze_output(out.reshape(batch))
+
     def logcdf(self, x, mean=None, cov=1, allow_singular=False, maxpts=None,
-               abseps=1e-5, releps=1e-5):
+               abseps=1e-5, releps=1e-5, *, method='mvndst', workers=1,
+               random_state=None):
         """Log of the multivariate normal cumulative distribution function.
 
         Parameters
@@ -566,6 +706,36 @@ class multivariate_normal_gen(multi_rv_generic):
             Absolute error tolerance (default 1e-5)
         releps : float, optional
             Relative error tolerance (default 1e-5)
+        method : {'mvndst', 'qmc'}, optional
+            Integration method. ``'mvndst'`` (default) integrates one
+            point at a time with the Fortran routine of Genz. ``'qmc'``
+            applies the same reduction of the integral [1]_ to all points at
+            once, in a vectorized loop over scrambled Sobol' points (see
+            `scipy.stats.qmc.Sobol`) that stops once the error estimate of
+            every point meets the tolerances. With ``'qmc'``, `mean` and
+            `cov` may also be stacks of vectors and of positive definite
+            matrices that are broadcast against `x`, so that many
+            distributions are evaluated in one call. ``'qmc'`` does not
+            support `allow_singular`; a singular covariance matrix raises
+            ``LinAlgError``.
+
+            .. versionadded:: 1.8.0
+        workers : int or map-like callable, optional
+            Only used by method ``'qmc'``. If `workers` is an int the points
+            are subdivided into chunks that are evaluated in parallel (uses
+            `multiprocessing.Pool <multiprocessing>`). Supply `-1` to use all
+            cores available to the Process. Alternatively supply a map-like
+            callable, such as `multiprocessing.Pool.map`. This evaluation is
+            carried out as ``workers(func, iterable)``. Default is 1.
+
+            .. versionadded:: 1.8.0
+        random_state : {None, int, `numpy.random.Generator`,
+                        `numpy.random.RandomState`}, optional
+            Only used by method ``'qmc'``, to scramble the Sobol' points.
+            If `random_state` is None the `random_state` of the distribution
+            is used.
+
+            .. versionadded:: 1.8.0
 
         Returns
         -------
@@ -578,18 +748,21 @@ class multivariate_normal_gen(multi_rv_generic):
 
         .. versionadded:: 1.0.0
 
+        References
+        ----------
+        .. [1] A. Genz, "Numerical computation of multivariate normal
+               probabilities", Journal of Computational and Graphical
+               Statistics, Vol. 1, pp. 141-149, 1992.
+
         """
-        dim, mean, cov = self._process_parameters(None, mean, cov)
-        x = self._process_quantiles(x, dim)
-        # Use _PSD to check covariance matrix
-        _PSD(cov, allow_singular=allow_singular)
-        if not maxpts:
-            maxpts = 1000000 * dim
-        out = np.log(self._cdf(x, mean, cov, maxpts, abseps, releps))
-        return out
+        out = self.cdf(x, mean, cov, allow_singular, maxpts, abseps, releps,
+                       method=method, workers=workers,
+                       random_state=random_state)
+        return np.log(out)
 
     def cdf(self, x, mean=None, cov=1, allow_singular=False, maxpts=None,
-            abseps=1e-5, releps=1e-5):
+            abseps=1e-5, releps=1e-5, *, method='mvndst', workers=1,
+            random_state=None):
         """Multivariate normal cumulative distribution function.
 
         Parameters
@@ -604,6 +777,36 @@ class multivariate_normal_gen(multi_rv_generic):
             Absolute error tolerance (default 1e-5)
         releps : float, optional
             Relative error tolerance (default 1e-5)
+        method : {'mvndst', 'qmc'}, optional
+            Integration method. ``'mvndst'`` (default) integrates one
+            point at a time with the Fortran routine of Genz. ``'qmc'``
+            applies the same reduction of the integral [1]_ to all points at
+            once, in a vectorized loop over scrambled Sobol' points (see
+            `scipy.stats.qmc.Sobol`) that stops once the error estimate of
+            every point meets the tolerances. With ``'qmc'``, `mean` and
+            `cov` may also be stacks of vectors and of positive definite
+            matrices that are broadcast against `x`, so that many
+            distributions are evaluated in one call. ``'qmc'`` does not
+            support `allow_singular`; a singular covariance matrix raises
+            ``LinAlgError``.
+
+            .. versionadded:: 1.8.0
+        workers : int or map-like callable, optional
+            Only used by method ``'qmc'``. If `workers` is an int the points
+            are subdivided into chunks that are evaluated in parallel (uses
+            `multiprocessing.Pool <multiprocessing>`). Supply `-1` to use all
+            cores available to the Process. Alternatively supply a map-like
+            callable, such as `multiprocessing.Pool.map`. This evaluation is
+            carried out as ``workers(func, iterable)``. Default is 1.
+
+            .. versionadded:: 1.8.0
+        random_state : {None, int, `numpy.random.Generator`,
+                        `numpy.random.RandomState`}, optional
+            Only used by method ``'qmc'``, to scramble the Sobol' points.
+            If `random_state` is None the `random_state` of the distribution
+            is used.
+
+            .. versionadded:: 1.8.0
 
         Returns
         -------
@@ -616,7 +819,27 @@ class multivariate_normal_gen(multi_rv_generic):
 
         .. versionadded:: 1.0.0
 
+        References
+        ----------
+        .. [1] A. Genz, "Numerical computation of multivariate normal
+               probabilities", Journal of Computational and Graphical
+               Statistics, Vol. 1, pp. 141-149, 1992.
+
         """
+        if method == 'qmc':
+            dim, mean, cov = self._process_batch_parameters(mean, cov)
+            x = self._process_quantiles(x, dim)
+            if x.shape[-1] != dim:
+                raise ValueError("The last axis of `x` must have length %d, "
+                                 "the dimension of the distribution." % dim)
+            if not maxpts:
+                maxpts = 1000000 * dim
+            random_state = self._get_random_state(random_state)
+            return self._cdf_qmc(x, mean, cov, maxpts, abseps, releps,
+                                 workers, random_state)
+        elif method != 'mvndst':
+            raise ValueError("`method` must be either 'mvndst' or 'qmc'.")
+
         dim, mean, cov = self._process_parameters(None, mean, cov)
         x = self._process_quantiles(x, dim)
         # Use _PSD to check covariance matrix
@@ -1116,11 +1339,22 @@ class matrix_normal_gen(multi_rv_generic):
         %(_matnorm_doc_callparams_note)s
 
         """
-        size = int(size)
         dims, mean, rowcov, colcov = self._process_parameters(mean, rowcov,
                                                               colcov)
         rowchol = scipy.linalg.cholesky(rowcov, lower=True)
         colchol = scipy.linalg.cholesky(colcov, lower=True)
+        return self._rvs(dims, mean, rowchol, colchol, size, random_state)
+
+    def _rvs(self, dims, mean, rowchol, colchol, size, random_state):
+        """Draw random samples given the Cholesky factors of the covariances.
+
+        Notes
+        -----
+        As this function does no argument checking, it should not be
+        called directly; use 'rvs' instead.
+
+        """
+        size = int(size)
         random_state = self._get_random_state(random_state)
         std_norm = random_state.standard_normal(size=(dims[1], size, dims[0]))
         roll_rvs = np.tensordot(colchol, np.dot(std_norm, rowchol.T), 1)
@@ -1171,6 +1405,8 @@ class matrix_normal_frozen(multi_rv_frozen):
             self._dist._process_parameters(mean, rowcov, colcov)
         self.rowpsd = _PSD(self.rowcov, allow_singular=False)
         self.colpsd = _PSD(self.colcov, allow_singular=False)
+        self.rowchol = scipy.linalg.cholesky(self.rowcov, lower=True)
+        self.colchol = scipy.linalg.cholesky(self.colcov, lower=True)
 
     def logpdf(self, X):
         X = self._dist._process_quantiles(X, self.dims)
@@ -1183,8 +1419,8 @@ class matrix_normal_frozen(multi_rv_frozen):
         return np.exp(self.logpdf(X))
 
     def rvs(self, size=1, random_state=None):
-        return self._dist.rvs(self.mean, self.rowcov, self.colcov, size,
-                              random_state)
+        return self._dist._rvs(self.dims, self.mean, self.rowchol,
+                               self.colchol, size, random_state)
 
 
 # Set frozen generator docstrings from corresponding docstrings in
@@ -1839,18 +2075,14 @@ class wishart_gen(multi_rv_generic):
 
         """
         # log determinant of x
-        # Note: x has components along the last axis, so that x.T has
-        # components alone the 0-th axis. Then since det(A) = det(A'), this
-        # gives us a 1-dim vector of determinants
-
-        # Retrieve tr(scale^{-1} x)
-        log_det_x = np.empty(x.shape[-1])
-        scale_inv_x = np.empty(x.shape)
-        tr_scale_inv_x = np.empty(x.shape[-1])
-        for i in range(x.shape[-1]):
-            _, log_det_x[i] = self._cholesky_logdet(x[:, :, i])
-            scale_inv_x[:, :, i] = scipy.linalg.cho_solve((C, True), x[:, :, i])
-            tr_scale_inv_x[i] = scale_inv_x[:, :, i].trace()
+        # Note: x has components along the last axis; the determinants of
+        # all of them are computed with one vectorized Cholesky factorization
+        log_det_x = _cholesky_logdet_batch(np.moveaxis(x, -1, 0))
+
+        # Retrieve tr(scale^{-1} x), using the factorization of the scale
+        # matrix once for all components
+        scale_inv = scipy.linalg.cho_solve((C, True), np.eye(dim))
+        tr_scale_inv_x = np.einsum('ij,jin->n', scale_inv, x)
 
         # Log PDF
         out = ((0.5 * (df - dim - 1) * log_det_x - 0.5 * tr_scale_inv_x) -
@@ -2294,67 +2526,15 @@ for name in ['logpdf', 'pdf', 'mean', 'mode', 'var', 'rvs', 'entropy']:
     method.__doc__ = doccer.docformat(method.__doc__, wishart_docdict_params)
 
 
-def _cho_inv_batch(a, check_finite=True):
-    """
-    Invert the matrices a_i, using a Cholesky factorization of A, where
-    a_i resides in the last two dimensions of a and the other indices describe
-    the index i.
-
-    Overwrites the data in a.
-
-    Parameters
-    ----------
-    a : array
-        Array of matrices to invert, where the matrices themselves are stored
-        in the last two dimensions.
-    check_finite : bool, optional
-        Whether to check that the input matrices contain only finite numbers.
-        Disabling may give a performance gain, but may result in problems
-        (crashes, non-termination) if the inputs do contain infinities or NaNs.
-
-    Returns
-    -------
-    x : array
-        Array of inverses of the matrices ``a_i``.
-
-    See Also
-    --------
-    scipy.linalg.cholesky : Cholesky factorization of a matrix
+def _cholesky_logdet_batch(a):
+    """Log of the determinants of the positive definite matrices ``a_i``.
 
+    The matrices reside in the last two dimensions of `a`. Raises
+    ``LinAlgError`` if any of them is not positive definite.
     """
-    if check_finite:
-        a1 = asarray_chkfinite(a)
-    else:
-        a1 = asarray(a)
-    if len(a1.shape) < 2 or a1.shape[-2] != a1.shape[-1]:
-        raise ValueError('expected square matrix in last two dimensions')
-
-    potrf, potri = get_lapack_funcs(('potrf', 'potri'), (a1,))
-
-    triu_rows, triu_cols = np.triu_indices(a.shape[-2], k=1)
-    for index in np.ndindex(a1.shape[:-2]):
-
-        # Cholesky decomposition
-        a1[index], info = potrf(a1[index], lower=True, overwrite_a=False,
-                                clean=False)
-        if info > 0:
-            raise LinAlgError("%d-th leading minor not positive definite"
-                              % info)
-        if info < 0:
-            raise ValueError('illegal value in %d-th argument of internal'
-                             ' potrf' % -info)
-        # Inversion
-        a1[index], info = potri(a1[index], lower=True, overwrite_c=False)
-        if info > 0:
-            raise LinAlgError("the inverse could not be computed")
-        if info < 0:
-            raise ValueError('illegal value in %d-th argument of internal'
-                             ' potrf' % -info)
-
-        # Make symmetric (dpotri only fills in the lower triangle)
-        a1[index][triu_rows, triu_cols] = a1[index][triu_cols, triu_rows]
-
-    return a1
+    c_decomp = np.linalg.cholesky(a)
+    diag = np.diagonal(c_decomp, axis1=-2, axis2=-1)
+    return 2 * np.sum(np.log(diag), axis=-1)
 
 
 class invwishart_gen(wishart_gen):
@@ -2491,20 +2671,12 @@ class invwishart_gen(wishart_gen):
         called directly; use 'logpdf' instead.
 
         """
-        log_det_x = np.empty(x.shape[-1])
-        x_inv = np.copy(x).T
-        if dim > 1:
-            _cho_inv_batch(x_inv)  # works in-place
-        else:
-            x_inv = 1./x_inv
-        tr_scale_x_inv = np.empty(x.shape[-1])
-
-        for i in range(x.shape[-1]):
-            C, lower = scipy.linalg.cho_factor(x[:, :, i], lower=True)
-
-            log_det_x[i] = 2 * np.sum(np.log(C.diagonal()))
-
-            tr_scale_x_inv[i] = np.dot(scale, x_inv[i]).trace()
+        # Note: x has components along the last axis; all of them are
+        # factored and solved in vectorized calls
+        x = np.moveaxis(x, -1, 0)
+        log_det_x = _cholesky_logdet_batch(x)
+        x_inv_scale = np.linalg.solve(x, np.broadcast_to(scale, x.shape))
+        tr_scale_x_inv = np.einsum('nii->n', x_inv_scale)
 
         # Log PDF
         out = ((0.5 * df * log_det_scale - 0.5 * tr_scale_x_inv) -
@@ -3941,6 +4113,16 @@ class multivariate_t_gen(multi_rv_generic):
         -------
         pdf : Probability density function evaluated at `x`.
 
+        Notes
+        -----
+        `loc` and `shape` may also be stacks of vectors and of matrices, with
+        shapes ``(..., dim)`` and ``(..., dim, dim)``, that are broadcast
+        against `x`. All shape matrices are then decomposed in a single
+        vectorized call.
+
+        .. versionadded:: 1.8.0
+            Stacks of parameters.
+
         Examples
         --------
         >>> from scipy.stats import multivariate_t
@@ -3952,9 +4134,8 @@ class multivariate_t_gen(multi_rv_generic):
         array([0.00075713])
 
         """
-        dim, loc, shape, df = self._process_parameters(loc, shape, df)
-        x = self._process_quantiles(x, dim)
-        shape_info = _PSD(shape, allow_singular=allow_singular)
+        dim, x, loc, shape_info, df = self._process_logpdf_parameters(
+            x, loc, shape, df, allow_singular)
         logpdf = self._logpdf(x, loc, shape_info.U, shape_info.log_pdet, df,
                               dim, shape_info.rank)
         return np.exp(logpdf)
@@ -3973,6 +4154,16 @@ class multivariate_t_gen(multi_rv_generic):
         -------
         logpdf : Log of the probability density function evaluated at `x`.
 
+        Notes
+        -----
+        `loc` and `shape` may also be stacks of vectors and of matrices, with
+        shapes ``(..., dim)`` and ``(..., dim, dim)``, that are broadcast
+        against `x`. All shape matrices are then decomposed in a single
+        vectorized call.
+
+        .. versionadded:: 1.8.0
+            Stacks of parameters.
+
         Examples
         --------
         >>> from scipy.stats import multivariate_t
@@ -3988,9 +4179,8 @@ class multivariate_t_gen(multi_rv_generic):
         pdf : Probability density function.
 
         """
-        dim, loc, shape, df = self._process_parameters(loc, shape, df)
-        x = self._process_quantiles(x, dim)
-        shape_info = _PSD(shape)
+        dim, x, loc, shape_info, df = self._process_logpdf_parameters(
+            x, loc, shape, df, allow_singular=True)
         return self._logpdf(x, loc, shape_info.U, shape_info.log_pdet, df, dim,
                             shape_info.rank)
 
@@ -4007,13 +4197,13 @@ class multivariate_t_gen(multi_rv_generic):
         prec_U : ndarray
             A decomposition such that `np.dot(prec_U, prec_U.T)` is the inverse
             of the shape matrix.
-        log_pdet : float
+        log_pdet : float or ndarray
             Logarithm of the determinant of the shape matrix.
         df : float
             Degrees of freedom of the distribution.
         dim : int
             Dimension of the quantiles x.
-        rank : int
+        rank : int or ndarray
             Rank of the shape matrix.
 
         Notes
@@ -4026,7 +4216,7 @@ class multivariate_t_gen(multi_rv_generic):
             return multivariate_normal._logpdf(x, loc, prec_U, log_pdet, rank)
 
         dev = x - loc
-        maha = np.square(np.dot(dev, prec_U)).sum(axis=-1)
+        maha = np.square(_dot_batch(dev, prec_U)).sum(axis=-1)
 
         t = 0.5 * (df + dim)
         A = gammaln(t)
@@ -4149,15 +4339,39 @@ class multivariate_t_gen(multi_rv_generic):
             raise ValueError("Array 'cov' must be at most two-dimensional,"
                              " but cov.ndim = %d" % shape.ndim)
 
-        # Process degrees of freedom.
+        df = self._process_df(df)
+
+        return dim, loc, shape, df
+
+    def _process_df(self, df):
+        """Check the degrees of freedom and handle the default."""
         if df is None:
             df = 1
         elif df <= 0:
             raise ValueError("'df' must be greater than zero.")
         elif np.isnan(df):
             raise ValueError("'df' is 'nan' but must be greater than zero or 'np.inf'.")
+        return df
 
-        return dim, loc, shape, df
+    def _process_logpdf_parameters(self, x, loc, shape, df, allow_singular):
+        """Process the arguments of `logpdf` and `pdf` and decompose `shape`.
+
+        `loc` and `shape` may be stacks of vectors resp. matrices, in which
+        case all matrices are decomposed at once.
+        """
+        if np.ndim(shape) > 2 or np.ndim(loc) > 1:
+            dim, loc, shape = multivariate_normal._process_batch_parameters(
+                loc, shape)
+            df = self._process_df(df)
+            x = self._process_quantiles(x, dim)
+            if x.shape[-1] != dim:
+                raise ValueError("The last axis of `x` must have length %d, "
+                                 "the dimension of the distribution." % dim)
+        else:
+            dim, loc, shape, df = self._process_parameters(loc, shape, df)
+            x = self._process_quantiles(x, dim)
+        shape_info = _PSD(shape, allow_singular=allow_singular)
+        return dim, x, loc, shape_info, df
 
 
 class multivariate_t_frozen(multi_rv_frozen):
@@ -7,7 +7,9 @@ import numbers
 from abc import ABC, abstractmethod
 import math
 from typing import (
+    Callable,
     ClassVar,
+    Dict,
     List,
     Optional,
     overload,
@@ -28,15 +30,16 @@ if TYPE_CHECKING:
 import scipy.stats as stats
 from scipy._lib._util import rng_integers
 from scipy.stats._sobol import (
-    initialize_v, _cscramble, _fill_p_cumulative, _draw, _fast_forward,
-    _categorize, initialize_direction_numbers, _MAXDIM, _MAXBIT
+    initialize_v, _cscramble, _fill_p_cumulative, _draw_threaded,
+    _jump, _categorize, initialize_direction_numbers, _MAXDIM, _MAXBIT
 )
 from scipy.stats._qmc_cy import (
     _cy_wrapper_centered_discrepancy,
     _cy_wrapper_wrap_around_discrepancy,
     _cy_wrapper_mixture_discrepancy,
     _cy_wrapper_l2_star_discrepancy,
-    _cy_wrapper_update_discrepancy
+    _cy_wrapper_update_discrepancy,
+    _cy_wrapper_perturb_discrepancy
 )
 
 
@@ -247,6 +250,14 @@ def discrepancy(
 
     See [2]_ for precise definitions of each method.
 
+    All methods require a sum over all pairs of points, which costs
+    :math:`O(n^2 d)` operations; it is evaluated in blocks over the pairs
+    ``i <= j`` and split among the `workers`. In low dimension, the sum
+    of the ``L2-star`` discrepancy is instead computed by divide and
+    conquer along each coordinate [4]_ in :math:`O(n \\log^d n)` operations
+    whenever that is estimated to be cheaper, which makes designs of
+    :math:`10^5` points and more tractable.
+
     Lastly, using ``iterative=True``, it is possible to compute the
     discrepancy as if we had :math:`n+1` samples. This is useful if we want
     to add a point to a sampling and check the candidate which would give the
@@ -263,6 +274,9 @@ def discrepancy(
     .. [3] T. T. Warnock. "Computational investigations of low discrepancy
        point sets". Applications of Number Theory to Numerical
        Analysis, Academic Press, pp. 319-343, 1972.
+    .. [4] S. Heinrich. "Efficient algorithms for computing the
+       L2-discrepancy". Mathematics of Computation, 65(216), pp. 1621-1633,
+       1996.
 
     Examples
     --------
@@ -292,6 +306,11 @@ def discrepancy(
     >>> qmc.update_discrepancy(space[-1], space[:-1], disc_init)
     0.008142039609053513
 
+    Several candidates can be evaluated at once.
+
+    >>> qmc.update_discrepancy(space[[-1, 0]], space[:-1], disc_init)
+    array([0.00814204, 0.03784883])
+
     """
     sample = np.asarray(sample, dtype=np.float64, order="C")
 
@@ -302,17 +321,11 @@ def discrepancy(
     if not (np.all(sample >= 0) and np.all(sample <= 1)):
         raise ValueError("Sample is not in unit hypercube")
 
-    workers = int(workers)
-    if workers == -1:
-        workers = os.cpu_count()  # type: ignore[assignment]
-        if workers is None:
-            raise NotImplementedError(
-                "Cannot determine the number of cpus using os.cpu_count(), "
-                "cannot use -1 for the number of workers"
-            )
-    elif workers <= 0:
-        raise ValueError(f"Invalid number of workers: {workers}, must be -1 "
-                         "or > 0")
+    workers = _validate_workers(workers)
+
+    if method == "L2-star" and _l2_star_fast_is_cheaper(*sample.shape,
+                                                        workers):
+        return _l2_star_discrepancy_fast(sample, iterative)
 
     methods = {
         "CD": _cy_wrapper_centered_discrepancy,
@@ -328,6 +341,119 @@ def discrepancy(
                          f" {set(methods)!r}")
 
 
+# Relative cost of one operation of the divide and conquer algorithm for
+# the L2-star discrepancy, compared to one term of the direct double sum.
+_L2_STAR_FAST_COST = 20
+
+# Maximum number of pairs of points summed directly in the divide and
+# conquer algorithm.
+_L2_STAR_LEAF_SIZE = 2**12
+
+
+def _l2_star_fast_is_cheaper(n: int, d: int, workers: int) -> bool:
+    """Whether the divide and conquer algorithm for the L2-star discrepancy
+    is expected to be faster than the direct, threaded, double sum."""
+    if n < 2 or d == 0:
+        return False
+    return _L2_STAR_FAST_COST * n * math.log2(n)**d < n**2 * d / workers
+
+
+def _l2_star_pair_sum(
+        a: np.ndarray, wa: np.ndarray, b: np.ndarray, wb: np.ndarray,
+        dims: tuple
+) -> float:
+    """Weighted sum over all pairs of points of the L2-star kernel.
+
+    Compute ``sum_ij wa[i] * wb[j] * prod_k (1 - max(a[i, k], b[j, k]))``
+    over the coordinates ``k`` in `dims`. The points are split at the median
+    of the first coordinate: pairs within each half are handled
+    recursively, while for pairs across the halves the maximum of that
+    coordinate is known, so that it moves into the weights and the
+    recursion continues with one coordinate less. One coordinate is summed
+    in a single sorted pass.
+    """
+    na, nb = a.shape[0], b.shape[0]
+    if na == 0 or nb == 0:
+        return 0.
+    if not dims:
+        return wa.sum() * wb.sum()
+
+    k = dims[0]
+    x = np.concatenate([a[:, k], b[:, k]])
+    order = np.argsort(x, kind='mergesort')
+
+    if len(dims) == 1:
+        # each pair is counted by its element that comes last in sorted
+        # order, with the weights of the other sample preceding it
+        w = np.concatenate([wa, np.zeros(nb)])[order]
+        v = np.concatenate([np.zeros(na), wb])[order]
+        cum_w = np.cumsum(w) - w
+        cum_v = np.cumsum(v) - v
+        return np.sum((1 - x[order]) * (w * cum_v + v * cum_w))
+
+    if na * nb <= _L2_STAR_LEAF_SIZE:
+        dims_ = list(dims)
+        prod = np.prod(1 - np.maximum(a[:, np.newaxis, dims_],
+                                      b[np.newaxis, :, dims_]), axis=-1)
+        return wa @ prod @ wb
+
+    # split by rank, which is well defined even with ties
+    hi = np.zeros(na + nb, dtype=bool)
+    hi[order[(na + nb) // 2:]] = True
+    hi_a, hi_b = hi[:na], hi[na:]
+    lo_a, lo_b = ~hi_a, ~hi_b
+    rest = dims[1:]
+    return (_l2_star_pair_sum(a[lo_a], wa[lo_a], b[lo_b], wb[lo_b], dims)
+            + _l2_star_pair_sum(a[hi_a], wa[hi_a], b[hi_b], wb[hi_b], dims)
+            + _l2_star_pair_sum(a[hi_a], wa[hi_a] * (1 - a[hi_a, k]),
+                                b[lo_b], wb[lo_b], rest)
+            + _l2_star_pair_sum(a[lo_a], wa[lo_a], b[hi_b],
+                                wb[hi_b] * (1 - b[hi_b, k]), rest))
+
+
+def _l2_star_discrepancy_fast(sample: np.ndarray, iterative: bool) -> float:
+    """L2-star discrepancy with the divide and conquer pair sum."""
+    n, d = sample.shape
+    disc1 = np.sum(np.prod(1 - sample ** 2, axis=1))
+    ones = np.ones(n)
+    disc2 = _l2_star_pair_sum(sample, ones, sample, ones, tuple(range(d)))
+
+    if iterative:
+        n += 1
+
+    return np.sqrt(3.0 ** -d - 2.0 ** (1 - d) / n * disc1 + disc2 / n ** 2)
+
+
+def _validate_workers(workers: IntNumber = 1) -> IntNumber:
+    """Validate `workers` based on platform and value.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Number of workers to use for parallel processing. If -1 is
+        given all CPU threads are used. Default 1.
+
+    Returns
+    -------
+    Workers : int
+        Number of CPU used by the algorithm
+
+    """
+    workers = int(workers)
+    if workers == -1:
+        workers = os.cpu_count()  # type: ignore[assignment]
+        if workers is None:
+            raise NotImplementedError(
+                "Cannot determine the number of cpus using os.cpu_count(), "
+                "cannot use -1 for the number of workers"
+            )
+    elif workers <= 0:
+        raise ValueError(f"Invalid number of workers: {workers}, must be -1 "
+                         "or > 0")
+
+    return workers
+
+
 def update_discrepancy(
         x_new: npt.ArrayLike,
         sample: npt.ArrayLike,
@@ -336,8 +462,8 @@ def update_discrepancy(
 
     Parameters
     ----------
-    x_new : array_like (1, d)
-        The new sample to add in `sample`.
+    x_new : array_like (d,) or (m, d)
+        The new sample to add in `sample`, or ``m`` candidates for it.
     sample : array_like (n, d)
         The initial sample.
     initial_disc : float
@@ -345,8 +471,10 @@ def update_discrepancy(
 
     Returns
     -------
-    discrepancy : float
+    discrepancy : float or ndarray (m,)
         Centered discrepancy of the sample composed of `x_new` and `sample`.
+        If `x_new` is 2D, the discrepancy obtained by adding each of its
+        rows, which allows to pick the best of many candidates in one call.
 
     Examples
     --------
@@ -364,6 +492,11 @@ def update_discrepancy(
     >>> qmc.update_discrepancy(space[-1], space[:-1], disc_init)
     0.008142039609053513
 
+    Several candidates can be evaluated at once.
+
+    >>> qmc.update_discrepancy(space[[-1, 0]], space[:-1], disc_init)
+    array([0.00814204, 0.03784883])
+
     """
     sample = np.asarray(sample, dtype=np.float64, order="C")
     x_new = np.asarray(x_new, dtype=np.float64, order="C")
@@ -375,16 +508,20 @@ def update_discrepancy(
     if not (np.all(sample >= 0) and np.all(sample <= 1)):
         raise ValueError('Sample is not in unit hypercube')
 
-    # Checking that x_new is within the hypercube and 1D
-    if not x_new.ndim == 1:
-        raise ValueError('x_new is not a 1D array')
+    # Checking that x_new is within the hypercube and 1D or 2D
+    if x_new.ndim not in (1, 2):
+        raise ValueError('x_new is not a 1D or 2D array')
 
     if not (np.all(x_new >= 0) and np.all(x_new <= 1)):
         raise ValueError('x_new is not in unit hypercube')
 
-    if x_new.shape[0] != sample.shape[1]:
+    if x_new.shape[-1] != sample.shape[1]:
         raise ValueError("x_new and sample must be broadcastable")
 
+    if x_new.ndim == 2:
+        return np.array([_cy_wrapper_update_discrepancy(x, sample,
+                                                        initial_disc)
+                         for x in x_new])
     return _cy_wrapper_update_discrepancy(x_new, sample, initial_disc)
 
 
@@ -811,6 +948,17 @@ class LatinHypercube(QMCEngine):
         Dimension of the parameter space.
     centered : bool, optional
         Center the point within the multi-dimensional grid. Default is False.
+    optimization : {None, "random-cd"}, optional
+        Whether to use an optimization scheme to improve the quality of the
+        design after sampling. Default is None.
+
+        * ``random-cd``: random permutations of coordinates to lower the
+          centered discrepancy [5]_. The best sample based on the centered
+          discrepancy is constantly updated. Centered discrepancy-based
+          sampling shows better space-filling robustness toward 2D and 3D
+          subprojections compared to using other discrepancy measures [6]_.
+
+        .. versionadded:: 1.8.0
     seed : {None, int, `numpy.random.Generator`}, optional
         If `seed` is None the `numpy.random.Generator` singleton is used.
         If `seed` is an int, a new ``Generator`` instance is used,
@@ -818,6 +966,17 @@ class LatinHypercube(QMCEngine):
         If `seed` is already a ``Generator`` instance then that instance is
         used.
 
+    Notes
+    -----
+    With ``optimization="random-cd"``, a column and two rows of the sample
+    are drawn at random and the two coordinates are swapped, which preserves
+    the Latin hypercube structure. The swap is kept if it lowers the
+    centered discrepancy. The change of the discrepancy is computed from the
+    terms involving the two rows only, in :math:`O(nd)` operations [5]_. The
+    search stops after 100 consecutive unsuccessful swaps or 10000 swaps in
+    total; these limits can be changed with the attributes ``n_nochange``
+    and ``maxiter``.
+
     References
     ----------
     .. [1] Mckay et al., "A Comparison of Three Methods for Selecting Values
@@ -829,6 +988,12 @@ class LatinHypercube(QMCEngine):
        SIAM Journal on Numerical Analysis 34, no. 5: 1884-1910, 1997
     .. [4]  Loh, W.-L. "On Latin hypercube sampling." The annals of statistics
        24, no. 5: 2058-2080, 1996.
+    .. [5] R. Jin, W. Chen and A. Sudjianto, "An efficient algorithm for
+       constructing optimal design of computer experiments." Journal of
+       Statistical Planning and Inference, 134(1): 268-287, 2005.
+    .. [6] Damblin et al., "Numerical studies of space filling designs:
+       optimization of Latin Hypercube Samples and subprojection properties."
+       Journal of Simulation, 2013.
 
     Examples
     --------
@@ -849,6 +1014,14 @@ class LatinHypercube(QMCEngine):
     >>> qmc.discrepancy(sample)
     0.019558034794794565  # random
 
+    Samples with a lower discrepancy can be obtained by optimizing the
+    design.
+
+    >>> sampler = qmc.LatinHypercube(d=2, optimization="random-cd")
+    >>> sample = sampler.random(n=5)
+    >>> qmc.discrepancy(sample)
+    0.0176...  # random
+
     Finally, samples can be scaled to bounds.
 
     >>> l_bounds = [0, 2]
@@ -864,11 +1037,32 @@ class LatinHypercube(QMCEngine):
 
     def __init__(
         self, d: IntNumber, *, centered: bool = False,
+        optimization: Optional[Literal["random-cd"]] = None,
         seed: SeedType = None
     ) -> None:
         super().__init__(d=d, seed=seed)
         self.centered = centered
 
+        optimization_method: Dict[Literal["random-cd"], Callable] = {
+            "random-cd": self._random_cd,
+        }
+
+        self.optimization_method: Optional[Callable]
+        if optimization is not None:
+            try:
+                optimization = optimization.lower()  # type: ignore[assignment]
+                self.optimization_method = optimization_method[optimization]
+            except KeyError as exc:
+                message = (f"{optimization!r} is not a valid optimization"
+                           f" method. It must be one of"
+                           f" {set(optimization_method)!r}")
+                raise ValueError(message) from exc
+        else:
+            self.optimization_method = None
+
+        self.n_nochange = 100
+        self.maxiter = 10_000
+
     def random(self, n: IntNumber = 1) -> np.ndarray:
         """Draw `n` in the half-open interval ``[0, 1)``.
 
@@ -883,6 +1077,15 @@ class LatinHypercube(QMCEngine):
             LHS sample.
 
         """
+        lhs = self._random(n)
+        if self.optimization_method is not None:
+            lhs = self.optimization_method(lhs)
+
+        self.num_generated += n
+        return lhs
+
+    def _random(self, n: IntNumber = 1) -> np.ndarray:
+        """Base LHS algorithm."""
         if self.centered:
             samples: np.ndarray | float = 0.5
         else:
@@ -894,9 +1097,61 @@ class LatinHypercube(QMCEngine):
         perms = perms.T
 
         samples = (perms - samples) / n
-        self.num_generated += n
         return samples  # type: ignore[return-value]
 
+    def _random_cd(self, best_sample: np.ndarray) -> np.ndarray:
+        """Optimal LHS on CD.
+
+        Create a base LHS and do random permutations of coordinates to
+        lower the centered discrepancy.
+        Because it starts with a normal LHS, it also works with the
+        `centered` keyword argument.
+
+        Two stopping criterion are used to stop the algorithm: at most,
+        `maxiter` iterations are performed; or if there is no improvement
+        for `n_nochange` consecutive iterations.
+        """
+        n = len(best_sample)
+
+        if self.d == 0 or n == 0:
+            return np.empty((n, self.d))
+
+        # the perturbation is computed on a C-contiguous array
+        best_sample = np.ascontiguousarray(best_sample)
+        best_disc = discrepancy(best_sample)
+
+        if n == 1:
+            return best_sample
+
+        bounds = ([0, self.d - 1],
+                  [0, n - 1],
+                  [0, n - 1])
+
+        n_nochange = 0
+        n_iters = 0
+        while n_nochange < self.n_nochange and n_iters < self.maxiter:
+            n_iters += 1
+
+            col = rng_integers(  # type: ignore[misc]
+                self.rng, *bounds[0], endpoint=True)
+            row_1 = rng_integers(  # type: ignore[misc]
+                self.rng, *bounds[1], endpoint=True)
+            row_2 = rng_integers(  # type: ignore[misc]
+                self.rng, *bounds[2], endpoint=True)
+            disc = _cy_wrapper_perturb_discrepancy(best_sample,
+                                                   row_1, row_2, col,
+                                                   best_disc)
+            if disc < best_disc:
+                best_sample[row_1, col], best_sample[row_2, col] = (
+                    best_sample[row_2, col], best_sample[row_1, col])
+
+                best_disc = disc
+                n_nochange = 0
+            else:
+                n_nochange += 1
+
+        return best_sample
+
 
 class Sobol(QMCEngine):
     """Engine for generating (scrambled) Sobol' sequences.
@@ -1056,21 +1311,46 @@ class Sobol(QMCEngine):
         _cscramble(self.d, ltm, self._sv)
         self.num_generated = 0
 
-    def random(self, n: IntNumber = 1) -> np.ndarray:
+    def random(
+            self, n: IntNumber = 1, *, workers: IntNumber = 1,
+            out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """Draw next point(s) in the Sobol' sequence.
 
         Parameters
         ----------
         n : int, optional
             Number of samples to generate in the parameter space. Default is 1.
+        workers : int, optional
+            Number of threads to use for the generation. The points are split
+            into contiguous ranges and each thread jumps directly to the
+            start of its range, so the sample is identical to the one
+            obtained with a single thread. If -1 is given all CPU threads are
+            used. Default is 1.
+
+            .. versionadded:: 1.8.0
+        out : ndarray (n, d), optional
+            Array of dtype float64 in which to write the sample, to avoid
+            allocating a new array for every call when drawing a long
+            sequence in blocks.
+
+            .. versionadded:: 1.8.0
 
         Returns
         -------
         sample : array_like (n, d)
-            Sobol' sample.
+            Sobol' sample. This is `out` if it was given.
 
         """
-        sample = np.empty((n, self.d), dtype=float)
+        workers = _validate_workers(workers)
+        if out is None:
+            sample = np.empty((n, self.d), dtype=float)
+        else:
+            if (not isinstance(out, np.ndarray) or out.dtype != np.float64
+                    or out.shape != (n, self.d)):
+                raise ValueError("`out` must be an array of dtype float64 "
+                                 f"and shape {(n, self.d)}.")
+            sample = out
 
         if self.num_generated == 0:
             # verify n is 2**n
@@ -1078,20 +1358,21 @@ class Sobol(QMCEngine):
                 warnings.warn("The balance properties of Sobol' points require"
                               " n to be a power of 2.")
 
-            if n == 1:
-                sample = self._first_point
-            else:
-                _draw(n - 1, self.num_generated, self.d, self._sv,
-                      self._quasi, sample)
-                sample = np.concatenate([self._first_point, sample])[:n]  # type: ignore[misc]
+            if n > 0:
+                sample[0] = self._first_point
+                _draw_threaded(n - 1, self.num_generated, self.d, self._sv,
+                               self._shift, self._quasi, sample[1:], workers)
         else:
-            _draw(n, self.num_generated - 1, self.d, self._sv,
-                  self._quasi, sample)
+            _draw_threaded(n, self.num_generated - 1, self.d, self._sv,
+                           self._shift, self._quasi, sample, workers)
 
         self.num_generated += n
         return sample
 
-    def random_base2(self, m: IntNumber) -> np.ndarray:
+    def random_base2(
+            self, m: IntNumber, *, workers: IntNumber = 1,
+            out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """Draw point(s) from the Sobol' sequence.
 
         This function draws :math:`n=2^m` points in the parameter space
@@ -1101,11 +1382,21 @@ class Sobol(QMCEngine):
         ----------
         m : int
             Logarithm in base 2 of the number of samples; i.e., n = 2^m.
+        workers : int, optional
+            Number of threads to use for the generation; see `random`.
+            Default is 1.
+
+            .. versionadded:: 1.8.0
+        out : ndarray (n, d), optional
+            Array of dtype float64 in which to write the sample; see
+            `random`.
+
+            .. versionadded:: 1.8.0
 
         Returns
         -------
         sample : array_like (n, d)
-            Sobol' sample.
+            Sobol' sample. This is `out` if it was given.
 
         """
         n = 2 ** m
@@ -1119,7 +1410,7 @@ class Sobol(QMCEngine):
                              "'Sobol.random()' can be used."
                              .format(self.num_generated, m, total_n))
 
-        return self.random(n)
+        return self.random(n, workers=workers, out=out)
 
     def reset(self) -> Sobol:
         """Reset the engine to base state.
@@ -1137,6 +1428,11 @@ class Sobol(QMCEngine):
     def fast_forward(self, n: IntNumber) -> Sobol:
         """Fast-forward the sequence by `n` positions.
 
+        The state of the engine is set directly from the Gray code of the
+        new position, so the cost does not depend on `n`. Together with
+        `random`, this allows disjoint blocks of a long sequence to be
+        generated independently, e.g. by separate processes.
+
         Parameters
         ----------
         n : int
@@ -1148,13 +1444,10 @@ class Sobol(QMCEngine):
             The fast-forwarded engine.
 
         """
-        if self.num_generated == 0:
-            _fast_forward(n - 1, self.num_generated, self.d,
-                          self._sv, self._quasi)
-        else:
-            _fast_forward(n, self.num_generated - 1, self.d,
-                          self._sv, self._quasi)
         self.num_generated += n
+        if self.num_generated > 0:
+            _jump(self.num_generated - 1, self.d, self._sv, self._shift,
+                  self._quasi)
         return self
 
 
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy._lib._util import DecimalNumber
+from scipy._lib._util import DecimalNumber, IntNumber
 
 
 def _cy_wrapper_centered_discrepancy(
@@ -35,3 +35,12 @@ def _cy_wrapper_update_discrepancy(
         sample_view: np.ndarray,
         initial_disc: DecimalNumber,
 ) -> float: ...
+
+
+def _cy_wrapper_perturb_discrepancy(
+        sample_view: np.ndarray,
+        i1: IntNumber,
+        i2: IntNumber,
+        k: IntNumber,
+        disc: float,
+) -> float: ...
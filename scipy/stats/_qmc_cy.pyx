@@ -32,6 +32,11 @@ from libcpp.vector cimport vector
 
 cdef mutex threaded_sum_mutex
 
+# Number of points per block in the loops over pairs of points. The loops
+# visit only the pairs ``j >= i`` and keep a block of points ``j`` in cache
+# while iterating over all points ``i`` of a thread.
+DEF BLOCK_SIZE = 256
+
 def _cy_wrapper_centered_discrepancy(double[:, ::1] sample, bint iterative,
                                      workers):
     return centered_discrepancy(sample, iterative, workers)
@@ -83,19 +88,21 @@ cdef double centered_discrepancy_loop(double[:, ::1] sample_view,
                                       Py_ssize_t istart, Py_ssize_t istop) nogil:
 
     cdef:
-        Py_ssize_t i, j, k
+        Py_ssize_t i, j, k, jblock
+        Py_ssize_t n = sample_view.shape[0]
         double prod, disc2 = 0
 
-    for i in range(istart, istop):
-        for j in range(sample_view.shape[0]):
-            prod = 1
-            for k in range(sample_view.shape[1]):
-                prod *= (
-                    1 + 0.5 * fabs(sample_view[i, k] - 0.5)
-                    + 0.5 * fabs(sample_view[j, k] - 0.5)
-                    - 0.5 * fabs(sample_view[i, k] - sample_view[j, k])
-                )
-            disc2 += prod
+    for jblock in range(istart, n, BLOCK_SIZE):
+        for i in range(istart, min(istop, jblock + BLOCK_SIZE)):
+            for j in range(max(i, jblock), min(n, jblock + BLOCK_SIZE)):
+                prod = 2 if j > i else 1
+                for k in range(sample_view.shape[1]):
+                    prod *= (
+                        1 + 0.5 * fabs(sample_view[i, k] - 0.5)
+                        + 0.5 * fabs(sample_view[j, k] - 0.5)
+                        - 0.5 * fabs(sample_view[i, k] - sample_view[j, k])
+                    )
+                disc2 += prod
 
     return disc2
 
@@ -121,16 +128,18 @@ cdef double wrap_around_loop(double[:, ::1] sample_view,
                              Py_ssize_t istart, Py_ssize_t istop) nogil:
 
     cdef:
-        Py_ssize_t i, j, k
-        double prod, disc = 0
+        Py_ssize_t i, j, k, jblock
+        Py_ssize_t n = sample_view.shape[0]
+        double prod, x_kikj, disc = 0
 
-    for i in range(istart, istop):
-        for j in range(sample_view.shape[0]):
-            prod = 1
-            for k in range(sample_view.shape[1]):
-                x_kikj = fabs(sample_view[i, k] - sample_view[j, k])
-                prod *= 3.0 / 2.0 - x_kikj + x_kikj ** 2
-            disc += prod
+    for jblock in range(istart, n, BLOCK_SIZE):
+        for i in range(istart, min(istop, jblock + BLOCK_SIZE)):
+            for j in range(max(i, jblock), min(n, jblock + BLOCK_SIZE)):
+                prod = 2 if j > i else 1
+                for k in range(sample_view.shape[1]):
+                    x_kikj = fabs(sample_view[i, k] - sample_view[j, k])
+                    prod *= 3.0 / 2.0 - x_kikj + x_kikj ** 2
+                disc += prod
 
     return disc
 
@@ -168,21 +177,23 @@ cdef double mixture_loop(double[:, ::1] sample_view, Py_ssize_t istart,
                          Py_ssize_t istop) nogil:
 
     cdef:
-        Py_ssize_t i, j, k
+        Py_ssize_t i, j, k, jblock
+        Py_ssize_t n = sample_view.shape[0]
         double prod, disc2 = 0
 
-    for i in range(istart, istop):
-        for j in range(sample_view.shape[0]):
-            prod = 1
-            for k in range(sample_view.shape[1]):
-                prod *= (15.0 / 8.0
-                         - 0.25 * fabs(sample_view[i, k] - 0.5)
-                         - 0.25 * fabs(sample_view[j, k] - 0.5)
-                         - 3.0 / 4.0 * fabs(sample_view[i, k]
-                                            - sample_view[j, k])
-                         + 0.5
-                         * fabs(sample_view[i, k] - sample_view[j, k]) ** 2)
-            disc2 += prod
+    for jblock in range(istart, n, BLOCK_SIZE):
+        for i in range(istart, min(istop, jblock + BLOCK_SIZE)):
+            for j in range(max(i, jblock), min(n, jblock + BLOCK_SIZE)):
+                prod = 2 if j > i else 1
+                for k in range(sample_view.shape[1]):
+                    prod *= (15.0 / 8.0
+                             - 0.25 * fabs(sample_view[i, k] - 0.5)
+                             - 0.25 * fabs(sample_view[j, k] - 0.5)
+                             - 3.0 / 4.0 * fabs(sample_view[i, k]
+                                                - sample_view[j, k])
+                             + 0.5
+                             * fabs(sample_view[i, k] - sample_view[j, k]) ** 2)
+                disc2 += prod
 
     return disc2
 
@@ -217,20 +228,19 @@ cdef double l2_star_loop(double[:, ::1] sample_view, Py_ssize_t istart,
                          Py_ssize_t istop) nogil:
 
     cdef:
-        Py_ssize_t i, j, k
-        double prod = 1, disc2 = 0, tmp_sum = 0
-
-    for i in range(istart, istop):
-        for j in range(sample_view.shape[0]):
-            prod = 1
-            for k in range(sample_view.shape[1]):
-                prod *= (
-                    1 - max(sample_view[i, k], sample_view[j, k])
-                )
-            tmp_sum += prod
+        Py_ssize_t i, j, k, jblock
+        Py_ssize_t n = sample_view.shape[0]
+        double prod, disc2 = 0
 
-        disc2 += tmp_sum
-        tmp_sum = 0
+    for jblock in range(istart, n, BLOCK_SIZE):
+        for i in range(istart, min(istop, jblock + BLOCK_SIZE)):
+            for j in range(max(i, jblock), min(n, jblock + BLOCK_SIZE)):
+                prod = 2 if j > i else 1
+                for k in range(sample_view.shape[1]):
+                    prod *= (
+                        1 - max(sample_view[i, k], sample_view[j, k])
+                    )
+                disc2 += prod
 
     return disc2
 
@@ -284,6 +294,72 @@ cdef double c_update_discrepancy(double[::1] x_new_view,
     return initial_disc + disc1 + disc2 + disc3
 
 
+def _cy_wrapper_perturb_discrepancy(double[:, ::1] sample_view,
+                                    Py_ssize_t i1, Py_ssize_t i2,
+                                    Py_ssize_t k, double disc):
+    return c_perturb_discrepancy(sample_view, i1, i2, k, disc)
+
+
+cdef inline double centered_pair(double zi, double zj) nogil:
+    return 1 + 0.5 * fabs(zi) + 0.5 * fabs(zj) - 0.5 * fabs(zi - zj)
+
+
+cdef double c_perturb_discrepancy(double[:, ::1] sample_view,
+                                  Py_ssize_t i1, Py_ssize_t i2, Py_ssize_t k,
+                                  double disc) nogil:
+    """Centered discrepancy after swapping coordinate `k` of points `i1`
+    and `i2`, given the discrepancy `disc` before the swap.
+
+    Only the terms involving `i1` or `i2` change, so the update costs
+    ``O(n d)`` operations instead of ``O(n^2 d)`` [1]_. The term between
+    `i1` and `i2` itself is symmetric in the swapped coordinates.
+
+    [1] R. Jin, W. Chen and A. Sudjianto, "An efficient algorithm for
+        constructing optimal design of computer experiments", Journal of
+        Statistical Planning and Inference, 134(1), pp. 268-287, 2005.
+    """
+    cdef:
+        Py_ssize_t n = sample_view.shape[0]
+        Py_ssize_t d = sample_view.shape[1]
+        Py_ssize_t j, m
+        double z1k = sample_view[i1, k] - 0.5
+        double z2k = sample_view[i2, k] - 0.5
+        double p1, p2, zj, cross = 0
+        double g1 = 1, g2 = 1, h1 = 1, h2 = 1, z1, z2
+
+    # terms between i1 or i2 and the other points
+    for j in range(n):
+        if j == i1 or j == i2:
+            continue
+        p1 = 1
+        p2 = 1
+        for m in range(d):
+            if m == k:
+                continue
+            zj = sample_view[j, m] - 0.5
+            p1 *= centered_pair(sample_view[i1, m] - 0.5, zj)
+            p2 *= centered_pair(sample_view[i2, m] - 0.5, zj)
+        zj = sample_view[j, k] - 0.5
+        cross += (p1 - p2) * (centered_pair(z2k, zj) - centered_pair(z1k, zj))
+
+    # terms of i1 and i2 with themselves, and with the uniform distribution
+    for m in range(d):
+        if m == k:
+            continue
+        z1 = sample_view[i1, m] - 0.5
+        z2 = sample_view[i2, m] - 0.5
+        g1 *= 1 + fabs(z1)
+        g2 *= 1 + fabs(z2)
+        h1 *= 1 + 0.5 * fabs(z1) - 0.5 * z1 ** 2
+        h2 *= 1 + 0.5 * fabs(z2) - 0.5 * z2 ** 2
+
+    return (disc
+            + 2.0 / (n ** 2) * cross
+            + 1.0 / (n ** 2) * (g1 - g2) * (fabs(z2k) - fabs(z1k))
+            - 2.0 / n * (h1 - h2) * 0.5 * (fabs(z2k) - fabs(z1k)
+                                           - z2k ** 2 + z1k ** 2))
+
+
 ctypedef double (*func_type)(double[:, ::1], Py_ssize_t,
                              Py_ssize_t) nogil
 
@@ -303,10 +379,14 @@ cdef double threaded_loops(func_type loop_func,
         unsigned int tid
         Py_ssize_t istart, istop
 
+    # the loops only visit the pairs ``j >= i``: the work of point ``i`` is
+    # proportional to ``n - i``, so give each thread an equal area of the
+    # triangle
     for tid in range(workers):
-        istart = <Py_ssize_t> (n / workers * tid)
+        istart = <Py_ssize_t> (n - n * sqrt(1 - <double> tid / workers))
         istop = <Py_ssize_t> (
-            n / workers * (tid + 1)) if tid < workers - 1 else n
+            n - n * sqrt(1 - <double> (tid + 1) / workers)
+        ) if tid < workers - 1 else n
         threads.push_back(
             thread(one_thread_loop, loop_func, ref(disc2),
                    sample_view, istart, istop)
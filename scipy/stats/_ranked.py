@@ -0,0 +1,192 @@
+"""Rank pooled samples once and reuse the ordering across statistics."""
+import numpy as np
+
+
+__all__ = ['RankedData']
+
+
+_RANK_METHODS = ('average', 'min', 'max', 'dense', 'ordinal')
+
+
+class RankedData:
+    """Pooled samples sorted once, with the tie structure precomputed.
+
+    Many rank-based statistics (`rankdata`, `tiecorrect`, `spearmanr`,
+    `kendalltau`, `kruskal`, `mannwhitneyu`) start by sorting the pooled
+    data. `RankedData` performs that sort a single time, vectorised over all
+    axes other than `axis`, and stores the ordering and the bounds of each
+    group of tied values so that ranks under any tie-breaking method and the
+    tie correction can be produced without sorting again. Instances can be
+    passed to the functions above in place of the raw samples.
+
+    Parameters
+    ----------
+    *samples : array_like
+        One or more samples. The arrays must be broadcastable except along
+        `axis`, along which they are concatenated.
+    axis : int or None, optional
+        Axis along which the observations lie. If None, each sample is
+        raveled before pooling. Default is 0.
+
+    Attributes
+    ----------
+    data : ndarray
+        The pooled (broadcast and concatenated) samples.
+    axis : int or None
+        The `axis` argument, normalised to a nonnegative integer.
+    sizes : tuple of int
+        Number of observations in each sample.
+    n : int
+        Total number of observations, ``sum(sizes)``.
+    has_ties : bool or ndarray of bool
+        Whether the pooled data contain tied values, for each slice along
+        `axis`.
+
+    Notes
+    -----
+    NaNs are sorted to the end and each is treated as a distinct value,
+    consistent with `rankdata`. Functions that accept a `RankedData` instance
+    use the `axis` it was constructed with; their own `axis` argument is
+    ignored in that case.
+
+    Examples
+    --------
+    >>> from scipy import stats
+    >>> x = [1.2, 3.4, 3.4, 0.5]
+    >>> y = [3.4, 2.2, 0.1]
+    >>> ranked = stats.RankedData(x, y)
+    >>> ranked.rank()
+    array([3. , 6. , 6. , 2. , 6. , 4. , 1. ])
+    >>> ranked.rank('min')
+    array([3, 5, 5, 2, 5, 4, 1])
+    >>> ranked.tiecorrect()
+    0.9285714285714286
+
+    The same object can be passed to tests that work on ranks.
+
+    >>> stats.kruskal(ranked)
+    KruskalResult(statistic=0.1346153846153846, pvalue=0.7136938405688267)
+    >>> stats.mannwhitneyu(ranked)
+    MannwhitneyuResult(statistic=7.0, pvalue=0.8544450676295319)
+
+    """
+
+    def __init__(self, *samples, axis=0):
+        if len(samples) == 0:
+            raise ValueError("At least one sample is required.")
+        samples = [np.asarray(sample) for sample in samples]
+
+        if axis is None:
+            samples = [sample.ravel() for sample in samples]
+            axis = 0
+            self.axis = None
+        else:
+            samples = [np.atleast_1d(sample) for sample in samples]
+            self.axis = axis
+
+        # avoid circular import; `stats` imports from this module
+        from .stats import _broadcast_concatenate
+        # the observations are kept along the last axis
+        x = np.moveaxis(_broadcast_concatenate(samples, axis), axis, -1)
+        # use scipy._lib._util._normalize_axis_index when available
+        self._axis = np.core.multiarray.normalize_axis_index(axis, x.ndim)
+        if self.axis is not None:
+            self.axis = self._axis
+        self.sizes = tuple(sample.shape[axis] for sample in samples)
+        self.n = x.shape[-1]
+        self._x = x
+
+        # sort once; the stable sort keeps the 'ordinal' ranks consistent
+        # with the order of appearance
+        sorter = np.argsort(x, axis=-1, kind='mergesort')
+        xs = np.take_along_axis(x, sorter, axis=-1)
+        obs = np.ones(xs.shape, dtype=bool)
+        obs[..., 1:] = xs[..., 1:] != xs[..., :-1]
+
+        # positions of the first and last member of the group of ties that
+        # each sorted element belongs to
+        idx = np.broadcast_to(np.arange(self.n, dtype=np.intp), xs.shape)
+        start = np.maximum.accumulate(np.where(obs, idx, 0), axis=-1)
+        last = np.ones(xs.shape, dtype=bool)
+        last[..., :-1] = obs[..., 1:]
+        end = np.where(last, idx, self.n - 1)[..., ::-1]
+        end = np.minimum.accumulate(end, axis=-1)[..., ::-1]
+
+        self._sorter = sorter
+        self._dense = np.cumsum(obs, axis=-1, dtype=np.intp)
+        self._start = start
+        self._end = end
+
+    @property
+    def data(self):
+        return np.moveaxis(self._x, -1, self._axis)
+
+    @property
+    def has_ties(self):
+        res = np.any(self._end != self._start, axis=-1)
+        return res[()]
+
+    def _unsort(self, values):
+        """Map values in sorted order back to the order of the data."""
+        out = np.empty(values.shape, dtype=values.dtype)
+        np.put_along_axis(out, self._sorter, values, axis=-1)
+        return out
+
+    def _rank(self, method='average'):
+        """Ranks with the observation axis last."""
+        if method not in _RANK_METHODS:
+            raise ValueError('unknown method "{0}"'.format(method))
+        if method == 'average':
+            ranks = 0.5 * (self._start + self._end) + 1
+        elif method == 'min':
+            ranks = self._start + 1
+        elif method == 'max':
+            ranks = self._end + 1
+        elif method == 'dense':
+            ranks = self._dense
+        else:
+            ranks = np.broadcast_to(np.arange(1, self.n + 1, dtype=np.intp),
+                                    self._sorter.shape)
+        return self._unsort(ranks)
+
+    def rank(self, method='average'):
+        """Ranks of the pooled data.
+
+        Parameters
+        ----------
+        method : {'average', 'min', 'max', 'dense', 'ordinal'}, optional
+            How to assign ranks to tied elements; see `rankdata`.
+
+        Returns
+        -------
+        ranks : ndarray
+            Array with the shape of `data` containing the ranks along
+            `axis`.
+
+        """
+        return np.moveaxis(self._rank(method), -1, self._axis)
+
+    def _tie_term(self):
+        """Sum of ``t**3 - t`` over the groups of ``t`` tied values."""
+        # each of the ``t`` members of a group contributes ``t**2 - 1``
+        t = (self._end - self._start + 1).astype(np.float64)
+        return (t**2 - 1).sum(axis=-1)
+
+    def tiecorrect(self):
+        """Tie correction factor for the Mann-Whitney U and Kruskal-Wallis
+        H tests; see `tiecorrect`.
+
+        Returns
+        -------
+        factor : float or ndarray
+            Correction factor for each slice along `axis`.
+
+        """
+        size = np.float64(self.n)
+        if size < 2:
+            return np.ones(self._x.shape[:-1])[()]
+        return (1.0 - self._tie_term() / (size**3 - size))[()]
+
+    def __repr__(self):
+        return ("RankedData(sizes={}, shape={}, axis={})"
+                .format(self.sizes, self._x.shape[:-1], self.axis))
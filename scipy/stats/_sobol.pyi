@@ -27,12 +27,23 @@ def _draw(
     result: np.ndarray
     ) -> None: ...
 
-def _fast_forward(
+def _jump(
+    index: IntNumber,
+    dim: IntNumber,
+    sv: np.ndarray,
+    shift: np.ndarray,
+    quasi: np.ndarray
+    ) -> None: ...
+
+def _draw_threaded(
     n: IntNumber,
     num_gen: IntNumber,
     dim: IntNumber,
     sv: np.ndarray,
-    quasi: np.ndarray
+    shift: np.ndarray,
+    quasi: np.ndarray,
+    result: np.ndarray,
+    workers: IntNumber
     ) -> None: ...
 
 def _categorize(
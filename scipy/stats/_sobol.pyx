@@ -4,6 +4,7 @@ cimport cython
 cimport numpy as cnp
 
 import os
+import threading
 import numpy as np
 
 # Parameters are linked to the direction numbers list.
@@ -257,18 +258,68 @@ cpdef void _draw(const int n,
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cpdef void _fast_forward(const int n,
-                         const int num_gen,
-                         const int dim,
-                         cnp.int_t[:, :] sv,
-                         cnp.int_t[:] quasi) nogil:
-    cdef int i, j, l
-    cdef int num_gen_loc = num_gen
-    for i in range(n):
-        l = low_0_bit(num_gen_loc)
-        for j in range(dim):
-            quasi[j] = quasi[j] ^ sv[j, l - 1]
-        num_gen_loc += 1
+cpdef void _jump(const int index,
+                 const int dim,
+                 cnp.int_t[:, :] sv,
+                 cnp.int_t[:] shift,
+                 cnp.int_t[:] quasi) nogil:
+    """Set `quasi` to the point at position `index` of the sequence.
+
+    Point ``index`` is the XOR of `shift` with the direction numbers
+    selected by the bits of the Gray code of `index`, so the state can be
+    set in ``O(MAXBIT * dim)`` operations instead of stepping through all
+    previous points.
+    """
+    cdef int i, j
+    cdef int gray = index ^ (index >> 1)
+    for j in range(dim):
+        quasi[j] = shift[j]
+    for i in range(MAXBIT):
+        if (gray >> i) & 1:
+            for j in range(dim):
+                quasi[j] = quasi[j] ^ sv[j, i]
+
+
+def _draw_threaded(const int n,
+                   const int num_gen,
+                   const int dim,
+                   cnp.int_t[:, :] sv,
+                   cnp.int_t[:] shift,
+                   cnp.int_t[:] quasi,
+                   cnp.float_t[:, :] result,
+                   int workers):
+    """Same as `_draw`, with the points split among `workers` threads.
+
+    Each thread starts from its own copy of the state, obtained with
+    `_jump`, so that the result is identical to the one of `_draw`. On
+    exit, `quasi` is set to the state after the last point.
+    """
+    cdef cnp.int_t[:, :] states
+    workers = min(n, workers)
+    if workers <= 1:
+        _draw(n, num_gen, dim, sv, quasi, result)
+        return
+
+    states = np.empty((workers, dim), dtype=int)
+
+    def _thread_func(int tid, int start, int stop):
+        cdef cnp.int_t[:] state = states[tid]
+        cdef cnp.float_t[:, :] chunk = result[start:stop]
+        with nogil:
+            _jump(num_gen + start, dim, sv, shift, state)
+            _draw(stop - start, num_gen + start, dim, sv, state, chunk)
+
+    threads = [threading.Thread(target=_thread_func,
+                                args=(tid, tid * n // workers,
+                                      (tid + 1) * n // workers))
+               for tid in range(workers)]
+    for t in threads:
+        t.daemon = True
+        t.start()
+    for t in threads:
+        t.join()
+
+    _jump(num_gen + n, dim, sv, shift, quasi)
 
 
 @cython.boundscheck(False)
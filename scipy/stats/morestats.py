@@ -17,7 +17,7 @@ from .stats import find_repeats, _contains_nan, _normtest_finish
 from .contingency import chi2_contingency
 from . import distributions
 from ._distn_infrastructure import rv_generic
-from ._hypotests import _get_wilcoxon_distr
+from ._hypotests import _get_wilcoxon_cdf
 
 
 __all__ = ['mvsdist',
@@ -3045,9 +3045,10 @@ def wilcoxon(x, y=None, zero_method="wilcox", correction=False,
     (``alternative == 'less'``), or vice versa (``alternative == 'greater.'``).
 
     To derive the p-value, the exact distribution (``mode == 'exact'``)
-    can be used for sample sizes of up to 25. The default ``mode == 'auto'``
-    uses the exact distribution if there are at most 25 observations and no
-    ties, otherwise a normal approximation is used (``mode == 'approx'``).
+    can be used for any sample size; it is computed once for each sample
+    size and cached. The default ``mode == 'auto'`` uses the exact
+    distribution if there are at most 25 observations and no ties, otherwise
+    a normal approximation is used (``mode == 'approx'``).
 
     The treatment of ties can be controlled by the parameter `zero_method`.
     If ``zero_method == 'pratt'``, the normal approximation is adjusted as in
@@ -3213,22 +3214,24 @@ def wilcoxon(x, y=None, zero_method="wilcox", correction=False,
         else:
             prob = distributions.norm.cdf(z)
     elif mode == "exact":
-        # get frequencies cnt of the possible positive ranksums r_plus
-        cnt = _get_wilcoxon_distr(count)
-        # note: r_plus is int (ties not allowed), need int for slices below
+        # get the CDF of the possible positive ranksums r_plus
+        cdf = _get_wilcoxon_cdf(count)
+        # note: r_plus is int (ties not allowed), need int for indexing below
         r_plus = int(r_plus)
+        r_max = len(cdf) - 1
+        # the distribution is symmetric, so P(r >= r_plus) = CDF(r_max-r_plus)
+        p_less = cdf[r_plus]
+        p_greater = cdf[r_max - r_plus]
         if alternative == "two-sided":
-            if r_plus == (len(cnt) - 1) // 2:
+            if r_plus == r_max // 2:
                 # r_plus is the center of the distribution.
                 prob = 1.0
             else:
-                p_less = np.sum(cnt[:r_plus + 1]) / 2**count
-                p_greater = np.sum(cnt[r_plus:]) / 2**count
                 prob = 2*min(p_greater, p_less)
         elif alternative == "greater":
-            prob = np.sum(cnt[r_plus:]) / 2**count
+            prob = p_greater
         else:
-            prob = np.sum(cnt[:r_plus + 1]) / 2**count
+            prob = p_less
 
     return WilcoxonResult(T, prob)
 
@@ -28,6 +28,7 @@ References
 """
 import warnings
 import math
+import functools
 from math import gcd
 from collections import namedtuple
 
@@ -36,8 +37,8 @@ from numpy import array, asarray, ma
 
 from scipy.spatial.distance import cdist
 from scipy.ndimage import measurements
-from scipy._lib._util import (check_random_state, MapWrapper,
-                              rng_integers, float_factorial)
+from scipy._lib._util import (check_random_state, float_factorial,
+                              MapWrapper)
 import scipy.special as special
 from scipy import linalg
 from . import distributions
@@ -46,8 +47,8 @@ from ._stats_mstats_common import (_find_repeats, linregress, theilslopes,
                                    siegelslopes)
 from ._stats import (_kendall_dis, _toint64, _weightedrankedtau,
                      _local_correlations)
+from ._ranked import RankedData
 from dataclasses import make_dataclass
-from ._hypotests import _all_partitions
 
 
 # Functions/classes in other files should be added in `__init__.py`, not here
@@ -4394,6 +4395,9 @@ def spearmanr(a, b=None, axis=0, nan_policy='propagate',
         observations of a single variable. For the behavior in the 2-D case,
         see under ``axis``, below.
         Both arrays need to have the same length in the ``axis`` dimension.
+        Either may be given as a single-sample `RankedData` instance (if
+        one is, both must be), in which case the stored ranks are used
+        and ``axis`` is taken from the instance.
     axis : int or None, optional
         If axis=0 (default), then each column represents a variable, with
         observations in the rows. If axis=1, the relationship is transposed:
@@ -4477,6 +4481,21 @@ def spearmanr(a, b=None, axis=0, nan_policy='propagate',
     SpearmanrResult(correlation=0.09800224850707953, pvalue=0.3320271757932076)
 
     """
+    ranks = None
+    if isinstance(a, RankedData) or isinstance(b, RankedData):
+        ranked = [a] if b is None else [a, b]
+        if not all(isinstance(r, RankedData) and len(r.sizes) == 1
+                   for r in ranked):
+            raise ValueError("If either of `a` or `b` is a `RankedData` "
+                             "instance, both must be, each holding a single "
+                             "sample.")
+        if len({r.axis for r in ranked}) != 1:
+            raise ValueError("`a` and `b` must be ranked along the same "
+                             "axis.")
+        axis = a.axis
+        ranks = [r.rank() for r in ranked]
+        a, b = ranked[0].data, (None if b is None else ranked[1].data)
+
     if axis is not None and axis > 1:
         raise ValueError("spearmanr only handles 1-D or 2-D arrays, "
                          "supplied axis argument {}, please use only "
@@ -4532,7 +4551,16 @@ def spearmanr(a, b=None, axis=0, nan_policy='propagate',
                 # only for those variables
                 variable_has_nan = np.isnan(a).any(axis=axisout)
 
-    a_ranked = np.apply_along_axis(rankdata, axisout, a)
+    if ranks is None:
+        a_ranked = rankdata(a, axis=axisout)
+    else:
+        ranks = [_chk_asarray(r, axis)[0] for r in ranks]
+        if len(ranks) == 1:
+            a_ranked = ranks[0]
+        elif axisout == 0:
+            a_ranked = np.column_stack(ranks)
+        else:
+            a_ranked = np.row_stack(ranks)
     rs = np.corrcoef(a_ranked, rowvar=axisout)
     dof = n_obs - 2  # degrees of freedom
 
@@ -4646,8 +4674,8 @@ def pointbiserialr(x, y):
 KendalltauResult = namedtuple('KendalltauResult', ('correlation', 'pvalue'))
 
 
-def kendalltau(x, y, initial_lexsort=None, nan_policy='propagate',
-               method='auto', variant='b'):
+def kendalltau(x, y=None, initial_lexsort=None, nan_policy='propagate',
+               method='auto', variant='b', *, axis=None, workers=1):
     """Calculate Kendall's tau, a correlation measure for ordinal data.
 
     Kendall's tau is a measure of the correspondence between two rankings.
@@ -4661,9 +4689,12 @@ def kendalltau(x, y, initial_lexsort=None, nan_policy='propagate',
 
     Parameters
     ----------
-    x, y : array_like
+    x, y : array_like or RankedData
         Arrays of rankings, of the same shape. If arrays are not 1-D, they
-        will be flattened to 1-D.
+        will be flattened to 1-D. Either may be given as a `RankedData`
+        instance holding a single 1-D sample (if one is, both must be), in
+        which case the stored ordering of `y` replaces one of the two sorts.
+        `y` is optional only if `axis` is not None; see below.
     initial_lexsort : bool, optional
         Unused (deprecated).
     nan_policy : {'propagate', 'raise', 'omit'}, optional
@@ -4687,14 +4718,37 @@ def kendalltau(x, y, initial_lexsort=None, nan_policy='propagate',
 
     variant: {'b', 'c'}, optional
         Defines which variant of Kendall's tau is returned. Default is 'b'.
+    axis : int or None, optional
+        If None (default), `x` and `y` are flattened and a single tau is
+        computed. If 0 or 1, `x` and `y` are 1-D or 2-D arrays of variables
+        laid out as in `spearmanr`: if ``axis=0`` each column represents a
+        variable, with observations in the rows; if ``axis=1`` each row
+        represents a variable. Tau is then computed for every pair of the
+        variables of `x` and `y` combined. Each variable is sorted once and
+        the pairs share that ordering, so only the discordant pairs are
+        counted per pair of variables.
+
+        .. versionadded:: 1.8.0
+
+    workers : int or map-like callable, optional
+        Only used if `axis` is not None. If `workers` is an int, the pairs
+        of variables are subdivided into sections evaluated in parallel
+        (uses ``multiprocessing.Pool <multiprocessing>``). Supply ``-1`` to
+        use all cores available to the Process. Alternatively supply a
+        map-like callable, such as ``multiprocessing.Pool.map``, which is
+        called as ``workers(func, iterable)``. The default is ``1``.
+
+        .. versionadded:: 1.8.0
 
     Returns
     -------
-    correlation : float
-       The tau statistic.
-    pvalue : float
+    correlation : float or ndarray (2-D square)
+       The tau statistic. If `axis` is not None, a square matrix whose
+       length is the total number of variables, unless there are exactly
+       two variables, in which case a float is returned.
+    pvalue : float or ndarray (2-D square)
        The two-sided p-value for a hypothesis test whose null hypothesis is
-       an absence of association, tau = 0.
+       an absence of association, tau = 0. Same shape as `correlation`.
 
     See Also
     --------
@@ -4741,7 +4795,33 @@ def kendalltau(x, y, initial_lexsort=None, nan_policy='propagate',
     >>> p_value
     0.2827454599327748
 
+    With ``axis=0``, every pair of columns is compared.
+
+    >>> rng = np.random.default_rng()
+    >>> x = rng.integers(10, size=(20, 3))
+    >>> tau, p_value = stats.kendalltau(x, axis=0)
+    >>> tau.shape
+    (3, 3)
+
     """
+    if axis is not None:
+        if isinstance(x, RankedData) or isinstance(y, RankedData):
+            raise ValueError("`RankedData` input is only supported with "
+                             "`axis=None`.")
+        return _kendalltau_pairwise(x, y, axis, nan_policy, method, variant,
+                                    workers)
+
+    y_ranked = None
+    if isinstance(x, RankedData) or isinstance(y, RankedData):
+        if not all(isinstance(r, RankedData) and len(r.sizes) == 1
+                   and r._x.ndim == 1 for r in (x, y)):
+            raise ValueError("If either of `x` or `y` is a `RankedData` "
+                             "instance, both must be, each holding a single "
+                             "one-dimensional sample.")
+        x, y, y_ranked = x.data, y.data, y
+
+    if y is None:
+        raise ValueError("`y` is required unless `axis` is specified.")
     x = np.asarray(x).ravel()
     y = np.asarray(y).ravel()
 
@@ -4781,9 +4861,13 @@ def kendalltau(x, y, initial_lexsort=None, nan_policy='propagate',
                 (cnt * (cnt - 1.) * (2*cnt + 5)).sum())
 
     size = x.size
-    perm = np.argsort(y)  # sort on y and convert y to dense ranks
-    x, y = x[perm], y[perm]
-    y = np.r_[True, y[1:] != y[:-1]].cumsum(dtype=np.intp)
+    if y_ranked is None:
+        perm = np.argsort(y)  # sort on y and convert y to dense ranks
+        x, y = x[perm], y[perm]
+        y = np.r_[True, y[1:] != y[:-1]].cumsum(dtype=np.intp)
+    else:
+        # reuse the ordering and dense ranks computed by `RankedData`
+        x, y = x[y_ranked._sorter], y_ranked._dense
 
     # stable sort on x and convert x to dense ranks
     perm = np.argsort(x, kind='mergesort')
@@ -4847,10 +4931,186 @@ def kendalltau(x, y, initial_lexsort=None, nan_policy='propagate',
     return KendalltauResult(tau, pvalue)
 
 
+def _pairwise_variables(x, y, axis, name):
+    """Stack the variables of `x` and `y` as the rows of a 2-D array."""
+    if axis not in (0, 1):
+        raise ValueError(f"`{name}` only handles 1-D or 2-D arrays; "
+                         f"`axis` must be 0, 1 or None, found {axis}.")
+    variables = []
+    for a in ([x] if y is None else [x, y]):
+        a = np.asarray(a)
+        if a.ndim > 2:
+            raise ValueError(f"`{name}` only handles 1-D or 2-D arrays")
+        if a.ndim < 2:
+            a = a.reshape(1, -1)
+        elif axis == 0:
+            a = a.T
+        variables.append(a)
+    if len({a.shape[1] for a in variables}) != 1:
+        raise ValueError(f"All inputs to `{name}` must have the same number "
+                         "of observations along `axis`.")
+    variables = np.concatenate(variables, axis=0)
+    if variables.shape[0] < 2:
+        raise ValueError(f"`{name}` needs at least 2 variables to compare")
+    return variables
+
+
+def _pair_sections(k, workers, symmetric=True):
+    """Pairs of `k` variables, split into sections of work.
+
+    If `symmetric`, only the pairs ``i <= j`` are included.
+    """
+    # avoid circular import; `_bootstrap` imports from this module
+    from ._bootstrap import _n_workers
+    if symmetric:
+        i, j = np.triu_indices(k)
+    else:
+        i, j = np.indices((k, k)).reshape(2, -1)
+    n_sections = 1 if workers == 1 else 4 * _n_workers(workers)
+    n_sections = max(1, min(i.size, max(n_sections, i.size // 2**14)))
+    return list(zip(np.array_split(i, n_sections),
+                    np.array_split(j, n_sections)))
+
+
+def _pairwise_matrix(k, sections, values, symmetric=True):
+    """Matrix from the values computed for each section."""
+    res = np.empty((k, k))
+    for (i, j), value in zip(sections, values):
+        res[i, j] = value
+        if symmetric:
+            res[j, i] = value
+    return res
+
+
+class _KendallDiscordant:
+    """Discordant and jointly tied pairs for sections of pairs of variables.
+
+    Each variable is sorted once; the ``(i, j)`` pair reuses the ordering
+    of variable ``i`` so that only the Fenwick-tree count remains.
+    """
+    def __init__(self, ranked):
+        self.sorter = ranked._sorter
+        self.dense_sorted = ranked._dense
+        self.dense = ranked._rank('dense')
+        self.has_ties = ranked.has_ties
+
+    def __call__(self, pairs):
+        i, j = pairs
+        n = self.dense.shape[-1]
+        dis = np.empty(i.size, dtype=np.int64)
+        ntie = np.zeros(i.size, dtype=np.int64)
+        for m, (a, b) in enumerate(zip(i, j)):
+            x = self.dense_sorted[a]
+            y = self.dense[b][self.sorter[a]]
+            dis[m] = _kendall_dis(x, y)
+            if self.has_ties[a] and self.has_ties[b]:
+                # joint ties can only occur if both variables have ties
+                key = np.sort(x.astype(np.int64) * (n + 1) + y)
+                obs = np.r_[True, key[1:] != key[:-1], True]
+                cnt = np.diff(np.nonzero(obs)[0]).astype('int64', copy=False)
+                ntie[m] = (cnt * (cnt - 1) // 2).sum()
+        return dis, ntie
+
+
+def _kendalltau_pairwise(x, y, axis, nan_policy, method, variant, workers):
+    """Kendall's tau for every pair of variables; see `kendalltau`."""
+    variables = _pairwise_variables(x, y, axis, 'kendalltau')
+    if variant not in ('b', 'c'):
+        raise ValueError(f"Unknown variant of the method chosen: {variant}. "
+                         "variant must be 'b' or 'c'.")
+    if method not in ('auto', 'exact', 'asymptotic'):
+        raise ValueError(f"Unknown method {method} specified.  Use 'auto', "
+                         "'exact' or 'asymptotic'.")
+    k, size = variables.shape
+
+    contains_nan, nan_policy = _contains_nan(variables, nan_policy)
+    if contains_nan and nan_policy == 'omit':
+        # pairwise deletion of observations; no shared ordering is possible
+        tau, pvalue = np.empty((k, k)), np.empty((k, k))
+        for a, b in zip(*np.triu_indices(k)):
+            res = kendalltau(variables[a], variables[b], nan_policy='omit',
+                             method=method, variant=variant)
+            tau[a, b] = tau[b, a] = res[0]
+            pvalue[a, b] = pvalue[b, a] = res[1]
+        if k == 2:
+            return KendalltauResult(tau[1, 0], pvalue[1, 0])
+        return KendalltauResult(tau, pvalue)
+
+    if size < 2:
+        nans = np.full((k, k), np.nan)
+        if k == 2:
+            return KendalltauResult(np.nan, np.nan)
+        return KendalltauResult(nans, nans.copy())
+
+    ranked = RankedData(variables, axis=1)
+    sections = _pair_sections(k, workers)
+    with MapWrapper(workers) as mapper:
+        results = list(mapper(_KendallDiscordant(ranked), sections))
+    dis = _pairwise_matrix(k, sections, [res[0] for res in results])
+    ntie = _pairwise_matrix(k, sections, [res[1] for res in results])
+
+    # the tie statistics of each variable; a group of `t` ties contributes
+    # ``t - 1`` to the sum below once for each of its `t` members
+    t = (ranked._end - ranked._start).astype(np.float64)
+    xtie = t.sum(axis=-1) / 2
+    x0 = (t * (t - 1)).sum(axis=-1)
+    x1 = (t * (2*t + 7)).sum(axis=-1)
+    xtie, ytie = xtie[:, np.newaxis], xtie[np.newaxis, :]
+    x0, y0 = x0[:, np.newaxis], x0[np.newaxis, :]
+    x1, y1 = x1[:, np.newaxis], x1[np.newaxis, :]
+
+    tot = (size * (size - 1)) // 2
+    con_minus_dis = tot - xtie - ytie + ntie - 2 * dis
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if variant == 'b':
+            tau = con_minus_dis / np.sqrt(tot - xtie) / np.sqrt(tot - ytie)
+        else:
+            classes = ranked._dense[:, -1]
+            minclasses = np.minimum.outer(classes, classes)
+            tau = 2*con_minus_dis / (size**2 * (minclasses-1)/minclasses)
+    # Limit range to fix computational errors
+    tau = np.clip(tau, -1., 1.)
+
+    undefined = (xtie == tot) | (ytie == tot)
+    ties = ((xtie != 0) | (ytie != 0)) & ~undefined
+    if method == 'exact' and ties.any():
+        raise ValueError("Ties found, exact method cannot be used.")
+    if method == 'auto':
+        exact = ~ties & ((size <= 33) | (np.minimum(dis, tot-dis) <= 1))
+    else:
+        exact = np.full((k, k), method == 'exact')
+    exact &= ~undefined
+
+    # con_minus_dis is approx normally distributed with this variance [3]_
+    m = size * (size - 1.)
+    var = ((m * (2*size + 5) - x1 - y1) / 18 +
+           (2 * xtie * ytie) / m + x0 * y0 / (9 * m * (size - 2)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pvalue = special.erfc(np.abs(con_minus_dis) / np.sqrt(var)
+                              / np.sqrt(2))
+    for a, b in zip(*np.nonzero(exact)):
+        c = min(dis[a, b], tot - dis[a, b])
+        pvalue[a, b] = mstats_basic._kendall_p_exact(size, int(c))
+
+    tau[undefined] = np.nan
+    pvalue[undefined] = np.nan
+    if contains_nan:
+        # nan_policy == 'propagate'
+        variable_has_nan = np.isnan(variables).any(axis=-1)
+        for res in (tau, pvalue):
+            res[variable_has_nan, :] = np.nan
+            res[:, variable_has_nan] = np.nan
+
+    if k == 2:
+        return KendalltauResult(tau[1, 0], pvalue[1, 0])
+    return KendalltauResult(tau, pvalue)
+
+
 WeightedTauResult = namedtuple('WeightedTauResult', ('correlation', 'pvalue'))
 
 
-def weightedtau(x, y, rank=True, weigher=None, additive=True):
+def weightedtau(x, y=None, rank=True, weigher=None, additive=True, *,
+                axis=None, workers=1):
     r"""Compute a weighted version of Kendall's :math:`\tau`.
 
     The weighted :math:`\tau` is a weighted version of Kendall's
@@ -4883,7 +5143,7 @@ def weightedtau(x, y, rank=True, weigher=None, additive=True):
     ----------
     x, y : array_like
         Arrays of scores, of the same shape. If arrays are not 1-D, they will
-        be flattened to 1-D.
+        be flattened to 1-D. `y` is optional only if `axis` is not None.
     rank : array_like of ints or bool, optional
         A nonnegative rank assigned to each element. If it is None, the
         decreasing lexicographical rank by (`x`, `y`) will be used: elements of
@@ -4902,12 +5162,35 @@ def weightedtau(x, y, rank=True, weigher=None, additive=True):
         If True, the weight of an exchange is computed by adding the
         weights of the ranks of the exchanged elements; otherwise, the weights
         are multiplied. The default is True.
+    axis : int or None, optional
+        If None (default), `x` and `y` are flattened and a single index is
+        computed. If 0 or 1, `x` and `y` are 1-D or 2-D arrays of variables
+        laid out as in `spearmanr` and the index is computed for every
+        ordered pair of the variables of `x` and `y` combined. The
+        conversion of the scores to a common type is done once per
+        variable.
+
+        .. versionadded:: 1.8.0
+
+    workers : int or map-like callable, optional
+        Only used if `axis` is not None. If `workers` is an int, the pairs
+        of variables are subdivided into sections evaluated in parallel
+        (uses ``multiprocessing.Pool <multiprocessing>``). Supply ``-1`` to
+        use all cores available to the Process. Alternatively supply a
+        map-like callable, such as ``multiprocessing.Pool.map``, which is
+        called as ``workers(func, iterable)``. Requires that `weigher` be
+        pickleable if it is not None. The default is ``1``.
+
+        .. versionadded:: 1.8.0
 
     Returns
     -------
-    correlation : float
-       The weighted :math:`\tau` correlation index.
-    pvalue : float
+    correlation : float or ndarray (2-D square)
+       The weighted :math:`\tau` correlation index. If `axis` is not None,
+       element ``[i, j]`` is the index between variables ``i`` and ``j``,
+       unless there are exactly two variables, in which case a float is
+       returned.
+    pvalue : float or ndarray (2-D square)
        Presently ``np.nan``, as the null statistics is unknown (even in the
        additive hyperbolic case).
 
@@ -4979,6 +5262,12 @@ def weightedtau(x, y, rank=True, weigher=None, additive=True):
     WeightedTauResult(correlation=-0.7181341329699028, pvalue=nan)
 
     """
+    if axis is not None:
+        return _weightedtau_pairwise(x, y, rank, weigher, additive, axis,
+                                     workers)
+    if y is None:
+        raise ValueError("`y` is required unless `axis` is specified.")
+
     x = np.asarray(x).ravel()
     y = np.asarray(y).ravel()
 
@@ -5027,25 +5316,86 @@ def weightedtau(x, y, rank=True, weigher=None, additive=True):
                              np.nan)
 
 
+class _WeightedTauPairs:
+    """Weighted tau for sections of pairs of variables."""
+    def __init__(self, variables, rank, weigher, additive):
+        self.variables = variables
+        self.rank = rank
+        self.weigher = weigher
+        self.additive = additive
+
+    def __call__(self, pairs):
+        i, j = pairs
+        res = np.empty(i.size)
+        for m, (a, b) in enumerate(zip(i, j)):
+            x, y = self.variables[a], self.variables[b]
+            if self.rank is True:
+                res[m] = (
+                    _weightedrankedtau(x, y, None, self.weigher,
+                                       self.additive) +
+                    _weightedrankedtau(y, x, None, self.weigher,
+                                       self.additive)) / 2
+            else:
+                res[m] = _weightedrankedtau(x, y, self.rank, self.weigher,
+                                            self.additive)
+        return res
+
+
+def _weightedtau_pairwise(x, y, rank, weigher, additive, axis, workers):
+    """Weighted tau for every pair of variables; see `weightedtau`."""
+    variables = _pairwise_variables(x, y, axis, 'weightedtau')
+    k, size = variables.shape
+    if not size:
+        nans = np.full((k, k), np.nan)
+        if k == 2:
+            return WeightedTauResult(np.nan, np.nan)
+        return WeightedTauResult(nans, nans.copy())
+
+    # Reduce the scores to a common supported type once per variable
+    # rather than once per pair
+    if (variables.dtype not in (np.int32, np.int64, np.float32, np.float64)
+            or np.isnan(np.sum(variables))):
+        variables = np.array([_toint64(v) for v in variables])
+    variables = np.ascontiguousarray(variables)
+
+    if rank is False:
+        rank = np.arange(size, dtype=np.intp)
+    elif rank is not None and rank is not True:
+        rank = np.asarray(rank).ravel()
+        if rank.size != size:
+            raise ValueError(
+                "All inputs to `weightedtau` must be of the same size, "
+                "found x-size %s and rank-size %s" % (size, rank.size)
+            )
+
+    # With an explicit or lexicographic rank the index is not symmetric
+    symmetric = rank is True
+    sections = _pair_sections(k, workers, symmetric)
+    with MapWrapper(workers) as mapper:
+        values = list(mapper(_WeightedTauPairs(variables, rank, weigher,
+                                               additive), sections))
+    tau = _pairwise_matrix(k, sections, values, symmetric)
+
+    if k == 2:
+        return WeightedTauResult(tau[0, 1], np.nan)
+    return WeightedTauResult(tau, np.full((k, k), np.nan))
+
+
 # FROM MGCPY: https://github.com/neurodata/mgcpy
 
 
-class _ParallelP:
-    """Helper function to calculate parallel p-value."""
+class _MGCPermutationStat:
+    """Helper function to calculate the MGC stat of permuted data."""
 
-    def __init__(self, x, y, random_states):
+    def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.random_states = random_states
 
-    def __call__(self, index):
-        order = self.random_states[index].permutation(self.y.shape[0])
+    def __call__(self, order):
         permy = self.y[order][:, order]
 
         # calculate permuted stats, store in null distribution
-        perm_stat = _mgc_stat(self.x, permy)[0]
-
-        return perm_stat
+        return _mgc_stat(self.x, permy)[0]
 
 
 def _perm_test(x, y, stat, reps=1000, workers=-1, random_state=None):
@@ -5059,7 +5409,9 @@ def _perm_test(x, y, stat, reps=1000, workers=-1, random_state=None):
         The sample test statistic.
     reps : int, optional
         The number of replications used to estimate the null when using the
-        permutation test. The default is 1000 replications.
+        permutation test. The default is 1000 replications. If `reps` is at
+        least the number of distinct permutations of the observations, each
+        of them is used exactly once.
     workers : int or map-like callable, optional
         If `workers` is an int the population is subdivided into `workers`
         sections and evaluated in parallel (uses
@@ -5086,16 +5438,15 @@ def _perm_test(x, y, stat, reps=1000, workers=-1, random_state=None):
         The approximated null distribution.
 
     """
-    # generate seeds for each rep (change to new parallel random number
-    # capabilities in numpy >= 1.17+)
-    random_state = check_random_state(random_state)
-    random_states = [np.random.RandomState(rng_integers(random_state, 1 << 32,
-                     size=4, dtype=np.uint32)) for _ in range(reps)]
+    # avoid circular import; `_bootstrap` imports from this module
+    from ._bootstrap import _calculate_null, _vectorize_statistic
 
-    # parallelizes with specified workers over number of reps and set seeds
-    parallelp = _ParallelP(x=x, y=y, random_states=random_states)
-    with MapWrapper(workers) as mapwrapper:
-        null_dist = np.array(list(mapwrapper(parallelp, range(reps))))
+    # the permutations act on the indices of the observations of `y`
+    random_state = check_random_state(random_state)
+    statistic = _vectorize_statistic(_MGCPermutationStat(x, y))
+    null_dist, reps, _ = _calculate_null(
+        [np.arange(y.shape[0])], statistic, 'pairings', reps, batch=None,
+        workers=workers, random_state=random_state)
 
     # calculate p-value and significant permutation map through list
     pvalue = (null_dist >= stat).sum() / reps
@@ -5156,7 +5507,9 @@ def multiscale_graphcorr(x, y, compute_distance=_euclidean_dist, reps=1000,
         pairwise distances are calculated.
     reps : int, optional
         The number of replications used to estimate the null when using the
-        permutation test. The default is ``1000``.
+        permutation test. The default is ``1000``. If ``reps`` is at least the
+        number of distinct permutations of the observations, the exact null
+        distribution is computed instead.
     workers : int or map-like callable, optional
         If ``workers`` is an int the population is subdivided into ``workers``
         sections and evaluated in parallel (uses ``multiprocessing.Pool
@@ -5181,6 +5534,12 @@ def multiscale_graphcorr(x, y, compute_distance=_euclidean_dist, reps=1000,
         If `seed` is already a ``Generator`` or ``RandomState`` instance then
         that instance is used.
 
+        .. versionchanged:: 1.8.0
+            The permutations are drawn directly from `random_state` rather
+            than from a separately seeded ``RandomState`` per replication,
+            so the p-value obtained with a given seed differs from that of
+            earlier versions.
+
     Returns
     -------
     stat : float
@@ -6252,7 +6611,7 @@ def _broadcast_concatenate(xs, axis):
     # move the axis we're concatenating along to the end
     xs = [np.swapaxes(x, axis, -1) for x in xs]
     # determine final shape of all but the last axis
-    shape = np.broadcast(*[x[..., 0] for x in xs]).shape
+    shape = np.broadcast(*[x[..., :1] for x in xs]).shape[:-1]
     # broadcast along all but the last axis
     xs = [np.broadcast_to(x, shape + (x.shape[-1],)) for x in xs]
     # concatenate along last axis
@@ -6262,33 +6621,6 @@ def _broadcast_concatenate(xs, axis):
     return res
 
 
-def _data_partitions(data, permutations, size_a, axis=-1, random_state=None):
-    """All partitions of data into sets of given lengths, ignoring order"""
-
-    random_state = check_random_state(random_state)
-    if axis < 0:  # we'll be adding a new dimension at the end
-        axis = data.ndim + axis
-
-    # prepare permutation indices
-    size = data.shape[axis]
-    # number of distinct combinations
-    n_max = special.comb(size, size_a)
-
-    if permutations < n_max:
-        indices = np.array([random_state.permutation(size)
-                            for i in range(permutations)]).T
-    else:
-        permutations = n_max
-        indices = np.array([np.concatenate(z)
-                            for z in _all_partitions(size_a, size-size_a)]).T
-
-    data = data.swapaxes(axis, -1)   # so we can index along a new dimension
-    data = data[..., indices]        # generate permutations
-    data = data.swapaxes(-2, axis)   # restore original axis order
-    data = np.moveaxis(data, -1, 0)  # permutations indexed along axis 0
-    return data, permutations
-
-
 def _calc_t_stat(a, b, equal_var, axis=-1):
     """Calculate the t statistic along the given dimension."""
     na = a.shape[axis]
@@ -6347,28 +6679,26 @@ def _permutation_ttest(a, b, permutations, axis=0, equal_var=True,
         The p-value.
 
     """
+    # avoid circular import; `_bootstrap` imports from this module
+    from ._bootstrap import _calculate_null
+
     random_state = check_random_state(random_state)
 
     t_stat_observed = _calc_t_stat(a, b, equal_var, axis=axis)
 
-    na = a.shape[axis]
-    mat = _broadcast_concatenate((a, b), axis=axis)
-    mat = np.moveaxis(mat, axis, -1)
-
-    mat_perm, permutations = _data_partitions(mat, permutations, size_a=na,
-                                              random_state=random_state)
-
-    a = mat_perm[..., :na]
-    b = mat_perm[..., na:]
-    t_stat = _calc_t_stat(a, b, equal_var)
+    data = [np.moveaxis(a, axis, -1), np.moveaxis(b, axis, -1)]
+    statistic = functools.partial(_calc_t_stat, equal_var=equal_var)
+    t_stat, permutations, _ = _calculate_null(
+        data, statistic, 'independent', permutations, batch=None, workers=1,
+        random_state=random_state)
 
     compare = {"less": np.less_equal,
                "greater": np.greater_equal,
                "two-sided": lambda x, y: (x <= -np.abs(y)) | (x >= np.abs(y))}
 
     # Calculate the p-values
-    cmps = compare[alternative](t_stat, t_stat_observed)
-    pvalues = cmps.sum(axis=0) / permutations
+    cmps = compare[alternative](t_stat, t_stat_observed[..., np.newaxis])
+    pvalues = cmps.sum(axis=-1) / permutations
 
     # nans propagate naturally in statistic calculation, but need to be
     # propagated manually into pvalues
@@ -7710,18 +8040,21 @@ def tiecorrect(rankvals):
 
     Parameters
     ----------
-    rankvals : array_like
+    rankvals : array_like or RankedData
         A 1-D sequence of ranks.  Typically this will be the array
-        returned by `~scipy.stats.rankdata`.
+        returned by `~scipy.stats.rankdata`. If a `RankedData` instance,
+        the factor is computed from its stored tie structure for every
+        slice along its axis.
 
     Returns
     -------
-    factor : float
+    factor : float or ndarray
         Correction factor for U or H.
 
     See Also
     --------
     rankdata : Assign ranks to the data
+    RankedData : Pooled samples ranked once
     mannwhitneyu : Mann-Whitney rank test
     kruskal : Kruskal-Wallis H test
 
@@ -7742,6 +8075,9 @@ def tiecorrect(rankvals):
     0.9833333333333333
 
     """
+    if isinstance(rankvals, RankedData):
+        return rankvals.tiecorrect()
+
     arr = np.sort(rankvals)
     idx = np.nonzero(np.r_[True, arr[1:] != arr[:-1], True])[0]
     cnt = np.diff(idx).astype(np.float64)
@@ -7847,7 +8183,10 @@ def kruskal(*args, nan_policy='propagate'):
     ----------
     sample1, sample2, ... : array_like
        Two or more arrays with the sample measurements can be given as
-       arguments. Samples must be one-dimensional.
+       arguments. Samples must be one-dimensional. Alternatively, a single
+       `RankedData` instance holding two or more pooled samples may be
+       given, in which case the test is performed for every slice along the
+       axis it was constructed with.
     nan_policy : {'propagate', 'raise', 'omit'}, optional
         Defines how to handle when input contains nan.
         The following options are available (default is 'propagate'):
@@ -7858,9 +8197,9 @@ def kruskal(*args, nan_policy='propagate'):
 
     Returns
     -------
-    statistic : float
+    statistic : float or ndarray
        The Kruskal-Wallis H statistic, corrected for ties.
-    pvalue : float
+    pvalue : float or ndarray
        The p-value for the test using the assumption that H has a chi
        square distribution. The p-value returned is the survival function of
        the chi square distribution evaluated at H.
@@ -7899,6 +8238,9 @@ def kruskal(*args, nan_policy='propagate'):
     KruskalResult(statistic=7.0, pvalue=0.0301973834223185)
 
     """
+    if len(args) == 1 and isinstance(args[0], RankedData):
+        return _kruskal_ranked_data(args[0], nan_policy)
+
     args = list(map(np.asarray, args))
 
     num_groups = len(args)
@@ -7911,8 +8253,6 @@ def kruskal(*args, nan_policy='propagate'):
         elif arg.ndim != 1:
             raise ValueError("Samples must be one-dimensional.")
 
-    n = np.asarray(list(map(len, args)))
-
     if nan_policy not in ('propagate', 'raise', 'omit'):
         raise ValueError("nan_policy must be 'propagate', 'raise' or 'omit'")
 
@@ -7931,24 +8271,59 @@ def kruskal(*args, nan_policy='propagate'):
     if contains_nan and nan_policy == 'propagate':
         return KruskalResult(np.nan, np.nan)
 
-    alldata = np.concatenate(args)
-    ranked = rankdata(alldata)
-    ties = tiecorrect(ranked)
-    if ties == 0:
+    return _kruskal(RankedData(*args))
+
+
+def _kruskal_ranked_data(ranked, nan_policy):
+    """`kruskal` for the pooled samples of a `RankedData` instance."""
+    if len(ranked.sizes) < 2:
+        raise ValueError("Need at least two groups in stats.kruskal()")
+    if min(ranked.sizes) == 0:
+        nans = np.full(ranked._x.shape[:-1], np.nan)[()]
+        return KruskalResult(nans, nans)
+
+    contains_nan, nan_policy = _contains_nan(ranked._x, nan_policy)
+    if contains_nan and nan_policy == 'omit':
+        if ranked._x.ndim > 1:
+            raise ValueError("nan_policy='omit' is only supported for "
+                             "one-dimensional samples.")
+        samples = np.split(ranked._x, np.cumsum(ranked.sizes)[:-1])
+        return mstats_basic.kruskal(*map(ma.masked_invalid, samples))
+
+    if not contains_nan:
+        return _kruskal(ranked)
+
+    has_nan = np.isnan(ranked._x).any(axis=-1)
+    if not has_nan.ndim:
+        return KruskalResult(np.nan, np.nan)
+    # evaluate the slices without NaNs; propagate NaN to the rest
+    ties = ranked.tiecorrect()
+    ties[has_nan] = 1
+    h, p = _kruskal(ranked, ties)
+    h[has_nan] = np.nan
+    p[has_nan] = np.nan
+    return KruskalResult(h, p)
+
+
+def _kruskal(ranked, ties=None):
+    """Kruskal-Wallis H statistic and p-value from ranked pooled samples."""
+    if ties is None:
+        ties = ranked.tiecorrect()
+    if np.any(ties == 0):
         raise ValueError('All numbers are identical in kruskal')
 
     # Compute sum^2/n for each group and sum
-    j = np.insert(np.cumsum(n), 0, 0)
-    ssbn = 0
-    for i in range(num_groups):
-        ssbn += _square_of_sums(ranked[j[i]:j[i+1]]) / n[i]
+    n = np.asarray(ranked.sizes)
+    j = np.insert(np.cumsum(n), 0, 0)[:-1]
+    sums = np.add.reduceat(ranked._rank(), j, axis=-1)
+    ssbn = (sums**2 / n).sum(axis=-1)
 
     totaln = np.sum(n, dtype=float)
     h = 12.0 / (totaln * (totaln + 1)) * ssbn - 3 * (totaln + 1)
-    df = num_groups - 1
+    df = len(n) - 1
     h /= ties
 
-    return KruskalResult(h, distributions.chi2.sf(h, df))
+    return KruskalResult(h[()], distributions.chi2.sf(h, df)[()])
 
 
 FriedmanchisquareResult = namedtuple('FriedmanchisquareResult',
@@ -8683,8 +9058,10 @@ def rankdata(a, method='average', *, axis=None):
 
     Parameters
     ----------
-    a : array_like
-        The array of values to be ranked.
+    a : array_like or RankedData
+        The array of values to be ranked. If a `RankedData` instance, the
+        ranks of its pooled data are computed from the stored ordering
+        without sorting again, and `axis` is ignored.
     method : {'average', 'min', 'max', 'dense', 'ordinal'}, optional
         The method used to assign ranks to tied elements.
         The following methods are available (default is 'average'):
@@ -8739,6 +9116,9 @@ def rankdata(a, method='average', *, axis=None):
     if method not in ('average', 'min', 'max', 'dense', 'ordinal'):
         raise ValueError('unknown method "{0}"'.format(method))
 
+    if isinstance(a, RankedData):
+        return a.rank(method)
+
     if axis is not None:
         a = np.asarray(a)
         if a.size == 0:
@@ -8748,7 +9128,8 @@ def rankdata(a, method='average', *, axis=None):
             np.core.multiarray.normalize_axis_index(axis, a.ndim)
             dt = np.float64 if method == 'average' else np.int_
             return np.empty(a.shape, dtype=dt)
-        return np.apply_along_axis(rankdata, axis, a, method)
+        # rank all slices with a single vectorised sort
+        return RankedData(a, axis=axis).rank(method)
 
     arr = np.ravel(np.asarray(a))
     algo = 'mergesort' if method == 'ordinal' else 'quicksort'
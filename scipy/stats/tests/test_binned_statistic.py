@@ -1,8 +1,9 @@
 import numpy as np
 from numpy.testing import assert_allclose
+import pytest
 from pytest import raises as assert_raises
 from scipy.stats import (binned_statistic, binned_statistic_2d,
-                         binned_statistic_dd)
+                         binned_statistic_dd, BinnedStatisticAccumulator)
 from scipy._lib._util import check_random_state
 
 from .common_tests import check_named_results
@@ -515,3 +516,68 @@ class TestBinnedStatistic:
         X = np.array([0, 0.42358226], dtype=np.float32)
         stat, _, _ = binned_statistic(X, None, 'count', bins=5)
         assert_allclose(stat, np.array([1, 0, 0, 0, 1], dtype=np.float64))
+
+    @pytest.mark.parametrize('statistic', ['std', 'median', 'min', 'max'])
+    def test_dd_vectorized_statistic(self, statistic):
+        # the vectorized statistics agree with the function applied per bin
+        rng = np.random.default_rng(6384529)
+        x = rng.random((1000, 2))
+        v = np.stack([rng.random(1000), rng.integers(0, 5, size=1000)])
+        v[0, :3] = np.nan
+        func = getattr(np, statistic)
+        # the standard deviation of a bin with fewer than two points is 0
+        n_min, empty = (2, 0) if statistic == 'std' else (1, np.nan)
+
+        stat, _, _ = binned_statistic_dd(x, v, statistic, bins=(7, 6))
+        stat2, _, _ = binned_statistic_dd(
+            x, v, lambda a: func(a) if len(a) >= n_min else empty,
+            bins=(7, 6))
+        assert_allclose(stat, stat2, rtol=1e-13)
+
+    @pytest.mark.parametrize('statistic',
+                             ['mean', 'count', 'sum', 'std', 'min', 'max'])
+    def test_accumulator(self, statistic):
+        rng = np.random.default_rng(984615)
+        x = rng.normal(size=(2000, 2))
+        v = [rng.random(2000), rng.normal(size=2000)]
+        bins = [5, np.linspace(-1, 1, 4)]
+        range = [(-2, 2), (0, 1)]
+        res = binned_statistic_dd(x, v, statistic, bins=bins, range=range)
+
+        acc = BinnedStatisticAccumulator(bins, range, statistic)
+        for idx in np.array_split(np.arange(2000), 7):
+            acc.update(x[idx], [v[0][idx], v[1][idx]])
+        assert acc.n == 2000
+        assert_allclose(acc.statistic, res.statistic, rtol=1e-12)
+        for edges, edges2 in zip(acc.bin_edges, res.bin_edges):
+            assert_allclose(edges, edges2)
+
+        # accumulators of parts of the data can be merged
+        acc1 = BinnedStatisticAccumulator(bins, range, statistic)
+        acc2 = BinnedStatisticAccumulator(bins, range, statistic)
+        acc1.update(x[:500], [v[0][:500], v[1][:500]])
+        acc2.update(x[500:], [v[0][500:], v[1][500:]])
+        acc1.merge(acc2)
+        assert_allclose(acc1.statistic, res.statistic, rtol=1e-12)
+
+    def test_accumulator_empty(self):
+        acc = BinnedStatisticAccumulator(3, [(0, 1)], 'mean')
+        assert_allclose(acc.statistic, np.full(3, np.nan))
+        acc = BinnedStatisticAccumulator(3, [(0, 1)], 'count')
+        acc.update([np.array([0.1, 0.2, 0.9, 2.])])
+        assert_allclose(acc.statistic, [2, 0, 1])
+
+    def test_accumulator_errors(self):
+        with assert_raises(ValueError, match='invalid statistic'):
+            BinnedStatisticAccumulator(3, [(0, 1)], 'median')
+        with assert_raises(ValueError, match='`range` must be given'):
+            BinnedStatisticAccumulator(3)
+        with assert_raises(ValueError, match='`range` must be given'):
+            BinnedStatisticAccumulator([3, [0, 0.5, 1]])
+
+        acc = BinnedStatisticAccumulator([[0, 0.5, 1]])
+        acc.update([self.x], self.v)
+        with assert_raises(ValueError, match='same for all chunks'):
+            acc.update([self.x], [self.v, self.v])
+        with assert_raises(ValueError, match='same bins and statistic'):
+            acc.merge(BinnedStatisticAccumulator([[0, 1]]))
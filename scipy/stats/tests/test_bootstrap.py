@@ -1,6 +1,7 @@
+import itertools
 import numpy as np
 import pytest
-from scipy.stats import bootstrap
+from scipy.stats import bootstrap, permutation_test
 from numpy.testing import assert_allclose, assert_equal
 from scipy import stats
 from .. import _bootstrap as _bootstrap
@@ -67,6 +68,10 @@ def test_bootstrap_iv():
     with pytest.raises(ValueError, match=message):
         bootstrap(([.1, .2, .3], [.1, .2, .3]), statistic, method='BCa')
 
+    message = "`workers` must be -1, a positive integer, or..."
+    with pytest.raises(ValueError, match=message):
+        bootstrap(([1, 2, 3],), np.mean, workers=0)
+
     message = "'herring' cannot be used to seed a"
     with pytest.raises(ValueError, match=message):
         bootstrap(([1, 2, 3],), np.mean, random_state='herring')
@@ -89,6 +94,34 @@ def test_bootstrap_batch(method, axis):
     assert_equal(res2.standard_error, res1.standard_error)
 
 
+@pytest.mark.parametrize("method", ['basic', 'percentile', 'BCa'])
+def test_bootstrap_workers(method):
+    # with parallel workers, each batch has its own random stream, so the
+    # result depends on `random_state` and `batch` but not on `workers`
+    np.random.seed(0)
+    x = np.random.rand(3, 20)
+    kwds = dict(method=method, axis=-1, n_resamples=100, batch=30)
+
+    res1 = bootstrap((x,), np.mean, random_state=0, workers=map, **kwds)
+    res2 = bootstrap((x,), np.mean, random_state=0, workers=2, **kwds)
+    assert_equal(res2.confidence_interval.low, res1.confidence_interval.low)
+    assert_equal(res2.confidence_interval.high, res1.confidence_interval.high)
+    assert_equal(res2.standard_error, res1.standard_error)
+
+    # the parallel bootstrap distribution is statistically equivalent
+    res3 = bootstrap((x,), np.mean, random_state=0, **kwds)
+    assert_allclose(res3.standard_error, res1.standard_error, rtol=0.5)
+
+
+def test_bootstrap_batch_default():
+    # by default, batches of resamples are bounded in size
+    x = np.ones(2**14)
+    assert _bootstrap._default_batch(9999, x.size, workers=1) == 2**10
+    assert _bootstrap._default_batch(10, x.size, workers=1) == 10
+    assert _bootstrap._default_batch(9999, 10, workers=4) == 2500
+    assert _bootstrap._default_batch(9999, 10, workers=map) >= 1
+
+
 @pytest.mark.parametrize("method", ['basic', 'percentile', 'BCa'])
 def test_bootstrap_paired(method):
     # test that `paired` works as expected
@@ -456,3 +489,141 @@ def test_vectorize_statistic(axis):
     res1 = statistic(x, y, z, axis=axis)
     res2 = statistic2(x, y, z, axis=axis)
     assert_allclose(res1, res2)
+
+
+def _mean_difference(x, y, axis):
+    return np.mean(x, axis=axis) - np.mean(y, axis=axis)
+
+
+def test_permutation_test_iv():
+
+    message = "`permutation_type` must be in..."
+    with pytest.raises(ValueError, match=message):
+        permutation_test(([1, 2], [3, 4]), _mean_difference,
+                         permutation_type='ekki')
+
+    message = "`vectorized` must be `True` or `False`."
+    with pytest.raises(ValueError, match=message):
+        permutation_test(([1, 2], [3, 4]), _mean_difference, vectorized=1.5)
+
+    message = "`data` must be a tuple containing at least two samples"
+    with pytest.raises(ValueError, match=message):
+        permutation_test(([1, 2, 3],), _mean_difference)
+
+    message = "each sample in `data` must contain two or more observations..."
+    with pytest.raises(ValueError, match=message):
+        permutation_test(([1, 2, 3], [4]), _mean_difference)
+
+    message = "When `permutation_type` is 'samples' or 'pairings', all..."
+    with pytest.raises(ValueError, match=message):
+        permutation_test(([1, 2, 3], [4, 5]), _mean_difference,
+                         permutation_type='samples')
+
+    message = "`n_resamples` must be a positive integer."
+    with pytest.raises(ValueError, match=message):
+        permutation_test(([1, 2], [3, 4]), _mean_difference, n_resamples=1.5)
+
+    message = "`batch` must be a positive integer or None."
+    with pytest.raises(ValueError, match=message):
+        permutation_test(([1, 2], [3, 4]), _mean_difference, batch=0)
+
+    message = "`alternative` must be in..."
+    with pytest.raises(ValueError, match=message):
+        permutation_test(([1, 2], [3, 4]), _mean_difference,
+                         alternative='ekki')
+
+    message = "`workers` must be -1, a positive integer, or..."
+    with pytest.raises(ValueError, match=message):
+        permutation_test(([1, 2], [3, 4]), _mean_difference, workers=0)
+
+    message = "'herring' cannot be used to seed a"
+    with pytest.raises(ValueError, match=message):
+        permutation_test(([1, 2], [3, 4]), _mean_difference,
+                         random_state='herring')
+
+
+@pytest.mark.parametrize('alternative', ['less', 'greater', 'two-sided'])
+def test_permutation_test_exact_independent(alternative):
+    # compare against a brute-force enumeration of the partitions
+    rng = np.random.default_rng(4267568)
+    x, y = rng.random(4), rng.random(3)
+    res = permutation_test((x, y), _mean_difference, n_resamples=np.inf,
+                           alternative=alternative)
+
+    z = np.concatenate((x, y))
+    null = []
+    for i in itertools.combinations(range(7), 4):
+        mask = np.zeros(7, dtype=bool)
+        mask[list(i)] = True
+        null.append(_mean_difference(z[mask], z[~mask], axis=0))
+    null = np.array(null)
+    p_less = np.mean(null <= res.statistic*(1 + 1e-14))
+    p_greater = np.mean(null >= res.statistic*(1 - 1e-14))
+    expected = {'less': p_less, 'greater': p_greater,
+                'two-sided': min(2*min(p_less, p_greater), 1)}[alternative]
+
+    assert_allclose(np.sort(res.null_distribution), np.sort(null))
+    assert_allclose(res.pvalue, expected, rtol=1e-14)
+
+
+@pytest.mark.parametrize('permutation_type', ['pairings', 'samples'])
+def test_permutation_test_exact_paired(permutation_type):
+    # check the size and symmetry of the exact null distributions
+    rng = np.random.default_rng(8293746)
+    x, y = rng.random(5), rng.random(5)
+
+    def statistic(x, y, axis):
+        return np.sum(x * y, axis=axis) - np.sum(x**2 + y, axis=axis)
+
+    res = permutation_test((x, y), statistic, n_resamples=np.inf,
+                           permutation_type=permutation_type)
+    n_max = 120 if permutation_type == 'pairings' else 32
+    assert res.null_distribution.size == n_max
+    # the identity permutation is always included
+    assert np.any(np.abs(res.null_distribution - res.statistic) < 1e-14)
+
+
+@pytest.mark.parametrize('permutation_type',
+                         ['independent', 'pairings', 'samples'])
+def test_permutation_test_batch_workers(permutation_type):
+    # results do not depend on `batch`, `workers` or `vectorized`
+    rng = np.random.default_rng(6543231)
+    x = rng.random((2, 3, 15))
+    y = rng.random((3, 15))
+
+    def statistic_1d(x, y):
+        return np.mean(x) - np.mean(y**2)
+
+    def statistic(x, y, axis):
+        return np.mean(x, axis=axis) - np.mean(y**2, axis=axis)
+
+    kwds = dict(permutation_type=permutation_type, axis=-1, n_resamples=99)
+    res1 = permutation_test((x, y), statistic, random_state=0, **kwds)
+    res2 = permutation_test((x, y), statistic, random_state=0, batch=7,
+                            workers=map, **kwds)
+    res3 = permutation_test((x, y), statistic_1d, random_state=0, batch=50,
+                            vectorized=False, **kwds)
+
+    assert res1.null_distribution.shape == (2, 3, 99)
+    assert_allclose(res2.statistic, res1.statistic)
+    assert_allclose(res2.null_distribution, res1.null_distribution)
+    assert_allclose(res2.pvalue, res1.pvalue)
+    assert_allclose(res3.null_distribution, res1.null_distribution)
+    assert_allclose(res3.pvalue, res1.pvalue)
+
+
+def test_permutation_test_against_ttest():
+    # the permutation t-test of `ttest_ind` is built on the same engine
+    rng = np.random.default_rng(1638083107694713882823079058616272161)
+    x, y = rng.normal(size=(4, 20)), rng.normal(loc=0.5, size=(4, 25))
+
+    def statistic(x, y, axis):
+        return stats.ttest_ind(x, y, axis=axis).statistic
+
+    res = permutation_test((x, y), statistic, axis=-1, n_resamples=999,
+                           alternative='greater', random_state=0)
+    ref = stats.ttest_ind(x, y, axis=-1, permutations=999,
+                          alternative='greater', random_state=0)
+    assert_allclose(res.statistic, ref.statistic)
+    # the p-value of `permutation_test` counts the observed statistic
+    assert_allclose(res.pvalue, (ref.pvalue*999 + 1)/1000)
@@ -2364,6 +2364,62 @@ class TestRvDiscrete:
         assert_array_equal(rv.ppf(rv.cdf(rv.xk[:-1]) + 1e-8),
                            rv.xk[1:])
 
+    def test_rvs_alias(self):
+        # the alias method draws each value with its probability
+        rng = np.random.default_rng(5839624)
+        xk = np.arange(50) * 2
+        pk = rng.random(50)
+        pk[[3, 10]] = 0
+        pk /= pk.sum()
+        rv = stats.rv_discrete(values=(xk, pk))
+        x = rv.rvs(size=100000, random_state=rng)
+        freq = np.bincount(x // 2, minlength=50) / 100000
+        assert_allclose(freq, pk, atol=5e-3)
+        assert_equal(freq[[3, 10]], 0)
+        assert_equal(rv.rvs(size=(2, 3), random_state=rng).shape, (2, 3))
+
+    @pytest.mark.parametrize('distname, args', [
+        ('hypergeom', ([50, 60, 70], [[10], [20]], [[[5]], [[15]]])),
+        ('betabinom', ([10, 25, 40], [[0.5], [2]], [[[1.5]], [[4]]]))])
+    def test_cdf_ppf_table(self, distname, args):
+        # the table of the CDF of bounded distributions agrees with the
+        # pointwise computations
+        dist = getattr(stats, distname)
+        q = np.linspace(0.01, 0.99, 7)[:, np.newaxis, np.newaxis, np.newaxis]
+        shapes = np.broadcast_arrays(q, *args)
+        expected = dist._ppfvec(*shapes)
+        assert_equal(dist.ppf(q, *args), expected)
+        # the cached table gives the same result
+        assert_equal(dist.ppf(q, *args), expected)
+
+        k = np.arange(10)[:, np.newaxis, np.newaxis, np.newaxis]
+        shapes = np.broadcast_arrays(k, *args)
+        assert_allclose(dist._cdf(*shapes), dist._cdfvec(*shapes),
+                        rtol=1e-13)
+
+    def test_cdf_table_scalar_pmf(self):
+        # the table is not used for a subclass whose methods may only handle
+        # the scalar shape parameters of the pointwise computation
+        class scalar_gen(stats.rv_discrete):
+            def _get_support(self, n):
+                return 0, n
+
+            def _pmf(self, k, n):
+                if np.ndim(n):
+                    raise TypeError("scalar shape parameters only")
+                return np.where((0 <= k) & (k <= n), 1 / (n + 1), 0.)
+
+        dist = scalar_gen(name='scalar')
+        assert dist._cdf_table(2, 5) is None
+        assert_allclose(dist.cdf([1, 2], [3, 5]), [0.5, 0.5])
+        assert_equal(dist.ppf(0.5, [3, 5]), [1, 2])
+
+    def test_cdf_table_too_large(self):
+        # a table of the CDF is not built for large supports
+        assert stats.betabinom._cdf_table(1, 10**7, 2, 3) is None
+        assert_allclose(stats.betabinom.cdf(2, 10**7, 2, 3),
+                        stats.betabinom._cdfvec(2, 10**7, 2, 3))
+
     def test_multidimension(self):
         xk = np.arange(12).reshape((3, 4))
         pk = np.array([[0.1, 0.1, 0.15, 0.05],
@@ -1,6 +1,7 @@
 from __future__ import division, print_function, absolute_import
 
 from itertools import product
+import math
 
 import numpy as np
 import pytest
@@ -14,7 +15,8 @@ from scipy.stats._hypotests import (epps_singleton_2samp, cramervonmises,
                                     _cdf_cvm, cramervonmises_2samp,
                                     _pval_cvm_2samp_exact, barnard_exact,
                                     boschloo_exact)
-from scipy.stats._mannwhitneyu import mannwhitneyu, _mwu_state
+from scipy.stats._mannwhitneyu import (mannwhitneyu, _mwu_state,
+                                       _mwu_distribution)
 from .common_tests import check_named_results
 
 
@@ -382,6 +384,36 @@ class TestMannWhitneyU:
                 pmf2 = _mwu_state.pmf(k=u2, m=n, n=m)
                 assert_allclose(pmf, pmf2)
 
+    def test_exact_distribution_large(self):
+        # compare against counts computed with Python integers by the
+        # recurrence f(m, n, k) = f(m-1, n, k-n) + f(m, n-1, k)
+        m, n = 20, 35
+        f = [[1] + [0]*(m*n) for _ in range(n + 1)]  # f(0, j, k), j <= n
+        for i in range(1, m + 1):
+            g = [[1] + [0]*(m*n)]  # f(i, 0, k)
+            for j in range(1, n + 1):
+                g.append([(f[j][k-j] if k >= j else 0) + g[j-1][k]
+                          for k in range(m*n + 1)])
+            f = g
+        total = math.comb(m + n, m)
+        pmf = np.array([count / total for count in f[n]])
+        u = np.arange(m*n + 1)
+        assert_allclose(_mwu_state.pmf(k=u, m=m, n=n), pmf, rtol=1e-12)
+        assert_allclose(_mwu_state.cdf(k=u, m=m, n=n), np.cumsum(pmf),
+                        rtol=1e-12)
+        assert_allclose(_mwu_state.sf(k=u, m=m, n=n),
+                        np.cumsum(pmf[::-1])[::-1], rtol=1e-12)
+
+    def test_exact_distribution_cached(self):
+        _mwu_distribution.cache_clear()
+        x, y = np.arange(200), np.arange(300) + 100.5
+        res1 = mannwhitneyu(x, y, method="exact")
+        res2 = mannwhitneyu(y, x, method="exact")
+        info = _mwu_distribution.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert 0 < res1.pvalue < 1e-20
+        assert_allclose(res2.pvalue, res1.pvalue, rtol=1e-10)
+
     def test_asymptotic_behavior(self):
         np.random.seed(0)
 
@@ -613,6 +645,33 @@ class TestMannWhitneyU:
                            method="asymptotic")
         assert_allclose(res, expected, rtol=1e-12)
 
+    @pytest.mark.parametrize("method", ["asymptotic", "exact"])
+    @pytest.mark.parametrize("alternative", ["two-sided", "less", "greater"])
+    def test_ranked_data(self, method, alternative):
+        # passing the samples pre-ranked gives the same result
+        rng = np.random.default_rng(3520493818)
+        x = rng.integers(0, 5, size=(7, 3))
+        y = rng.integers(0, 5, size=(6, 3))
+        ref = mannwhitneyu(x, y, method=method, alternative=alternative)
+        res = mannwhitneyu(stats.RankedData(x, y), method=method,
+                           alternative=alternative)
+        assert_allclose(res, ref, rtol=1e-14)
+
+        res = mannwhitneyu(stats.RankedData(x.T, y.T, axis=1), axis=0,
+                           method=method, alternative=alternative)
+        assert_allclose(res, ref, rtol=1e-14)
+
+    def test_ranked_data_iv(self):
+        message = "If `x` is a `RankedData` instance"
+        with assert_raises(ValueError, match=message):
+            mannwhitneyu(stats.RankedData([1, 2], [3, 4]), [5, 6])
+        with assert_raises(ValueError, match=message):
+            mannwhitneyu(stats.RankedData([1, 2], [3, 4], [5, 6]))
+        with assert_raises(ValueError, match="`y` is required"):
+            mannwhitneyu([1, 2])
+        with assert_raises(ValueError, match="`x` and `y` must not contain"):
+            mannwhitneyu(stats.RankedData([1, np.nan], [3, 4]))
+
 
 class TestSomersD:
 
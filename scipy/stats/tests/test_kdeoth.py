@@ -486,3 +486,73 @@ def test_seed():
     test_seed_sub(gkde_2d)
     gkde_2d_weighted = stats.gaussian_kde(xn_2d, weights=wn)
     test_seed_sub(gkde_2d_weighted)
+
+
+@pytest.mark.parametrize("d", [1, 2, 3])
+def test_evaluate_tree(d):
+    # the truncated sum respects the absolute error bound
+    rng = np.random.default_rng(2360984)
+    dataset = rng.normal(size=(d, 500))
+    weights = rng.uniform(size=500)
+    points = rng.normal(size=(d, 100))
+    gkde = stats.gaussian_kde(dataset, weights=weights)
+    ref = gkde.evaluate(points)
+
+    assert_allclose(gkde.evaluate(points, method='tree'), ref,
+                    rtol=0, atol=1e-8)
+    atol = 1e-4
+    res = gkde.evaluate(points, method='tree', atol=atol)
+    assert np.all(np.abs(res - ref) <= atol)
+    assert np.all(res <= ref)
+
+
+def test_evaluate_workers():
+    rng = np.random.default_rng(843214)
+    gkde = stats.gaussian_kde(rng.normal(size=(2, 300)))
+    points = rng.normal(size=(2, 50))
+    ref = gkde.evaluate(points)
+    assert_allclose(gkde.evaluate(points, workers=map), ref, rtol=1e-14)
+    assert_allclose(gkde(points, method='tree', workers=map),
+                    ref, rtol=0, atol=1e-8)
+
+
+def test_evaluate_bad_method():
+    gkde = stats.gaussian_kde([1., 2., 3.])
+    with pytest.raises(ValueError, match="`method` must be"):
+        gkde.evaluate([1.], method='fft')
+    with pytest.raises(ValueError, match="`atol` must be"):
+        gkde.evaluate([1.], method='tree', atol=0)
+
+
+@pytest.mark.parametrize("d", [1, 2, 3])
+def test_evaluate_grid(d):
+    rng = np.random.default_rng(5432678)
+    gkde = stats.gaussian_kde(rng.normal(size=(d, 1000)),
+                              weights=rng.uniform(size=1000))
+    axes = [np.linspace(-3, 3, 61), np.linspace(-2, 2, 41),
+            np.linspace(-1, 1, 21)][:d]
+    res = gkde.evaluate_grid(axes)
+    assert res.shape == tuple(len(ax) for ax in axes)
+
+    grid = np.meshgrid(*axes, indexing='ij')
+    ref = gkde(np.vstack([g.ravel() for g in grid])).reshape(res.shape)
+    assert_allclose(res, ref, rtol=0, atol=5e-3*ref.max())
+
+
+def test_evaluate_grid_1d_array():
+    # a single axis can be passed for univariate data
+    x = np.linspace(-5, 5, 101)
+    gkde = stats.gaussian_kde(np.random.default_rng(2).normal(size=100))
+    assert_allclose(gkde.evaluate_grid(x), gkde.evaluate_grid([x]))
+    assert_allclose(gkde.evaluate_grid(x, workers=2), gkde.evaluate_grid(x))
+
+
+def test_evaluate_grid_input_validation():
+    gkde = stats.gaussian_kde(np.random.default_rng(3).normal(size=(2, 20)))
+    x = np.linspace(0, 1, 5)
+    with pytest.raises(ValueError, match="Number of grid axes"):
+        gkde.evaluate_grid([x])
+    with pytest.raises(ValueError, match="evenly spaced"):
+        gkde.evaluate_grid([x, x**2])
+    with pytest.raises(ValueError, match="at least two"):
+        gkde.evaluate_grid([x, [1.]])
@@ -15,7 +15,7 @@ from scipy import optimize
 from scipy import stats
 from scipy.stats.morestats import _abw_state
 from .common_tests import check_named_results
-from .._hypotests import _get_wilcoxon_distr
+from .._hypotests import _get_wilcoxon_cdf
 from scipy.stats._binomtest import _binary_search_for_binom_tst
 
 # Matplotlib is not a scipy dependency but is optionally used in probplot, so
@@ -1421,9 +1421,9 @@ class TestWilcoxon:
 
     def test_exact_basic(self):
         for n in range(1, 26):
-            cnt = _get_wilcoxon_distr(n)
-            assert_equal(n*(n+1)/2 + 1, len(cnt))
-            assert_equal(sum(cnt), 2**n)
+            cdf = _get_wilcoxon_cdf(n)
+            assert_equal(n*(n+1)/2 + 1, len(cdf))
+            assert_allclose(cdf[-1], 1, rtol=1e-15)
 
     def test_exact_pval(self):
         # expected values computed with "R version 3.4.1 (2017-06-30)"
@@ -1447,8 +1447,30 @@ class TestWilcoxon:
         _, p = stats.wilcoxon(x, y, alternative="greater", mode="exact")
         assert_almost_equal(p, 0.5795889, decimal=6)
 
-        d = np.arange(26) + 1
-        assert_raises(ValueError, stats.wilcoxon, d, mode="exact")
+        # the exact distribution is not limited to small samples
+        d = np.arange(60) + 1
+        _, p = stats.wilcoxon(d, alternative="two-sided", mode="exact")
+        assert_equal(p, 2**-59)
+        _, p = stats.wilcoxon(-d, alternative="greater", mode="exact")
+        assert_allclose(p, 1)
+
+    def test_exact_cdf(self):
+        for n in [1, 2, 10, 25, 40, 62, 80]:
+            # counts of each value of r_plus, in exact integer arithmetic
+            cnt = np.zeros(n*(n+1)//2 + 1, dtype=object)
+            cnt[0] = 1
+            for i in range(1, n + 1):
+                cnt[i:] = cnt[i:] + cnt[:len(cnt) - i]
+            cdf = _get_wilcoxon_cdf(n)
+            assert_allclose(cdf, (np.cumsum(cnt) / 2**n).astype(float),
+                            rtol=1e-13)
+            assert_allclose(cdf[::-1][1:], 1 - cdf[:-1], atol=1e-15)
+
+        # tails keep relative precision for large n
+        n = 300
+        cdf = _get_wilcoxon_cdf(n)
+        assert_allclose(cdf[:4], np.array([1, 2, 3, 5]) / 2.**n, rtol=1e-12)
+        assert_allclose(cdf[-1], 1, rtol=1e-12)
 
     # These inputs were chosen to give a W statistic that is either the
     # center of the distribution (when the length of the support is odd), or
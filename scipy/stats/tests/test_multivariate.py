@@ -18,8 +18,8 @@ import numpy as np
 import scipy.linalg
 from scipy.stats._multivariate import (_PSD,
                                        _lnB,
-                                       _cho_inv_batch,
                                        multivariate_normal_frozen)
+from scipy.stats._qmvn import _prioritized_cholesky
 from scipy.stats import (multivariate_normal, multivariate_hypergeom,
                          matrix_normal, special_ortho_group, ortho_group,
                          random_correlation, unitary_group, dirichlet,
@@ -299,6 +299,27 @@ class TestMultivariateNormal:
         # agrees with 1 / pseudo-determinant
         assert_allclose(-psd.log_pdet, psd_pinv.log_pdet)
 
+    def test_psd_batch(self):
+        # a stack of matrices is decomposed like each matrix on its own
+        rng = np.random.default_rng(2894513495)
+        a = rng.standard_normal((4, 3, 5, 5))
+        cov = a @ np.swapaxes(a, -1, -2)
+        cov[0, 1] = np.ones((5, 5))  # singular, rank 1
+        psd = _PSD(cov)
+        assert_equal(psd.U.shape, (4, 3, 5, 5))
+        for i, j in np.ndindex(4, 3):
+            ref = _PSD(cov[i, j])
+            assert_equal(psd.rank[i, j], ref.rank)
+            assert_allclose(psd.log_pdet[i, j], ref.log_pdet)
+            assert_allclose(psd.pinv[i, j], ref.pinv, atol=1e-10)
+
+        assert_raises(np.linalg.LinAlgError, _PSD, cov, allow_singular=False)
+        cov[2, 2, 0, 0] = -100
+        assert_raises(ValueError, _PSD, cov)
+        cov[2, 2, 0, 0] = np.nan
+        assert_raises(ValueError, _PSD, cov)
+        assert_raises(ValueError, _PSD, np.ones((2, 2, 3)))
+
     def test_exception_nonsquare_cov(self):
         cov = [[1, 2, 3], [4, 5, 6]]
         assert_raises(ValueError, _PSD, cov)
@@ -454,6 +475,122 @@ class TestMultivariateNormal:
 
         assert_almost_equal(np.exp(_lnB(alpha)), desired)
 
+    @pytest.mark.parametrize('dim', [1, 2, 4, 8])
+    def test_cdf_qmc(self, dim):
+        rng = np.random.default_rng(2846)
+        mean = rng.normal(size=dim)
+        M = rng.normal(size=(dim, dim))
+        cov = M @ M.T + np.eye(dim)
+        x = mean + rng.normal(size=(10, dim)) * np.sqrt(np.diag(cov))
+
+        res = multivariate_normal.cdf(x, mean, cov, method='qmc',
+                                      random_state=1)
+        ref = multivariate_normal.cdf(x, mean, cov)
+        assert_allclose(res, ref, atol=5e-5)
+        res2 = multivariate_normal.logcdf(x, mean, cov, method='qmc',
+                                          random_state=1)
+        assert_allclose(res2, np.log(res))
+
+    def test_cdf_qmc_exact(self):
+        # orthant probabilities of the equicorrelated bivariate normal,
+        # 1/4 + arcsin(rho)/(2 pi), and independent components
+        rho = np.array([-0.9, -0.5, 0, 0.5, 0.99])
+        cov = np.ones((5, 2, 2))
+        cov[:, 0, 1] = cov[:, 1, 0] = rho
+        res = multivariate_normal.cdf([0, 0], cov=cov, method='qmc',
+                                      abseps=1e-7, releps=0, random_state=0)
+        assert_allclose(res, 0.25 + np.arcsin(rho) / (2*np.pi), atol=1e-6)
+
+        x = [[np.inf, 0, 1], [-np.inf, 0, 1], [np.inf, np.inf, np.inf]]
+        res = multivariate_normal.cdf(x, cov=[1, 2, 3], method='qmc',
+                                      random_state=0)
+        ref = np.prod(norm.cdf(x, scale=np.sqrt([1, 2, 3])), axis=-1)
+        assert_allclose(res, ref, atol=1e-12)
+
+    def test_cdf_qmc_infinite_limits(self):
+        # a limit of -inf doesn't turn the conditional means of the
+        # variables ordered after it into nan, so that the others are still
+        # ordered by their standardized limits
+        cov = np.array([[2, 1, 0.5], [1, 2, 1], [0.5, 1, 2]])
+        b = np.array([[-np.inf, 1., 0.], [np.inf, 0.5, 0.]])
+        b2, L = _prioritized_cholesky(b, np.broadcast_to(cov, (2, 3, 3)))
+        assert_equal(b2, [[-np.inf, 0, 1], [0, 0.5, np.inf]])
+        assert np.all(np.isfinite(L))
+
+    def test_cdf_qmc_batch(self):
+        # stacks of means and covariance matrices broadcast against `x`
+        rng = np.random.default_rng(6124)
+        dim = 3
+        M = rng.normal(size=(4, 1, dim, dim))
+        cov = M @ np.swapaxes(M, -1, -2) + np.eye(dim)
+        mean = rng.normal(size=(5, dim))
+        x = rng.normal(size=(4, 5, dim))
+
+        res = multivariate_normal.cdf(x, mean, cov, method='qmc',
+                                      random_state=1)
+        assert res.shape == (4, 5)
+        for i in range(4):
+            for j in range(5):
+                ref = multivariate_normal.cdf(x[i, j], mean[j], cov[i, 0])
+                assert_allclose(res[i, j], ref, atol=5e-5)
+
+        # the result does not depend on how the points are split
+        res2 = multivariate_normal.cdf(x, mean, cov, method='qmc',
+                                       random_state=1, workers=map)
+        assert_equal(res2, res)
+
+    def test_logpdf_batch(self):
+        # stacks of means and covariances broadcast against `x`
+        rng = np.random.default_rng(4418251917)
+        a = rng.standard_normal((6, 3, 3))
+        cov = a @ np.swapaxes(a, -1, -2) + np.eye(3)
+        mean = rng.standard_normal((6, 3))
+        x = rng.standard_normal((2, 6, 3))
+        res = multivariate_normal.logpdf(x, mean, cov)
+        assert_equal(res.shape, (2, 6))
+        for i in range(6):
+            ref = multivariate_normal.logpdf(x[:, i], mean[i], cov[i])
+            assert_allclose(res[:, i], ref)
+        assert_allclose(multivariate_normal.pdf(x, mean, cov), np.exp(res))
+
+        # a single mean with a stack of covariances, and vice versa
+        res = multivariate_normal.logpdf(x[0], cov=cov)
+        ref = [multivariate_normal.logpdf(x[0, i], cov=cov[i])
+               for i in range(6)]
+        assert_allclose(res, ref)
+        res = multivariate_normal.logpdf(x[0], mean, cov[0])
+        ref = [multivariate_normal.logpdf(x[0, i], mean[i], cov[0])
+               for i in range(6)]
+        assert_allclose(res, ref)
+
+        message = "The last axis of `x` must have length 3"
+        with assert_raises(ValueError, match=message):
+            multivariate_normal.logpdf([0, 0], mean, cov)
+        cov[1] = np.ones((3, 3))
+        assert_raises(np.linalg.LinAlgError, multivariate_normal.pdf,
+                      x, mean, cov)
+        res = multivariate_normal.pdf(x, mean, cov, allow_singular=True)
+        assert_equal(res.shape, (2, 6))
+
+    def test_cdf_qmc_iv(self):
+        message = "`method` must be either 'mvndst' or 'qmc'."
+        with assert_raises(ValueError, match=message):
+            multivariate_normal.cdf([0, 0], cov=np.eye(2), method='lattice')
+        message = "The last axis of `x` must have length 2"
+        with assert_raises(ValueError, match=message):
+            multivariate_normal.cdf([0, 0, 0], cov=np.eye(2), method='qmc')
+        message = "Array 'cov' must be square"
+        with assert_raises(ValueError, match=message):
+            multivariate_normal.cdf([0, 0], cov=np.ones((3, 2, 3)),
+                                    method='qmc')
+        with assert_raises(np.linalg.LinAlgError):
+            multivariate_normal.cdf([0, 0], cov=[[1, 1], [1, 1]],
+                                    method='qmc')
+        message = "`allow_singular` is not supported"
+        with assert_raises(np.linalg.LinAlgError, match=message):
+            multivariate_normal.cdf([0, 0], cov=[[1, 1], [1, 1]],
+                                    allow_singular=True, method='qmc')
+
 class TestMatrixNormal:
 
     def test_bad_input(self):
@@ -1300,23 +1437,6 @@ class TestInvwishart:
         assert_allclose(iw_rvs, manual_iw_rvs)
         assert_allclose(frozen_iw_rvs, manual_iw_rvs)
 
-    def test_cho_inv_batch(self):
-        """Regression test for gh-8844."""
-        a0 = np.array([[2, 1, 0, 0.5],
-                       [1, 2, 0.5, 0.5],
-                       [0, 0.5, 3, 1],
-                       [0.5, 0.5, 1, 2]])
-        a1 = np.array([[2, -1, 0, 0.5],
-                       [-1, 2, 0.5, 0.5],
-                       [0, 0.5, 3, 1],
-                       [0.5, 0.5, 1, 4]])
-        a = np.array([a0, a1])
-        ainv = a.copy()
-        _cho_inv_batch(ainv)
-        ident = np.eye(4)
-        assert_allclose(a[0].dot(ainv[0]), ident, atol=1e-15)
-        assert_allclose(a[1].dot(ainv[1]), ident, atol=1e-15)
-
     def test_logpdf_4x4(self):
         """Regression test for gh-8844."""
         X = np.array([[2, 1, 0, 0.5],
@@ -1343,6 +1463,29 @@ class TestInvwishart:
 
 
 class TestSpecialOrthoGroup:
+    def test_logpdf_many(self):
+        # the vectorized evaluation of many quantiles agrees with the
+        # definitions of the densities
+        rng = np.random.default_rng(3364890012)
+        dim, n, df = 3, 10, 6
+        a = rng.standard_normal((dim, dim))
+        scale = a @ a.T + np.eye(dim)
+        x = wishart.rvs(df, scale, size=n, random_state=rng)
+        logdet_x = np.linalg.slogdet(x)[1]
+        logdet_scale = np.linalg.slogdet(scale)[1]
+        const = 0.5 * df * dim * np.log(2) + multigammaln(0.5 * df, dim)
+
+        tr = np.trace(np.linalg.solve(scale, x), axis1=-2, axis2=-1)
+        ref = (0.5 * (df - dim - 1) * logdet_x - 0.5 * tr
+               - 0.5 * df * logdet_scale - const)
+        assert_allclose(wishart.logpdf(np.moveaxis(x, 0, -1), df, scale), ref)
+
+        tr = np.trace(scale @ np.linalg.inv(x), axis1=-2, axis2=-1)
+        ref = (0.5 * df * logdet_scale - 0.5 * tr
+               - 0.5 * (df + dim + 1) * logdet_x - const)
+        assert_allclose(invwishart.logpdf(np.moveaxis(x, 0, -1), df, scale),
+                        ref)
+
     def test_reproducibility(self):
         np.random.seed(514)
         x = special_ortho_group.rvs(3)
@@ -1870,6 +2013,21 @@ class TestMultivariateT:
         args = dict(loc=[0,0], shape=[[0,0],[0,1]], df=1, allow_singular=False)
         assert_raises(np.linalg.LinAlgError, multivariate_t, **args)
 
+    @pytest.mark.parametrize("df", [3., np.inf])
+    def test_logpdf_batch(self, df):
+        rng = np.random.default_rng(1398146812)
+        a = rng.standard_normal((5, 4, 4))
+        shape = a @ np.swapaxes(a, -1, -2) + np.eye(4)
+        loc = rng.standard_normal((5, 4))
+        x = rng.standard_normal((3, 5, 4))
+        res = multivariate_t.logpdf(x, loc, shape, df)
+        assert_equal(res.shape, (3, 5))
+        for i in range(5):
+            ref = multivariate_t.logpdf(x[:, i], loc[i], shape[i], df)
+            assert_allclose(res[:, i], ref)
+        assert_allclose(multivariate_t.pdf(x, loc, shape, df), np.exp(res))
+        assert_raises(ValueError, multivariate_t.pdf, x, loc, shape, df=-1)
+
     @pytest.mark.parametrize("size", [(10, 3), (5, 6, 4, 3)])
     @pytest.mark.parametrize("dim", [2, 3, 4, 5])
     @pytest.mark.parametrize("df", [1., 2., np.inf])
@@ -9,9 +9,12 @@ from numpy.testing import (assert_allclose, assert_almost_equal,
 from scipy.stats import shapiro
 
 from scipy.stats._sobol import _test_find_index
+from scipy.stats._qmc_cy import (_cy_wrapper_l2_star_discrepancy,
+                                 _cy_wrapper_perturb_discrepancy)
 from scipy.stats import qmc
 from scipy.stats._qmc import (van_der_corput, n_primes, primes_from_2_to,
-                              update_discrepancy, QMCEngine)
+                              update_discrepancy, QMCEngine,
+                              _l2_star_pair_sum, _l2_star_discrepancy_fast)
 
 
 class TestUtils:
@@ -200,8 +203,9 @@ class TestUtils:
                                              r"hypercube"):
             update_discrepancy(x_new, space_1[:-1], disc_init)
 
-        x_new = [[0.5, 0.5]]
-        with pytest.raises(ValueError, match=r"x_new is not a 1D array"):
+        x_new = [[[0.5, 0.5]]]
+        with pytest.raises(ValueError, match=r"x_new is not a 1D or 2D "
+                                             r"array"):
             update_discrepancy(x_new, space_1[:-1], disc_init)
 
         x_new = [0.3, 0.1, 0]
@@ -209,6 +213,35 @@ class TestUtils:
                                              r"broadcastable"):
             update_discrepancy(x_new, space_1[:-1], disc_init)
 
+    def test_update_discrepancy_candidates(self):
+        rng = np.random.default_rng(8345726)
+        sample = rng.random((20, 3))
+        candidates = rng.random((5, 3))
+        disc_init = qmc.discrepancy(sample, iterative=True)
+        res = update_discrepancy(candidates, sample, disc_init)
+        ref = [qmc.discrepancy(np.concatenate([sample, x[np.newaxis]]))
+               for x in candidates]
+        assert_allclose(res, ref)
+
+    @pytest.mark.parametrize("d", [1, 2, 3, 5])
+    def test_l2_star_fast(self, d):
+        # the divide and conquer sum agrees with the direct double sum,
+        # also with ties in the coordinates
+        rng = np.random.default_rng(6834451)
+        sample = rng.random((300, d))
+        sample[::7] = sample[::7].round(1)
+        ones = np.ones(300)
+        res = _l2_star_pair_sum(sample, ones, sample, ones, tuple(range(d)))
+        ref = np.sum(np.prod(1 - np.maximum(sample[:, np.newaxis],
+                                            sample[np.newaxis]), axis=-1))
+        assert_allclose(res, ref, rtol=1e-12)
+
+        for iterative in [False, True]:
+            assert_allclose(_l2_star_discrepancy_fast(sample, iterative),
+                            _cy_wrapper_l2_star_discrepancy(sample, iterative,
+                                                            workers=1),
+                            rtol=1e-10)
+
     def test_discrepancy_alternative_implementation(self):
         """Alternative definitions from Matt Haberland."""
         def disc_c2(x):
@@ -533,6 +566,38 @@ class TestLHS(QMCEngineTests):
         assert_allclose(sorted_sample, expected, atol=0.5 / n)
         assert np.any(sample - expected > 0.5 / n)
 
+    @pytest.mark.parametrize("centered", [False, True])
+    def test_optimizer_random_cd(self, centered):
+        d, n = 4, 40
+        expected1d = (np.arange(n) + 0.5) / n
+        expected = np.broadcast_to(expected1d, (d, n)).T
+
+        engine = self.engine(d=d, scramble=False, centered=centered,
+                             optimization="random-cd")
+        sample = engine.random(n=n)
+        # still a Latin hypercube
+        assert_allclose(np.sort(sample, axis=0), expected, atol=0.5 / n)
+
+        engine = self.engine(d=d, scramble=False, centered=centered)
+        sample_ref = engine.random(n=n)
+        assert qmc.discrepancy(sample) < qmc.discrepancy(sample_ref)
+
+        with pytest.raises(ValueError, match="'toto' is not a valid"):
+            self.engine(d=d, scramble=False, optimization="toto")
+
+    def test_perturb_discrepancy(self):
+        # the incremental update matches a recomputation from scratch
+        rng = np.random.default_rng(8764125)
+        sample = rng.random((30, 4))
+        disc = qmc.discrepancy(sample)
+        for i1, i2, k in [(0, 29, 0), (3, 7, 2), (5, 5, 1), (12, 2, 3)]:
+            perturbed = sample.copy()
+            perturbed[[i1, i2], k] = perturbed[[i2, i1], k]
+            assert_allclose(
+                _cy_wrapper_perturb_discrepancy(sample, i1, i2, k, disc),
+                qmc.discrepancy(perturbed)
+            )
+
 
 class TestSobol(QMCEngineTests):
     qmce = qmc.Sobol
@@ -595,6 +660,50 @@ class TestSobol(QMCEngineTests):
         assert_equal(count1, Counter({0.0: 1111}))
         assert_equal(count2, Counter({0.5: 1111}))
 
+    @pytest.mark.parametrize("scramble", [False, True])
+    def test_workers(self, scramble):
+        ref_engine = qmc.Sobol(5, scramble=scramble, seed=123)
+        ref = ref_engine.random_base2(10)
+        ref = np.concatenate([ref, ref_engine.random(37)])
+
+        # splitting among threads gives the same points and the same state
+        engine = qmc.Sobol(5, scramble=scramble, seed=123)
+        sample = engine.random_base2(10, workers=3)
+        assert_array_equal(sample, ref[:1024])
+        sample = engine.random(33, workers=-1)
+        assert_array_equal(sample, ref[1024:1057])
+        assert_array_equal(engine.random(4), ref[1057:])
+
+        with pytest.raises(ValueError, match="Invalid number of workers"):
+            engine.random(4, workers=0)
+
+    @pytest.mark.parametrize("scramble", [False, True])
+    def test_fast_forward_jump(self, scramble):
+        engine = qmc.Sobol(4, scramble=scramble, seed=123)
+        ref = engine.random_base2(12)
+        for start in [0, 1, 5, 1000, 4087]:
+            engine.reset().fast_forward(start)
+            assert_array_equal(engine.random(1), ref[start:start+1])
+            assert engine.num_generated == start + 1
+            assert_array_equal(engine.fast_forward(7).random(1),
+                               ref[start+8:start+9])
+
+    def test_out(self):
+        engine = qmc.Sobol(3, scramble=False)
+        ref = engine.random_base2(4)
+        engine.reset()
+        out = np.empty((8, 3))
+        res = engine.random_base2(3, out=out)
+        assert res is out
+        assert_array_equal(out, ref[:8])
+        res = engine.random(8, out=out)
+        assert_array_equal(out, ref[8:])
+
+        with pytest.raises(ValueError, match="`out` must be an array"):
+            engine.random(4, out=out)
+        with pytest.raises(ValueError, match="`out` must be an array"):
+            engine.random(8, out=out.astype(np.float32))
+
 
 class TestMultinomialQMC:
     def test_validations(self):
@@ -1,7 +1,7 @@
 import numpy as np
 from numpy.testing import assert_equal, assert_array_equal
 
-from scipy.stats import rankdata, tiecorrect
+from scipy.stats import rankdata, tiecorrect, RankedData
 import pytest
 
 
@@ -239,3 +239,77 @@ def test_cases():
     for values, method, expected in _cases:
         r = rankdata(values, method=method)
         assert_array_equal(r, expected)
+
+
+class TestRankedData:
+
+    methods = ["average", "min", "max", "dense", "ordinal"]
+
+    @pytest.mark.parametrize("method", methods)
+    @pytest.mark.parametrize("shape, axis", [((20,), 0), ((7, 30), 1),
+                                             ((30, 4, 3), 0), ((5, 6), None),
+                                             ((0, 3), 0)])
+    def test_rank(self, method, shape, axis):
+        # compare against ranking each slice separately
+        np.random.seed(3462)
+        a = np.random.randint(0, 6, size=shape).astype(float)
+        ranked = RankedData(a, axis=axis)
+        r = ranked.rank(method)
+        assert_equal(r.dtype, np.float64 if method == 'average' else np.intp)
+        if axis is None:
+            expected = rankdata(a, method)
+        else:
+            moved = np.moveaxis(a, axis, -1)
+            expected = np.empty(moved.shape, dtype=r.dtype)
+            for index in np.ndindex(moved.shape[:-1]):
+                expected[index] = rankdata(moved[index], method)
+            expected = np.moveaxis(expected, -1, axis)
+        assert_equal(r.shape, expected.shape)
+        assert_array_equal(r, expected)
+        assert_array_equal(rankdata(ranked, method), expected)
+
+    def test_pooled(self):
+        x = [1.2, 3.4, 3.4, 0.5]
+        y = [3.4, 2.2, 0.1]
+        ranked = RankedData(x, y)
+        assert_equal(ranked.sizes, (4, 3))
+        assert_equal(ranked.n, 7)
+        assert_array_equal(ranked.data, x + y)
+        assert_array_equal(ranked.rank(), rankdata(x + y))
+        assert_equal(ranked.tiecorrect(), tiecorrect(rankdata(x + y)))
+        assert ranked.has_ties
+
+    def test_broadcast(self):
+        x = np.arange(5.)
+        y = np.arange(12.).reshape(3, 4) / 2
+        ranked = RankedData(x, y, axis=-1)
+        assert_equal(ranked.axis, 1)
+        assert_equal(ranked.data.shape, (3, 9))
+        expected = rankdata(np.concatenate((np.tile(x, (3, 1)), y), axis=1),
+                            axis=1)
+        assert_array_equal(ranked.rank(), expected)
+
+    def test_tiecorrect(self):
+        np.random.seed(1234)
+        a = np.random.randint(0, 6, size=(8, 40))
+        ranked = RankedData(a, axis=1)
+        expected = [tiecorrect(rankdata(row)) for row in a]
+        assert_array_equal(tiecorrect(ranked), expected)
+        assert_array_equal(ranked.has_ties, True)
+
+        assert_equal(RankedData([]).tiecorrect(), 1.0)
+        assert_equal(RankedData([1.0]).tiecorrect(), 1.0)
+        assert not RankedData([1.0, 2.0]).has_ties
+
+    def test_overflow(self):
+        ntie, k = 2000, 5
+        a = np.repeat(np.arange(k), ntie)
+        n = a.size  # ntie * k
+        out = RankedData(a).tiecorrect()
+        assert_equal(out, 1.0 - k * (ntie**3 - ntie) / float(n**3 - n))
+
+    def test_input_validation(self):
+        with pytest.raises(ValueError, match="At least one sample"):
+            RankedData()
+        with pytest.raises(ValueError, match="unknown method"):
+            RankedData([1, 2]).rank('foo')
@@ -38,7 +38,8 @@ from scipy.stats._distr_params import distcont
 from numpy.lib import NumpyVersion
 from scipy.stats.stats import (_broadcast_concatenate,
                                AlexanderGovernConstantInputWarning)
-from scipy.stats.stats import _calc_t_stat, _data_partitions
+from scipy.stats.stats import _calc_t_stat
+from scipy.stats._bootstrap import _calculate_null
 
 """ Numbers in docstrings beginning with 'W' refer to the section numbers
     and headings found in the STATISTICS QUIZ of Leland Wilkinson.  These are
@@ -798,6 +799,32 @@ class TestCorrSpearmanr:
         expected = [0.865895477, 0.866100381, 0.866100381]
         assert_allclose([res1, res2, res3], expected)
 
+    @pytest.mark.parametrize('axis', [0, 1, None])
+    def test_ranked_data(self, axis):
+        np.random.seed(7546)
+        a = np.random.randint(0, 5, size=(20, 3))
+        b = np.random.rand(20, 3)
+        if axis == 1:
+            a, b = a.T, b.T
+        ref = stats.spearmanr(a, b, axis=axis)
+        res = stats.spearmanr(stats.RankedData(a, axis=axis),
+                              stats.RankedData(b, axis=axis))
+        assert_allclose(res, ref, rtol=1e-14)
+
+        if axis is not None:
+            ref = stats.spearmanr(a, axis=axis)
+            res = stats.spearmanr(stats.RankedData(a, axis=axis))
+            assert_allclose(res, ref, rtol=1e-14)
+
+    def test_ranked_data_iv(self):
+        a = stats.RankedData(np.arange(5))
+        with assert_raises(ValueError, match="both must be"):
+            stats.spearmanr(a, np.arange(5))
+        with assert_raises(ValueError, match="both must be"):
+            stats.spearmanr(stats.RankedData([1, 2], [3, 4]), a)
+        with assert_raises(ValueError, match="same axis"):
+            stats.spearmanr(a, stats.RankedData(np.arange(5), axis=None))
+
 
 class TestCorrSpearmanr2:
     """Some further tests of the spearmanr function."""
@@ -1242,6 +1269,30 @@ def test_kendalltau_nan_2nd_arg():
     assert_allclose(r1.correlation, r2.correlation, atol=1e-15)
 
 
+@pytest.mark.parametrize('variant', ['b', 'c'])
+def test_kendalltau_ranked_data(variant):
+    np.random.seed(9374)
+    x = np.random.randint(0, 6, size=50)
+    y = np.random.rand(50)
+    ref = stats.kendalltau(x, y, variant=variant)
+    res = stats.kendalltau(stats.RankedData(x), stats.RankedData(y),
+                           variant=variant)
+    assert_allclose(res, ref, rtol=1e-14)
+
+    # NaNs are handled as for the raw data
+    y[3] = np.nan
+    ref = stats.kendalltau(x, y, nan_policy='omit')
+    res = stats.kendalltau(stats.RankedData(x), stats.RankedData(y),
+                           nan_policy='omit')
+    assert_allclose(res, ref, rtol=1e-14)
+
+    with assert_raises(ValueError, match="both must be"):
+        stats.kendalltau(stats.RankedData(x), y)
+    with assert_raises(ValueError, match="one-dimensional sample"):
+        stats.kendalltau(stats.RankedData(x.reshape(5, 10)),
+                         stats.RankedData(y.reshape(5, 10)))
+
+
 def test_weightedtau():
     x = [12, 2, 1, 12, 2]
     y = [1, 4, 7, 1, 0]
@@ -1383,6 +1434,121 @@ def test_weightedtau_vs_quadratic():
             np.random.shuffle(rank)
 
 
+def _pairwise_reference(func, variables, **kwds):
+    k = len(variables)
+    tau, p = np.empty((k, k)), np.empty((k, k))
+    for i, j in product(range(k), repeat=2):
+        tau[i, j], p[i, j] = func(variables[i], variables[j], **kwds)
+    return tau, p
+
+
+@pytest.mark.parametrize('n', [10, 50])
+@pytest.mark.parametrize('variant', ['b', 'c'])
+@pytest.mark.parametrize('method', ['auto', 'asymptotic'])
+def test_kendalltau_axis(n, variant, method):
+    np.random.seed(8321)
+    x = np.random.randint(0, 5, size=(n, 3))
+    y = np.random.rand(n, 2)
+    y[:, 1] = x[:, 0]  # joint ties
+    ref = _pairwise_reference(stats.kendalltau, np.hstack((x, y)).T,
+                              variant=variant, method=method)
+    res = stats.kendalltau(x, y, axis=0, variant=variant, method=method)
+    assert_allclose(res, ref, rtol=1e-12)
+    res = stats.kendalltau(np.hstack((x, y)).T, axis=1, variant=variant,
+                           method=method)
+    assert_allclose(res, ref, rtol=1e-12)
+
+    # two variables give scalars
+    res = stats.kendalltau(x[:, 0], y[:, 0], axis=0, variant=variant,
+                           method=method)
+    ref = stats.kendalltau(x[:, 0], y[:, 0], variant=variant, method=method)
+    assert_allclose(res, ref, rtol=1e-12)
+
+
+def test_kendalltau_axis_exact():
+    np.random.seed(2093)
+    x = np.random.rand(12, 4)
+    res = stats.kendalltau(x, axis=0, method='exact')
+    ref = _pairwise_reference(stats.kendalltau, x.T, method='exact')
+    assert_allclose(res, ref, rtol=1e-12)
+
+    x[1, 2] = x[0, 2]
+    with assert_raises(ValueError, match="Ties found"):
+        stats.kendalltau(x, axis=0, method='exact')
+
+
+def test_kendalltau_axis_nan_constant():
+    np.random.seed(5312)
+    x = np.random.rand(20, 4)
+    x[:, 1] = 3.  # constant
+    x[5, 2] = np.nan
+    tau, p = stats.kendalltau(x, axis=0)
+    expected = [[False, True, True, False],
+                [True, True, True, True],
+                [True, True, True, True],
+                [False, True, True, False]]
+    assert_equal(np.isnan(tau), expected)
+    assert_equal(np.isnan(p), expected)
+    assert_allclose((tau[0, 3], p[0, 3]),
+                    stats.kendalltau(x[:, 0], x[:, 3]))
+
+    res = stats.kendalltau(x, axis=0, nan_policy='omit')
+    ref = _pairwise_reference(stats.kendalltau, x.T, nan_policy='omit')
+    assert_allclose(res, ref, rtol=1e-12)
+    with assert_raises(ValueError, match="The input contains nan"):
+        stats.kendalltau(x, axis=0, nan_policy='raise')
+
+
+def test_kendalltau_axis_workers():
+    np.random.seed(1732)
+    x = np.random.randint(0, 10, size=(40, 5))
+    ref = stats.kendalltau(x, axis=0)
+    assert_equal(stats.kendalltau(x, axis=0, workers=map), ref)
+    assert_equal(stats.kendalltau(x, axis=0, workers=2), ref)
+
+
+def test_kendalltau_axis_iv():
+    x = np.arange(10.)
+    with assert_raises(ValueError, match="`y` is required"):
+        stats.kendalltau(x)
+    with assert_raises(ValueError, match="at least 2 variables"):
+        stats.kendalltau(x, axis=0)
+    with assert_raises(ValueError, match="same number of observations"):
+        stats.kendalltau(x, x[:-1], axis=0)
+    with assert_raises(ValueError, match="1-D or 2-D"):
+        stats.kendalltau(x.reshape(1, 2, 5), axis=0)
+    with assert_raises(ValueError, match="1-D or 2-D"):
+        stats.kendalltau(x, x, axis=2)
+    with assert_raises(ValueError, match="Unknown variant"):
+        stats.kendalltau(x, x, axis=0, variant='d')
+
+
+@pytest.mark.parametrize('rank', [True, None, False, 'array'])
+@pytest.mark.parametrize('additive', [True, False])
+def test_weightedtau_axis(rank, additive):
+    np.random.seed(4812)
+    x = np.random.randint(0, 5, size=(30, 3)).astype(float)
+    x[4, 1] = np.nan
+    y = np.random.rand(30)
+    if rank == 'array':
+        rank = np.random.permutation(30)
+    variables = np.vstack((x.T, y))
+    ref, _ = _pairwise_reference(stats.weightedtau, variables, rank=rank,
+                                 additive=additive)
+    tau, p = stats.weightedtau(x, y, rank=rank, additive=additive, axis=0)
+    assert_allclose(tau, ref, rtol=1e-12)
+    assert np.isnan(p).all()
+    tau, _ = stats.weightedtau(variables, rank=rank, additive=additive,
+                               axis=1, workers=map)
+    assert_allclose(tau, ref, rtol=1e-12)
+
+    res = stats.weightedtau(x[:, 0], y, rank=rank, additive=additive, axis=0)
+    assert_allclose(res.correlation, ref[0, 3], rtol=1e-12)
+
+    with assert_raises(ValueError, match="`y` is required"):
+        stats.weightedtau(y)
+
+
 class TestFindRepeats:
 
     def test_basic(self):
@@ -4128,15 +4294,14 @@ class Test_ttest_ind_permutations():
         a = np.random.rand(3)
         b = np.random.rand(4)
 
-        data = np.concatenate((a, b))
         na, nb = len(a), len(b)
 
         permutations = 100000
-        mat_perm, _ = _data_partitions(data, permutations, na)
-
-        a = mat_perm[..., :na]
-        b = mat_perm[..., nb:]
-        t_stat = _calc_t_stat(a, b, True)
+        t_stat, _, exact = _calculate_null(
+            [a, b], lambda a, b, axis: _calc_t_stat(a, b, True, axis=axis),
+            'independent', permutations, batch=None, workers=1,
+            random_state=None)
+        assert exact
         n_unique = len(set(t_stat))
         assert n_unique == binom(na + nb, na)
         assert len(t_stat) == n_unique
@@ -6290,6 +6455,35 @@ class TestKruskal:
         expected = 0
         assert_approx_equal(p, expected)
 
+    def test_ranked_data(self):
+        np.random.seed(2148)
+        samples = [np.random.randint(0, 8, size=(n, 4)) for n in (5, 7, 9)]
+        h, p = stats.kruskal(stats.RankedData(*samples))
+        for i in range(4):
+            ref = stats.kruskal(*[sample[:, i] for sample in samples])
+            assert_allclose((h[i], p[i]), ref, rtol=1e-13)
+
+        # 1-D samples give scalars
+        res = stats.kruskal(stats.RankedData(*[s[:, 0] for s in samples]))
+        assert_allclose(res, (h[0], p[0]), rtol=1e-13)
+        assert np.ndim(res.statistic) == 0
+
+    def test_ranked_data_nan_policy(self):
+        x = np.arange(10.).reshape(5, 2)
+        y = np.arange(10., 18.).reshape(4, 2)
+        x[1, 0] = np.nan
+        ranked = stats.RankedData(x, y)
+        h, p = stats.kruskal(ranked)
+        assert_equal((h[0], p[0]), (np.nan, np.nan))
+        assert_allclose((h[1], p[1]), stats.kruskal(x[:, 1], y[:, 1]))
+        assert_raises(ValueError, stats.kruskal, ranked, nan_policy='raise')
+        assert_raises(ValueError, stats.kruskal, ranked, nan_policy='omit')
+
+        ranked = stats.RankedData(x[:, 0], y[:, 0])
+        assert_allclose(stats.kruskal(ranked, nan_policy='omit'),
+                        stats.kruskal(x[:, 0], y[:, 0], nan_policy='omit'))
+        assert_raises(ValueError, stats.kruskal, stats.RankedData(x))
+
 
 class TestCombinePvalues:
 